@@ -66,6 +66,7 @@ pub trait CacheDatabase {
     fn flushdb(&mut self) -> Result<()>;
     fn keys(&mut self, pattern: &str) -> Result<Vec<String>>;
     fn read(&mut self, key: &str) -> Result<Vec<Vec<u8>>>;
+    fn read_bulk(&mut self, keys: &[String]) -> Result<Vec<Vec<Vec<u8>>>>;
     fn insert(&mut self, key: String, payload: Option<Vec<Vec<u8>>>) -> Result<()>;
     fn update(&mut self, key: String, payload: Option<Vec<Vec<u8>>>) -> Result<()>;
     fn delete(&mut self, key: String, payload: Option<Vec<Vec<u8>>>) -> Result<()>;
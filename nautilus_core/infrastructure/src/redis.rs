@@ -36,6 +36,7 @@ const CHANNEL_TX_FAILED: &str = "Failed to send to channel";
 // Redis constants
 const FLUSHDB: &str = "FLUSHDB";
 const DELIMITER: char = ':';
+const READ_BULK_CHUNK_SIZE: usize = 1_000;
 
 // Collection keys
 const INDEX: &str = "index";
@@ -136,6 +137,49 @@ impl CacheDatabase for RedisCacheDatabase {
         }
     }
 
+    fn read_bulk(&mut self, keys: &[String]) -> Result<Vec<Vec<Vec<u8>>>> {
+        let mut results = Vec::with_capacity(keys.len());
+
+        // Pipeline each chunk of reads to avoid a round trip per key
+        for chunk in keys.chunks(READ_BULK_CHUNK_SIZE) {
+            let mut pipe = redis::pipe();
+            let mut is_list = Vec::with_capacity(chunk.len());
+
+            for key in chunk {
+                let collection = get_collection_key(key)?;
+                let key = format!("{}{DELIMITER}{}", self.trader_key, key);
+
+                match collection {
+                    GENERAL | CURRENCIES | INSTRUMENTS | SYNTHETICS | ACTORS | STRATEGIES => {
+                        pipe.get(key);
+                        is_list.push(false);
+                    }
+                    ACCOUNTS | ORDERS | POSITIONS => {
+                        pipe.lrange(key, 0, -1);
+                        is_list.push(true);
+                    }
+                    _ => bail!("Unsupported operation: `read_bulk` for collection '{collection}'"),
+                }
+            }
+
+            let values: Vec<redis::Value> = pipe.query(&mut self.conn)?;
+            for (value, is_list) in values.iter().zip(is_list) {
+                if is_list {
+                    results.push(redis::from_redis_value::<Vec<Vec<u8>>>(value)?);
+                } else {
+                    let result = redis::from_redis_value::<Vec<u8>>(value)?;
+                    if result.is_empty() {
+                        results.push(vec![]);
+                    } else {
+                        results.push(vec![result]);
+                    }
+                }
+            }
+        }
+
+        Ok(results)
+    }
+
     fn insert(&mut self, key: String, payload: Option<Vec<Vec<u8>>>) -> Result<()> {
         let op = DatabaseCommand::new(DatabaseOperation::Insert, key, payload);
         match self.tx.send(op) {
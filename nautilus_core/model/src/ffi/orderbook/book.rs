@@ -163,6 +163,50 @@ pub extern "C" fn orderbook_asks(book: &mut OrderBook_API) -> CVec {
         .into()
 }
 
+/// Fills the given buffers with the price, size and order count of the top bid levels.
+///
+/// # Safety
+///
+/// - Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+#[no_mangle]
+pub unsafe extern "C" fn orderbook_bids_fill_depth(
+    book: &OrderBook_API,
+    depth: usize,
+    prices: *mut f64,
+    sizes: *mut f64,
+    counts: *mut u64,
+    cumulative: u8,
+) -> usize {
+    book.fill_bids_depth(
+        std::slice::from_raw_parts_mut(prices, depth),
+        std::slice::from_raw_parts_mut(sizes, depth),
+        std::slice::from_raw_parts_mut(counts, depth),
+        cumulative != 0,
+    )
+}
+
+/// Fills the given buffers with the price, size and order count of the top ask levels.
+///
+/// # Safety
+///
+/// - Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+#[no_mangle]
+pub unsafe extern "C" fn orderbook_asks_fill_depth(
+    book: &OrderBook_API,
+    depth: usize,
+    prices: *mut f64,
+    sizes: *mut f64,
+    counts: *mut u64,
+    cumulative: u8,
+) -> usize {
+    book.fill_asks_depth(
+        std::slice::from_raw_parts_mut(prices, depth),
+        std::slice::from_raw_parts_mut(sizes, depth),
+        std::slice::from_raw_parts_mut(counts, depth),
+        cumulative != 0,
+    )
+}
+
 #[no_mangle]
 pub extern "C" fn orderbook_has_bid(book: &mut OrderBook_API) -> u8 {
     book.has_bid() as u8
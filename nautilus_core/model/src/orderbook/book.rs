@@ -164,6 +164,28 @@ impl OrderBook {
         }
     }
 
+    /// Fills the given buffers with the top bid levels, returning the number of levels filled.
+    pub fn fill_bids_depth(
+        &self,
+        prices: &mut [f64],
+        sizes: &mut [f64],
+        counts: &mut [u64],
+        cumulative: bool,
+    ) -> usize {
+        self.bids.fill_depth(prices, sizes, counts, cumulative)
+    }
+
+    /// Fills the given buffers with the top ask levels, returning the number of levels filled.
+    pub fn fill_asks_depth(
+        &self,
+        prices: &mut [f64],
+        sizes: &mut [f64],
+        counts: &mut [u64],
+        cumulative: bool,
+    ) -> usize {
+        self.asks.fill_depth(prices, sizes, counts, cumulative)
+    }
+
     pub fn bids(&self) -> Vec<&Level> {
         self.bids.levels.values().collect()
     }
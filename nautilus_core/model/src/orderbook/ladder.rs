@@ -167,6 +167,31 @@ impl Ladder {
         return self.levels.values().map(|l| l.exposure()).sum();
     }
 
+    /// Fills the given buffers with the price, size and order count of the top
+    /// levels (up to the shortest buffer length), returning the number of levels filled.
+    ///
+    /// If `cumulative` then each size is the total size from the top of the ladder.
+    pub fn fill_depth(
+        &self,
+        prices: &mut [f64],
+        sizes: &mut [f64],
+        counts: &mut [u64],
+        cumulative: bool,
+    ) -> usize {
+        let depth = prices.len().min(sizes.len()).min(counts.len());
+        let mut total_size = 0.0;
+        let mut filled = 0;
+        for level in self.levels.values().take(depth) {
+            let size = level.size();
+            total_size += size;
+            prices[filled] = level.price.value.as_f64();
+            sizes[filled] = if cumulative { total_size } else { size };
+            counts[filled] = level.len() as u64;
+            filled += 1;
+        }
+        filled
+    }
+
     #[must_use]
     pub fn top(&self) -> Option<&Level> {
         match self.levels.iter().next() {
@@ -224,6 +249,46 @@ mod tests {
         types::{price::Price, quantity::Quantity},
     };
 
+    #[rstest]
+    fn test_fill_depth() {
+        let mut ladder = Ladder::new(OrderSide::Buy);
+        ladder.add_bulk(vec![
+            BookOrder::new(OrderSide::Buy, Price::from("10.00"), Quantity::from(20), 1),
+            BookOrder::new(OrderSide::Buy, Price::from("10.00"), Quantity::from(30), 2),
+            BookOrder::new(OrderSide::Buy, Price::from("9.00"), Quantity::from(50), 3),
+            BookOrder::new(OrderSide::Buy, Price::from("8.00"), Quantity::from(100), 4),
+        ]);
+
+        let mut prices = [0.0; 2];
+        let mut sizes = [0.0; 2];
+        let mut counts = [0; 2];
+        let filled = ladder.fill_depth(&mut prices, &mut sizes, &mut counts, false);
+
+        assert_eq!(filled, 2);
+        assert_eq!(prices, [10.0, 9.0]);
+        assert_eq!(sizes, [50.0, 50.0]);
+        assert_eq!(counts, [2, 1]);
+    }
+
+    #[rstest]
+    fn test_fill_depth_cumulative_with_fewer_levels_than_depth() {
+        let mut ladder = Ladder::new(OrderSide::Sell);
+        ladder.add_bulk(vec![
+            BookOrder::new(OrderSide::Sell, Price::from("11.00"), Quantity::from(20), 1),
+            BookOrder::new(OrderSide::Sell, Price::from("12.00"), Quantity::from(30), 2),
+        ]);
+
+        let mut prices = [0.0; 5];
+        let mut sizes = [0.0; 5];
+        let mut counts = [0; 5];
+        let filled = ladder.fill_depth(&mut prices, &mut sizes, &mut counts, true);
+
+        assert_eq!(filled, 2);
+        assert_eq!(prices[..2], [11.0, 12.0]);
+        assert_eq!(sizes[..2], [20.0, 50.0]);
+        assert_eq!(counts[..2], [1, 1]);
+    }
+
     #[rstest]
     fn test_book_price_bid_sorting() {
         let mut bid_prices = [
@@ -13,8 +13,12 @@
 //  limitations under the License.
 // -------------------------------------------------------------------------------------------------
 
+use std::ffi::c_void;
+
 use nautilus_core::{ffi::cvec::CVec, python::to_pyruntime_err};
-use nautilus_model::data::{bar::Bar, delta::OrderBookDelta, quote::QuoteTick, trade::TradeTick};
+use nautilus_model::data::{
+    bar::Bar, delta::OrderBookDelta, quote::QuoteTick, trade::TradeTick, Data,
+};
 use pyo3::{prelude::*, types::PyCapsule};
 
 use crate::backend::session::{DataBackendSession, DataQueryResult};
@@ -90,16 +94,28 @@ impl DataQueryResult {
     }
 
     /// Each iteration returns a chunk of values read from the parquet file.
+    ///
+    /// The chunk is owned by the returned capsule, and is dropped along with
+    /// the capsule once it is no longer referenced.
     fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<PyObject>> {
         match slf.next() {
             Some(acc) if !acc.is_empty() => {
-                let cvec = acc.into();
-                Python::with_gil(|py| match PyCapsule::new::<CVec>(py, cvec, None) {
-                    Ok(capsule) => Ok(Some(capsule.into_py(py))),
-                    Err(err) => Err(to_pyruntime_err(err)),
+                let cvec: CVec = acc.into();
+                Python::with_gil(|py| {
+                    match PyCapsule::new_with_destructor::<CVec, _>(py, cvec, None, drop_chunk) {
+                        Ok(capsule) => Ok(Some(capsule.into_py(py))),
+                        Err(err) => Err(to_pyruntime_err(err)),
+                    }
                 })
             }
             _ => Ok(None),
         }
     }
 }
+
+/// Drops the chunk of data owned by a capsule yielded from a [`DataQueryResult`].
+fn drop_chunk(chunk: CVec, _context: *mut c_void) {
+    let CVec { ptr, len, cap } = chunk;
+    let data: Vec<Data> = unsafe { Vec::from_raw_parts(ptr.cast::<Data>(), len, cap) };
+    drop(data);
+}
@@ -31,6 +31,21 @@ cdef class ExchangeRateCalculator:
     )
 
 
+cdef class ExchangeRateGraph:
+    cdef dict _bids
+    cdef dict _asks
+    cdef dict _mids
+    cdef dict _adjacency
+    cdef dict _paths
+    cdef dict _rates
+    cdef dict _dependents
+
+    cpdef void update(self, str symbol, double bid, double ask)
+    cpdef double get_rate(self, str from_code, str to_code, PriceType price_type)
+    cpdef void clear(self)
+    cdef list _find_path(self, str from_code, str to_code)
+
+
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
 
@@ -182,6 +182,229 @@ cdef class ExchangeRateCalculator:
         return quotes.get(to_currency.code, 0.0)
 
 
+cdef class ExchangeRateGraph:
+    """
+    Provides a persistent graph of exchange rates between currencies.
+
+    The graph is maintained incrementally from currency pair quotes, with each
+    pair forming a leg between its base and quote currency. Conversion paths
+    between currencies are found once (shortest path), and the resulting rates
+    are cached until one of the legs along the path changes.
+
+    The rates are consistent with the `ExchangeRateCalculator`, with inverse
+    legs calculated as ``1.0 / quote`` and inferred rates calculated by
+    dividing through the common currency.
+    """
+
+    def __init__(self):
+        self._bids: dict[str, float] = {}
+        self._asks: dict[str, float] = {}
+        self._mids: dict[str, float] = {}
+        self._adjacency: dict[str, dict[str, tuple[str, bool]]] = {}
+        self._paths: dict[tuple[str, str], list[tuple[str, bool]]] = {}
+        self._rates: dict[tuple[str, str, PriceType], float] = {}
+        self._dependents: dict[str, set[tuple[str, str, PriceType]]] = {}
+
+    cpdef void update(self, str symbol, double bid, double ask):
+        """
+        Update the graph with the given quote for the currency pair.
+
+        Only the cached rates which depend on the pair are invalidated, if the
+        quote is unchanged then this is a no-op.
+
+        Parameters
+        ----------
+        symbol : str
+            The currency pair symbol, in the form "{base}/{quote}".
+        bid : double
+            The bid price for the pair.
+        ask : double
+            The ask price for the pair.
+
+        """
+        Condition.not_none(symbol, "symbol")
+
+        cdef tuple pieces
+        cdef str code_lhs
+        cdef str code_rhs
+        cdef dict adjacency_lhs
+        cdef dict adjacency_rhs
+        cdef tuple existing
+        cdef set dependents
+        cdef tuple key
+        if symbol not in self._bids:
+            pieces = symbol.partition("/")
+            code_lhs = pieces[0]
+            code_rhs = pieces[2]
+
+            adjacency_lhs = self._adjacency.get(code_lhs)
+            if adjacency_lhs is None:
+                adjacency_lhs = {}
+                self._adjacency[code_lhs] = adjacency_lhs
+            adjacency_rhs = self._adjacency.get(code_rhs)
+            if adjacency_rhs is None:
+                adjacency_rhs = {}
+                self._adjacency[code_rhs] = adjacency_rhs
+
+            # A direct quote always takes precedence over an inverse
+            adjacency_lhs[code_rhs] = (symbol, False)
+            existing = adjacency_rhs.get(code_lhs)
+            if existing is None or existing[1]:
+                adjacency_rhs[code_lhs] = (symbol, True)
+
+            # The topology changed, so all paths must be found again
+            self._paths.clear()
+            self._rates.clear()
+            self._dependents.clear()
+        elif self._bids[symbol] == bid and self._asks[symbol] == ask:
+            return  # Leg unchanged
+        else:
+            dependents = self._dependents.pop(symbol, None)
+            if dependents:
+                for key in dependents:
+                    self._rates.pop(key, None)
+
+        self._bids[symbol] = bid
+        self._asks[symbol] = ask
+        self._mids[symbol] = (bid + ask) / 2.0
+
+    cpdef double get_rate(self, str from_code, str to_code, PriceType price_type):
+        """
+        Return the exchange rate between the given currencies.
+
+        Parameters
+        ----------
+        from_code : str
+            The currency code to convert from.
+        to_code : str
+            The currency code to convert to.
+        price_type : PriceType
+            The price type for conversion.
+
+        Returns
+        -------
+        double
+
+        Raises
+        ------
+        ValueError
+            If `price_type` is not ``BID``, ``ASK`` or ``MID``.
+
+        Notes
+        -----
+        If there is no path between the currencies then will return 0.
+
+        """
+        Condition.not_none(from_code, "from_code")
+        Condition.not_none(to_code, "to_code")
+
+        if from_code == to_code:
+            return 1.0  # No conversion necessary
+
+        cdef tuple key = (from_code, to_code, price_type)
+        rate = self._rates.get(key)
+        if rate is not None:
+            return rate
+
+        cdef dict prices
+        if price_type == PriceType.BID:
+            prices = self._bids
+        elif price_type == PriceType.ASK:
+            prices = self._asks
+        elif price_type == PriceType.MID:
+            prices = self._mids
+        else:
+            raise ValueError(f"Cannot calculate exchange rate for PriceType."
+                             f"{price_type_to_str(price_type)}")
+
+        cdef tuple pair = (from_code, to_code)
+        cdef list path
+        if pair in self._paths:
+            path = self._paths[pair]
+        else:
+            path = self._find_path(from_code, to_code)
+            self._paths[pair] = path
+
+        if path is None:
+            return 0.0  # No path between currencies
+
+        # The first leg converts from the source currency, each subsequent leg
+        # is divided through from the next currency back to the previous one.
+        cdef double result = 0.0
+        cdef double leg_rate
+        cdef set dependents
+        cdef tuple leg
+        cdef str symbol
+        cdef Py_ssize_t i
+        for i in range(len(path)):
+            leg = path[i]
+            symbol = leg[0]
+            leg_rate = prices[symbol]
+            if leg[1]:
+                leg_rate = 1.0 / leg_rate
+            if i == 0:
+                result = leg_rate
+            else:
+                result = result / leg_rate
+
+            dependents = self._dependents.get(symbol)
+            if dependents is None:
+                dependents = set()
+                self._dependents[symbol] = dependents
+            dependents.add(key)
+
+        self._rates[key] = result
+        return result
+
+    cpdef void clear(self):
+        """
+        Clear all legs, paths and cached rates from the graph.
+        """
+        self._bids.clear()
+        self._asks.clear()
+        self._mids.clear()
+        self._adjacency.clear()
+        self._paths.clear()
+        self._rates.clear()
+        self._dependents.clear()
+
+    cdef list _find_path(self, str from_code, str to_code):
+        if from_code not in self._adjacency or to_code not in self._adjacency:
+            return None
+
+        # Breadth-first search for the path with the fewest legs
+        cdef dict previous = {from_code: None}
+        cdef list frontier = [from_code]
+        cdef list next_frontier
+        cdef str code
+        cdef str neighbor
+        while frontier and to_code not in previous:
+            next_frontier = []
+            for code in frontier:
+                for neighbor in self._adjacency[code]:
+                    if neighbor not in previous:
+                        previous[neighbor] = code
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        if to_code not in previous:
+            return None
+
+        cdef list codes = [to_code]
+        code = to_code
+        while previous[code] is not None:
+            code = previous[code]
+            codes.append(code)
+        codes.reverse()
+
+        cdef list path = [self._adjacency[codes[0]][codes[1]]]
+        cdef Py_ssize_t i
+        for i in range(2, len(codes)):
+            path.append(self._adjacency[codes[i]][codes[i - 1]])
+
+        return path
+
+
 cdef class RolloverInterestCalculator:
     """
     Provides rollover interest rate calculations.
@@ -17,7 +17,9 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from numpy import float64
 
 from nautilus_trader.accounting.accounts.base import Account
@@ -416,6 +418,63 @@ class PortfolioAnalyzer:
 
         return output
 
+    def calculate_statistics_batch(
+        self,
+        returns: np.ndarray | pa.Table | None = None,
+        realized_pnls: np.ndarray | pa.Table | None = None,
+    ) -> pd.DataFrame:
+        """
+        Calculate the registered statistics for many runs at once.
+
+        Each run is a row of a 2-D array (shorter runs padded with NaN), or a
+        column of an Arrow table. Statistics which do not support the input
+        are omitted from the output.
+
+        Parameters
+        ----------
+        returns : np.ndarray or pa.Table, optional
+            The daily returns for each run.
+        realized_pnls : np.ndarray or pa.Table, optional
+            The realized PnLs for each run.
+
+        Returns
+        -------
+        pd.DataFrame
+            The statistics with one row per run and one column per statistic.
+
+        Raises
+        ------
+        ValueError
+            If an array input is not 2-dimensional.
+        ValueError
+            If `returns` and `realized_pnls` have a different number of runs.
+
+        """
+        returns, index = _to_batch_array(returns)
+        realized_pnls, pnls_index = _to_batch_array(realized_pnls)
+        if returns is not None and realized_pnls is not None:
+            PyCondition.equal(
+                returns.shape[0],
+                realized_pnls.shape[0],
+                "returns runs",
+                "realized_pnls runs",
+            )
+        index = index if index is not None else pnls_index
+
+        columns: dict[str, np.ndarray] = {}
+        if realized_pnls is not None:
+            for name, stat in self._statistics.items():
+                values = stat.calculate_from_realized_pnls_batch(realized_pnls)
+                if values is not None:
+                    columns[name] = values
+        if returns is not None:
+            for name, stat in self._statistics.items():
+                values = stat.calculate_from_returns_batch(returns)
+                if values is not None:
+                    columns[name] = values
+
+        return pd.DataFrame(columns, index=index)
+
     def get_stats_pnls_formatted(
         self,
         currency: Currency | None = None,
@@ -487,3 +546,19 @@ class PortfolioAnalyzer:
             output.append(f"{k}: {' ' * padding}{v_formatted}")
 
         return output
+
+
+def _to_batch_array(values: np.ndarray | pa.Table | None) -> tuple[np.ndarray | None, list | None]:
+    if values is None:
+        return None, None
+    if isinstance(values, pa.Table):
+        # Arrow columns are equal length, with nulls for padding (converted to NaN)
+        array = np.array(
+            [column.to_numpy().astype(np.float64) for column in values.columns],
+            dtype=np.float64,
+        ).reshape(values.num_columns, values.num_rows)
+        return array, list(values.column_names)
+
+    array = np.asarray(values, dtype=np.float64)
+    PyCondition.true(array.ndim == 2, "batch input was not 2-dimensional")
+    return array, list(range(array.shape[0]))
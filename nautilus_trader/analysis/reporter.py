@@ -13,10 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.accounting.accounts.base import Account
 from nautilus_trader.core.datetime import unix_nanos_to_dt
+from nautilus_trader.model.enums import liquidity_side_to_str
+from nautilus_trader.model.enums import order_side_to_str
+from nautilus_trader.model.enums import order_type_to_str
+from nautilus_trader.model.enums import position_side_to_str
 from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.orders import Order
@@ -75,8 +80,8 @@ class ReportProvider:
             return pd.DataFrame()
 
         report = pd.DataFrame(data=filled_orders).set_index("client_order_id").sort_index()
-        report["ts_last"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_last"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
+        report["ts_last"] = _nanos_to_datetimes(report["ts_last"].fillna(0))
+        report["ts_init"] = _nanos_to_datetimes(report["ts_init"])
 
         return report
 
@@ -100,18 +105,38 @@ class ReportProvider:
         if not orders:
             return pd.DataFrame()
 
-        fills = [
-            OrderFilled.to_dict(e) for o in orders for e in o.events if isinstance(e, OrderFilled)
-        ]
+        fills = [e for o in orders for e in o.events if isinstance(e, OrderFilled)]
         if not fills:
             return pd.DataFrame()
 
-        report = pd.DataFrame(data=fills).set_index("client_order_id").sort_index()
-        report["ts_event"] = [unix_nanos_to_dt(ts_last or 0) for ts_last in report["ts_event"]]
-        report["ts_init"] = [unix_nanos_to_dt(ts_init) for ts_init in report["ts_init"]]
-        del report["type"]
-
-        return report
+        # Build the columns directly from the events, rather than creating an
+        # intermediate dict per fill.
+        report = pd.DataFrame(
+            {
+                "trader_id": [e.trader_id.value for e in fills],
+                "strategy_id": [e.strategy_id.value for e in fills],
+                "instrument_id": [e.instrument_id.value for e in fills],
+                "client_order_id": [e.client_order_id.value for e in fills],
+                "venue_order_id": [e.venue_order_id.value for e in fills],
+                "account_id": [e.account_id.value for e in fills],
+                "trade_id": [e.trade_id.value for e in fills],
+                "position_id": [e.position_id.value if e.position_id else None for e in fills],
+                "order_side": [order_side_to_str(e.order_side) for e in fills],
+                "order_type": [order_type_to_str(e.order_type) for e in fills],
+                "last_qty": [str(e.last_qty) for e in fills],
+                "last_px": [str(e.last_px) for e in fills],
+                "currency": [e.currency.code for e in fills],
+                "commission": [e.commission.to_str() for e in fills],
+                "liquidity_side": [liquidity_side_to_str(e.liquidity_side) for e in fills],
+                "event_id": [e.id.value for e in fills],
+                "ts_event": _nanos_to_datetimes([e.ts_event for e in fills]),
+                "ts_init": _nanos_to_datetimes([e.ts_init for e in fills]),
+                "info": [e.info for e in fills],
+                "reconciliation": [e.reconciliation for e in fills],
+            },
+        )
+
+        return report.set_index("client_order_id").sort_index()
 
     @staticmethod
     def generate_positions_report(positions: list[Position]) -> pd.DataFrame:
@@ -131,22 +156,45 @@ class ReportProvider:
         if not positions:
             return pd.DataFrame()
 
-        positions = [p.to_dict() for p in positions]
-        if not positions:
-            return pd.DataFrame()
+        # Build the columns directly from the positions, rather than creating an
+        # intermediate dict per position.
+        report = pd.DataFrame(
+            {
+                "position_id": [p.id.value for p in positions],
+                "trader_id": [p.trader_id.value for p in positions],
+                "strategy_id": [p.strategy_id.value for p in positions],
+                "instrument_id": [p.instrument_id.value for p in positions],
+                "account_id": [p.account_id.value for p in positions],
+                "opening_order_id": [p.opening_order_id.value for p in positions],
+                "closing_order_id": [
+                    p.closing_order_id.value if p.closing_order_id is not None else None
+                    for p in positions
+                ],
+                "entry": [order_side_to_str(p.entry) for p in positions],
+                "side": [position_side_to_str(p.side) for p in positions],
+                "peak_qty": [str(p.peak_qty) for p in positions],
+                "ts_opened": _nanos_to_datetimes([p.ts_opened for p in positions]),
+                "ts_last": [p.ts_last for p in positions],
+                "ts_closed": _nanos_to_datetimes(
+                    [p.ts_closed for p in positions], zero_as_nat=True
+                ),
+                "duration_ns": [p.duration_ns if p.duration_ns > 0 else None for p in positions],
+                "avg_px_open": [str(p.avg_px_open) for p in positions],
+                "avg_px_close": [
+                    str(p.avg_px_close) if p.avg_px_close > 0 else None for p in positions
+                ],
+                "commissions": [_commissions_to_str(p) for p in positions],
+                "realized_return": [str(round(p.realized_return, 5)) for p in positions],
+                "realized_pnl": [p.realized_pnl.to_str() for p in positions],
+            },
+        )
 
         sort = ["ts_opened", "ts_closed", "position_id"]
-        report = pd.DataFrame(data=positions).set_index("position_id").sort_values(sort)
-        del report["signed_qty"]
-        del report["quantity"]
-        del report["quote_currency"]
-        del report["base_currency"]
-        del report["settlement_currency"]
-        report["ts_opened"] = [unix_nanos_to_dt(ts_opened) for ts_opened in report["ts_opened"]]
-        report["ts_closed"] = [
-            unix_nanos_to_dt(ts_closed) if not pd.isna(ts_closed) else pd.NA
-            for ts_closed in report["ts_closed"]
-        ]
+        report = report.set_index("position_id").sort_values(sort)
+
+        # Open positions have no close time, which is reported as `pd.NA`
+        ts_closed = report["ts_closed"]
+        report["ts_closed"] = ts_closed.astype(object).where(ts_closed.notna(), pd.NA)
 
         return report
 
@@ -187,3 +235,19 @@ class ReportProvider:
         del report["event_id"]
 
         return report
+
+
+def _nanos_to_datetimes(values, zero_as_nat: bool = False) -> pd.DatetimeIndex:
+    # Converts the whole column in one call rather than a datetime per value
+    nanos = np.asarray(values, dtype=np.int64)
+    timestamps = pd.to_datetime(nanos, unit="ns", utc=True)
+    if zero_as_nat:
+        timestamps = timestamps.where(nanos != 0, pd.NaT)
+    return timestamps
+
+
+def _commissions_to_str(position: Position) -> str | None:
+    commissions = position.commissions()
+    if not commissions:
+        return None
+    return str([c.to_str() for c in commissions])
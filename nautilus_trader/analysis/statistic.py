@@ -16,6 +16,7 @@
 import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.model.orders import Order
@@ -130,6 +131,68 @@ class PortfolioStatistic:
         """
         ...  # Override in implementation
 
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        """
+        Calculate the statistic values from the given raw returns for many runs.
+
+        The default implementation calls `calculate_from_returns` for each run,
+        statistics should override this with a vectorized implementation.
+
+        Parameters
+        ----------
+        returns : np.ndarray
+            The daily returns with shape (runs, days), shorter runs are padded
+            with NaN (NaN values are treated as missing and excluded).
+
+        Returns
+        -------
+        np.ndarray or ``None``
+            The statistic value for each run.
+
+        """
+        if not self._is_overridden("calculate_from_returns"):
+            return None  # Not implemented
+
+        values = [self.calculate_from_returns(self._row_to_daily_returns(row)) for row in returns]
+        if not values or all(value is None for value in values):
+            return None  # Not implemented
+
+        return np.asarray(values)
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        """
+        Calculate the statistic values from the given raw realized PnLs for many runs.
+
+        The default implementation calls `calculate_from_realized_pnls` for each
+        run, statistics should override this with a vectorized implementation.
+
+        Parameters
+        ----------
+        realized_pnls : np.ndarray
+            The realized PnLs with shape (runs, trades), shorter runs are padded
+            with NaN (NaN values are treated as missing and excluded).
+
+        Returns
+        -------
+        np.ndarray or ``None``
+            The statistic value for each run.
+
+        """
+        if not self._is_overridden("calculate_from_realized_pnls"):
+            return None  # Not implemented
+
+        values = [
+            self.calculate_from_realized_pnls(pd.Series(row[~np.isnan(row)], dtype=np.float64))
+            for row in realized_pnls
+        ]
+        if not values or all(value is None for value in values):
+            return None  # Not implemented
+
+        return np.asarray(values)
+
+    def _is_overridden(self, method_name: str) -> bool:
+        return getattr(type(self), method_name) is not getattr(PortfolioStatistic, method_name)
+
     def _check_valid_returns(self, returns: pd.Series) -> bool:
         if returns is None or returns.empty or returns.isna().all():
             return False
@@ -138,3 +201,25 @@ class PortfolioStatistic:
 
     def _downsample_to_daily_bins(self, returns: pd.Series) -> pd.Series:
         return returns.dropna().resample("1D").sum()
+
+    def _row_to_daily_returns(self, row: np.ndarray) -> pd.Series:
+        values = row[~np.isnan(row)]
+        index = pd.date_range("1970-01-01", periods=len(values), freq="D", tz="UTC")
+        return pd.Series(values, index=index, dtype=np.float64)
+
+    def _batch_mean(self, values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        # Mean of the masked values for each row (NaN where no values)
+        counts = np.count_nonzero(mask, axis=1)
+        totals = np.where(mask, values, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return totals / counts
+
+    def _batch_std(self, values: np.ndarray) -> np.ndarray:
+        # Sample standard deviation (ddof=1) of the non-NaN values for each row
+        mask = ~np.isnan(values)
+        counts = np.count_nonzero(mask, axis=1)
+        mean = self._batch_mean(values, mask)
+        deviations = np.where(mask, values - mean[:, np.newaxis], 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = (deviations**2).sum(axis=1) / (counts - 1)
+        return np.where(counts > 1, np.sqrt(variance), np.nan)
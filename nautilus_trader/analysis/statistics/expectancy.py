@@ -15,10 +15,12 @@
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 from nautilus_trader.analysis.statistics.loser_avg import AvgLoser
+from nautilus_trader.analysis.statistics.win_rate import WinRate
 from nautilus_trader.analysis.statistics.winner_avg import AvgWinner
 
 
@@ -45,3 +47,11 @@ class Expectancy(PortfolioStatistic):
         loss_rate = 1.0 - win_rate
 
         return (avg_winner * win_rate) + (avg_loser * loss_rate)
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        avg_winner = AvgWinner().calculate_from_realized_pnls_batch(realized_pnls)
+        avg_loser = AvgLoser().calculate_from_realized_pnls_batch(realized_pnls)
+        win_rate = WinRate().calculate_from_realized_pnls_batch(realized_pnls)
+        loss_rate = 1.0 - win_rate
+
+        return (avg_winner * win_rate) + (avg_loser * loss_rate)
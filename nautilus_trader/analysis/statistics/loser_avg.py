@@ -15,6 +15,7 @@
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
@@ -37,3 +38,7 @@ class AvgLoser(PortfolioStatistic):
             return 0.0
 
         return losers.mean()
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        res = self._batch_mean(realized_pnls, realized_pnls <= 0.0)
+        return np.nan_to_num(res, nan=0.0)
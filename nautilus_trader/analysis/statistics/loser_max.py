@@ -37,3 +37,8 @@ class MaxLoser(PortfolioStatistic):
             return 0.0
 
         return min(np.asarray(losers, dtype=np.float64))
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        mask = realized_pnls < 0.0
+        res = np.where(mask, realized_pnls, np.inf).min(axis=1, initial=np.inf)
+        return np.where(mask.any(axis=1), res, 0.0)
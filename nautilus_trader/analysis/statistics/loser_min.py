@@ -37,3 +37,8 @@ class MinLoser(PortfolioStatistic):
             return 0.0
 
         return max(np.asarray(losers, dtype=np.float64))  # max is least loser
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        mask = realized_pnls <= 0.0
+        res = np.where(mask, realized_pnls, -np.inf).max(axis=1, initial=-np.inf)
+        return np.where(mask.any(axis=1), res, 0.0)
@@ -38,3 +38,12 @@ class ProfitFactor(PortfolioStatistic):
             return np.nan
         else:
             return abs(positive_returns_sum / negative_returns_sum)
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        mask = ~np.isnan(returns)
+        positive_returns_sum = np.where(mask & (returns >= 0), returns, 0.0).sum(axis=1)
+        negative_returns_sum = np.where(mask & (returns < 0), returns, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = np.abs(positive_returns_sum / negative_returns_sum)
+
+        return np.where(negative_returns_sum == 0, np.nan, res)
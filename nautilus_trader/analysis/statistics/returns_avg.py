@@ -36,3 +36,6 @@ class ReturnsAverage(PortfolioStatistic):
             return np.nan
 
         return returns[returns != 0].dropna().mean()
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        return self._batch_mean(returns, ~np.isnan(returns) & (returns != 0))
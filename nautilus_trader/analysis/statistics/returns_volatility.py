@@ -49,3 +49,6 @@ class ReturnsVolatility(PortfolioStatistic):
         returns = self._downsample_to_daily_bins(returns)
 
         return returns.std() * np.sqrt(self.period)
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        return self._batch_std(returns) * np.sqrt(self.period)
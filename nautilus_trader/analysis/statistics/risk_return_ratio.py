@@ -32,3 +32,8 @@ class RiskReturnRatio(PortfolioStatistic):
             return np.nan
 
         return returns.mean() / returns.std()
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        mean = self._batch_mean(returns, ~np.isnan(returns))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return mean / self._batch_std(returns)
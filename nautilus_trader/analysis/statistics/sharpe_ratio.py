@@ -52,3 +52,11 @@ class SharpeRatio(PortfolioStatistic):
         res = returns.mean() / divisor
 
         return res * np.sqrt(self.period)
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        mask = ~np.isnan(returns)
+        mean = self._batch_mean(returns, mask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = mean / self._batch_std(returns)
+
+        return res * np.sqrt(self.period)
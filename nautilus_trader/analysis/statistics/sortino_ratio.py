@@ -55,3 +55,13 @@ class SortinoRatio(PortfolioStatistic):
         res = returns.mean() / downside
 
         return res * np.sqrt(self.period)
+
+    def calculate_from_returns_batch(self, returns: np.ndarray) -> np.ndarray | None:
+        mask = ~np.isnan(returns)
+        counts = np.count_nonzero(mask, axis=1)
+        downside_sq = np.where(mask & (returns < 0), returns**2, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            downside = np.sqrt(downside_sq / counts)
+            res = self._batch_mean(returns, mask) / downside
+
+        return np.where(downside == 0, np.nan, res * np.sqrt(self.period))
@@ -15,6 +15,7 @@
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
@@ -35,3 +36,9 @@ class WinRate(PortfolioStatistic):
         losers = [x for x in realized_pnls if x <= 0.0]
 
         return len(winners) / float(max(1, (len(winners) + len(losers))))
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        counts = np.count_nonzero(~np.isnan(realized_pnls), axis=1)
+        winners = np.count_nonzero(realized_pnls > 0.0, axis=1)
+
+        return winners / np.maximum(1, counts).astype(np.float64)
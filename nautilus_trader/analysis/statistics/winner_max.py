@@ -15,6 +15,7 @@
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from nautilus_trader.analysis.statistic import PortfolioStatistic
@@ -32,3 +33,8 @@ class MaxWinner(PortfolioStatistic):
 
         # Calculate statistic
         return max(realized_pnls)
+
+    def calculate_from_realized_pnls_batch(self, realized_pnls: np.ndarray) -> np.ndarray | None:
+        mask = ~np.isnan(realized_pnls)
+        res = np.where(mask, realized_pnls, -np.inf).max(axis=1, initial=-np.inf)
+        return np.where(mask.any(axis=1), res, 0.0)
@@ -0,0 +1,107 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.rust.model cimport Data_t
+from nautilus_trader.core.rust.model cimport Data_t_Tag
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.identifiers cimport InstrumentId
+
+
+cdef class ArrowDataSource:
+    cdef readonly type data_cls
+    """The data type for the source.\n\n:returns: `type`"""
+    cdef readonly Data_t_Tag tag
+    """The precomputed type tag for the source.\n\n:returns: `Data_t_Tag`"""
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the source.\n\n:returns: `InstrumentId`"""
+    cdef readonly BarType bar_type
+    """The bar type for the source (if bar data).\n\n:returns: `BarType` or ``None``"""
+    cdef readonly uint64_t ts_first
+    """The UNIX timestamp (nanoseconds) of the first element.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t ts_last
+    """The UNIX timestamp (nanoseconds) of the last element.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t size
+    """The total number of elements in the source.\n\n:returns: `uint64_t`"""
+
+    cdef uint8_t _price_prec
+    cdef uint8_t _size_prec
+    cdef list _batches
+    cdef Py_ssize_t _batch_index
+    cdef Py_ssize_t _row
+    cdef Py_ssize_t _rows
+
+    cdef const uint64_t[:] _ts_event
+    cdef const uint64_t[:] _ts_init
+    cdef const int64_t[:] _price
+    cdef const int64_t[:] _ask_price
+    cdef const uint64_t[:] _size
+    cdef const uint64_t[:] _ask_size
+    cdef const int64_t[:] _high
+    cdef const int64_t[:] _low
+    cdef const int64_t[:] _close
+    cdef const uint8_t[:] _action
+    cdef const uint8_t[:] _side
+    cdef const uint64_t[:] _order_id
+    cdef const uint8_t[:] _flags
+    cdef const uint64_t[:] _sequence
+    cdef list _trade_ids
+
+    cdef void _load_batch(self, Py_ssize_t index)
+    cdef bint has_next_c(self)
+    cdef uint64_t peek_ts_c(self)
+    cdef Data next_c(self)
+    cdef void skip_until_c(self, uint64_t ts)
+    cpdef void reset(self)
+
+
+cdef class ArrowDataStream:
+    cdef list _sources
+    cdef ArrowDataSource _current
+
+    cdef readonly Data_t_Tag tag
+    """The type tag of the last element returned from the stream.\n\n:returns: `Data_t_Tag`"""
+
+    cdef void _select_next(self)
+    cdef bint has_next_c(self)
+    cdef uint64_t peek_ts_c(self)
+    cdef Data next_c(self)
+    cdef void skip_until_c(self, uint64_t ts)
+    cpdef void add_source(self, ArrowDataSource source)
+    cpdef void reset(self)
+    cpdef void clear(self)
+
+
+cdef class CapsuleDataStream:
+    cdef object _chunks
+    cdef object _chunk
+    cdef Data_t* _ptr
+    cdef uint64_t _len
+    cdef uint64_t _row
+
+    cdef readonly Data_t_Tag tag
+    """The type tag of the last element returned from the stream.\n\n:returns: `Data_t_Tag`"""
+    cdef readonly uint64_t count
+    """The number of elements returned from the stream.\n\n:returns: `uint64_t`"""
+
+    cdef void _load_next_chunk(self)
+    cdef bint has_next_c(self)
+    cdef uint64_t peek_ts_c(self)
+    cdef Data next_c(self)
+    cdef void skip_until_c(self, uint64_t ts)
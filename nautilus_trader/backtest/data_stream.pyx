@@ -0,0 +1,520 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pyarrow as pa
+
+from cpython.pycapsule cimport PyCapsule_GetPointer
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.data cimport Data
+from nautilus_trader.core.rust.core cimport CVec
+from nautilus_trader.core.rust.model cimport AggressorSide
+from nautilus_trader.core.rust.model cimport BookAction
+from nautilus_trader.core.rust.model cimport Data_t
+from nautilus_trader.core.rust.model cimport Data_t_Tag
+from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport bar_new_from_raw
+from nautilus_trader.model.data cimport Bar
+from nautilus_trader.model.data cimport BarType
+from nautilus_trader.model.data cimport OrderBookDelta
+from nautilus_trader.model.data cimport OrderBookDeltas
+from nautilus_trader.model.data cimport QuoteTick
+from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport TradeId
+
+
+_DATA_CLS_TAGS = {
+    OrderBookDelta: Data_t_Tag.DELTA,
+    OrderBookDeltas: Data_t_Tag.DELTA,
+    QuoteTick: Data_t_Tag.QUOTE,
+    TradeTick: Data_t_Tag.TRADE,
+    Bar: Data_t_Tag.BAR,
+}
+
+
+cdef class ArrowDataSource:
+    """
+    Provides a source of Nautilus data decoded on the fly from Arrow record batches.
+
+    The batches are held in their columnar form, and each Nautilus object is
+    only constructed from its row of raw fixed-point values as the source is
+    consumed. This avoids holding every element as a heap object for the
+    lifetime of a backtest.
+
+    Parameters
+    ----------
+    data_cls : type
+        The Nautilus data type for the batches (one of `OrderBookDelta`,
+        `QuoteTick`, `TradeTick` or `Bar`).
+    data : pa.Table | list[pa.RecordBatch]
+        The Arrow data in the Nautilus Parquet/Arrow schema for the data type.
+        All batches must share the same schema metadata (a single instrument or bar type).
+
+    Raises
+    ------
+    KeyError
+        If `data_cls` is not a supported Arrow data type.
+    ValueError
+        If `data` is empty.
+    ValueError
+        If the `ts_init` values of `data` are not monotonically increasing (or non-decreasing).
+
+    """
+
+    def __init__(self, type data_cls not None, data not None):
+        if isinstance(data, pa.Table):
+            data = data.to_batches()
+        cdef list batches = [b for b in data if b.num_rows > 0]
+        Condition.not_empty(batches, "data")
+
+        self.data_cls = data_cls
+        self.tag = _DATA_CLS_TAGS[data_cls]
+
+        cdef dict metadata = {
+            k.decode(): v.decode() for k, v in (batches[0].schema.metadata or {}).items()
+        }
+        if self.tag == Data_t_Tag.BAR:
+            self.bar_type = BarType.from_str_c(metadata["bar_type"])
+            self.instrument_id = self.bar_type.instrument_id
+        else:
+            self.bar_type = None
+            self.instrument_id = InstrumentId.from_str_c(metadata["instrument_id"])
+        self._price_prec = int(metadata["price_precision"])
+        self._size_prec = int(metadata["size_precision"])
+
+        # Validate ordering across all batches (vectorized)
+        ts_init = np.concatenate([b.column("ts_init").to_numpy() for b in batches])
+        Condition.true(
+            bool(np.all(ts_init[1:] >= ts_init[:-1])),
+            "`ts_init` was not monotonically increasing (or non-decreasing)",
+        )
+
+        self.ts_first = ts_init[0]
+        self.ts_last = ts_init[-1]
+        self.size = len(ts_init)
+
+        self._batches = batches
+        self._load_batch(0)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Data:
+        if not self.has_next_c():
+            raise StopIteration
+        return self.next_c()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"data_cls={self.data_cls.__name__}, "
+            f"instrument_id={self.instrument_id}, "
+            f"size={self.size})"
+        )
+
+    cdef void _load_batch(self, Py_ssize_t index):
+        self._batch_index = index
+        self._row = 0
+        if index >= len(self._batches):
+            self._rows = 0
+            return
+
+        batch = self._batches[index]
+        self._rows = batch.num_rows
+        self._ts_event = batch.column("ts_event").to_numpy()
+        self._ts_init = batch.column("ts_init").to_numpy()
+
+        if self.tag == Data_t_Tag.QUOTE:
+            self._price = batch.column("bid_price").to_numpy()
+            self._ask_price = batch.column("ask_price").to_numpy()
+            self._size = batch.column("bid_size").to_numpy()
+            self._ask_size = batch.column("ask_size").to_numpy()
+        elif self.tag == Data_t_Tag.TRADE:
+            self._price = batch.column("price").to_numpy()
+            self._size = batch.column("size").to_numpy()
+            self._side = batch.column("aggressor_side").to_numpy()
+            self._trade_ids = batch.column("trade_id").to_pylist()
+        elif self.tag == Data_t_Tag.BAR:
+            self._price = batch.column("open").to_numpy()
+            self._high = batch.column("high").to_numpy()
+            self._low = batch.column("low").to_numpy()
+            self._close = batch.column("close").to_numpy()
+            self._size = batch.column("volume").to_numpy()
+        elif self.tag == Data_t_Tag.DELTA:
+            self._action = batch.column("action").to_numpy()
+            self._side = batch.column("side").to_numpy()
+            self._price = batch.column("price").to_numpy()
+            self._size = batch.column("size").to_numpy()
+            self._order_id = batch.column("order_id").to_numpy()
+            self._flags = batch.column("flags").to_numpy()
+            self._sequence = batch.column("sequence").to_numpy()
+
+    cdef bint has_next_c(self):
+        return self._row < self._rows
+
+    cdef uint64_t peek_ts_c(self):
+        return self._ts_init[self._row]
+
+    cdef Data next_c(self):
+        cdef Py_ssize_t i = self._row
+        cdef Data data
+        if self.tag == Data_t_Tag.QUOTE:
+            data = QuoteTick.from_raw_c(
+                self.instrument_id,
+                self._price[i],
+                self._ask_price[i],
+                self._price_prec,
+                self._price_prec,
+                self._size[i],
+                self._ask_size[i],
+                self._size_prec,
+                self._size_prec,
+                self._ts_event[i],
+                self._ts_init[i],
+            )
+        elif self.tag == Data_t_Tag.TRADE:
+            data = TradeTick.from_raw_c(
+                self.instrument_id,
+                self._price[i],
+                self._price_prec,
+                self._size[i],
+                self._size_prec,
+                <AggressorSide>self._side[i],
+                TradeId(self._trade_ids[i]),
+                self._ts_event[i],
+                self._ts_init[i],
+            )
+        elif self.tag == Data_t_Tag.BAR:
+            data = Bar.from_mem_c(
+                bar_new_from_raw(
+                    self.bar_type._mem,
+                    self._price[i],
+                    self._high[i],
+                    self._low[i],
+                    self._close[i],
+                    self._price_prec,
+                    self._size[i],
+                    self._size_prec,
+                    self._ts_event[i],
+                    self._ts_init[i],
+                )
+            )
+        else:  # Data_t_Tag.DELTA
+            data = OrderBookDelta.from_raw_c(
+                self.instrument_id,
+                <BookAction>self._action[i],
+                <OrderSide>self._side[i],
+                self._price[i],
+                self._price_prec,
+                self._size[i],
+                self._size_prec,
+                self._order_id[i],
+                self._flags[i],
+                self._sequence[i],
+                self._ts_event[i],
+                self._ts_init[i],
+            )
+
+        self._row += 1
+        if self._row >= self._rows:
+            self._load_batch(self._batch_index + 1)
+
+        return data
+
+    cdef void skip_until_c(self, uint64_t ts):
+        # Skips whole batches where possible without constructing any objects
+        while self._row < self._rows and self._ts_init[self._rows - 1] < ts:
+            self._load_batch(self._batch_index + 1)
+        while self._row < self._rows and self._ts_init[self._row] < ts:
+            self._row += 1
+
+    cpdef void reset(self):
+        """
+        Reset the source to its first element.
+
+        """
+        self._load_batch(0)
+
+
+cdef class ArrowDataStream:
+    """
+    Provides a `ts_init` ordered stream of Nautilus data merged from many
+    columnar `ArrowDataSource` objects.
+
+    Each source carries a precomputed type tag, which is exposed for the last
+    returned element so that consumers can dispatch without type checks.
+
+    Parameters
+    ----------
+    sources : list[ArrowDataSource], optional
+        The initial sources for the stream.
+
+    Warnings
+    --------
+    Selecting the next element scans the head of every source, so the cost per
+    element is proportional to the number of sources.
+
+    """
+
+    def __init__(self, list sources = None):
+        self._sources = []
+        self._current = None
+        self.tag = Data_t_Tag.DELTA
+
+        cdef ArrowDataSource source
+        for source in sources or []:
+            self.add_source(source)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Data:
+        if not self.has_next_c():
+            raise StopIteration
+        return self.next_c()
+
+    @property
+    def sources(self) -> list[ArrowDataSource]:
+        """
+        Return the sources for the stream.
+
+        Returns
+        -------
+        list[ArrowDataSource]
+
+        """
+        return self._sources.copy()
+
+    @property
+    def size(self) -> int:
+        """
+        Return the total number of elements for all sources of the stream.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum([source.size for source in self._sources])
+
+    @property
+    def ts_first(self) -> int | None:
+        """
+        Return the UNIX timestamp (nanoseconds) of the first element of the stream.
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        return min([source.ts_first for source in self._sources], default=None)
+
+    @property
+    def ts_last(self) -> int | None:
+        """
+        Return the UNIX timestamp (nanoseconds) of the last element of the stream.
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        return max([source.ts_last for source in self._sources], default=None)
+
+    cpdef void add_source(self, ArrowDataSource source):
+        """
+        Add the given source to the stream.
+
+        Parameters
+        ----------
+        source : ArrowDataSource
+            The source to add.
+
+        """
+        Condition.not_none(source, "source")
+
+        self._sources.append(source)
+        self._select_next()
+
+    cpdef void reset(self):
+        """
+        Reset every source of the stream to its first element.
+
+        """
+        cdef ArrowDataSource source
+        for source in self._sources:
+            source.reset()
+        self._select_next()
+
+    cpdef void clear(self):
+        """
+        Clear all sources from the stream.
+
+        """
+        self._sources.clear()
+        self._current = None
+
+    cdef void _select_next(self):
+        # Ties are resolved in the order the sources were added
+        cdef ArrowDataSource selected = None
+        cdef ArrowDataSource source
+        for source in self._sources:
+            if not source.has_next_c():
+                continue
+            if selected is None or source.peek_ts_c() < selected.peek_ts_c():
+                selected = source
+        self._current = selected
+
+    cdef bint has_next_c(self):
+        return self._current is not None
+
+    cdef uint64_t peek_ts_c(self):
+        return self._current.peek_ts_c()
+
+    cdef Data next_c(self):
+        cdef ArrowDataSource source = self._current
+        self.tag = source.tag
+        cdef Data data = source.next_c()
+        self._select_next()
+        return data
+
+    cdef void skip_until_c(self, uint64_t ts):
+        cdef ArrowDataSource source
+        for source in self._sources:
+            source.skip_until_c(ts)
+        self._select_next()
+
+
+cdef inline uint64_t _data_ts_init(Data_t* data):
+    if data.tag == Data_t_Tag.QUOTE:
+        return data.quote.ts_init
+    elif data.tag == Data_t_Tag.TRADE:
+        return data.trade.ts_init
+    elif data.tag == Data_t_Tag.BAR:
+        return data.bar.ts_init
+    else:  # Data_t_Tag.DELTA
+        return data.delta.ts_init
+
+
+cdef class CapsuleDataStream:
+    """
+    Provides a `ts_init` ordered stream of Nautilus data decoded on the fly
+    from an iterator of data capsules.
+
+    Each capsule wraps a chunk of Rust `Data_t` values, such as the chunks
+    yielded from the k-merge of a `DataQueryResult`. Only the current chunk is
+    held at any one time, and each Nautilus object is only constructed as the
+    stream is consumed, so memory is bounded by the chunk size rather than
+    the length of the stream.
+
+    Parameters
+    ----------
+    chunks : Iterable
+        The data capsules for the stream.
+        The data must be ordered by `ts_init` within and across all chunks.
+
+    Warnings
+    --------
+    The stream can only be consumed once (it cannot be reset).
+
+    """
+
+    def __init__(self, chunks not None):
+        self._chunks = iter(chunks)
+        self._chunk = None
+        self._ptr = NULL
+        self._len = 0
+        self._row = 0
+        self.tag = Data_t_Tag.DELTA
+        self.count = 0
+
+        self._load_next_chunk()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Data:
+        if not self.has_next_c():
+            raise StopIteration
+        return self.next_c()
+
+    @property
+    def ts_first(self) -> int | None:
+        """
+        Return the UNIX timestamp (nanoseconds) of the next element of the stream.
+
+        Returns
+        -------
+        int or ``None``
+
+        """
+        if not self.has_next_c():
+            return None
+        return self.peek_ts_c()
+
+    cdef void _load_next_chunk(self):
+        # Each capsule owns its chunk, so holding the capsule keeps `_ptr` valid
+        # (replacing it releases the previous chunk)
+        self._chunk = next(self._chunks, None)
+        self._row = 0
+        if self._chunk is None:
+            self._ptr = NULL
+            self._len = 0
+            return
+
+        cdef CVec* cvec = <CVec*>PyCapsule_GetPointer(self._chunk, NULL)
+        self._ptr = <Data_t*>cvec.ptr
+        self._len = cvec.len
+        if self._len == 0:
+            self._load_next_chunk()
+
+    cdef bint has_next_c(self):
+        return self._row < self._len
+
+    cdef uint64_t peek_ts_c(self):
+        return _data_ts_init(&self._ptr[self._row])
+
+    cdef Data next_c(self):
+        cdef Data_t* raw = &self._ptr[self._row]
+        self.tag = raw.tag
+
+        cdef Data data
+        if raw.tag == Data_t_Tag.QUOTE:
+            data = QuoteTick.from_mem_c(raw.quote)
+        elif raw.tag == Data_t_Tag.TRADE:
+            data = TradeTick.from_mem_c(raw.trade)
+        elif raw.tag == Data_t_Tag.BAR:
+            data = Bar.from_mem_c(raw.bar)
+        else:  # Data_t_Tag.DELTA
+            data = OrderBookDelta.from_mem_c(raw.delta)
+
+        # The element is copied into the object, so the chunk can now be released
+        self.count += 1
+        self._row += 1
+        if self._row >= self._len:
+            self._load_next_chunk()
+
+        return data
+
+    cdef void skip_until_c(self, uint64_t ts):
+        while self.has_next_c() and self.peek_ts_c() < ts:
+            self._row += 1
+            if self._row >= self._len:
+                self._load_next_chunk()
@@ -16,6 +16,8 @@
 from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
+from nautilus_trader.backtest.data_stream cimport ArrowDataStream
+from nautilus_trader.backtest.data_stream cimport CapsuleDataStream
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.logging cimport Logger
 from nautilus_trader.common.logging cimport LoggerAdapter
@@ -45,10 +47,15 @@ cdef class BacktestEngine:
 
     cdef dict _venues
     cdef list _data
+    cdef bint _data_sort_pending
+    cdef ArrowDataStream _data_stream
+    cdef CapsuleDataStream _capsule_stream
+    cdef int _data_tag
     cdef uint64_t _data_len
     cdef uint64_t _index
     cdef uint64_t _iteration
 
+    cdef void _sort_data(self)
     cdef Data _next(self)
     cdef CVec _advance_time(self, uint64_t ts_now, list clocks)
     cdef void _process_raw_time_event_handlers(
@@ -15,6 +15,7 @@
 
 import pickle
 from decimal import Decimal
+from operator import attrgetter
 from typing import Optional
 from typing import Union
 
@@ -29,15 +30,22 @@ from nautilus_trader.config import DataEngineConfig
 from nautilus_trader.config import ExecEngineConfig
 from nautilus_trader.config import RiskEngineConfig
 from nautilus_trader.config.error import InvalidConfiguration
-from nautilus_trader.model import NAUTILUS_PYO3_DATA_TYPES
+from nautilus_trader.core.nautilus_pyo3 import Bar as RustBar
+from nautilus_trader.core.nautilus_pyo3 import OrderBookDelta as RustOrderBookDelta
+from nautilus_trader.core.nautilus_pyo3 import QuoteTick as RustQuoteTick
+from nautilus_trader.core.nautilus_pyo3 import TradeTick as RustTradeTick
 from nautilus_trader.system.kernel import NautilusKernel
 from nautilus_trader.trading.trader import Trader
 
 from cpython.datetime cimport datetime
+from libc.stdint cimport UINT64_MAX
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.backtest.data_client cimport BacktestDataClient
 from nautilus_trader.backtest.data_client cimport BacktestMarketDataClient
+from nautilus_trader.backtest.data_stream cimport ArrowDataSource
+from nautilus_trader.backtest.data_stream cimport ArrowDataStream
+from nautilus_trader.backtest.data_stream cimport CapsuleDataStream
 from nautilus_trader.backtest.exchange cimport SimulatedExchange
 from nautilus_trader.backtest.execution_client cimport BacktestExecClient
 from nautilus_trader.backtest.models cimport FillModel
@@ -68,6 +76,7 @@ from nautilus_trader.core.rust.core cimport CVec
 from nautilus_trader.core.rust.model cimport AccountType
 from nautilus_trader.core.rust.model cimport AggregationSource
 from nautilus_trader.core.rust.model cimport BookType
+from nautilus_trader.core.rust.model cimport Data_t_Tag
 from nautilus_trader.core.rust.model cimport OmsType
 from nautilus_trader.core.uuid cimport UUID4
 from nautilus_trader.execution.algorithm cimport ExecAlgorithm
@@ -91,6 +100,14 @@ from nautilus_trader.portfolio.base cimport PortfolioFacade
 from nautilus_trader.trading.strategy cimport Strategy
 
 
+_PYO3_DATA_CONVERTERS = {
+    RustOrderBookDelta: OrderBookDelta.from_pyo3,
+    RustQuoteTick: QuoteTick.from_pyo3,
+    RustTradeTick: TradeTick.from_pyo3,
+    RustBar: Bar.from_pyo3,
+}
+
+
 cdef class BacktestEngine:
     """
     Provides a backtest engine to run a portfolio of strategies over historical
@@ -125,6 +142,10 @@ cdef class BacktestEngine:
         # Venues and data
         self._venues: dict[Venue, SimulatedExchange] = {}
         self._data: list[Data] = []
+        self._data_sort_pending = False
+        self._data_stream = ArrowDataStream()
+        self._capsule_stream = None
+        self._data_tag = -1
         self._data_len: uint64_t = 0
         self._index: uint64_t = 0
         self._iteration: uint64_t = 0
@@ -318,6 +339,7 @@ cdef class BacktestEngine:
         list[Data]
 
         """
+        self._sort_data()
         return self._data.copy()
 
     @property
@@ -574,6 +596,8 @@ cdef class BacktestEngine:
         sort : bool, default True
             If `data` should be sorted by `ts_init` with the rest of the stream after adding
             (recommended when adding data directly to the engine).
+            The sort is deferred until the stream is next accessed, so that
+            multiple sorted batches are merged in a single pass.
 
         Raises
         ------
@@ -585,26 +609,26 @@ cdef class BacktestEngine:
             If `instrument_id` for the data is not found in the cache.
         ValueError
             If `data` elements do not have an `instrument_id` and `client_id` is ``None``.
-        TypeError
-            If `data` is a type provided by Rust pyo3 (cannot add directly to engine yet).
 
         Warnings
         --------
         Assumes all data elements are of the same type. Adding lists of varying
         data types could result in incorrect backtest logic.
 
+        Data of types provided by Rust pyo3 is converted to the equivalent
+        Cython objects before being added.
+
         Caution if adding data without `sort` being True, as this could lead to running backtests
         on a stream which does not have monotonically increasing timestamps.
 
         """
         Condition.not_empty(data, "data")
-        Condition.list_type(data, Data, "data")
 
-        if isinstance(data[0], NAUTILUS_PYO3_DATA_TYPES):
-            raise TypeError(
-                f"Cannot add data of type `{type(data[0]).__name__}` from pyo3 directly to engine. "
-                "This will supported in a future release.",
-            )
+        pyo3_converter = _PYO3_DATA_CONVERTERS.get(type(data[0]))
+        if pyo3_converter is not None:
+            data = pyo3_converter(data)
+
+        Condition.list_type(data, Data, "data")
 
         cdef str data_added_str = "data"
 
@@ -640,16 +664,114 @@ cdef class BacktestEngine:
                 if isinstance(first, GenericData):
                     data_added_str = f"{type(first.data).__name__} "
 
+        if not sort:
+            # Apply any pending sort so unsorted data is appended to a sorted stream
+            self._sort_data()
+
         # Add data
         self._data.extend(data)
 
         if sort:
-            self._data = sorted(self._data, key=lambda x: x.ts_init)
+            self._data_sort_pending = True
 
         self._log.info(
             f"Added {len(data):,} {data_added_str} element{'' if len(data) == 1 else 's'}.",
         )
 
+    def add_arrow_data(self, data, type data_cls, bint validate = True) -> None:
+        """
+        Add the given Arrow data to the backtest engine as a columnar data source.
+
+        Unlike `add_data`, the data is held in its columnar form and each Nautilus
+        object is only constructed from its row as the backtest reaches it. The
+        source is merged by `ts_init` with the rest of the data stream, and is
+        dispatched using a type tag precomputed for the source.
+
+        Parameters
+        ----------
+        data : pa.Table | list[pa.RecordBatch]
+            The Arrow data in the Nautilus Parquet/Arrow schema for `data_cls`,
+            for a single instrument or bar type (as written to a data catalog).
+        data_cls : type
+            The data type (one of `OrderBookDelta`, `QuoteTick`, `TradeTick` or `Bar`).
+        validate : bool, default True
+            If the instrument for `data` should be validated.
+
+        Raises
+        ------
+        KeyError
+            If `data_cls` is not a supported Arrow data type.
+        ValueError
+            If `data` is empty.
+        ValueError
+            If the `ts_init` values of `data` are not monotonically increasing (or non-decreasing).
+        ValueError
+            If `instrument_id` for the data is not found in the cache.
+
+        Warnings
+        --------
+        Columnar data sources are not included in the `data` property or
+        `dump_pickled_data`.
+
+        """
+        cdef ArrowDataSource source = ArrowDataSource(data_cls, data)
+
+        if validate:
+            Condition.true(
+                source.instrument_id in self.kernel.cache.instrument_ids(),
+                f"`Instrument` {source.instrument_id} for the given data not found in the cache. "
+                "Add the instrument through `add_instrument()` prior to adding related data.",
+            )
+            if source.bar_type is not None:
+                Condition.equal(
+                    source.bar_type.aggregation_source,
+                    AggregationSource.EXTERNAL,
+                    "bar_type.aggregation_source",
+                    "required source",
+                )
+            # Check client has been registered
+            self._add_market_data_client_if_not_exists(source.instrument_id.venue)
+
+        self._data_stream.add_source(source)
+
+        self._log.info(
+            f"Added {source.size:,} {source.bar_type or source.instrument_id} "
+            f"{data_cls.__name__} element{'' if source.size == 1 else 's'} (columnar).",
+        )
+
+    def add_capsule_stream(self, chunks) -> None:
+        """
+        Add the given iterator of data capsules to the backtest engine as a
+        streaming data source.
+
+        The chunks are consumed directly by the main backtest loop as it
+        reaches them, with each Nautilus object decoded on the fly. Only the
+        current chunk is held, so a stream of any length runs in memory
+        bounded by the chunk size. The stream is merged by `ts_init` with the
+        rest of the data stream.
+
+        Parameters
+        ----------
+        chunks : Iterable
+            The data capsules, such as a `DataQueryResult` from a `DataBackendSession`.
+            The data must be ordered by `ts_init` within and across all chunks.
+
+        Warnings
+        --------
+        Only one capsule stream can be added, and it can only be consumed once,
+        so the engine cannot be reset and rerun over the same stream.
+
+        The data is not validated, all required instruments must be added to
+        the engine prior to running.
+
+        """
+        Condition.not_none(chunks, "chunks")
+        Condition.none(self._capsule_stream, "_capsule_stream")
+
+        self._capsule_stream = CapsuleDataStream(chunks)
+
+        self._log.info("Added capsule data stream.")
+
     def dump_pickled_data(self) -> bytes:
         """
         Return the internal data stream pickled.
@@ -659,6 +781,7 @@ cdef class BacktestEngine:
         bytes
 
         """
+        self._sort_data()
         return pickle.dumps(self._data)
 
     def load_pickled_data(self, bytes data) -> None:
@@ -680,6 +803,7 @@ cdef class BacktestEngine:
         Condition.not_none(data, "data")
 
         self._data = pickle.loads(data)
+        self._data_sort_pending = False
 
         self._log.info(
             f"Loaded {len(self._data):,} data "
@@ -815,6 +939,7 @@ cdef class BacktestEngine:
         # Reset timing
         self._iteration = 0
         self._index = 0
+        self._data_stream.reset()
         self._run_started = None
         self._run_finished = None
         self._backtest_start = None
@@ -830,6 +955,9 @@ cdef class BacktestEngine:
 
         """
         self._data.clear()
+        self._data_sort_pending = False
+        self._data_stream.clear()
+        self._capsule_stream = None
         self._data_len = 0
         self._index = 0
 
@@ -971,7 +1099,7 @@ cdef class BacktestEngine:
             backtest_start=maybe_dt_to_unix_nanos(self._backtest_start),
             backtest_end=maybe_dt_to_unix_nanos(self._backtest_end),
             elapsed_time=(self._backtest_end - self._backtest_start).total_seconds(),
-            iterations=self._index,
+            iterations=self._iteration,
             total_events=self._kernel.exec_engine.event_count,
             total_orders=self._kernel.cache.orders_total_count(),
             total_positions=self._kernel.cache.positions_total_count(),
@@ -987,23 +1115,40 @@ cdef class BacktestEngine:
     ):
         cdef uint64_t start_ns
         cdef uint64_t end_ns
+        self._sort_data()
+        cdef bint has_capsule_stream = self._capsule_stream is not None and self._capsule_stream.has_next_c()
+        Condition.true(
+            len(self._data) > 0 or self._data_stream.size > 0 or has_capsule_stream,
+            "the data was empty",
+        )
         # Time range check and set
         if start is None:
-            # Set `start` to start of data
-            start_ns = self._data[0].ts_init
+            # Set `start` to start of data (including any columnar and capsule data sources)
+            start_ns = min([
+                ts for ts in (
+                    self._data[0].ts_init if self._data else None,
+                    self._data_stream.ts_first,
+                    self._capsule_stream.ts_first if has_capsule_stream else None,
+                )
+                if ts is not None
+            ])
             start = unix_nanos_to_dt(start_ns)
         else:
             start = pd.to_datetime(start, utc=True)
             start_ns = start.value
-        if end is None:
-            # Set `end` to end of data
-            end_ns = self._data[-1].ts_init
+        if end is None and has_capsule_stream:
+            # The end of a capsule stream is only known once it is consumed
+            end_ns = UINT64_MAX
+        elif end is None:
+            # Set `end` to end of data (including any columnar data sources)
+            end_ns = self._data[-1].ts_init if self._data else self._data_stream.ts_last
+            if self._data_stream.ts_last is not None:
+                end_ns = max(end_ns, self._data_stream.ts_last)
             end = unix_nanos_to_dt(end_ns)
         else:
             end = pd.to_datetime(end, utc=True)
             end_ns = end.value
         Condition.true(start_ns < end_ns, "start was >= end")
-        Condition.not_empty(self._data, "data")
 
         # Gather clocks
         cdef list clocks = [self.kernel.clock]
@@ -1059,6 +1204,11 @@ cdef class BacktestEngine:
                 self._index = i
                 break
 
+        # Set starting position for columnar and capsule data sources
+        self._data_stream.skip_until_c(start_ns)
+        if has_capsule_stream:
+            self._capsule_stream.skip_until_c(start_ns)
+
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
         cdef uint64_t last_ns = 0
@@ -1077,7 +1227,20 @@ cdef class BacktestEngine:
                     raw_handlers_count = raw_handlers.len
 
                 # Process data through venue
-                if isinstance(data, OrderBookDelta):
+                if self._data_tag == Data_t_Tag.QUOTE:
+                    # Columnar data sources are dispatched on their precomputed type tag
+                    venue = self._venues[(<QuoteTick>data).instrument_id.venue]
+                    venue.process_quote_tick(<QuoteTick>data)
+                elif self._data_tag == Data_t_Tag.TRADE:
+                    venue = self._venues[(<TradeTick>data).instrument_id.venue]
+                    venue.process_trade_tick(<TradeTick>data)
+                elif self._data_tag == Data_t_Tag.BAR:
+                    venue = self._venues[(<Bar>data).bar_type.instrument_id.venue]
+                    venue.process_bar(<Bar>data)
+                elif self._data_tag == Data_t_Tag.DELTA:
+                    venue = self._venues[(<OrderBookDelta>data).instrument_id.venue]
+                    venue.process_order_book_delta(<OrderBookDelta>data)
+                elif isinstance(data, OrderBookDelta):
                     venue = self._venues[data.instrument_id.venue]
                     venue.process_order_book_delta(data)
                 elif isinstance(data, OrderBookDeltas):
@@ -1143,10 +1306,43 @@ cdef class BacktestEngine:
             )
             vec_time_event_handlers_drop(raw_handlers)
 
+    cdef void _sort_data(self):
+        if not self._data_sort_pending:
+            return
+
+        # Each added batch is typically already sorted, forming a run in the
+        # stream which the stable in-place sort detects and merges. This is a
+        # single O(N log k) merge over k batches, rather than a full re-sort of
+        # the accumulated stream on every call to `add_data`.
+        self._data.sort(key=attrgetter("ts_init"))
+        self._data_sort_pending = False
+
     cdef Data _next(self):
         cdef uint64_t cursor = self._index
+        cdef bint has_data = cursor < self._data_len
+        cdef uint64_t ts_next = self._data[cursor].ts_init if has_data else 0
+        cdef Data data
+
+        if self._capsule_stream is not None and self._capsule_stream.has_next_c():
+            if (not has_data or self._capsule_stream.peek_ts_c() < ts_next) and (
+                not self._data_stream.has_next_c()
+                or self._capsule_stream.peek_ts_c() < self._data_stream.peek_ts_c()
+            ):
+                data = self._capsule_stream.next_c()
+                self._data_tag = self._capsule_stream.tag
+                return data
+
+        if self._data_stream.has_next_c() and (
+            not has_data
+            or self._data_stream.peek_ts_c() < ts_next
+        ):
+            data = self._data_stream.next_c()
+            self._data_tag = self._data_stream.tag
+            return data
+
+        self._data_tag = -1  # Dispatch on type
         self._index += 1
-        if cursor < self._data_len:
+        if has_data:
             return self._data[cursor]
 
     cdef CVec _advance_time(self, uint64_t ts_now, list clocks):
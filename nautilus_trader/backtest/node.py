@@ -13,9 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import multiprocessing
+import tempfile
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 from decimal import Decimal
 
 import pandas as pd
+import pyarrow as pa
 
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.engine import BacktestEngineConfig
@@ -30,7 +36,9 @@ from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.model.data import Bar
-from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.enums import book_type_from_str
@@ -40,7 +48,9 @@ from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.shared import SharedDataStore
 from nautilus_trader.persistence.catalog.types import CatalogDataResult
+from nautilus_trader.persistence.funcs import class_to_filename
 
 
 class BacktestNode:
@@ -74,6 +84,7 @@ class BacktestNode:
         # Configuration
         self._configs: list[BacktestRunConfig] = configs
         self._engines: dict[str, BacktestEngine] = {}
+        self._shared_store: SharedDataStore | None = None
 
     @property
     def configs(self) -> list[BacktestRunConfig]:
@@ -114,20 +125,58 @@ class BacktestNode:
         """
         return list(self._engines.values())
 
-    def run(self) -> list[BacktestResult]:
+    def run(
+        self,
+        max_workers: int | None = None,
+        shared_data: bool = False,
+    ) -> list[BacktestResult]:
         """
-        Run the backtest node which will synchronously execute the list of loaded
-        backtest run configs.
+        Run the backtest node which will execute the list of loaded backtest run
+        configs.
+
+        If `max_workers` is greater than one then each run config is shipped to
+        a separate worker process, where its `BacktestEngine` is built and run,
+        otherwise the run configs are executed synchronously in this process.
 
         Any exceptions raised from a backtest will be printed to stdout and
         the next backtest run will commence (if any).
 
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker processes to execute the runs with.
+            If ``None`` or ``1`` then runs are executed synchronously.
+        shared_data : bool, default False
+            If data should be shared between worker processes. When enabled each
+            distinct data config is queried from the catalog once, and written to
+            a host local memory-mapped Arrow store which all workers attach to
+            (zero-copy), decoding to Nautilus objects only within each engine.
+            Only applicable when executing with multiple worker processes and
+            for non-streaming runs of Nautilus data types.
+
         Returns
         -------
         list[BacktestResult]
-            The results of the backtest runs.
+            The results of the backtest runs (in run config order).
+
+        Raises
+        ------
+        ValueError
+            If `max_workers` is not a positive integer.
+
+        Warnings
+        --------
+        When executing with multiple worker processes the engines are created
+        and disposed within each worker, and so will not be available from
+        `get_engine` or `get_engines` after the run.
 
         """
+        if max_workers is not None:
+            PyCondition.positive_int(max_workers, "max_workers")
+
+        if max_workers is not None and max_workers > 1:
+            return self._run_parallel(max_workers=max_workers, shared_data=shared_data)
+
         results: list[BacktestResult] = []
         for config in self._configs:
             try:
@@ -146,6 +195,55 @@ class BacktestNode:
 
         return results
 
+    def _run_parallel(self, max_workers: int, shared_data: bool) -> list[BacktestResult]:
+        with tempfile.TemporaryDirectory(prefix="nautilus-shared-data-") as shared_path:
+            if shared_data:
+                self._write_shared_data(SharedDataStore(shared_path))
+
+            # Use a spawn context so workers do not inherit threads or Rust runtime
+            # state from the parent process (fork is unsafe in this case)
+            context = multiprocessing.get_context("spawn")
+            results: dict[int, BacktestResult] = {}
+
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(self._configs)),
+                mp_context=context,
+            ) as executor:
+                futures: dict[Future, int] = {
+                    executor.submit(
+                        _run_config,
+                        config,
+                        shared_path if shared_data else None,
+                    ): i
+                    for i, config in enumerate(self._configs)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    config = self._configs[i]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        # Broad catch all prevents a single backtest run from halting
+                        # the collection of results from the other backtests.
+                        print(f"Error running {config}: {e}")
+
+        return [results[i] for i in sorted(results)]
+
+    def _write_shared_data(self, store: SharedDataStore) -> None:
+        for config in self._configs:
+            if config.batch_size_bytes is not None:
+                continue  # Streaming runs read directly from the catalog
+
+            for data_config in config.data:
+                if not is_nautilus_class(data_config.data_type):
+                    continue  # Generic data is loaded by each engine
+                if store.contains(data_config.id):
+                    continue  # Already queried for another run config
+
+                table = self.load_data_table(data_config)
+                if table is not None:
+                    store.put(data_config.id, table)
+
     def _validate_configs(self, configs: list[BacktestRunConfig]) -> None:
         venue_ids: list[Venue] = []
         for config in configs:
@@ -298,19 +396,9 @@ class BacktestNode:
                 session=session,
             )
 
-        # Stream data
-        for chunk in session.to_query_result():
-            engine.add_data(
-                data=capsule_to_list(chunk),
-                validate=False,  # Cannot validate mixed type stream
-                sort=True,  # Temporarily sorting  # Already sorted from kmerge
-            )
-            engine.run(
-                run_config_id=run_config_id,
-                streaming=True,
-            )
-
-        engine.end()
+        # Stream data (the engine consumes the k-merged chunks directly)
+        engine.add_capsule_stream(session.to_query_result())
+        engine.run(run_config_id=run_config_id)
         engine.dispose()
 
     def _run_oneshot(
@@ -325,12 +413,24 @@ class BacktestNode:
             engine._log.info(
                 f"Reading {config.data_type} data for instrument={config.instrument_id}.",
             )
-            result: CatalogDataResult = self.load_data_config(config)
+            result: CatalogDataResult
+            if self._shared_store is not None and self._shared_store.contains(config.id):
+                result = self.load_shared_data_config(config, self._shared_store)
+            else:
+                result = self.load_data_config(config)
             if config.instrument_id and result.instrument is None:
                 engine._log.warning(
                     f"Requested instrument_id={result.instrument} from data_config not found in catalog",
                 )
                 continue
+            if result.table is not None:
+                # Rows are only decoded as the backtest reaches them
+                engine.add_arrow_data(result.table, data_cls=result.data_cls)
+                engine._log.info(
+                    f"Added {result.table.num_rows:,} rows from the shared data store "
+                    f"in {pd.Timedelta(pd.Timestamp.now() - t0)}s.",
+                )
+                continue
             if not result.data:
                 engine._log.warning(f"No data found for {config}")
                 continue
@@ -373,7 +473,123 @@ class BacktestNode:
             client_id=ClientId(config.client_id) if config.client_id else None,
         )
 
+    @classmethod
+    def load_data_table(cls, config: BacktestDataConfig) -> pa.Table | None:
+        """
+        Return the undecoded Arrow table for the given data config from its catalog.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data configuration to query.
+
+        Returns
+        -------
+        pa.Table or ``None``
+            ``None`` if no data exists for the configuration.
+
+        """
+        catalog: ParquetDataCatalog = cls.load_catalog(config)
+        dataset_path = f"{catalog.path}/data/{class_to_filename(config.data_type)}"
+        if not catalog.fs.exists(dataset_path):
+            return None
+
+        query = config.query
+        filter_expr = query["filter_expr"]
+        instrument_ids = query["instrument_ids"]
+        if config.data_type == Bar and config.bar_spec:
+            # Bar types are not stored in the table, need to filter based on files
+            filter_expr = None
+            instrument_ids = [f"{config.instrument_id}-{config.bar_spec}-EXTERNAL"]
+
+        return catalog._load_pyarrow_table(
+            path=dataset_path,
+            filter_expr=filter_expr,
+            instrument_ids=instrument_ids,
+            start=query["start"],
+            end=query["end"],
+        )
+
+    @classmethod
+    def load_shared_data_config(
+        cls,
+        config: BacktestDataConfig,
+        store: SharedDataStore,
+    ) -> CatalogDataResult:
+        """
+        Return the data for the given data config from the shared data store.
+
+        If the data is for a single instrument (or bar type) of a type supported by
+        `BacktestEngine.add_arrow_data`, then the memory-mapped table is returned
+        undecoded (so each row is only decoded as the backtest reaches it), otherwise
+        the table is decoded to Nautilus objects.
+
+        Parameters
+        ----------
+        config : BacktestDataConfig
+            The data configuration to load.
+        store : SharedDataStore
+            The shared data store holding the queried table.
+
+        Returns
+        -------
+        CatalogDataResult
+
+        """
+        catalog: ParquetDataCatalog = cls.load_catalog(config)
+
+        instruments = (
+            catalog.instruments(instrument_ids=[config.instrument_id])
+            if config.instrument_id
+            else None
+        )
+        if config.instrument_id and not instruments:
+            return CatalogDataResult(data_cls=config.data_type, data=[])
+
+        table = store.get(config.id)
+        if table is None or table.num_rows == 0:
+            return CatalogDataResult(data_cls=config.data_type, data=[])
+
+        if cls._is_single_arrow_source(config):
+            return CatalogDataResult(
+                data_cls=config.data_type,
+                data=[],
+                instrument=instruments[0] if instruments else None,
+                client_id=ClientId(config.client_id) if config.client_id else None,
+                table=table,
+            )
+
+        return CatalogDataResult(
+            data_cls=config.data_type,
+            data=ParquetDataCatalog._handle_table_nautilus(table, data_cls=config.data_type),
+            instrument=instruments[0] if instruments else None,
+            client_id=ClientId(config.client_id) if config.client_id else None,
+        )
+
+    @staticmethod
+    def _is_single_arrow_source(config: BacktestDataConfig) -> bool:
+        # Columnar sources must hold a single instrument (or bar type) of a Rust data type
+        if config.data_type not in (OrderBookDelta, QuoteTick, TradeTick, Bar):
+            return False
+        if config.instrument_id is None:
+            return False
+        return config.data_type != Bar or config.bar_spec is not None
+
     def dispose(self):
         for engine in self.get_engines():
             if not engine.trader.is_disposed:
                 engine.dispose()
+
+
+def _run_config(config: BacktestRunConfig, shared_path: str | None = None) -> BacktestResult:
+    # Entry point for a worker process (must be importable at module level)
+    node = BacktestNode(configs=[config])
+    if shared_path is not None:
+        node._shared_store = SharedDataStore(shared_path)
+    return node._run(
+        run_config_id=config.id,
+        engine_config=config.engine,
+        venue_configs=config.venues,
+        data_configs=config.data,
+        batch_size_bytes=config.batch_size_bytes,
+    )
@@ -17,7 +17,7 @@ from cpython.datetime cimport datetime
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.base cimport CacheFacade
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.actor cimport Actor
@@ -54,10 +54,10 @@ from nautilus_trader.trading.strategy cimport Strategy
 cdef class Cache(CacheFacade):
     cdef LoggerAdapter _log
     cdef CacheDatabaseFacade _database
-    cdef ExchangeRateCalculator _xrate_calculator
 
     cdef dict _general
     cdef dict _xrate_symbols
+    cdef dict _xrate_graphs
     cdef dict _tickers
     cdef dict _quote_ticks
     cdef dict _trade_ticks
@@ -101,6 +101,8 @@ cdef class Cache(CacheFacade):
     cdef set _index_actors
     cdef set _index_strategies
     cdef set _index_exec_algorithms
+    cdef set _orders_unloaded
+    cdef set _positions_unloaded
 
     cdef readonly int tick_capacity
     """The caches tick capacity.\n\n:returns: `int`"""
@@ -110,6 +112,8 @@ cdef class Cache(CacheFacade):
     """If order state snapshots should be persisted.\n\n:returns: `bool`"""
     cdef readonly bint snapshot_positions
     """If position state snapshots should be persisted.\n\n:returns: `bool`"""
+    cdef readonly bint warm_start
+    """If only open orders and positions are loaded from the database on start.\n\n:returns: `bool`"""
 
     cpdef void cache_general(self)
     cpdef void cache_currencies(self)
@@ -126,11 +130,17 @@ cdef class Cache(CacheFacade):
     cpdef void reset(self)
     cpdef void flush_db(self)
 
-    cdef tuple _build_quote_table(self, Venue venue)
+    cdef void _update_xrate(self, InstrumentId instrument_id)
     cdef void _build_index_venue_account(self)
     cdef void _cache_venue_account_id(self, AccountId account_id)
     cdef void _build_indexes_from_orders(self)
     cdef void _build_indexes_from_positions(self)
+    cdef void _index_order(self, Order order)
+    cdef void _index_position(self, Position position)
+    cdef Order _load_order(self, ClientOrderId client_order_id)
+    cdef Position _load_position(self, PositionId position_id)
+    cdef void _load_unloaded_orders(self)
+    cdef void _load_unloaded_positions(self)
     cdef set _build_order_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef set _build_position_query_filter_set(self, Venue venue, InstrumentId instrument_id, StrategyId strategy_id)
     cdef list _get_orders_for_ids(self, set client_order_ids, OrderSide side)
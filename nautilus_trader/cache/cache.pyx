@@ -28,7 +28,7 @@ from libc.stdint cimport uint8_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
-from nautilus_trader.accounting.calculators cimport ExchangeRateCalculator
+from nautilus_trader.accounting.calculators cimport ExchangeRateGraph
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
 from nautilus_trader.common.logging cimport LogColor
 from nautilus_trader.common.logging cimport Logger
@@ -106,17 +106,18 @@ cdef class Cache(CacheFacade):
 
         self._database = database
         self._log = LoggerAdapter(component_name=type(self).__name__, logger=logger)
-        self._xrate_calculator = ExchangeRateCalculator()
 
         # Configuration
         self.tick_capacity = config.tick_capacity
         self.bar_capacity = config.bar_capacity
         self.snapshot_orders = snapshot_orders
         self.snapshot_positions = snapshot_positions
+        self.warm_start = config.warm_start
 
         # Caches
         self._general: dict[str, bytes] = {}
         self._xrate_symbols: dict[InstrumentId, str] = {}
+        self._xrate_graphs: dict[Venue, ExchangeRateGraph] = {}
         self._tickers: dict[InstrumentId, deque[Ticker]] = {}
         self._quote_ticks: dict[InstrumentId, deque[QuoteTick]] = {}
         self._trade_ticks: dict[InstrumentId, deque[TradeTick]] = {}
@@ -162,6 +163,10 @@ cdef class Cache(CacheFacade):
         self._index_strategies: set[StrategyId] = set()
         self._index_exec_algorithms: set[ExecAlgorithmId] = set()
 
+        # Closed objects not yet loaded from the database (warm start)
+        self._orders_unloaded: set[ClientOrderId] = set()
+        self._positions_unloaded: set[PositionId] = set()
+
         self._log.info("READY.")
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -264,11 +269,19 @@ cdef class Cache(CacheFacade):
     cpdef void cache_orders(self):
         """
         Clear the current orders cache and load orders from the cache database.
+
+        If `warm_start` then only open orders are loaded, with closed orders
+        loaded on first access.
         """
         self._log.debug(f"Loading orders from database...")
 
+        self._orders_unloaded = set()
         if self._database is not None:
-            self._orders = self._database.load_orders()
+            if self.warm_start:
+                self._orders = self._database.load_open_orders()
+                self._orders_unloaded = self._database.load_index_orders_closed().difference(self._orders)
+            else:
+                self._orders = self._database.load_orders()
             self._index_order_position = self._database.load_index_order_position()
             self._index_order_client = self._database.load_index_order_client()
         else:
@@ -289,6 +302,9 @@ cdef class Cache(CacheFacade):
     cpdef void cache_order_lists(self):
         """
         Clear the current order lists cache and load order lists using cached orders.
+
+        If `warm_start` then any unloaded orders linked to a cached order list
+        member are loaded from the database, so that lists are complete.
         """
         self._log.debug(f"Loading order lists...")
 
@@ -297,14 +313,32 @@ cdef class Cache(CacheFacade):
         # Collect all orders common to an OrderListId
         cdef:
             Order order
+            Order linked_order
+            ClientOrderId client_order_id
             list orders
-        for order in self._orders.values():
-            if order.order_list_id is not None:
-                orders = order_list_index.get(order.order_list_id)
-                if orders is None:
-                    orders = []
-                    order_list_index[order.order_list_id] = orders
-                orders.append(order)
+            list pending = list(self._orders.values())
+            int i = 0
+        while i < len(pending):
+            order = pending[i]
+            i += 1
+            if order.order_list_id is None:
+                continue
+            orders = order_list_index.get(order.order_list_id)
+            if orders is None:
+                orders = []
+                order_list_index[order.order_list_id] = orders
+            orders.append(order)
+
+            if not self._orders_unloaded:
+                continue
+
+            # Load any closed members of the list which were not loaded on a warm start
+            for client_order_id in (order.linked_order_ids or []) + [order.parent_order_id]:
+                if client_order_id is None:
+                    continue
+                linked_order = self._load_order(client_order_id)
+                if linked_order is not None:
+                    pending.append(linked_order)
 
         # Rebuild and cache order lists
         cdef:
@@ -327,11 +361,19 @@ cdef class Cache(CacheFacade):
         """
         Clear the current positions cache and load positions from the cache
         database.
+
+        If `warm_start` then only open positions are loaded, with closed
+        positions loaded on first access.
         """
         self._log.debug(f"Loading positions from database...")
 
+        self._positions_unloaded = set()
         if self._database is not None:
-            self._positions = self._database.load_positions()
+            if self.warm_start:
+                self._positions = self._database.load_open_positions()
+                self._positions_unloaded = self._database.load_index_positions_closed().difference(self._positions)
+            else:
+                self._positions = self._database.load_positions()
         else:
             self._positions = {}
 
@@ -490,7 +532,7 @@ cdef class Cache(CacheFacade):
                 error_count += 1
 
         for client_order_id in self._index_order_position:
-            if client_order_id not in self._orders:
+            if client_order_id not in self._orders and client_order_id not in self._orders_unloaded:
                 self._log.error(
                     f"{failure} in _index_order_position: "
                     f"{repr(client_order_id)} not found in self._cached_orders"
@@ -722,6 +764,7 @@ cdef class Cache(CacheFacade):
 
         self._general.clear()
         self._xrate_symbols.clear()
+        self._xrate_graphs.clear()
         self._tickers.clear()
         self._quote_ticks.clear()
         self._trade_ticks.clear()
@@ -737,6 +780,8 @@ cdef class Cache(CacheFacade):
         self._order_lists.clear()
         self._positions.clear()
         self._position_snapshots.clear()
+        self._orders_unloaded.clear()
+        self._positions_unloaded.clear()
         self.clear_index()
 
         self._log.debug(f"Reset cache.")
@@ -766,116 +811,179 @@ cdef class Cache(CacheFacade):
         self._index_venue_account[Venue(account_id.get_issuer())] = account_id
 
     cdef void _build_indexes_from_orders(self):
-        cdef ClientOrderId client_order_id
         cdef Order order
-        for client_order_id, order in self._orders.items():
-            # 1: Build _index_venue_orders -> {Venue, {ClientOrderId}}
-            if order.instrument_id.venue not in self._index_venue_orders:
-                self._index_venue_orders[order.instrument_id.venue] = set()
-            self._index_venue_orders[order.instrument_id.venue].add(client_order_id)
-
-            # 2: Build _index_order_ids -> {VenueOrderId, ClientOrderId}
-            if order.venue_order_id is not None:
-                self._index_order_ids[order.venue_order_id] = order.client_order_id
-
-            # 3: Build _index_order_position -> {ClientOrderId, PositionId}
-            if order.position_id is not None:
-                self._index_order_position[client_order_id] = order.position_id
-
-            # 4: Build _index_order_strategy -> {ClientOrderId, StrategyId}
-            self._index_order_strategy[client_order_id] = order.strategy_id
-
-            # 5: Build _index_instrument_orders -> {InstrumentId, {ClientOrderId}}
-            if order.instrument_id not in self._index_instrument_orders:
-                self._index_instrument_orders[order.instrument_id] = set()
-            self._index_instrument_orders[order.instrument_id].add(client_order_id)
-
-            # 6: Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
-            if order.strategy_id not in self._index_strategy_orders:
-                self._index_strategy_orders[order.strategy_id] = set()
-            self._index_strategy_orders[order.strategy_id].add(client_order_id)
-
-            # 7: Build _index_exec_algorithm_orders -> {ExecAlgorithmId, {ClientOrderId}}
-            if order.exec_algorithm_id is not None:
-                if order.exec_algorithm_id not in self._index_exec_algorithm_orders:
-                    self._index_exec_algorithm_orders[order.exec_algorithm_id] = set()
-                self._index_exec_algorithm_orders[order.exec_algorithm_id].add(order.client_order_id)
-
-            # 8: Build _index_exec_spawn_orders -> {ClientOrderId, {ClientOrderId}}
-            if order.exec_algorithm_id is not None:
-                if order.exec_spawn_id not in self._index_exec_spawn_orders:
-                    self._index_exec_spawn_orders[order.exec_spawn_id] = set()
-                self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
+        for order in self._orders.values():
+            self._index_order(order)
+
+    cdef void _build_indexes_from_positions(self):
+        cdef Position position
+        for position in self._positions.values():
+            self._index_position(position)
 
-            # 9: Build _index_orders -> {ClientOrderId}
-            self._index_orders.add(client_order_id)
+    cdef void _index_order(self, Order order):
+        # 1: Build _index_venue_orders -> {Venue, {ClientOrderId}}
+        if order.instrument_id.venue not in self._index_venue_orders:
+            self._index_venue_orders[order.instrument_id.venue] = set()
+        self._index_venue_orders[order.instrument_id.venue].add(order.client_order_id)
 
-            # 10: Build _index_orders_open -> {ClientOrderId}
-            if order.is_open_c():
-                self._index_orders_open.add(client_order_id)
+        # 2: Build _index_order_ids -> {VenueOrderId, ClientOrderId}
+        if order.venue_order_id is not None:
+            self._index_order_ids[order.venue_order_id] = order.client_order_id
 
-            # 11: Build _index_orders_closed -> {ClientOrderId}
-            if order.is_closed_c():
-                self._index_orders_closed.add(client_order_id)
+        # 3: Build _index_order_position -> {ClientOrderId, PositionId}
+        if order.position_id is not None:
+            self._index_order_position[order.client_order_id] = order.position_id
 
-            # 12: Build _index_orders_emulated -> {ClientOrderId}
-            if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
-                self._index_orders_emulated.add(client_order_id)
+        # 4: Build _index_order_strategy -> {ClientOrderId, StrategyId}
+        self._index_order_strategy[order.client_order_id] = order.strategy_id
 
-            # 13: Build _index_orders_inflight -> {ClientOrderId}
-            if order.is_inflight_c():
-                self._index_orders_inflight.add(client_order_id)
+        # 5: Build _index_instrument_orders -> {InstrumentId, {ClientOrderId}}
+        if order.instrument_id not in self._index_instrument_orders:
+            self._index_instrument_orders[order.instrument_id] = set()
+        self._index_instrument_orders[order.instrument_id].add(order.client_order_id)
 
-            # 14: Build _index_strategies -> {StrategyId}
-            self._index_strategies.add(order.strategy_id)
+        # 6: Build _index_strategy_orders -> {StrategyId, {ClientOrderId}}
+        if order.strategy_id not in self._index_strategy_orders:
+            self._index_strategy_orders[order.strategy_id] = set()
+        self._index_strategy_orders[order.strategy_id].add(order.client_order_id)
 
-            # 15: Build _index_strategies -> {ExecAlgorithmId}
-            if order.exec_algorithm_id is not None:
-                self._index_exec_algorithms.add(order.exec_algorithm_id)
+        # 7: Build _index_exec_algorithm_orders -> {ExecAlgorithmId, {ClientOrderId}}
+        if order.exec_algorithm_id is not None:
+            if order.exec_algorithm_id not in self._index_exec_algorithm_orders:
+                self._index_exec_algorithm_orders[order.exec_algorithm_id] = set()
+            self._index_exec_algorithm_orders[order.exec_algorithm_id].add(order.client_order_id)
 
-    cdef void _build_indexes_from_positions(self):
+        # 8: Build _index_exec_spawn_orders -> {ClientOrderId, {ClientOrderId}}
+        if order.exec_algorithm_id is not None:
+            if order.exec_spawn_id not in self._index_exec_spawn_orders:
+                self._index_exec_spawn_orders[order.exec_spawn_id] = set()
+            self._index_exec_spawn_orders[order.exec_spawn_id].add(order.client_order_id)
+
+        # 9: Build _index_orders -> {ClientOrderId}
+        self._index_orders.add(order.client_order_id)
+
+        # 10: Build _index_orders_open -> {ClientOrderId}
+        if order.is_open_c():
+            self._index_orders_open.add(order.client_order_id)
+
+        # 11: Build _index_orders_closed -> {ClientOrderId}
+        if order.is_closed_c():
+            self._index_orders_closed.add(order.client_order_id)
+
+        # 12: Build _index_orders_emulated -> {ClientOrderId}
+        if order.emulation_trigger != TriggerType.NO_TRIGGER and not order.is_closed_c():
+            self._index_orders_emulated.add(order.client_order_id)
+
+        # 13: Build _index_orders_inflight -> {ClientOrderId}
+        if order.is_inflight_c():
+            self._index_orders_inflight.add(order.client_order_id)
+
+        # 14: Build _index_strategies -> {StrategyId}
+        self._index_strategies.add(order.strategy_id)
+
+        # 15: Build _index_strategies -> {ExecAlgorithmId}
+        if order.exec_algorithm_id is not None:
+            self._index_exec_algorithms.add(order.exec_algorithm_id)
+
+    cdef void _index_position(self, Position position):
         cdef ClientOrderId client_order_id
-        cdef PositionId position_id
-        cdef Position position
-        for position_id, position in self._positions.items():
-            # 1: Build _index_venue_positions -> {Venue, {PositionId}}
-            if position.instrument_id.venue not in self._index_venue_positions:
-                self._index_venue_positions[position.instrument_id.venue] = set()
-            self._index_venue_positions[position.instrument_id.venue].add(position_id)
 
-            # 2: Build _index_position_strategy -> {PositionId, StrategyId}
-            if position.strategy_id is not None:
-                self._index_position_strategy[position_id] = position.strategy_id
+        # 1: Build _index_venue_positions -> {Venue, {PositionId}}
+        if position.instrument_id.venue not in self._index_venue_positions:
+            self._index_venue_positions[position.instrument_id.venue] = set()
+        self._index_venue_positions[position.instrument_id.venue].add(position.id)
+
+        # 2: Build _index_position_strategy -> {PositionId, StrategyId}
+        if position.strategy_id is not None:
+            self._index_position_strategy[position.id] = position.strategy_id
+
+        # 3: Build _index_position_orders -> {PositionId, {ClientOrderId}}
+        if position.id not in self._index_position_orders:
+            self._index_position_orders[position.id] = set()
+        index_position_orders = self._index_position_orders[position.id]
+        for client_order_id in position.client_order_ids_c():
+            index_position_orders.add(client_order_id)
+
+        # 4: Build _index_instrument_positions -> {InstrumentId, {PositionId}}
+        if position.instrument_id not in self._index_instrument_positions:
+            self._index_instrument_positions[position.instrument_id] = set()
+        self._index_instrument_positions[position.instrument_id].add(position.id)
+
+        # 5: Build _index_strategy_positions -> {StrategyId, {PositionId}}
+        if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
+            self._index_strategy_positions[position.strategy_id] = set()
+        self._index_strategy_positions[position.strategy_id].add(position.id)
+
+        # 6: Build _index_positions -> {PositionId}
+        self._index_positions.add(position.id)
 
-            # 3: Build _index_position_orders -> {PositionId, {ClientOrderId}}
-            if position_id not in self._index_position_orders:
-                self._index_position_orders[position_id] = set()
-            index_position_orders = self._index_position_orders[position_id]
-            for client_order_id in position.client_order_ids_c():
-                index_position_orders.add(client_order_id)
-
-            # 4: Build _index_instrument_positions -> {InstrumentId, {PositionId}}
-            if position.instrument_id not in self._index_instrument_positions:
-                self._index_instrument_positions[position.instrument_id] = set()
-            self._index_instrument_positions[position.instrument_id].add(position_id)
-
-            # 5: Build _index_strategy_positions -> {StrategyId, {PositionId}}
-            if position.strategy_id is not None and position.strategy_id not in self._index_strategy_positions:
-                self._index_strategy_positions[position.strategy_id] = set()
-            self._index_strategy_positions[position.strategy_id].add(position.id)
-
-            # 6: Build _index_positions -> {PositionId}
-            self._index_positions.add(position_id)
-
-            # 7: Build _index_positions_open -> {PositionId}
-            if position.is_open_c():
-                self._index_positions_open.add(position_id)
-            # 8: Build _index_positions_closed -> {PositionId}
-            elif position.is_closed_c():
-                self._index_positions_closed.add(position_id)
-
-            # 9: Build _index_strategies -> {StrategyId}
-            self._index_strategies.add(position.strategy_id)
+        # 7: Build _index_positions_open -> {PositionId}
+        if position.is_open_c():
+            self._index_positions_open.add(position.id)
+        # 8: Build _index_positions_closed -> {PositionId}
+        elif position.is_closed_c():
+            self._index_positions_closed.add(position.id)
+
+        # 9: Build _index_strategies -> {StrategyId}
+        self._index_strategies.add(position.strategy_id)
+
+    cdef Order _load_order(self, ClientOrderId client_order_id):
+        # Loads a closed order which was not loaded on a warm start
+        if client_order_id not in self._orders_unloaded:
+            return None
+
+        self._orders_unloaded.discard(client_order_id)
+        cdef Order order = self._database.load_order(client_order_id)
+        if order is None:
+            return None
+
+        self._orders[client_order_id] = order
+        self._index_order(order)
+        self._log.debug(f"Loaded {order} from database.")
+
+        return order
+
+    cdef Position _load_position(self, PositionId position_id):
+        # Loads a closed position which was not loaded on a warm start
+        if position_id not in self._positions_unloaded:
+            return None
+
+        self._positions_unloaded.discard(position_id)
+        cdef Position position = self._database.load_position(position_id)
+        if position is None:
+            return None
+
+        self._positions[position_id] = position
+        self._index_position(position)
+        self._log.debug(f"Loaded {position} from database.")
+
+        return position
+
+    cdef void _load_unloaded_orders(self):
+        # Loads all closed orders which were not loaded on a warm start, as the
+        # order indexes only hold loaded orders
+        if not self._orders_unloaded:
+            return
+
+        self._log.info(
+            f"Loading {len(self._orders_unloaded)} closed orders not loaded on warm start...",
+        )
+        cdef ClientOrderId client_order_id
+        for client_order_id in sorted(self._orders_unloaded):
+            self._load_order(client_order_id)
+
+    cdef void _load_unloaded_positions(self):
+        # Loads all closed positions which were not loaded on a warm start, as the
+        # position indexes only hold loaded positions
+        if not self._positions_unloaded:
+            return
+
+        self._log.info(
+            f"Loading {len(self._positions_unloaded)} closed positions not loaded on warm start...",
+        )
+        cdef PositionId position_id
+        for position_id in sorted(self._positions_unloaded):
+            self._load_position(position_id)
 
     cdef void _assign_position_id_to_contingencies(self, Order order):
         cdef:
@@ -1053,7 +1161,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return self._orders.get(client_order_id)
+        cdef Order order = self._orders.get(client_order_id)
+        if order is None and self._orders_unloaded:
+            order = self._load_order(client_order_id)
+
+        return order
 
     cpdef Position load_position(self, PositionId position_id):
         """
@@ -1071,7 +1183,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._positions.get(position_id)
+        cdef Position position = self._positions.get(position_id)
+        if position is None and self._positions_unloaded:
+            position = self._load_position(position_id)
+
+        return position
 
     cpdef void add(self, str key, bytes value):
         """
@@ -1155,6 +1271,9 @@ cdef class Cache(CacheFacade):
 
         ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate(instrument_id)
+
     cpdef void add_trade_tick(self, TradeTick tick):
         """
         Add the given trade tick to the cache.
@@ -1203,6 +1322,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate(bar.bar_type.instrument_id)
 
     cpdef void add_quote_ticks(self, list ticks):
         """
@@ -1241,6 +1365,9 @@ cdef class Cache(CacheFacade):
         for tick in ticks:
             cached_ticks.appendleft(tick)
 
+        if instrument_id in self._xrate_symbols:
+            self._update_xrate(instrument_id)
+
     cpdef void add_trade_ticks(self, list ticks):
         """
         Add the given trade ticks to the cache.
@@ -1321,6 +1448,11 @@ cdef class Cache(CacheFacade):
             self._bars_bid[bar.bar_type.instrument_id] = bar
         elif price_type == PriceType.ASK:
             self._bars_ask[bar.bar_type.instrument_id] = bar
+        else:
+            return
+
+        if bar.bar_type.instrument_id in self._xrate_symbols:
+            self._update_xrate(bar.bar_type.instrument_id)
 
     cpdef void add_currency(self, Currency currency):
         """
@@ -1359,6 +1491,7 @@ cdef class Cache(CacheFacade):
             self._xrate_symbols[instrument.id] = (
                 f"{instrument.base_currency}/{instrument.quote_currency}"
             )
+            self._update_xrate(instrument.id)
 
         self._log.debug(f"Added instrument {instrument.id}.")
 
@@ -2451,48 +2584,42 @@ cdef class Cache(CacheFacade):
         if from_currency == to_currency:
             return Decimal(1)  # No conversion necessary
 
-        cdef tuple quotes = self._build_quote_table(venue)
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(venue)
+        if graph is None:
+            Condition.true(price_type != PriceType.LAST, "price_type was invalid (LAST)")
+            return 0.0  # No prices for venue
 
-        return self._xrate_calculator.get_rate(
-            from_currency=from_currency,
-            to_currency=to_currency,
-            price_type=price_type,
-            bid_quotes=quotes[0],  # Bid
-            ask_quotes=quotes[1],  # Ask
-        )
+        return graph.get_rate(from_currency.code, to_currency.code, price_type)
 
-    cdef tuple _build_quote_table(self, Venue venue):
-        cdef dict bid_quotes = {}
-        cdef dict ask_quotes = {}
+    cdef void _update_xrate(self, InstrumentId instrument_id):
+        cdef str base_quote = self._xrate_symbols.get(instrument_id)
+        if base_quote is None:
+            return  # Not an exchange rate instrument
 
         cdef:
-            InstrumentId instrument_id
-            str base_quote
             Price bid_price
             Price ask_price
             Bar bid_bar
             Bar ask_bar
-        for instrument_id, base_quote in self._xrate_symbols.items():
-            if instrument_id.venue != venue:
-                continue
-
-            ticks = self._quote_ticks.get(instrument_id)
-            if ticks:
-                bid_price = ticks[0].bid_price
-                ask_price = ticks[0].ask_price
-            else:
-                # No quotes for instrument_id
-                bid_bar = self._bars_bid.get(instrument_id)
-                ask_bar = self._bars_ask.get(instrument_id)
-                if bid_bar is None or ask_bar is None:
-                    continue # No prices for instrument_id
-                bid_price = bid_bar.close
-                ask_price = ask_bar.close
+        ticks = self._quote_ticks.get(instrument_id)
+        if ticks:
+            bid_price = ticks[0].bid_price
+            ask_price = ticks[0].ask_price
+        else:
+            # No quotes for instrument_id
+            bid_bar = self._bars_bid.get(instrument_id)
+            ask_bar = self._bars_ask.get(instrument_id)
+            if bid_bar is None or ask_bar is None:
+                return  # No prices for instrument_id
+            bid_price = bid_bar.close
+            ask_price = ask_bar.close
 
-            bid_quotes[base_quote] = bid_price.as_f64_c()
-            ask_quotes[base_quote] = ask_price.as_f64_c()
+        cdef ExchangeRateGraph graph = self._xrate_graphs.get(instrument_id.venue)
+        if graph is None:
+            graph = ExchangeRateGraph()
+            self._xrate_graphs[instrument_id.venue] = graph
 
-        return bid_quotes, ask_quotes
+        graph.update(base_quote, bid_price.as_f64_c(), ask_price.as_f64_c())
 
 # -- INSTRUMENT QUERIES ---------------------------------------------------------------------------
 
@@ -2725,7 +2852,11 @@ cdef class Cache(CacheFacade):
             Order order
         try:
             for client_order_id in sorted(client_order_ids):
-                order = self._orders[client_order_id]
+                order = self._orders.get(client_order_id)
+                if order is None:
+                    order = self._load_order(client_order_id)
+                if order is None:
+                    raise KeyError(client_order_id)
                 if side == OrderSide.NO_ORDER_SIDE or side == order.side:
                     orders.append(order)
         except KeyError as e:
@@ -2741,7 +2872,11 @@ cdef class Cache(CacheFacade):
             Position position
         try:
             for position_id in sorted(position_ids):
-                position = self._positions[position_id]
+                position = self._positions.get(position_id)
+                if position is None:
+                    position = self._load_position(position_id)
+                if position is None:
+                    raise KeyError(position_id)
                 if side == PositionSide.NO_POSITION_SIDE or side == position.side:
                     positions.append(position)
         except KeyError as e:
@@ -2772,6 +2907,7 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
+        self._load_unloaded_orders()
         cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
 
         if query is None:
@@ -2832,6 +2968,7 @@ cdef class Cache(CacheFacade):
         set[ClientOrderId]
 
         """
+        self._load_unloaded_orders()
         cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
 
         if query is None:
@@ -2941,6 +3078,7 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
+        self._load_unloaded_positions()
         cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
 
         if query is None:
@@ -3001,6 +3139,7 @@ cdef class Cache(CacheFacade):
         set[PositionId]
 
         """
+        self._load_unloaded_positions()
         cdef set query = self._build_position_query_filter_set(venue, instrument_id, strategy_id)
 
         if query is None:
@@ -3054,7 +3193,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return self._orders.get(client_order_id)
+        cdef Order order = self._orders.get(client_order_id)
+        if order is None and self._orders_unloaded:
+            order = self._load_order(client_order_id)
+
+        return order
 
     cpdef ClientOrderId client_order_id(self, VenueOrderId venue_order_id):
         """
@@ -3274,11 +3417,12 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
+        self._load_position(position_id)  # Indexes the orders if not loaded on a warm start
         cdef set client_order_ids = self._index_position_orders.get(position_id)
         if not client_order_ids:
             return []
 
-        return [self._orders[client_order_id] for client_order_id in client_order_ids]
+        return self._get_orders_for_ids(client_order_ids, OrderSide.NO_ORDER_SIDE)
 
     cpdef bint order_exists(self, ClientOrderId client_order_id):
         """
@@ -3296,7 +3440,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return client_order_id in self._index_orders
+        return client_order_id in self._index_orders or client_order_id in self._orders_unloaded
 
     cpdef bint is_order_open(self, ClientOrderId client_order_id):
         """
@@ -3332,7 +3476,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(client_order_id, "client_order_id")
 
-        return client_order_id in self._index_orders_closed
+        return client_order_id in self._index_orders_closed or client_order_id in self._orders_unloaded
 
     cpdef bint is_order_emulated(self, ClientOrderId client_order_id):
         """
@@ -3626,6 +3770,7 @@ cdef class Cache(CacheFacade):
 
         cdef set query = self._build_order_query_filter_set(venue, instrument_id, strategy_id)
 
+        self._load_unloaded_orders()
         cdef set exec_algorithm_order_ids = self._index_exec_algorithm_orders.get(exec_algorithm_id)
 
         if query is not None and exec_algorithm_order_ids is not None:
@@ -3651,6 +3796,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(exec_spawn_id, "exec_spawn_id")
 
+        self._load_unloaded_orders()
         return self._get_orders_for_ids(self._index_exec_spawn_orders.get(exec_spawn_id), OrderSide.NO_ORDER_SIDE)
 
     cpdef Quantity exec_spawn_total_quantity(self, ClientOrderId exec_spawn_id, bint active_only=False):
@@ -3791,7 +3937,11 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return self._positions.get(position_id)
+        cdef Position position = self._positions.get(position_id)
+        if position is None and self._positions_unloaded:
+            position = self._load_position(position_id)
+
+        return position
 
     cpdef Position position_for_order(self, ClientOrderId client_order_id):
         """
@@ -3813,7 +3963,7 @@ cdef class Cache(CacheFacade):
         if position_id is None:
             return None
 
-        return self._positions.get(position_id)
+        return self.position(position_id)
 
     cpdef PositionId position_id(self, ClientOrderId client_order_id):
         """
@@ -3965,7 +4115,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions
+        return position_id in self._index_positions or position_id in self._positions_unloaded
 
     cpdef bint is_position_open(self, PositionId position_id):
         """
@@ -4003,7 +4153,7 @@ cdef class Cache(CacheFacade):
         """
         Condition.not_none(position_id, "position_id")
 
-        return position_id in self._index_positions_closed
+        return position_id in self._index_positions_closed or position_id in self._positions_unloaded
 
     cpdef int positions_open_count(
         self,
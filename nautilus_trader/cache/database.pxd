@@ -13,7 +13,13 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+from nautilus_trader.accounting.accounts.base cimport Account
 from nautilus_trader.cache.facade cimport CacheDatabaseFacade
+from nautilus_trader.model.events.order cimport OrderFilled
+from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.orders.base cimport Order
+from nautilus_trader.model.position cimport Position
 from nautilus_trader.serialization.base cimport Serializer
 
 
@@ -47,3 +53,11 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
 
     cdef Serializer _serializer
     cdef object _backing
+
+    cdef list _read_bulk(self, str collection, list ids)
+    cdef dict _load_orders(self, list ids)
+    cdef dict _load_positions(self, list ids)
+    cdef Currency _currency_from_bytes(self, str code, bytes value)
+    cdef Account _account_from_events(self, list result)
+    cdef Order _order_from_events(self, list result)
+    cdef Position _position_from_events(self, Instrument instrument, OrderFilled initial_fill, list result)
@@ -278,16 +278,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not currency_keys:
             return currencies
 
+        cdef list codes = [key.rsplit(':', maxsplit=1)[1] for key in currency_keys]
+        cdef list results = self._read_bulk(_CURRENCIES, codes)
+
         cdef:
-            str key
             str currency_code
-            Currency currency
-        for key in currency_keys:
-            currency_code = key.rsplit(':', maxsplit=1)[1]
-            currency = self.load_currency(currency_code)
-
-            if currency is not None:
-                currencies[currency.code] = currency
+            list result
+        for currency_code, result in zip(codes, results):
+            if result:
+                currencies[currency_code] = self._currency_from_bytes(currency_code, result[0])
 
         return currencies
 
@@ -306,15 +305,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not instrument_keys:
             return instruments
 
+        cdef list ids = [key.rsplit(':', maxsplit=1)[1] for key in instrument_keys]
+        cdef list results = self._read_bulk(_INSTRUMENTS, ids)
+
         cdef:
-            str key
-            InstrumentId instrument_id
+            list result
             Instrument instrument
-        for key in instrument_keys:
-            instrument_id = InstrumentId.from_str_c(key.rsplit(':', maxsplit=1)[1])
-            instrument = self.load_instrument(instrument_id)
-
-            if instrument is not None:
+        for result in results:
+            if result:
+                instrument = self._serializer.deserialize(result[0])
                 instruments[instrument.id] = instrument
 
         return instruments
@@ -334,15 +333,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not synthetic_keys:
             return synthetics
 
+        cdef list ids = [key.rsplit(':', maxsplit=1)[1] for key in synthetic_keys]
+        cdef list results = self._read_bulk(_SYNTHETICS, ids)
+
         cdef:
-            str key
-            InstrumentId instrument_id
+            list result
             SyntheticInstrument synthetic
-        for key in synthetic_keys:
-            instrument_id = InstrumentId.from_str_c(key.rsplit(':', maxsplit=1)[1])
-            synthetic = self.load_synthetic(instrument_id)
-
-            if synthetic is not None:
+        for result in results:
+            if result:
+                synthetic = self._serializer.deserialize(result[0])
                 synthetics[synthetic.id] = synthetic
 
         return synthetics
@@ -362,16 +361,15 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not account_keys:
             return accounts
 
+        cdef list ids = [key.rsplit(':', maxsplit=1)[1] for key in account_keys]
+        cdef list results = self._read_bulk(_ACCOUNTS, ids)
+
         cdef:
-            str key
-            str account_str
-            AccountId account_id
+            list result
             Account account
-        for key in account_keys:
-            account_id = AccountId(key.rsplit(':', maxsplit=1)[1])
-            account = self.load_account(account_id)
-
-            if account is not None:
+        for result in results:
+            if result:
+                account = self._account_from_events(result)
                 accounts[account.id] = account
 
         return accounts
@@ -385,21 +383,40 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         dict[ClientOrderId, Order]
 
         """
-        cdef dict orders = {}
-
         cdef list order_keys = self._backing.keys(f"*:{_ORDERS}*")
-        if not order_keys:
+
+        return self._load_orders([key.rsplit(':', maxsplit=1)[1] for key in order_keys])
+
+    cpdef dict load_open_orders(self):
+        """
+        Load all open orders from the database.
+
+        This includes all orders which are not closed (such as initialized,
+        emulated and in-flight orders).
+
+        Returns
+        -------
+        dict[ClientOrderId, Order]
+
+        """
+        cdef set order_ids = set(self._backing.read(_INDEX_ORDERS))
+        order_ids.difference_update(self._backing.read(_INDEX_ORDERS_CLOSED))
+
+        return self._load_orders([i.decode() for i in order_ids])
+
+    cdef dict _load_orders(self, list ids):
+        cdef dict orders = {}
+        if not ids:
             return orders
 
+        cdef list results = self._read_bulk(_ORDERS, ids)
+
         cdef:
-            str key
-            ClientOrderId client_order_id
+            list result
             Order order
-        for key in order_keys:
-            client_order_id = ClientOrderId(key.rsplit(':', maxsplit=1)[1])
-            order = self.load_order(client_order_id)
-
-            if order is not None:
+        for result in results:
+            if result:
+                order = self._order_from_events(result)
                 orders[order.client_order_id] = order
 
         return orders
@@ -413,25 +430,94 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         dict[PositionId, Position]
 
         """
-        cdef dict positions = {}
-
         cdef list position_keys = self._backing.keys(f"*:{_POSITIONS}*")
-        if not position_keys:
+
+        return self._load_positions([key.rsplit(':', maxsplit=1)[1] for key in position_keys])
+
+    cpdef dict load_open_positions(self):
+        """
+        Load all open positions from the database.
+
+        Returns
+        -------
+        dict[PositionId, Position]
+
+        """
+        cdef list position_ids = self._backing.read(_INDEX_POSITIONS_OPEN)
+
+        return self._load_positions([i.decode() for i in position_ids])
+
+    cdef dict _load_positions(self, list ids):
+        cdef dict positions = {}
+        if not ids:
             return positions
 
+        cdef list results = self._read_bulk(_POSITIONS, ids)
+
+        # Deserialize the initial fills first, so that the instruments for
+        # all positions can then be read in bulk.
+        cdef list initial_fills = [
+            self._serializer.deserialize(result.pop(0)) if result else None
+            for result in results
+        ]
+        cdef list instrument_ids = list({
+            fill.instrument_id.to_str() for fill in initial_fills if fill is not None
+        })
+        cdef dict instruments = {}
+
         cdef:
-            str key
-            PositionId position_id
-            Position position
-        for key in position_keys:
-            position_id = PositionId(key.rsplit(':', maxsplit=1)[1])
-            position = self.load_position(position_id)
+            list result
+            Instrument instrument
+        for result in self._read_bulk(_INSTRUMENTS, instrument_ids):
+            if result:
+                instrument = self._serializer.deserialize(result[0])
+                instruments[instrument.id] = instrument
 
-            if position is not None:
-                positions[position.id] = position
+        cdef:
+            OrderFilled initial_fill
+            Position position
+        for initial_fill, result in zip(initial_fills, results):
+            if initial_fill is None:
+                continue
+            instrument = instruments.get(initial_fill.instrument_id)
+            if instrument is None:
+                self._log.error(
+                    f"Cannot load position: "
+                    f"no instrument found for {initial_fill.instrument_id}",
+                )
+                continue
+            position = self._position_from_events(instrument, initial_fill, result)
+            positions[position.id] = position
 
         return positions
 
+    cdef list _read_bulk(self, str collection, list ids):
+        # Reads the values for all `ids` of the collection in order, pipelined
+        # as chunks of reads rather than a database round trip per key.
+        return self._backing.read_bulk([f"{collection}:{i}" for i in ids])
+
+    cpdef set load_index_orders_closed(self):
+        """
+        Load the closed orders index from the database.
+
+        Returns
+        -------
+        set[ClientOrderId]
+
+        """
+        return {ClientOrderId(i.decode()) for i in self._backing.read(_INDEX_ORDERS_CLOSED)}
+
+    cpdef set load_index_positions_closed(self):
+        """
+        Load the closed positions index from the database.
+
+        Returns
+        -------
+        set[PositionId]
+
+        """
+        return {PositionId(i.decode()) for i in self._backing.read(_INDEX_POSITIONS_CLOSED)}
+
     cpdef dict load_index_order_position(self):
         """
         Load the order to position index from the database.
@@ -486,7 +572,10 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not result:
             return None
 
-        cdef dict c_map = self._serializer.deserialize(result[0])
+        return self._currency_from_bytes(code, result[0])
+
+    cdef Currency _currency_from_bytes(self, str code, bytes value):
+        cdef dict c_map = self._serializer.deserialize(value)
 
         return Currency(
             code=code,
@@ -575,6 +664,9 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not result:
             return None
 
+        return self._account_from_events(result)
+
+    cdef Account _account_from_events(self, list result):
         cdef bytes initial_event = result.pop(0)
         cdef Account account = AccountFactory.create_c(self._serializer.deserialize(initial_event))
 
@@ -607,6 +699,9 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
         if not result:
             return None
 
+        return self._order_from_events(result)
+
+    cdef Order _order_from_events(self, list result):
         cdef OrderInitialized init = self._serializer.deserialize(result.pop(0))
         cdef Order order = OrderUnpacker.from_init_c(init)
 
@@ -668,11 +763,17 @@ cdef class CacheDatabaseAdapter(CacheDatabaseFacade):
             )
             return
 
+        return self._position_from_events(instrument, initial_fill, result)
+
+    cdef Position _position_from_events(
+        self,
+        Instrument instrument,
+        OrderFilled initial_fill,
+        list result,
+    ):
         cdef Position position = Position(instrument, initial_fill)
 
-        cdef:
-            bytes event_bytes
-            OrderFilled fill
+        cdef bytes event_bytes
         for event_bytes in result:
             event = self._serializer.deserialize(event_bytes)
 
@@ -113,6 +113,22 @@ cdef class CacheDatabaseFacade:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_positions` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef dict load_open_orders(self):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `load_open_orders` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef dict load_open_positions(self):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `load_open_positions` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef set load_index_orders_closed(self):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `load_index_orders_closed` must be implemented in the subclass")  # pragma: no cover
+
+    cpdef set load_index_positions_closed(self):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `load_index_positions_closed` must be implemented in the subclass")  # pragma: no cover
+
     cpdef dict load_index_order_position(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `load_index_order_position` must be implemented in the subclass")  # pragma: no cover
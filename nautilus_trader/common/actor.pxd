@@ -33,6 +33,7 @@ from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.indicators.base.indicator cimport Indicator
 from nautilus_trader.model.book cimport OrderBook
+from nautilus_trader.model.book cimport OrderBookDiff
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.data cimport DataType
@@ -93,6 +94,7 @@ cdef class Actor(Component):
     cpdef void on_instrument(self, Instrument instrument)
     cpdef void on_order_book_deltas(self, OrderBookDeltas deltas)
     cpdef void on_order_book(self, OrderBook order_book)
+    cpdef void on_order_book_diff(self, OrderBookDiff diff)
     cpdef void on_ticker(self, Ticker ticker)
     cpdef void on_quote_tick(self, QuoteTick tick)
     cpdef void on_trade_tick(self, TradeTick tick)
@@ -157,6 +159,16 @@ cdef class Actor(Component):
         dict kwargs=*,
         ClientId client_id=*
     )
+    cpdef void subscribe_order_book_diffs(
+        self,
+        InstrumentId instrument_id,
+        BookType book_type=*,
+        int depth=*,
+        int interval_ms=*,
+        int checkpoint_interval=*,
+        dict kwargs=*,
+        ClientId client_id=*
+    )
     cpdef void subscribe_ticker(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void subscribe_quote_ticks(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void subscribe_trade_ticks(self, InstrumentId instrument_id, ClientId client_id=*)
@@ -169,6 +181,7 @@ cdef class Actor(Component):
     cpdef void unsubscribe_instrument(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void unsubscribe_order_book_deltas(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void unsubscribe_order_book_snapshots(self, InstrumentId instrument_id, int interval_ms=*, ClientId client_id=*)
+    cpdef void unsubscribe_order_book_diffs(self, InstrumentId instrument_id, int interval_ms=*, ClientId client_id=*)
     cpdef void unsubscribe_ticker(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void unsubscribe_quote_ticks(self, InstrumentId instrument_id, ClientId client_id=*)
     cpdef void unsubscribe_trade_ticks(self, InstrumentId instrument_id, ClientId client_id=*)
@@ -236,6 +249,7 @@ cdef class Actor(Component):
     cpdef void handle_instruments(self, list instruments)
     cpdef void handle_order_book(self, OrderBook order_book)
     cpdef void handle_order_book_deltas(self, OrderBookDeltas deltas)
+    cpdef void handle_order_book_diff(self, OrderBookDiff diff)
     cpdef void handle_ticker(self, Ticker ticker)
     cpdef void handle_quote_tick(self, QuoteTick tick)
     cpdef void handle_quote_ticks(self, list ticks)
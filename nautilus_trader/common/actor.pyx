@@ -384,6 +384,22 @@ cdef class Actor(Component):
         """
         # Optionally override in subclass
 
+    cpdef void on_order_book_diff(self, OrderBookDiff diff):
+        """
+        Actions to be performed when running and receives an order book diff.
+
+        Parameters
+        ----------
+        diff : OrderBookDiff
+            The order book diff received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        # Optionally override in subclass
+
     cpdef void on_order_book_deltas(self, OrderBookDeltas deltas):
         """
         Actions to be performed when running and receives order book deltas.
@@ -1332,6 +1348,95 @@ cdef class Actor(Component):
 
         self._send_data_cmd(command)
 
+    cpdef void subscribe_order_book_diffs(
+        self,
+        InstrumentId instrument_id,
+        BookType book_type=BookType.L2_MBP,
+        int depth = 0,
+        int interval_ms = 1000,
+        int checkpoint_interval = 100,
+        dict kwargs = None,
+        ClientId client_id = None,
+    ):
+        """
+        Subscribe to `OrderBookDiff` updates at a specified interval, for the given instrument ID.
+
+        Each diff contains only the price levels which changed since the previous
+        diff, with a full checkpoint of the book published every
+        `checkpoint_interval` intervals (and on every new subscription). Diffs are
+        sequenced per subscription, so a gap in the sequence indicates the
+        subscriber should wait for the next checkpoint to resynchronize.
+
+        The `DataEngine` will only maintain one order book for each instrument.
+        Because of this - the level, depth and kwargs for the stream will be set
+        as per the last subscription request (this will also affect all subscribers).
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The order book instrument ID to subscribe to.
+        book_type : BookType {``L1_MBP``, ``L2_MBP``, ``L3_MBO``}
+            The order book type.
+        depth : int, optional
+            The maximum depth for the diffs. A depth of 0 is maximum depth.
+        interval_ms : int
+            The order book diff interval in milliseconds (not less than 20 milliseconds).
+        checkpoint_interval : int, default 100
+            The number of intervals between full checkpoints.
+        kwargs : dict, optional
+            The keyword arguments for exchange specific parameters.
+        client_id : ClientId, optional
+            The specific client ID for the command.
+            If ``None`` then will be inferred from the venue in the instrument ID.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is negative (< 0).
+        ValueError
+            If `interval_ms` is less than the minimum of 20.
+        ValueError
+            If `checkpoint_interval` is not positive (> 0).
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.not_negative(depth, "depth")
+        Condition.true(interval_ms >= 20, f"`interval_ms` {interval_ms} was less than minimum 20")
+        Condition.positive_int(checkpoint_interval, "checkpoint_interval")
+        Condition.true(self.trader_id is not None, "The actor has not been registered")
+
+        if book_type == BookType.L1_MBP and depth > 1:
+            self._log.error(
+                "Cannot subscribe to order book diffs: "
+                f"L1 TBBO book subscription depth > 1, was {depth}",
+            )
+            return
+
+        self._msgbus.subscribe(
+            topic=f"data.book.diffs"
+                  f".{instrument_id.venue}"
+                  f".{instrument_id.symbol}"
+                  f".{interval_ms}",
+            handler=self.handle_order_book_diff,
+        )
+
+        cdef Subscribe command = Subscribe(
+            client_id=client_id,
+            venue=instrument_id.venue,
+            data_type=DataType(OrderBookDiff, metadata={
+                "instrument_id": instrument_id,
+                "book_type": book_type,
+                "depth": depth,
+                "interval_ms": interval_ms,
+                "checkpoint_interval": checkpoint_interval,
+                "kwargs": kwargs,
+            }),
+            command_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+        )
+
+        self._send_data_cmd(command)
+
     cpdef void subscribe_ticker(self, InstrumentId instrument_id, ClientId client_id = None):
         """
         Subscribe to streaming `Ticker` data for the given instrument ID.
@@ -1746,6 +1851,52 @@ cdef class Actor(Component):
 
         self._send_data_cmd(command)
 
+    cpdef void unsubscribe_order_book_diffs(
+        self,
+        InstrumentId instrument_id,
+        int interval_ms = 1000,
+        ClientId client_id = None,
+    ):
+        """
+        Unsubscribe from `OrderBookDiff` updates, for the given instrument ID.
+
+        The interval must match the previously subscribed interval.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The order book instrument to unsubscribe from.
+        interval_ms : int
+            The order book diff interval in milliseconds.
+        client_id : ClientId, optional
+            The specific client ID for the command.
+            If ``None`` then will be inferred from the venue in the instrument ID.
+
+        """
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.true(self.trader_id is not None, "The actor has not been registered")
+
+        self._msgbus.unsubscribe(
+            topic=f"data.book.diffs"
+                  f".{instrument_id.venue}"
+                  f".{instrument_id.symbol}"
+                  f".{interval_ms}",
+            handler=self.handle_order_book_diff,
+        )
+
+        cdef Unsubscribe command = Unsubscribe(
+            client_id=client_id,
+            venue=instrument_id.venue,
+            data_type=DataType(OrderBookDiff, metadata={
+                "instrument_id": instrument_id,
+                "interval_ms": interval_ms,
+            }),
+            command_id=UUID4(),
+            ts_init=self._clock.timestamp_ns(),
+        )
+
+        self._send_data_cmd(command)
+
     cpdef void unsubscribe_ticker(self, InstrumentId instrument_id, ClientId client_id = None):
         """
         Unsubscribe from streaming `Ticker` data for the given instrument ID.
@@ -2527,6 +2678,31 @@ cdef class Actor(Component):
                 self._log.exception(f"Error on handling {repr(order_book)}", e)
                 raise
 
+    cpdef void handle_order_book_diff(self, OrderBookDiff diff):
+        """
+        Handle the given order book diff.
+
+        Passes to `on_order_book_diff` if state is ``RUNNING``.
+
+        Parameters
+        ----------
+        diff : OrderBookDiff
+            The order book diff received.
+
+        Warnings
+        --------
+        System method (not intended to be called by user code).
+
+        """
+        Condition.not_none(diff, "diff")
+
+        if self._fsm.state == ComponentState.RUNNING:
+            try:
+                self.on_order_book_diff(diff)
+            except Exception as e:
+                self._log.exception(f"Error on handling {repr(diff)}", e)
+                raise
+
     cpdef void handle_ticker(self, Ticker ticker):
         """
         Handle the given ticker.
@@ -2728,6 +2904,10 @@ cdef class Actor(Component):
         """
         Handle the given historical bar data by handling each bar individually.
 
+        If `on_historical_data` is not overridden, then the indicators
+        registered for the bar type are updated with all bars in a single batch
+        (see `Indicator.handle_bars`).
+
         Parameters
         ----------
         bars : list[Bar]
@@ -2756,6 +2936,18 @@ cdef class Actor(Component):
         # Update indicators
         cdef list indicators = self._indicators_for_bars.get(first.bar_type)
 
+        cdef Indicator indicator
+        cdef bint default_on_historical_data = (
+            type(self).on_historical_data is Actor.on_historical_data
+            and "on_historical_data" not in getattr(self, "__dict__", {})
+        )
+        if indicators and default_on_historical_data:
+            # No intermediate indicator state can be observed from the default
+            # `on_historical_data`, so warm up each indicator over all bars at once
+            for indicator in indicators:
+                indicator.handle_bars(bars)
+            indicators = None
+
         cdef:
             int i
             Bar bar
@@ -83,19 +83,25 @@ cdef class LiveClock(Clock):
     cdef dict _handlers
 
     cdef object _loop
+    cdef object _handle
     cdef int _timer_count
     cdef dict _timers
-    cdef LiveTimer[:] _stack
+    cdef list _heap
+    cdef uint64_t _heap_seq
+    cdef uint64_t _handle_time_ns
     cdef tzinfo _utc
     cdef uint64_t _next_event_time_ns
 
     cpdef void _raise_time_event(self, LiveTimer timer)
+    cpdef void _process_due_timers(self)
 
+    cdef void _fire_timer(self, LiveTimer timer)
     cdef void _handle_time_event(self, TimeEvent event)
     cdef void _add_timer(self, LiveTimer timer, handler: Callable[[TimeEvent], None])
     cdef void _remove_timer(self, LiveTimer timer)
-    cdef void _update_stack(self)
+    cdef void _push_timer(self, LiveTimer timer)
     cdef void _update_timing(self)
+    cdef void _schedule_next(self)
     cdef LiveTimer _create_timer(
         self,
         str name,
@@ -154,3 +160,7 @@ cdef class ThreadTimer(LiveTimer):
 
 cdef class LoopTimer(LiveTimer):
     cdef object _loop
+
+
+cdef class ScheduledTimer(LiveTimer):
+    pass
@@ -14,12 +14,13 @@
 # -------------------------------------------------------------------------------------------------
 
 import asyncio
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
 from threading import Timer as TimerThread
 from typing import Callable
 from typing import Optional
 
-import cython
-import numpy as np
 import pandas as pd
 import pytz
 
@@ -600,9 +601,13 @@ cdef class LiveClock(Clock):
 
     All times are tz-aware UTC.
 
+    Timers are kept on a heap ordered by their next time. If an event loop is
+    provided then a single loop callback dispatches all due timers in batch,
+    otherwise each timer runs on its own thread.
+
     Parameters
     ----------
-    loop : asyncio.AbstractEventLoop
+    loop : asyncio.AbstractEventLoop, optional
         The event loop for the clocks timers.
     """
 
@@ -612,8 +617,11 @@ cdef class LiveClock(Clock):
         self._handlers: dict[str, Callable[[TimeEvent], None]] = {}
 
         self._loop = loop
+        self._handle = None
         self._timers: dict[str, LiveTimer] = {}
-        self._stack = np.ascontiguousarray([], dtype=LiveTimer)
+        self._heap: list[tuple[int, int, LiveTimer]] = []
+        self._heap_seq = 0
+        self._handle_time_ns = 0
 
         self._timer_count = 0
         self._next_event_time_ns = 0
@@ -651,7 +659,7 @@ cdef class LiveClock(Clock):
         callback: Optional[Callable[[TimeEvent], None]] = None,
     ):
         Condition.valid_string(name, "name")
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.not_in(name, self._timers, "name", "self.timer_names")
         if callback is None:
             callback = self._default_handler
 
@@ -674,7 +682,7 @@ cdef class LiveClock(Clock):
         uint64_t stop_time_ns,
         callback: Optional[Callable[[TimeEvent], None]] = None,
     ):
-        Condition.not_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.not_in(name, self._timers, "name", "self.timer_names")
 
         cdef uint64_t ts_now = self.timestamp_ns()  # Call here for greater accuracy
 
@@ -705,33 +713,39 @@ cdef class LiveClock(Clock):
     cdef void _add_timer(self, LiveTimer timer, handler: Callable[[TimeEvent], None]):
         self._timers[timer.name] = timer
         self._handlers[timer.name] = handler
-        self._update_stack()
+        self._timer_count = len(self._timers)
+        self._push_timer(timer)
         self._update_timing()
 
     cdef void _remove_timer(self, LiveTimer timer):
         self._timers.pop(timer.name, None)
         self._handlers.pop(timer.name, None)
-        self._update_stack()
+        self._timer_count = len(self._timers)
+        # Any entries for the timer remaining on the heap are now stale, and
+        # will be discarded when they reach the top (O(1) removal).
         self._update_timing()
 
-    cdef void _update_stack(self):
-        self._timer_count = len(self._timers)
-
-        if self._timer_count > 0:
-            # The call to `np.ascontiguousarray` here looks inefficient, its
-            # only called when a timer is added or removed. This then allows the
-            # construction of an efficient Timer[:] memoryview.
-            timers = list(self._timers.values())
-            self._stack = np.ascontiguousarray(timers, dtype=LiveTimer)
-        else:
-            self._stack = None
+    cdef void _push_timer(self, LiveTimer timer):
+        cdef LiveTimer live_timer
+        if len(self._heap) > 2 * self._timer_count + 64:
+            # Rebuild the heap from the live timers to purge stale entries
+            self._heap = []
+            for live_timer in self._timers.values():
+                if live_timer is not timer:
+                    self._heap_seq += 1
+                    self._heap.append((live_timer.next_time_ns, self._heap_seq, live_timer))
+            heapify(self._heap)
+
+        # The sequence number orders timers with the same next time by insertion
+        self._heap_seq += 1
+        heappush(self._heap, (timer.next_time_ns, self._heap_seq, timer))
 
     cpdef uint64_t next_time_ns(self, str name):
         return self._timers[name].next_time_ns
 
     cpdef void cancel_timer(self, str name):
         Condition.valid_string(name, "name")
-        Condition.is_in(name, self.timer_names, "name", "self.timer_names")
+        Condition.is_in(name, self._timers, "name", "self.timer_names")
 
         cdef LiveTimer timer = self._timers.pop(name, None)
         if not timer:
@@ -750,30 +764,43 @@ cdef class LiveClock(Clock):
             # and timer.
             self.cancel_timer(name)
 
-    @cython.boundscheck(False)
-    @cython.wraparound(False)
     cdef void _update_timing(self):
-        if self._timer_count == 0:
+        cdef tuple entry
+        cdef LiveTimer timer
+        while self._heap:
+            entry = self._heap[0]
+            timer = entry[2]
+            if self._timers.get(timer.name) is timer and timer.next_time_ns == entry[0]:
+                break
+            heappop(self._heap)  # Stale entry (timer removed or rescheduled)
+
+        if self._heap:
+            self._next_event_time_ns = self._heap[0][0]
+        else:
             self._next_event_time_ns = 0
-            return
 
-        cdef LiveTimer first_timer = self._stack[0]
-        if self._timer_count == 1:
-            self._next_event_time_ns = first_timer.next_time_ns
+        if self._loop is not None:
+            self._schedule_next()
+
+    cdef void _schedule_next(self):
+        if self._next_event_time_ns == 0:
+            if self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
             return
 
-        cdef uint64_t next_time_ns = first_timer.next_time_ns
-        cdef:
-            int i
-            LiveTimer timer
-            uint64_t observed_ns
-        for i in range(self._timer_count - 1):
-            timer = self._stack[i + 1]
-            observed_ns = timer.next_time_ns
-            if observed_ns < next_time_ns:
-                next_time_ns = observed_ns
+        if self._handle is not None:
+            if self._handle_time_ns <= self._next_event_time_ns:
+                return  # Already scheduled early enough
+            self._handle.cancel()
 
-        self._next_event_time_ns = next_time_ns
+        cdef uint64_t ts_now = self.timestamp_ns()
+        cdef double delay = 0.0
+        if self._next_event_time_ns > ts_now:
+            delay = nanos_to_secs(self._next_event_time_ns - ts_now)
+
+        self._handle = self._loop.call_later(delay, self._process_due_timers)
+        self._handle_time_ns = self._next_event_time_ns
 
     cdef LiveTimer _create_timer(
         self,
@@ -784,8 +811,7 @@ cdef class LiveClock(Clock):
         uint64_t stop_time_ns,
     ):
         if self._loop is not None:
-            return LoopTimer(
-                loop=self._loop,
+            return ScheduledTimer(
                 name=name,
                 callback=self._raise_time_event,
                 interval_ns=interval_ns,
@@ -804,6 +830,33 @@ cdef class LiveClock(Clock):
             )
 
     cpdef void _raise_time_event(self, LiveTimer timer):
+        self._fire_timer(timer)
+        self._update_timing()
+
+    cpdef void _process_due_timers(self):
+        self._handle = None
+
+        cdef uint64_t ts_now = self.timestamp_ns()
+
+        # Collect all due timers first, so that a timer which is still due after
+        # repeating is dispatched on the next callback (rather than looping here).
+        cdef list due = []
+        cdef tuple entry
+        cdef LiveTimer timer
+        while self._heap and self._heap[0][0] <= ts_now:
+            entry = heappop(self._heap)
+            timer = entry[2]
+            if self._timers.get(timer.name) is timer and timer.next_time_ns == entry[0]:
+                due.append(timer)
+
+        for timer in due:
+            if self._timers.get(timer.name) is not timer:
+                continue  # Canceled by a previous handler
+            self._fire_timer(timer)
+
+        self._update_timing()
+
+    cdef void _fire_timer(self, LiveTimer timer):
         cdef uint64_t now = self.timestamp_ns()
         cdef TimeEvent event = timer.pop_event(
             event_id=UUID4(),
@@ -817,11 +870,14 @@ cdef class LiveClock(Clock):
 
         self._handle_time_event(event)
 
+        if self._timers.get(timer.name) is not timer:
+            return  # Canceled by the handler
+
         if timer.is_expired:
             self._remove_timer(timer)
         else:  # Continue timing
             timer.repeat(ts_now=self.timestamp_ns())
-            self._update_timing()
+            self._push_timer(timer)
 
     cdef void _handle_time_event(self, TimeEvent event):
         handler = self._handlers.get(event.name)
@@ -1172,6 +1228,65 @@ cdef class ThreadTimer(LiveTimer):
         return timer
 
 
+cdef class ScheduledTimer(LiveTimer):
+    """
+    Provides a timer for live trading which is scheduled by its owning clock.
+
+    The timer does not hold its own thread or event loop handle, instead the
+    `LiveClock` keeps all of its timers on a single heap and dispatches every
+    due timer from one event loop callback.
+
+    Parameters
+    ----------
+    name : str
+        The name for the timer.
+    callback : Callable[[TimeEvent], None]
+        The delegate to call at the next time.
+    interval_ns : uint64_t
+        The time interval for the timer (nanoseconds).
+    ts_now : uint64_t
+        The current UNIX epoch (nanoseconds).
+    start_time_ns : uint64_t
+        The start datetime for the timer (UTC).
+    stop_time_ns : uint64_t, optional
+        The stop datetime for the timer (UTC) (if None then timer repeats).
+
+    Raises
+    ------
+    TypeError
+        If `callback` is not of type `Callable`.
+    """
+
+    def __init__(
+        self,
+        str name not None,
+        callback not None: Callable[[TimeEvent], None],
+        uint64_t interval_ns,
+        uint64_t ts_now,
+        uint64_t start_time_ns,
+        uint64_t stop_time_ns=0,
+    ):
+        super().__init__(
+            name=name,
+            callback=callback,
+            interval_ns=interval_ns,
+            ts_now=ts_now,
+            start_time_ns=start_time_ns,
+            stop_time_ns=stop_time_ns,
+        )
+
+    cpdef void cancel(self):
+        """
+        Cancels the timer (the timer will not generate an event).
+
+        The owning clock discards the timer from its schedule on removal.
+        """
+        self.is_expired = True
+
+    cdef object _start_timer(self, uint64_t ts_now):
+        return None  # Scheduled by the owning clock
+
+
 cdef class LoopTimer(LiveTimer):
     """
     Provides an event loop based timer for live trading.
@@ -103,6 +103,7 @@ cdef class MessageBus:
     cdef Clock _clock
     cdef LoggerAdapter _log
     cdef dict[Subscription, list[str]] _subscriptions
+    cdef SubscriptionTrie _trie
     cdef dict[str, Subscription[:]] _patterns
     cdef dict[str, object] _endpoints
     cdef dict[UUID4, object] _correlation_index
@@ -159,6 +160,23 @@ cdef class Subscription:
     """The priority for the subscription.\n\n:returns: `int`"""
 
 
+cdef class SubscriptionTrieNode:
+    cdef readonly bint is_wildcard
+    """If the node is for a `*` wildcard character.\n\n:returns: `bool`"""
+    cdef dict children
+    cdef list subscriptions
+
+
+cdef class SubscriptionTrie:
+    cdef SubscriptionTrieNode _root
+    cdef dict[Subscription, int] _sequence
+    cdef uint64_t _next_sequence
+
+    cpdef void add(self, Subscription sub)
+    cpdef void remove(self, Subscription sub)
+    cpdef list match(self, str topic)
+
+
 cdef class Throttler:
     cdef Clock _clock
     cdef LoggerAdapter _log
@@ -26,7 +26,6 @@ import numpy as np
 from nautilus_trader.config.error import InvalidConfiguration
 from nautilus_trader.core.rust.common import ComponentState as PyComponentState
 
-cimport numpy as np
 from cpython.datetime cimport timedelta
 from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
@@ -777,6 +776,7 @@ cdef class MessageBus:
         self._endpoints: dict[str, Callable[[Any], None]] = {}
         self._patterns: dict[str, Subscription[:]] = {}
         self._subscriptions: dict[Subscription, list[str]] = {}
+        self._trie = SubscriptionTrie()
         self._correlation_index: dict[UUID4, Callable[[Any], None]] = {}
         self._has_backing = config.database is not None
         self._publishable_types = EXTERNAL_PUBLISHING_TYPES
@@ -1100,13 +1100,23 @@ cdef class MessageBus:
             self._log.debug(f"{sub} already exists.")
             return
 
-        cdef list matches = []
-        cdef list patterns = list(self._patterns.keys())
+        self._trie.add(sub)
+
+        # Find the already resolved topics which the subscription matches,
+        # a subscription without wildcards can only match its own topic.
+        cdef list patterns
+        if "*" in topic or "?" in topic:
+            patterns = list(self._patterns.keys())
+        elif topic in self._patterns:
+            patterns = [topic]
+        else:
+            patterns = []
 
+        cdef list matches = []
         cdef str pattern
         cdef list subs
         for pattern in patterns:
-            if is_matching(topic, pattern):
+            if is_matching(pattern, topic):
                 subs = list(self._patterns[pattern])
                 subs.append(sub)
                 subs = sorted(subs, reverse=True)
@@ -1157,6 +1167,7 @@ cdef class MessageBus:
             self._patterns[pattern] = np.ascontiguousarray(subs, dtype=Subscription)
 
         del self._subscriptions[sub]
+        self._trie.remove(sub)
 
         self._log.debug(f"Removed {sub}.")
 
@@ -1214,54 +1225,52 @@ cdef class MessageBus:
         self.pub_count += 1
 
     cdef Subscription[:] _resolve_subscriptions(self, str topic):
-        cdef list subs_list = []
-        cdef Subscription existing_sub
-        for existing_sub in self._subscriptions:
-            if is_matching(topic, existing_sub.topic):
-                subs_list.append(existing_sub)
-
-        subs_list = sorted(subs_list, reverse=True)
+        # Subscriptions are returned in priority order (highest first)
+        cdef list subs_list = self._trie.match(topic)
         cdef Subscription[:] subs_array = np.ascontiguousarray(subs_list, dtype=Subscription)
         self._patterns[topic] = subs_array
 
-        cdef list matches
-        for sub in subs_array:
-            matches = self._subscriptions.get(sub, [])
-            if topic not in matches:
-                matches.append(topic)
-            self._subscriptions[sub] = sorted(matches)
+        cdef Subscription sub
+        for sub in subs_list:
+            self._subscriptions[sub].append(topic)
 
         return subs_array
 
 
 cdef inline bint is_matching(str topic, str pattern):
-    # Get length of string and wildcard pattern
-    cdef int n = len(topic)
-    cdef int m = len(pattern)
-
-    # Create a DP lookup table
-    cdef np.ndarray[np.int8_t, ndim=2] t = np.empty((n + 1, m + 1), dtype=np.int8)
-    t.fill(False)
-
-    # If both pattern and string are empty: match
-    t[0, 0] = True
-
-    # Handle empty string case (i == 0)
-    cdef int j
-    for j in range(1, m + 1):
-        if pattern[j - 1] == '*':
-            t[0, j] = t[0, j - 1]
-
-    # Build a matrix in a bottom-up manner
-    cdef int i
-    for i in range(1, n + 1):
-        for j in range(1, m + 1):
-            if pattern[j - 1] == '*':
-                t[i, j] = t[i - 1, j] or t[i, j - 1]
-            elif pattern[j - 1] == '?' or topic[i - 1] == pattern[j - 1]:
-                t[i, j] = t[i - 1, j - 1]
-
-    return t[n, m]
+    # Greedy wildcard matching which backtracks to the last `*` on a mismatch,
+    # runs in linear time for typical topics and does not allocate.
+    cdef Py_ssize_t n = len(topic)
+    cdef Py_ssize_t m = len(pattern)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j = 0
+    cdef Py_ssize_t star_i = 0
+    cdef Py_ssize_t star_j = -1
+    cdef Py_UCS4 c
+    while i < n:
+        if j < m:
+            c = pattern[j]
+            if c == "*":
+                star_i = i
+                star_j = j
+                j += 1
+                continue
+            if c == "?" or c == topic[i]:
+                i += 1
+                j += 1
+                continue
+        if star_j == -1:
+            return False
+        # Backtrack: extend the last `*` by one more character
+        star_i += 1
+        i = star_i
+        j = star_j + 1
+
+    # Any remaining pattern must be all `*`
+    while j < m and pattern[j] == "*":
+        j += 1
+
+    return j == m
 
 
 # Python wrapper for test access
@@ -1340,6 +1349,170 @@ cdef class Subscription:
             f"handler={self.handler}, "
             f"priority={self.priority})"
         )
+
+
+cdef class SubscriptionTrieNode:
+    """
+    Represents a node of a `SubscriptionTrie`.
+
+    This is an internal class intended to be used by the subscription trie.
+
+    Parameters
+    ----------
+    is_wildcard : bool
+        If the node is for a `*` wildcard character.
+    """
+
+    def __init__(self, bint is_wildcard):
+        self.is_wildcard = is_wildcard
+        self.children = {}
+        self.subscriptions = []
+
+
+cdef class SubscriptionTrie:
+    """
+    Provides an index of subscriptions keyed by the characters of their topic.
+
+    This is an internal class intended to be used by the message bus to find
+    the subscriptions matching a topic. Topics are matched by advancing the set
+    of active trie nodes one character at a time, so the cost is proportional to
+    the length of the topic (rather than the number of subscriptions).
+
+    A `*` node can match zero characters (it is entered along with its parent)
+    or any number of characters (it remains active after each character),
+    and a `?` node matches any single character.
+    """
+
+    def __init__(self):
+        self._root = SubscriptionTrieNode(is_wildcard=False)
+        self._sequence: dict[Subscription, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    cpdef void add(self, Subscription sub):
+        """
+        Add the given subscription to the trie.
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to add.
+
+        """
+        Condition.not_none(sub, "sub")
+
+        if sub in self._sequence:
+            return  # Already indexed
+
+        cdef SubscriptionTrieNode node = self._root
+        cdef SubscriptionTrieNode child
+        cdef Py_UCS4 c
+        for c in sub.topic:
+            child = node.children.get(c)
+            if child is None:
+                child = SubscriptionTrieNode(is_wildcard=c == "*")
+                node.children[c] = child
+            node = child
+
+        node.subscriptions.append(sub)
+        self._sequence[sub] = self._next_sequence
+        self._next_sequence += 1
+
+    cpdef void remove(self, Subscription sub):
+        """
+        Remove the given subscription from the trie.
+
+        Parameters
+        ----------
+        sub : Subscription
+            The subscription to remove.
+
+        """
+        Condition.not_none(sub, "sub")
+
+        if self._sequence.pop(sub, None) is None:
+            return  # Not indexed
+
+        cdef list path = [self._root]
+        cdef SubscriptionTrieNode node = self._root
+        cdef Py_UCS4 c
+        for c in sub.topic:
+            node = node.children[c]
+            path.append(node)
+
+        node.subscriptions.remove(sub)
+
+        # Prune any nodes left without subscriptions or children
+        cdef int i
+        for i in range(len(sub.topic), 0, -1):
+            node = path[i]
+            if node.subscriptions or node.children:
+                break
+            (<SubscriptionTrieNode>path[i - 1]).children.pop(sub.topic[i - 1])
+
+    cpdef list match(self, str topic):
+        """
+        Return the subscriptions matching the given `topic`.
+
+        Parameters
+        ----------
+        topic : str
+            The topic to match (wildcard characters are matched literally).
+
+        Returns
+        -------
+        list[Subscription]
+            Sorted in priority order (highest first), then in the order the
+            subscriptions were added.
+
+        """
+        Condition.not_none(topic, "topic")
+
+        cdef list states = []
+        _add_trie_state(self._root, states)
+
+        cdef:
+            list next_states
+            SubscriptionTrieNode node
+            SubscriptionTrieNode child
+            Py_UCS4 c
+        for c in topic:
+            if not states:
+                return []
+            next_states = []
+            for node in states:
+                if node.is_wildcard:
+                    _add_trie_state(node, next_states)
+                child = node.children.get(c)
+                if child is not None:
+                    _add_trie_state(child, next_states)
+                child = node.children.get("?")
+                if child is not None:
+                    _add_trie_state(child, next_states)
+            states = next_states
+
+        cdef list matches = []
+        for node in states:
+            matches.extend(node.subscriptions)
+
+        matches.sort(key=self._sequence.__getitem__)
+        matches.sort(reverse=True)  # Stable, so ties remain in insertion order
+        return matches
+
+
+cdef inline void _add_trie_state(SubscriptionTrieNode node, list states):
+    if node in states:
+        return
+    states.append(node)
+
+    # A `*` can match zero characters, so its node is also active
+    cdef SubscriptionTrieNode wildcard = node.children.get("*")
+    if wildcard is not None:
+        _add_trie_state(wildcard, states)
+
+
 cdef class Throttler:
     """
     Provides a generic throttler which can either buffer or drop messages.
@@ -237,11 +237,14 @@ class CacheConfig(NautilusConfig, frozen=True):
     ----------
     database : DatabaseConfig, optional
         The configuration for the cache backing database.
-    encoding : str, {'msgpack', 'json'}, default 'msgpack'
+    encoding : str, {'msgpack', 'json', 'compact'}, default 'msgpack'
         The encoding for database operations, controls the type of serializer used.
+        The 'compact' encoding writes order and position events as schema encoded
+        binary values (with all other objects encoded as for 'msgpack').
     timestamps_as_iso8601, default False
         If timestamps should be persisted as ISO 8601 strings.
         If `False` then will persit as UNIX nanoseconds.
+        Not applicable for the 'compact' encoding (always UNIX nanoseconds).
     buffer_interval_ms : PositiveInt, optional
         The buffer interval (milliseconds) between pipelined/batched transactions.
         The recommended range if using buffered pipeling is [10, 1000] milliseconds,
@@ -256,6 +259,11 @@ class CacheConfig(NautilusConfig, frozen=True):
         The maximum length for internal tick dequeues.
     bar_capacity : PositiveInt, default 10_000
         The maximum length for internal bar dequeues.
+    warm_start : bool, default False
+        If only open orders and positions should be loaded from the database on start.
+        Closed orders and positions are then loaded from the database on first access
+        by ID, or all at once by the first query which can include them (such as
+        `orders`, `orders_closed`, `positions` or `positions_closed`).
 
     """
 
@@ -268,6 +276,7 @@ class CacheConfig(NautilusConfig, frozen=True):
     use_instance_id: bool = False
     tick_capacity: PositiveInt = 10_000
     bar_capacity: PositiveInt = 10_000
+    warm_start: bool = False
 
 
 class MessageBusConfig(NautilusConfig, frozen=True):
@@ -278,11 +287,14 @@ class MessageBusConfig(NautilusConfig, frozen=True):
     ----------
     database : DatabaseConfig, optional
         The configuration for the message bus backing database.
-    encoding : str, {'msgpack', 'json'}, default 'msgpack'
+    encoding : str, {'msgpack', 'json', 'compact'}, default 'msgpack'
         The encoding for database operations, controls the type of serializer used.
+        The 'compact' encoding writes order and position events as schema encoded
+        binary values (with all other objects encoded as for 'msgpack').
     timestamps_as_iso8601, default False
         If timestamps should be persisted as ISO 8601 strings.
         If `False` then will persit as UNIX nanoseconds.
+        Not applicable for the 'compact' encoding (always UNIX nanoseconds).
     buffer_interval_ms : PositiveInt, optional
         The buffer interval (milliseconds) between pipelined/batched transactions.
         The recommended range if using buffered pipeling is [10, 1000] milliseconds,
@@ -393,6 +405,13 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
     max_notional_per_order : dict[str, int], default empty dict
         The maximum notional value of an order per instrument ID.
         The value should be a valid decimal format.
+    max_net_exposure_per_instrument : dict[str, int], default empty dict
+        The maximum net exposure (notional value of the net position including
+        the order) per instrument ID, checked for margin accounts.
+        The value should be a valid decimal format.
+    max_leverage : float, optional
+        The maximum effective leverage of the net position including the order
+        (net exposure / account total balance), checked for margin accounts.
     debug : bool, default False
         If debug mode is active (will provide extra debug logging).
 
@@ -402,6 +421,8 @@ class RiskEngineConfig(NautilusConfig, frozen=True):
     max_order_submit_rate: str = "100/00:00:01"
     max_order_modify_rate: str = "100/00:00:01"
     max_notional_per_order: dict[str, int] = {}
+    max_net_exposure_per_instrument: dict[str, int] = {}
+    max_leverage: float | None = None
     debug: bool = False
 
 
@@ -36,10 +36,14 @@ class LiveDataEngineConfig(DataEngineConfig, frozen=True):
     ----------
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    batch_size : PositiveInt, default 1_000
+        The maximum number of data items drained from the internal data queue
+        per wakeup, before yielding back to the event loop.
 
     """
 
     qsize: PositiveInt = 100_000
+    batch_size: PositiveInt = 1_000
 
 
 class LiveRiskEngineConfig(RiskEngineConfig, frozen=True):
@@ -88,6 +92,9 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
         are colocated with the venue (to avoid the potential for race conditions).
     qsize : PositiveInt, default 100_000
         The queue size for the engines internal queue buffers.
+    batch_size : PositiveInt, default 1_000
+        The maximum number of events drained from the internal event queue
+        per wakeup, before yielding back to the event loop.
 
     """
 
@@ -98,6 +105,7 @@ class LiveExecEngineConfig(ExecEngineConfig, frozen=True):
     inflight_check_interval_ms: NonNegativeInt = 2_000
     inflight_check_threshold_ms: NonNegativeInt = 5_000
     qsize: PositiveInt = 100_000
+    batch_size: PositiveInt = 1_000
 
 
 class RoutingConfig(NautilusConfig, frozen=True):
@@ -1997,6 +1997,34 @@ CVec orderbook_bids(struct OrderBook_API *book);
 
 CVec orderbook_asks(struct OrderBook_API *book);
 
+/**
+ * Fills the given buffers with the price, size and order count of the top bid levels.
+ *
+ * # Safety
+ *
+ * - Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+ */
+uintptr_t orderbook_bids_fill_depth(const struct OrderBook_API *book,
+                                    uintptr_t depth,
+                                    double *prices,
+                                    double *sizes,
+                                    uint64_t *counts,
+                                    uint8_t cumulative);
+
+/**
+ * Fills the given buffers with the price, size and order count of the top ask levels.
+ *
+ * # Safety
+ *
+ * - Assumes `prices`, `sizes` and `counts` are valid pointers to buffers of at least `depth` elements.
+ */
+uintptr_t orderbook_asks_fill_depth(const struct OrderBook_API *book,
+                                    uintptr_t depth,
+                                    double *prices,
+                                    double *sizes,
+                                    uint64_t *counts,
+                                    uint8_t cumulative);
+
 uint8_t orderbook_has_bid(struct OrderBook_API *book);
 
 uint8_t orderbook_has_ask(struct OrderBook_API *book);
@@ -181,6 +181,9 @@ cdef class DataClient(Component):
     def _handle_data_py(self, Data data):
         self._handle_data(data)
 
+    def _handle_data_batch_py(self, list data):
+        self._handle_data_batch(data)
+
     def _handle_data_response_py(self, DataType data_type, data, UUID4 correlation_id):
         self._handle_data_response(data_type, data, correlation_id)
 
@@ -189,6 +192,9 @@ cdef class DataClient(Component):
     cpdef void _handle_data(self, Data data):
         self._msgbus.send(endpoint="DataEngine.process", msg=data)
 
+    cpdef void _handle_data_batch(self, list data):
+        self._msgbus.send(endpoint="DataEngine.process_batch", msg=data)
+
     cpdef void _handle_data_response(self, DataType data_type, data, UUID4 correlation_id):
         cdef DataResponse response = DataResponse(
             client_id=self.id,
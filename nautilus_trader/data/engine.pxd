@@ -24,6 +24,7 @@ from nautilus_trader.data.messages cimport DataRequest
 from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.data.messages cimport Subscribe
 from nautilus_trader.data.messages cimport Unsubscribe
+from nautilus_trader.model.book cimport OrderBookDiffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarType
 from nautilus_trader.model.data cimport DataType
@@ -52,11 +53,17 @@ cdef class DataEngine(Component):
     cdef readonly dict[ClientId, DataClient] _clients
     cdef readonly dict[Venue, DataClient] _routing_map
     cdef readonly dict _order_book_intervals
+    cdef readonly dict[str, OrderBookDiffer] _order_book_differs
     cdef readonly dict[BarType, BarAggregator] _bar_aggregators
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_quote_feeds
     cdef readonly dict[InstrumentId, list[SyntheticInstrument]] _synthetic_trade_feeds
     cdef readonly list[InstrumentId] _subscribed_synthetic_quotes
     cdef readonly list[InstrumentId] _subscribed_synthetic_trades
+    cdef dict[InstrumentId, str] _topic_cache_deltas
+    cdef dict[InstrumentId, str] _topic_cache_tickers
+    cdef dict[InstrumentId, str] _topic_cache_quotes
+    cdef dict[InstrumentId, str] _topic_cache_trades
+    cdef dict[BarType, str] _topic_cache_bars
     cdef readonly bint _time_bars_build_with_no_updates
     cdef readonly bint _time_bars_timestamp_on_close
     cdef readonly str _time_bars_interval_type
@@ -107,6 +114,7 @@ cdef class DataEngine(Component):
 
     cpdef void execute(self, DataCommand command)
     cpdef void process(self, Data data)
+    cpdef void process_batch(self, list data)
     cpdef void request(self, DataRequest request)
     cpdef void response(self, DataResponse response)
 
@@ -118,6 +126,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_subscribe_instrument(self, MarketDataClient client, InstrumentId instrument_id)
     cpdef void _handle_subscribe_order_book_deltas(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
     cpdef void _handle_subscribe_order_book_snapshots(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
+    cpdef void _handle_subscribe_order_book_diffs(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
     cpdef void _setup_order_book(self, MarketDataClient client, InstrumentId instrument_id, dict metadata, bint only_deltas)  # noqa
     cpdef void _handle_subscribe_ticker(self, MarketDataClient client, InstrumentId instrument_id)
     cpdef void _handle_subscribe_quote_ticks(self, MarketDataClient client, InstrumentId instrument_id)
@@ -132,6 +141,7 @@ cdef class DataEngine(Component):
     cpdef void _handle_unsubscribe_instrument(self, MarketDataClient client, InstrumentId instrument_id)
     cpdef void _handle_unsubscribe_order_book_deltas(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
     cpdef void _handle_unsubscribe_order_book_snapshots(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
+    cpdef void _handle_unsubscribe_order_book_diffs(self, MarketDataClient client, InstrumentId instrument_id, dict metadata)  # noqa
     cpdef void _handle_unsubscribe_ticker(self, MarketDataClient client, InstrumentId instrument_id)
     cpdef void _handle_unsubscribe_quote_ticks(self, MarketDataClient client, InstrumentId instrument_id)
     cpdef void _handle_unsubscribe_trade_ticks(self, MarketDataClient client, InstrumentId instrument_id)
@@ -155,6 +165,15 @@ cdef class DataEngine(Component):
     cpdef void _handle_instrument_status(self, InstrumentStatus data)
     cpdef void _handle_close_price(self, InstrumentClose data)
 
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef void _clear_topic_caches(self)
+    cdef str _get_deltas_topic(self, InstrumentId instrument_id)
+    cdef str _get_tickers_topic(self, InstrumentId instrument_id)
+    cdef str _get_quotes_topic(self, InstrumentId instrument_id)
+    cdef str _get_trades_topic(self, InstrumentId instrument_id)
+    cdef str _get_bars_topic(self, BarType bar_type)
+
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response)
@@ -168,6 +187,7 @@ cdef class DataEngine(Component):
     cpdef void _internal_update_instruments(self, list instruments)
     cpdef void _update_order_book(self, Data data)
     cpdef void _snapshot_order_book(self, TimeEvent snap_event)
+    cpdef void _diff_order_book(self, TimeEvent diff_event)
     cpdef void _start_bar_aggregator(self, MarketDataClient client, BarType bar_type, bint await_partial)
     cpdef void _stop_bar_aggregator(self, MarketDataClient client, BarType bar_type)
     cpdef void _update_synthetics_with_quote(self, list synthetics, QuoteTick update)
@@ -43,6 +43,7 @@ from libc.stdint cimport uint64_t
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
 from nautilus_trader.common.component cimport MessageBus
+from nautilus_trader.common.component cimport Subscription
 from nautilus_trader.common.logging cimport CMD
 from nautilus_trader.common.logging cimport RECV
 from nautilus_trader.common.logging cimport REQ
@@ -71,6 +72,8 @@ from nautilus_trader.data.messages cimport DataResponse
 from nautilus_trader.data.messages cimport Subscribe
 from nautilus_trader.data.messages cimport Unsubscribe
 from nautilus_trader.model.book cimport OrderBook
+from nautilus_trader.model.book cimport OrderBookDiff
+from nautilus_trader.model.book cimport OrderBookDiffer
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport BarAggregation
 from nautilus_trader.model.data cimport BarType
@@ -136,12 +139,20 @@ cdef class DataEngine(Component):
         self._default_client: Optional[DataClient] = None
         self._catalog: Optional[ParquetDataCatalog] = None
         self._order_book_intervals: dict[(InstrumentId, int), list[Callable[[Bar], None]]] = {}
+        self._order_book_differs: dict[str, OrderBookDiffer] = {}
         self._bar_aggregators: dict[BarType, BarAggregator] = {}
         self._synthetic_quote_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._synthetic_trade_feeds: dict[InstrumentId, list[SyntheticInstrument]] = {}
         self._subscribed_synthetic_quotes: list[InstrumentId] = []
         self._subscribed_synthetic_trades: list[InstrumentId] = []
 
+        # Topic caches (avoids building topic strings for every message)
+        self._topic_cache_deltas: dict[InstrumentId, str] = {}
+        self._topic_cache_tickers: dict[InstrumentId, str] = {}
+        self._topic_cache_quotes: dict[InstrumentId, str] = {}
+        self._topic_cache_trades: dict[InstrumentId, str] = {}
+        self._topic_cache_bars: dict[BarType, str] = {}
+
         # Settings
         self.debug = config.debug
         self._time_bars_build_with_no_updates = config.time_bars_build_with_no_updates
@@ -158,6 +169,7 @@ cdef class DataEngine(Component):
         # Register endpoints
         self._msgbus.register(endpoint="DataEngine.execute", handler=self.execute)
         self._msgbus.register(endpoint="DataEngine.process", handler=self.process)
+        self._msgbus.register(endpoint="DataEngine.process_batch", handler=self.process_batch)
         self._msgbus.register(endpoint="DataEngine.request", handler=self.request)
         self._msgbus.register(endpoint="DataEngine.response", handler=self.response)
 
@@ -545,11 +557,13 @@ cdef class DataEngine(Component):
             client.reset()
 
         self._order_book_intervals.clear()
+        self._order_book_differs.clear()
         self._bar_aggregators.clear()
         self._synthetic_quote_feeds.clear()
         self._synthetic_trade_feeds.clear()
         self._subscribed_synthetic_quotes.clear()
         self._subscribed_synthetic_trades.clear()
+        self._clear_topic_caches()
 
         self._clock.cancel_timers()
         self.command_count = 0
@@ -562,6 +576,7 @@ cdef class DataEngine(Component):
         for client in self._clients.values():
             client.dispose()
 
+        self._clear_topic_caches()
         self._clock.cancel_timers()
 
 # -- COMMANDS -------------------------------------------------------------------------------------
@@ -594,6 +609,22 @@ cdef class DataEngine(Component):
 
         self._handle_data(data)
 
+    cpdef void process_batch(self, list data):
+        """
+        Process the given batch of data (in order).
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to process.
+
+        """
+        Condition.not_none(data, "data")
+
+        cdef Data item
+        for item in data:
+            self._handle_data(item)
+
     cpdef void request(self, DataRequest request):
         """
         Handle the given request.
@@ -663,6 +694,12 @@ cdef class DataEngine(Component):
                 command.data_type.metadata.get("instrument_id"),
                 command.data_type.metadata,
             )
+        elif command.data_type.type == OrderBookDiff:
+            self._handle_subscribe_order_book_diffs(
+                client,
+                command.data_type.metadata.get("instrument_id"),
+                command.data_type.metadata,
+            )
         elif command.data_type.type == OrderBookDelta:
             self._handle_subscribe_order_book_deltas(
                 client,
@@ -720,6 +757,12 @@ cdef class DataEngine(Component):
                 command.data_type.metadata.get("instrument_id"),
                 command.data_type.metadata,
             )
+        elif command.data_type.type == OrderBookDiff:
+            self._handle_unsubscribe_order_book_diffs(
+                client,
+                command.data_type.metadata.get("instrument_id"),
+                command.data_type.metadata,
+            )
         elif command.data_type.type == OrderBookDelta:
             self._handle_unsubscribe_order_book_deltas(
                 client,
@@ -834,6 +877,67 @@ cdef class DataEngine(Component):
             only_deltas=False,
         )
 
+    cpdef void _handle_subscribe_order_book_diffs(
+        self,
+        MarketDataClient client,
+        InstrumentId instrument_id,
+        dict metadata,
+    ):
+        Condition.not_none(client, "client")
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.not_none(metadata, "metadata")
+
+        if instrument_id.is_synthetic():
+            self._log.error("Cannot subscribe for synthetic instrument `OrderBookDiff` data.")
+            return
+
+        cdef:
+            uint64_t interval_ms = metadata["interval_ms"]
+            uint64_t interval_ns
+            uint64_t timestamp_ns
+        timer_name = f"OrderBookDiff-{instrument_id}-{interval_ms}"
+        cdef OrderBookDiffer differ = self._order_book_differs.get(timer_name)
+        if differ is None:
+            self._order_book_differs[timer_name] = OrderBookDiffer(
+                instrument_id=instrument_id,
+                depth=metadata["depth"],
+                checkpoint_interval=metadata["checkpoint_interval"],
+            )
+
+            interval_ns = millis_to_nanos(interval_ms)
+            timestamp_ns = self._clock.timestamp_ns()
+            start_time_ns = timestamp_ns - (timestamp_ns % interval_ns)
+
+            if start_time_ns - NANOSECONDS_IN_MILLISECOND <= self._clock.timestamp_ns():
+                start_time_ns += NANOSECONDS_IN_SECOND  # Add one second
+
+            self._clock.set_timer_ns(
+                name=timer_name,
+                interval_ns=interval_ns,
+                start_time_ns=start_time_ns,
+                stop_time_ns=0,  # No stop
+                callback=self._diff_order_book,
+            )
+            self._log.debug(f"Set timer {timer_name}.")
+        else:
+            if differ.depth != metadata["depth"] or differ.checkpoint_interval != metadata["checkpoint_interval"]:
+                self._log.warning(
+                    f"Subscription to `OrderBookDiff` data for {instrument_id} "
+                    f"every {interval_ms}ms already exists with "
+                    f"depth={differ.depth}, checkpoint_interval={differ.checkpoint_interval}, "
+                    f"ignoring depth={metadata['depth']}, "
+                    f"checkpoint_interval={metadata['checkpoint_interval']}.",
+                )
+            # Force a checkpoint so the new subscriber can synchronize
+            differ.force_checkpoint()
+
+        self._setup_order_book(
+            client,
+            instrument_id,
+            metadata,
+            only_deltas=False,
+        )
+
     cpdef void _setup_order_book(
         self,
         MarketDataClient client,
@@ -1140,6 +1244,59 @@ cdef class DataEngine(Component):
         ):
             client.unsubscribe_order_book_snapshots(instrument_id)
 
+    cpdef void _handle_unsubscribe_order_book_diffs(
+        self,
+        MarketDataClient client,
+        InstrumentId instrument_id,
+        dict metadata,
+    ):
+        Condition.not_none(client, "client")
+        Condition.not_none(instrument_id, "instrument_id")
+        Condition.not_none(metadata, "metadata")
+
+        if instrument_id.is_synthetic():
+            self._log.error("Cannot unsubscribe from synthetic instrument `OrderBookDiff` data.")
+            return
+
+        cdef uint64_t interval_ms = metadata["interval_ms"]
+        if self._msgbus.has_subscribers(
+            f"data.book.diffs"
+            f".{instrument_id.venue}"
+            f".{instrument_id.symbol}"
+            f".{interval_ms}",
+        ):
+            return  # Still subscribed
+
+        timer_name = f"OrderBookDiff-{instrument_id}-{interval_ms}"
+        if self._order_book_differs.pop(timer_name, None) is not None:
+            if timer_name in self._clock.timer_names:
+                self._clock.cancel_timer(timer_name)
+            self._log.debug(f"Cancelled timer {timer_name}.")
+
+        # The order book is still required by diffs at other intervals or by snapshots
+        cdef OrderBookDiffer differ
+        for differ in self._order_book_differs.values():
+            if differ.instrument_id == instrument_id:
+                return
+        if self._msgbus.has_subscribers(
+            f"data.book.snapshots"
+            f".{instrument_id.venue}"
+            f".{instrument_id.symbol}",
+        ):
+            return
+
+        # The engine maintains the book through its own subscription to the
+        # deltas, so only subscriptions from other handlers keep the deltas
+        cdef str topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+        cdef Subscription sub
+        for sub in self._msgbus.subscriptions(topic):
+            if sub.handler != self._update_order_book:
+                return
+
+        if self._msgbus.is_subscribed(topic=topic, handler=self._update_order_book):
+            self._msgbus.unsubscribe(topic=topic, handler=self._update_order_book)
+        client.unsubscribe_order_book_deltas(instrument_id)
+
     cpdef void _handle_unsubscribe_ticker(
         self,
         MarketDataClient client,
@@ -1427,26 +1584,20 @@ cdef class DataEngine(Component):
             deltas=[delta]
         )
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{deltas.instrument_id.venue}"
-                  f".{deltas.instrument_id.symbol}",
+            topic=self._get_deltas_topic(deltas.instrument_id),
             msg=deltas,
         )
 
     cpdef void _handle_order_book_deltas(self, OrderBookDeltas deltas):
         self._msgbus.publish_c(
-            topic=f"data.book.deltas"
-                  f".{deltas.instrument_id.venue}"
-                  f".{deltas.instrument_id.symbol}",
+            topic=self._get_deltas_topic(deltas.instrument_id),
             msg=deltas,
         )
 
     cpdef void _handle_ticker(self, Ticker ticker):
         self._cache.add_ticker(ticker)
         self._msgbus.publish_c(
-            topic=f"data.tickers"
-                  f".{ticker.instrument_id.venue}"
-                  f".{ticker.instrument_id.symbol}",
+            topic=self._get_tickers_topic(ticker.instrument_id),
             msg=ticker,
         )
 
@@ -1459,9 +1610,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_quote(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_quotes_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1474,9 +1623,7 @@ cdef class DataEngine(Component):
             self._update_synthetics_with_trade(synthetics, tick)
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{tick.instrument_id.venue}"
-                  f".{tick.instrument_id.symbol}",
+            topic=self._get_trades_topic(tick.instrument_id),
             msg=tick,
         )
 
@@ -1517,7 +1664,7 @@ cdef class DataEngine(Component):
         if not bar.is_revision:
             self._cache.add_bar(bar)
 
-        self._msgbus.publish_c(topic=f"data.bars.{bar_type}", msg=bar)
+        self._msgbus.publish_c(topic=self._get_bars_topic(bar_type), msg=bar)
 
     cpdef void _handle_venue_status(self, VenueStatus data):
         self._msgbus.publish_c(topic=f"data.status.{data.venue}", msg=data)
@@ -1531,6 +1678,50 @@ cdef class DataEngine(Component):
     cpdef void _handle_generic_data(self, GenericData data):
         self._msgbus.publish_c(topic=f"data.{data.data_type.topic}", msg=data.data)
 
+# -- TOPICS ---------------------------------------------------------------------------------------
+
+    cdef void _clear_topic_caches(self):
+        self._topic_cache_deltas.clear()
+        self._topic_cache_tickers.clear()
+        self._topic_cache_quotes.clear()
+        self._topic_cache_trades.clear()
+        self._topic_cache_bars.clear()
+
+    cdef str _get_deltas_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_deltas.get(instrument_id)
+        if topic is None:
+            topic = f"data.book.deltas.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_deltas[instrument_id] = topic
+        return topic
+
+    cdef str _get_tickers_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_tickers.get(instrument_id)
+        if topic is None:
+            topic = f"data.tickers.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_tickers[instrument_id] = topic
+        return topic
+
+    cdef str _get_quotes_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_quotes.get(instrument_id)
+        if topic is None:
+            topic = f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_quotes[instrument_id] = topic
+        return topic
+
+    cdef str _get_trades_topic(self, InstrumentId instrument_id):
+        cdef str topic = self._topic_cache_trades.get(instrument_id)
+        if topic is None:
+            topic = f"data.trades.{instrument_id.venue}.{instrument_id.symbol}"
+            self._topic_cache_trades[instrument_id] = topic
+        return topic
+
+    cdef str _get_bars_topic(self, BarType bar_type):
+        cdef str topic = self._topic_cache_bars.get(bar_type)
+        if topic is None:
+            topic = f"data.bars.{bar_type}"
+            self._topic_cache_bars[bar_type] = topic
+        return topic
+
 # -- RESPONSE HANDLERS ----------------------------------------------------------------------------
 
     cpdef void _handle_response(self, DataResponse response):
@@ -1627,6 +1818,36 @@ cdef class DataEngine(Component):
                 f"no order book found, {snap_event}.",
             )
 
+    cpdef void _diff_order_book(self, TimeEvent diff_event):
+        cdef OrderBookDiffer differ = self._order_book_differs.get(diff_event.name)
+        if differ is None:
+            return  # Unsubscribed
+
+        cdef InstrumentId instrument_id = differ.instrument_id
+        cdef OrderBook order_book = self._cache.order_book(instrument_id)
+        if order_book is None:
+            self._log.error(
+                f"Cannot diff orderbook: "
+                f"no order book found, {diff_event}.",
+            )
+            return
+
+        if order_book.ts_last == 0:
+            self._log.debug("OrderBook not yet updated, skipping diff.")
+            return
+
+        cdef OrderBookDiff diff = differ.diff(order_book, diff_event.ts_init)
+        if diff is None:
+            return  # No levels changed
+
+        self._msgbus.publish_c(
+            topic=f"data.book.diffs"
+                  f".{instrument_id.venue}"
+                  f".{instrument_id.symbol}"
+                  f".{diff_event.name.rpartition('-')[2]}",
+            msg=diff,
+        )
+
     cpdef void _start_bar_aggregator(
         self,
         MarketDataClient client,
@@ -1790,9 +2011,7 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.quotes"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._get_quotes_topic(synthetic_instrument_id),
             msg=synthetic_quote,
         )
 
@@ -1839,8 +2058,6 @@ cdef class DataEngine(Component):
         )
 
         self._msgbus.publish_c(
-            topic=f"data.trades"
-                  f".{synthetic_instrument_id.venue}"
-                  f".{synthetic_instrument_id.symbol}",
+            topic=self._get_trades_topic(synthetic_instrument_id),
             msg=synthetic_trade,
         )
@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 
 
 cdef class AroonOscillator(Indicator):
-    cdef object _high_inputs
-    cdef object _low_inputs
+    cdef RollingExtremum _high_inputs
+    cdef RollingExtremum _low_inputs
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -30,4 +33,7 @@ cdef class AroonOscillator(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
     cdef void _check_initialized(self)
@@ -13,12 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
-import numpy as np
+cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 from nautilus_trader.model.data cimport Bar
 
 
@@ -42,8 +42,8 @@ cdef class AroonOscillator(Indicator):
         super().__init__(params = params)
 
         self.period = period
-        self._high_inputs = deque(maxlen = self.period + 1)
-        self._low_inputs = deque(maxlen = self.period + 1)
+        self._high_inputs = RollingExtremum(self.period + 1, is_max=True)
+        self._low_inputs = RollingExtremum(self.period + 1, is_max=False)
         self.aroon_up = 0
         self.aroon_down = 0
         self.value = 0
@@ -65,6 +65,21 @@ cdef class AroonOscillator(Indicator):
             bar.low.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1])
+
     cpdef void update_raw(
         self,
         double high,
@@ -81,12 +96,12 @@ cdef class AroonOscillator(Indicator):
             The low price.
         """
         # Update inputs
-        self._high_inputs.appendleft(high)
-        self._low_inputs.appendleft(low)
+        self._high_inputs.append(high)
+        self._low_inputs.append(low)
 
         # Convert to double to compute values
-        cdef double periods_from_hh = np.argmax(self._high_inputs)
-        cdef double periods_from_ll = np.argmin(self._low_inputs)
+        cdef double periods_from_hh = self._high_inputs.age()
+        cdef double periods_from_ll = self._low_inputs.age()
 
         self.aroon_up = 100.0 * (1.0 - periods_from_hh / self.period)
         self.aroon_down = 100.0 * (1.0 - periods_from_ll / self.period)
@@ -94,11 +109,52 @@ cdef class AroonOscillator(Indicator):
 
         self._check_initialized()
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator values after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+            The `aroon_up`, `aroon_down` and `value` values after each update (one column each).
+
+        Raises
+        ------
+        ValueError
+            If any of `highs` or `lows` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows],
+            ["highs", "lows"],
+            3,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.aroon_up
+        outputs[i, 1] = self.aroon_down
+        outputs[i, 2] = self.value
+
     cdef void _check_initialized(self):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._high_inputs) >= self.period + 1:
+            if self._high_inputs.is_full():
                 self._set_initialized(True)
 
     cpdef void _reset(self):
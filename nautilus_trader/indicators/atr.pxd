@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
 
@@ -29,5 +31,8 @@ cdef class AverageTrueRange(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
     cdef void _floor_value(self)
     cdef void _check_initialized(self)
@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
 from nautilus_trader.model.data cimport Bar
 
 
@@ -78,6 +83,21 @@ cdef class AverageTrueRange(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double(), bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1], hlc[2])
+
     cpdef void update_raw(
         self,
         double high,
@@ -109,6 +129,46 @@ cdef class AverageTrueRange(Indicator):
         self._floor_value()
         self._check_initialized()
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If any of `highs`, `lows` or `closes` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows, closes],
+            ["highs", "lows", "closes"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i], inputs[2, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cdef void _floor_value(self):
         if self._value_floor == 0:
             self.value = self._ma.value
@@ -16,6 +16,10 @@
 from enum import Enum
 from enum import unique
 
+import numpy as np
+
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
@@ -80,6 +84,40 @@ cdef class MovingAverage(Indicator):
         """
         raise NotImplementedError("method `update_raw` must be implemented in the subclass")  # pragma: no cover
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray values, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `values` is not one dimensional.
+
+        """
+        return self._update_raw_batch(
+            [values],
+            ["values"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cpdef void _increment_count(self):
         self.count += 1
 
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -33,8 +35,18 @@ cdef class Indicator:
     cpdef void handle_quote_tick(self, QuoteTick tick)
     cpdef void handle_trade_tick(self, TradeTick tick)
     cpdef void handle_bar(self, Bar bar)
+    cpdef void handle_bars(self, list bars)
     cpdef void reset(self)
 
     cpdef void _set_has_inputs(self, bint setting)
     cpdef void _set_initialized(self, bint setting)
     cpdef void _reset(self)
+
+    cdef np.ndarray _update_raw_batch(self, list inputs, list params, int outputs_count, bint return_values)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
+
+
+cdef double[::1] batch_inputs(np.ndarray values, str param)
+cdef np.ndarray bars_to_closes(list bars)
+cdef np.ndarray bars_to_hlc(list bars)
@@ -13,6 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
+cimport numpy as np
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport FIXED_SCALAR
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -57,6 +63,25 @@ cdef class Indicator:
         """Abstract method (implement in subclass)."""
         raise NotImplementedError(f"Cannot handle {repr(bar)}: method `handle_bar` not implemented in subclass")  # pragma: no cover
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        The resulting state is identical to calling `handle_bar` for each bar
+        in order, without the overhead of a Python level call per bar.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef Bar bar
+        for bar in bars:
+            self.handle_bar(bar)
+
     cpdef void reset(self):
         """
         Reset the indicator.
@@ -76,3 +101,90 @@ cdef class Indicator:
     cpdef void _reset(self):
         """Abstract method (implement in subclass)."""
         raise NotImplementedError("method `_reset` must be implemented in the subclass")  # pragma: no cover
+
+    cdef np.ndarray _update_raw_batch(
+        self,
+        list inputs,
+        list params,
+        int outputs_count,
+        bint return_values,
+    ):
+        # Update the indicator with the given raw input arrays in a single pass,
+        # calling `_update_raw_at` for each index. The resulting state is identical
+        # to calling `update_raw` for each set of values in order, without the
+        # overhead of a Python level call per update. If `return_values` then the
+        # outputs set by `_set_outputs_at` after each update are returned, of shape
+        # (length,) for a single output, otherwise (length, outputs_count).
+        cdef double[::1] values = batch_inputs(inputs[0], params[0])
+        cdef Py_ssize_t length = values.shape[0]
+        cdef double[:, ::1] rows = np.empty((len(inputs), length), dtype=np.float64)
+        rows[0, :] = values
+
+        cdef Py_ssize_t i
+        for i in range(1, len(inputs)):
+            values = batch_inputs(inputs[i], params[i])
+            Condition.equal(values.shape[0], length, f"len({params[i]})", f"len({params[0]})")
+            rows[i, :] = values
+
+        if not return_values:
+            for i in range(length):
+                self._update_raw_at(rows, i)
+            return None
+
+        cdef np.ndarray outputs = np.empty((length, outputs_count), dtype=np.float64)
+        cdef double[:, ::1] outputs_view = outputs
+        for i in range(length):
+            self._update_raw_at(rows, i)
+            self._set_outputs_at(outputs_view, i)
+
+        return outputs.reshape(length) if outputs_count == 1 else outputs
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `_update_raw_at` must be implemented in the subclass")  # pragma: no cover
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        """Abstract method (implement in subclass)."""
+        raise NotImplementedError("method `_set_outputs_at` must be implemented in the subclass")  # pragma: no cover
+
+
+cdef double[::1] batch_inputs(np.ndarray values, str param):
+    # Return the given batch update values as a contiguous float64 view
+    Condition.not_none(values, param)
+    Condition.true(values.ndim == 1, f"`{param}` was not one dimensional")
+
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+cdef np.ndarray bars_to_closes(list bars):
+    # Return the close prices of the given bars
+    cdef Py_ssize_t length = len(bars)
+    cdef np.ndarray closes = np.empty(length, dtype=np.float64)
+    cdef double[::1] closes_view = closes
+
+    cdef:
+        Py_ssize_t i
+        Bar bar
+    for i in range(length):
+        bar = bars[i]
+        closes_view[i] = bar._mem.close.raw / FIXED_SCALAR
+
+    return closes
+
+
+cdef np.ndarray bars_to_hlc(list bars):
+    # Return the high, low and close prices of the given bars (as rows)
+    cdef Py_ssize_t length = len(bars)
+    cdef np.ndarray hlc = np.empty((3, length), dtype=np.float64)
+    cdef double[:, ::1] hlc_view = hlc
+
+    cdef:
+        Py_ssize_t i
+        Bar bar
+    for i in range(length):
+        bar = bars[i]
+        hlc_view[0, i] = bar._mem.high.raw / FIXED_SCALAR
+        hlc_view[1, i] = bar._mem.low.raw / FIXED_SCALAR
+        hlc_view[2, i] = bar._mem.close.raw / FIXED_SCALAR
+
+    return hlc
@@ -0,0 +1,60 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport uint64_t
+
+
+cdef class RollingWindow:
+    cdef double[::1] _values
+    cdef int _index
+    cdef double _mean
+    cdef double _m2
+
+    cdef readonly int capacity
+    """The maximum number of values in the window.\n\n:returns: `int`"""
+    cdef readonly int count
+    """The current number of values in the window.\n\n:returns: `int`"""
+    cdef readonly double sum
+    """The sum of the values in the window.\n\n:returns: `double`"""
+
+    cdef void append(self, double value)
+    cdef double get(self, int index)
+    cdef double oldest(self)
+    cdef double mean(self)
+    cdef double variance(self)
+    cdef double std(self)
+    cdef double std_with_mean(self, double mean)
+    cdef double mad_with_mean(self, double mean)
+    cdef bint is_full(self)
+    cdef void clear(self)
+    cdef void _resum(self)
+
+
+cdef class RollingExtremum:
+    cdef double[::1] _values
+    cdef uint64_t[::1] _seqs
+    cdef int _head
+    cdef int _size
+    cdef uint64_t _seq
+    cdef bint _is_max
+
+    cdef readonly int capacity
+    """The maximum number of values in the window.\n\n:returns: `int`"""
+
+    cdef void append(self, double value)
+    cdef double value(self)
+    cdef int age(self)
+    cdef bint is_full(self)
+    cdef void clear(self)
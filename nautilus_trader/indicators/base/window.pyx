@@ -0,0 +1,372 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+cimport cython
+from libc.math cimport fabs
+from libc.math cimport sqrt
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.core.correctness cimport Condition
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef class RollingWindow:
+    """
+    Provides a fixed capacity window of values with running statistics.
+
+    Values are held in a preallocated ring buffer, and the sum and the sum of
+    squared deviations (Welford) are updated in O(1) for each appended value.
+    The running statistics are recomputed from the buffer each time the ring
+    wraps, which bounds any accumulated floating point error at an amortized
+    O(1) cost per value.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values in the window (> 0).
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity):
+        Condition.positive_int(capacity, "capacity")
+
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._index = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        self.capacity = capacity
+        self.count = 0
+        self.sum = 0.0
+
+    cdef void append(self, double value):
+        """
+        Append the given value, evicting the oldest value if the window is full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        cdef double evicted
+        cdef double delta
+        cdef double prev_mean
+        if self.count < self.capacity:
+            self.count += 1
+            self.sum += value
+            delta = value - self._mean
+            self._mean += delta / self.count
+            self._m2 += delta * (value - self._mean)
+        else:
+            evicted = self._values[self._index]
+            delta = value - evicted
+            prev_mean = self._mean
+            self.sum += delta
+            self._mean += delta / self.count
+            self._m2 += delta * (value - self._mean + evicted - prev_mean)
+            if self._m2 < 0.0:
+                self._m2 = 0.0
+
+        self._values[self._index] = value
+        self._index += 1
+        if self._index == self.capacity:
+            self._index = 0
+            self._resum()
+
+    cdef void _resum(self):
+        # Called when the ring wraps, so the oldest value is at index 0
+        cdef double total = 0.0
+        cdef int i
+        for i in range(self.capacity):
+            total += self._values[i]
+
+        cdef double mean = total / self.capacity
+        cdef double m2 = 0.0
+        cdef double v
+        for i in range(self.capacity):
+            v = self._values[i] - mean
+            m2 += v * v
+
+        self.sum = total
+        self._mean = mean
+        self._m2 = m2
+
+    cdef double get(self, int index):
+        """
+        Return the value at the given index, where zero is the oldest value.
+
+        Parameters
+        ----------
+        index : int
+            The index for the value (0 <= index < count).
+
+        Returns
+        -------
+        double
+
+        """
+        cdef int start = self._index if self.count == self.capacity else 0
+        cdef int position = start + index
+        if position >= self.capacity:
+            position -= self.capacity
+        return self._values[position]
+
+    cdef double oldest(self):
+        """
+        Return the oldest value in the window (next to be evicted when full).
+
+        Returns
+        -------
+        double
+
+        """
+        return self.get(0)
+
+    cdef double mean(self):
+        """
+        Return the mean of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        return self.sum / self.count
+
+    cdef double variance(self):
+        """
+        Return the population variance of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        return self._m2 / self.count
+
+    cdef double std(self):
+        """
+        Return the population standard deviation of the values in the window.
+
+        Returns
+        -------
+        double
+
+        """
+        return sqrt(self.variance())
+
+    cdef double std_with_mean(self, double mean):
+        """
+        Return the standard deviation of the values in the window about the
+        given mean.
+
+        Parameters
+        ----------
+        mean : double
+            The mean for the calculation (may differ from the window mean).
+
+        Returns
+        -------
+        double
+
+        """
+        if self.count == 0:
+            return 0.0
+        cdef double offset = self._mean - mean
+        return sqrt(self._m2 / self.count + offset * offset)
+
+    cdef double mad_with_mean(self, double mean):
+        """
+        Return the mean absolute deviation of the values in the window about
+        the given mean.
+
+        Parameters
+        ----------
+        mean : double
+            The mean for the calculation.
+
+        Returns
+        -------
+        double
+
+        Notes
+        -----
+        This statistic cannot be maintained incrementally and is O(count),
+        though without any allocation.
+
+        """
+        if self.count == 0:
+            return 0.0
+        cdef double total = 0.0
+        cdef int i
+        for i in range(self.count):
+            total += fabs(self.get(i) - mean)
+        return total / self.count
+
+    cdef bint is_full(self):
+        """
+        Return a value indicating whether the window is at capacity.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self.count == self.capacity
+
+    cdef void clear(self):
+        """
+        Clear all values from the window.
+
+        """
+        self._index = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.count = 0
+        self.sum = 0.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef class RollingExtremum:
+    """
+    Provides the rolling maximum or minimum over a fixed capacity window.
+
+    Implemented as a monotonic queue on preallocated ring buffers, so each
+    appended value is O(1) amortized. Where the extremum occurs more than once
+    in the window the most recent occurrence is used.
+
+    Parameters
+    ----------
+    capacity : int
+        The maximum number of values in the window (> 0).
+    is_max : bool, default True
+        If the rolling maximum should be tracked, else the rolling minimum.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive (> 0).
+
+    """
+
+    def __init__(self, int capacity, bint is_max=True):
+        Condition.positive_int(capacity, "capacity")
+
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._seqs = np.zeros(capacity, dtype=np.uint64)
+        self._head = 0
+        self._size = 0
+        self._seq = 0
+        self._is_max = is_max
+
+        self.capacity = capacity
+
+    cdef void append(self, double value):
+        """
+        Append the given value, evicting the oldest value if the window is full.
+
+        Parameters
+        ----------
+        value : double
+            The value to append.
+
+        """
+        self._seq += 1
+
+        # Expire the front if it has left the window
+        if self._size > 0 and self._seqs[self._head] + self.capacity <= self._seq:
+            self._head += 1
+            if self._head == self.capacity:
+                self._head = 0
+            self._size -= 1
+
+        # Drop values from the back which can no longer be the extremum
+        cdef int back
+        while self._size > 0:
+            back = self._head + self._size - 1
+            if back >= self.capacity:
+                back -= self.capacity
+            if self._is_max and self._values[back] > value:
+                break
+            if not self._is_max and self._values[back] < value:
+                break
+            self._size -= 1
+
+        back = self._head + self._size
+        if back >= self.capacity:
+            back -= self.capacity
+        self._values[back] = value
+        self._seqs[back] = self._seq
+        self._size += 1
+
+    cdef double value(self):
+        """
+        Return the current extremum of the window.
+
+        Returns
+        -------
+        double
+
+        """
+        if self._size == 0:
+            return 0.0
+        return self._values[self._head]
+
+    cdef int age(self):
+        """
+        Return the number of values appended since the current extremum.
+
+        Returns
+        -------
+        int
+
+        """
+        if self._size == 0:
+            return 0
+        return <int>(self._seq - self._seqs[self._head])
+
+    cdef bint is_full(self):
+        """
+        Return a value indicating whether the window is at capacity.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._seq >= <uint64_t>self.capacity
+
+    cdef void clear(self):
+        """
+        Clear all values from the window.
+
+        """
+        self._head = 0
+        self._size = 0
+        self._seq = 0
@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 
 
 cdef class BollingerBands(Indicator):
     cdef object _ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
@@ -32,3 +35,6 @@ cdef class BollingerBands(Indicator):
     """The current value of the lower band.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
@@ -13,16 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -66,7 +67,7 @@ cdef class BollingerBands(Indicator):
         self.period = period
         self.k = k
         self._ma = MovingAverageFactory.create(period, ma_type)
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
 
         self.upper = 0.0
         self.middle = 0.0
@@ -122,6 +123,21 @@ cdef class BollingerBands(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1], hlc[2])
+
     cpdef void update_raw(self, double high, double low, double close):
         """
         Update the indicator with the given prices.
@@ -145,20 +161,60 @@ cdef class BollingerBands(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._prices) >= self.period:
+            if self._prices.is_full():
                 self._set_initialized(True)
 
         # Calculate values
-        cdef double std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        cdef double std = self._prices.std_with_mean(self._ma.value)
 
         # Set values
         self.upper = self._ma.value + (self.k * std)
         self.middle = self._ma.value
         self.lower = self._ma.value - (self.k * std)
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator values after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+            The `upper`, `middle` and `lower` values after each update (one column each).
+
+        Raises
+        ------
+        ValueError
+            If any of `highs`, `lows` or `closes` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows, closes],
+            ["highs", "lows", "closes"],
+            3,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i], inputs[2, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.upper
+        outputs[i, 1] = self.middle
+        outputs[i, 2] = self.lower
+
     cpdef void _reset(self):
         self._ma.reset()
         self._prices.clear()
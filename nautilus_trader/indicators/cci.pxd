@@ -13,14 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
 cdef class CommodityChannelIndex(Indicator):
     cdef MovingAverage _ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -33,3 +36,6 @@ cdef class CommodityChannelIndex(Indicator):
 
     cpdef void handle_bar(self, Bar bar)
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
@@ -13,16 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_mad_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -62,7 +63,7 @@ cdef class CommodityChannelIndex(Indicator):
 
         self.period = period
         self.scalar = scalar
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
         self._ma = MovingAverageFactory.create(period, MovingAverageType.SIMPLE)
         self._mad = 0.0
         self.value = 0.0
@@ -85,6 +86,21 @@ cdef class CommodityChannelIndex(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1], hlc[2])
+
     cpdef void update_raw(
         self,
         double high,
@@ -107,10 +123,7 @@ cdef class CommodityChannelIndex(Indicator):
         cdef double typical_price = (high + low + close) / 3.0
         self._prices.append(typical_price)
         self._ma.update_raw(typical_price)
-        self._mad = fast_mad_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        self._mad = self._prices.mad_with_mean(self._ma.value)
         if self._ma.initialized:
             self.value = (typical_price - self._ma.value) / (self.scalar * self._mad)
 
@@ -120,6 +133,46 @@ cdef class CommodityChannelIndex(Indicator):
             if self._ma.initialized:
                 self._set_initialized(True)
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If any of `highs`, `lows` or `closes` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows, closes],
+            ["highs", "lows", "closes"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i], inputs[2, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cpdef void _reset(self):
         """
         Reset the indicator.
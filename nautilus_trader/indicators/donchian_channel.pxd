@@ -13,12 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 
 
 cdef class DonchianChannel(Indicator):
-    cdef object _upper_prices
-    cdef object _lower_prices
+    cdef RollingExtremum _upper_prices
+    cdef RollingExtremum _lower_prices
 
     cdef readonly int period
     """The period for the moving average.\n\n:returns: `int`"""
@@ -30,3 +33,6 @@ cdef class DonchianChannel(Indicator):
     """The current value of the lower band.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
@@ -13,10 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+import numpy as np
+
+cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -48,8 +52,8 @@ cdef class DonchianChannel(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._upper_prices = deque(maxlen=period)
-        self._lower_prices = deque(maxlen=period)
+        self._upper_prices = RollingExtremum(period, is_max=True)
+        self._lower_prices = RollingExtremum(period, is_max=False)
 
         self.upper = 0
         self.middle = 0
@@ -100,6 +104,21 @@ cdef class DonchianChannel(Indicator):
 
         self.update_raw(bar.high.as_double(), bar.low.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1])
+
     cpdef void update_raw(self, double high, double low):
         """
         Update the indicator with the given prices.
@@ -119,14 +138,55 @@ cdef class DonchianChannel(Indicator):
         # Initialization logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._upper_prices) >= self.period and len(self._lower_prices) >= self.period:
+            if self._upper_prices.is_full():
                 self._set_initialized(True)
 
         # Set values
-        self.upper = max(self._upper_prices)
-        self.lower = min(self._lower_prices)
+        self.upper = self._upper_prices.value()
+        self.lower = self._lower_prices.value()
         self.middle = (self.upper + self.lower) / 2
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator values after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+            The `upper`, `middle` and `lower` values after each update (one column each).
+
+        Raises
+        ------
+        ValueError
+            If any of `highs` or `lows` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows],
+            ["highs", "lows"],
+            3,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.upper
+        outputs[i, 1] = self.middle
+        outputs[i, 2] = self.lower
+
     cpdef void _reset(self):
         self._upper_prices.clear()
         self._lower_prices.clear()
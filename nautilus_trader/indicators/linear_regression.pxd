@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 
 
 cdef class LinearRegression(Indicator):
-    cdef object _inputs
+    cdef RollingWindow _inputs
+    cdef double _xy_sum
+    cdef int _slides
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -35,3 +40,7 @@ cdef class LinearRegression(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close_price)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
+    cdef double _calculate_xy_sum(self)
@@ -13,15 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-from statistics import mean
-
-import numpy as np
-
+cimport cython
 cimport numpy as np
+from libc.math cimport M_PI
+from libc.math cimport atan
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_closes
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -45,7 +45,9 @@ cdef class LinearRegression(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._inputs = deque(maxlen=self.period)
+        self._inputs = RollingWindow(period)
+        self._xy_sum = 0.0
+        self._slides = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -67,6 +69,22 @@ cdef class LinearRegression(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray closes = bars_to_closes(bars)
+        self.update_raw_batch(closes)
+
+    @cython.cdivision(True)
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw values.
@@ -77,38 +95,98 @@ cdef class LinearRegression(Indicator):
             The close price.
 
         """
+        cdef double prev_y_sum = self._inputs.sum
         self._inputs.append(close)
 
         # Warmup indicator logic
         if not self.initialized:
             self._set_has_inputs(True)
-            if len(self._inputs) >= self.period:
+            if self._inputs.is_full():
                 self._set_initialized(True)
+                self._xy_sum = self._calculate_xy_sum()
             else:
                 return
+        else:
+            self._slides += 1
+            if self._slides == self.period:
+                # Recalculate to bound the accumulated floating point error
+                self._slides = 0
+                self._xy_sum = self._calculate_xy_sum()
+            else:
+                # Sliding the window moves each remaining input down one x position
+                self._xy_sum += self.period * close - prev_y_sum
 
-        cdef np.ndarray x_arr = np.arange(1, self.period + 1, dtype=np.float64)
-        cdef np.ndarray y_arr = np.asarray(self._inputs, dtype=np.float64)
         cdef double x_sum = 0.5 * self.period * (self.period + 1)
         cdef double x2_sum = x_sum * (2 * self.period + 1) / 3
         cdef double divisor = self.period * x2_sum - x_sum * x_sum
-        cdef double y_sum = sum(y_arr)
-        cdef double xy_sum = sum(x_arr * y_arr)
+        cdef double y_sum = self._inputs.sum
+        cdef double xy_sum = self._xy_sum
         self.slope = (self.period * xy_sum - x_sum * y_sum) / divisor
         self.intercept = (y_sum * x2_sum - x_sum * xy_sum) / divisor
 
-        cdef np.ndarray residuals = np.zeros(self.period, dtype=np.float64)
-        cdef int i
-        for i in np.arange(self.period):
-            residuals[i] = self.slope * x_arr[i] + self.intercept - y_arr[i]
+        cdef double residual = self.slope * self.period + self.intercept - close
+
+        self.value = residual + close
+        self.degree = 180.0 / M_PI * atan(self.slope)
+        self.cfo = 100.0 * residual / close
+
+        # Residual sum of squares from the centered sums, where the bias term
+        # is zero for an exact fit and only captures floating point error.
+        cdef double n = self.period
+        cdef double sxx = x2_sum - x_sum * x_sum / n
+        cdef double sxy = xy_sum - x_sum * y_sum / n
+        cdef double syy = self._inputs.variance() * n
+        cdef double bias = y_sum / n - self.intercept - self.slope * x_sum / n
+        cdef double sse = syy - 2.0 * self.slope * sxy + self.slope * self.slope * sxx + n * bias * bias
+        if sse < 0.0:
+            sse = 0.0
+        self.R2 = 1.0 - sse / syy
+
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `closes` is not one dimensional.
 
-        self.value = residuals[-1] + y_arr[-1]
-        self.degree = 180.0 / np.pi * np.arctan(self.slope)
-        self.cfo = 100.0 * residuals[-1] / y_arr[-1]
-        self.R2 = 1.0 - sum(residuals * residuals) / sum((y_arr - mean(y_arr)) * (y_arr - mean(y_arr)))
+        """
+        return self._update_raw_batch(
+            [closes],
+            ["closes"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
+    cdef double _calculate_xy_sum(self):
+        cdef double xy_sum = 0.0
+        cdef int i
+        for i in range(self.period):
+            xy_sum += (i + 1) * self._inputs.get(i)
+        return xy_sum
 
     cpdef void _reset(self):
         self._inputs.clear()
+        self._xy_sum = 0.0
+        self._slides = 0
         self.slope = 0.0
         self.intercept = 0.0
         self.degree = 0.0
@@ -13,12 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.rust.model cimport PriceType
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_closes
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
@@ -119,6 +124,20 @@ cdef class MovingAverageConvergenceDivergence(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_raw_batch(bars_to_closes(bars))
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given close price.
@@ -139,6 +158,40 @@ cdef class MovingAverageConvergenceDivergence(Indicator):
             if self._fast_ma.initialized and self._slow_ma.initialized:
                 self._set_initialized(True)
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray values, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `values` is not one dimensional.
+
+        """
+        return self._update_raw_batch(
+            [values],
+            ["values"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cpdef void _reset(self):
         self._fast_ma.reset()
         self._slow_ma.reset()
@@ -13,11 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_closes
 from nautilus_trader.model.data cimport Bar
 
 
@@ -67,6 +72,20 @@ cdef class RelativeStrengthIndex(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        self.update_raw_batch(bars_to_closes(bars))
+
     cpdef void update_raw(self, double value):
         """
         Update the indicator with the given value.
@@ -108,6 +127,40 @@ cdef class RelativeStrengthIndex(Indicator):
         self.value = self._rsi_max - (self._rsi_max / (1 + rs))
         self._last_value = value
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray values, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            The update values (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `values` is not one dimensional.
+
+        """
+        return self._update_raw_batch(
+            [values],
+            ["values"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cpdef void _reset(self):
         self._average_gain.reset()
         self._average_loss.reset()
@@ -13,8 +13,11 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -22,7 +25,7 @@ cdef class RelativeVolatilityIndex(Indicator):
     cdef MovingAverage _ma
     cdef MovingAverage _pos_ma
     cdef MovingAverage _neg_ma
-    cdef object _prices
+    cdef RollingWindow _prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -37,3 +40,6 @@ cdef class RelativeVolatilityIndex(Indicator):
 
     cpdef void handle_bar(self, Bar bar)
     cpdef void update_raw(self, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
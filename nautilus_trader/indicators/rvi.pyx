@@ -13,16 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import numpy as np
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
+cimport numpy as np
+
 from nautilus_trader.core.correctness cimport Condition
-from nautilus_trader.core.stats cimport fast_std_with_mean
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_closes
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -59,7 +60,7 @@ cdef class RelativeVolatilityIndex(Indicator):
 
         self.period = period
         self.scalar = scalar
-        self._prices = deque(maxlen=period)
+        self._prices = RollingWindow(period)
         self._ma = MovingAverageFactory.create(period, MovingAverageType.SIMPLE)
         self._pos_ma = MovingAverageFactory.create(period, ma_type)
         self._neg_ma = MovingAverageFactory.create(period, ma_type)
@@ -81,6 +82,21 @@ cdef class RelativeVolatilityIndex(Indicator):
 
         self.update_raw(bar.close.as_double())
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray closes = bars_to_closes(bars)
+        self.update_raw_batch(closes)
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw values.
@@ -94,10 +110,7 @@ cdef class RelativeVolatilityIndex(Indicator):
         self._prices.append(close)
         self._ma.update_raw(close)
 
-        self._std = fast_std_with_mean(
-            values=np.asarray(self._prices, dtype=np.float64),
-            mean=self._ma.value,
-        )
+        self._std = self._prices.std_with_mean(self._ma.value)
 
         self._std = self._std * np.sqrt(self.period) / np.sqrt(self.period - 1)
 
@@ -124,6 +137,40 @@ cdef class RelativeVolatilityIndex(Indicator):
             if  self._pos_ma.initialized:
                 self._set_initialized(True)
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `closes` is not one dimensional.
+
+        """
+        return self._update_raw_batch(
+            [closes],
+            ["closes"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cpdef void _reset(self):
         """
         Reset the indicator.
@@ -13,14 +13,18 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
+from nautilus_trader.indicators.base.window cimport RollingWindow
 
 
 cdef class Stochastics(Indicator):
-    cdef object _highs
-    cdef object _lows
-    cdef object _c_sub_l
-    cdef object _h_sub_l
+    cdef RollingExtremum _highs
+    cdef RollingExtremum _lows
+    cdef RollingWindow _c_sub_l
+    cdef RollingWindow _h_sub_l
 
     cdef readonly int period_k
     """The K window period.\n\n:returns: `int`"""
@@ -32,3 +36,6 @@ cdef class Stochastics(Indicator):
     """The current D line value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double high, double low, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
@@ -13,10 +13,15 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
+import numpy as np
+
+cimport numpy as np
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_hlc
+from nautilus_trader.indicators.base.window cimport RollingExtremum
+from nautilus_trader.indicators.base.window cimport RollingWindow
 from nautilus_trader.model.data cimport Bar
 
 
@@ -51,10 +56,10 @@ cdef class Stochastics(Indicator):
 
         self.period_k = period_k
         self.period_d = period_d
-        self._highs = deque(maxlen=period_k)
-        self._lows = deque(maxlen=period_k)
-        self._c_sub_l = deque(maxlen=period_d)
-        self._h_sub_l = deque(maxlen=period_d)
+        self._highs = RollingExtremum(period_k, is_max=True)
+        self._lows = RollingExtremum(period_k, is_max=False)
+        self._c_sub_l = RollingWindow(period_d)
+        self._h_sub_l = RollingWindow(period_d)
 
         self.value_k = 0
         self.value_d = 0
@@ -77,6 +82,21 @@ cdef class Stochastics(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray hlc = bars_to_hlc(bars)
+        self.update_raw_batch(hlc[0], hlc[1], hlc[2])
+
     cpdef void update_raw(
         self,
         double high,
@@ -105,11 +125,11 @@ cdef class Stochastics(Indicator):
 
         # Initialization logic
         if not self.initialized:
-            if len(self._highs) == self.period_k and len(self._lows) == self.period_k:
+            if self._highs.is_full():
                 self._set_initialized(True)
 
-        cdef double k_max_high = max(self._highs)
-        cdef double k_min_low = min(self._lows)
+        cdef double k_max_high = self._highs.value()
+        cdef double k_min_low = self._lows.value()
 
         self._c_sub_l.append(close - k_min_low)
         self._h_sub_l.append(k_max_high - k_min_low)
@@ -118,7 +138,49 @@ cdef class Stochastics(Indicator):
             return  # Divide by zero guard
 
         self.value_k = 100 * ((close - k_min_low) / (k_max_high - k_min_low))
-        self.value_d = 100 * (sum(self._c_sub_l) / sum(self._h_sub_l))
+        self.value_d = 100 * (self._c_sub_l.sum / self._h_sub_l.sum)
+
+    cpdef np.ndarray update_raw_batch(self, np.ndarray highs, np.ndarray lows, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        highs : np.ndarray
+            The high prices (one dimensional, in ascending time order).
+        lows : np.ndarray
+            The low prices (one dimensional, in ascending time order).
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator values after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+            The `value_k` and `value_d` values after each update (one column each).
+
+        Raises
+        ------
+        ValueError
+            If any of `highs`, `lows` or `closes` is not one dimensional.
+        ValueError
+            If the input lengths are not equal.
+
+        """
+        return self._update_raw_batch(
+            [highs, lows, closes],
+            ["highs", "lows", "closes"],
+            2,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i], inputs[1, i], inputs[2, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value_k
+        outputs[i, 1] = self.value_d
 
     cpdef void _reset(self):
         self._highs.clear()
@@ -16,12 +16,13 @@
 from cpython.datetime cimport datetime
 
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 from nautilus_trader.model.data cimport Bar
 
 
 cdef class Swings(Indicator):
-    cdef object _high_inputs
-    cdef object _low_inputs
+    cdef RollingExtremum _high_inputs
+    cdef RollingExtremum _low_inputs
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
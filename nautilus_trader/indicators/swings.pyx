@@ -13,13 +13,12 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
 import pandas as pd
 from cpython.datetime cimport datetime
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 from nautilus_trader.model.data cimport Bar
 
 
@@ -38,8 +37,8 @@ cdef class Swings(Indicator):
         super().__init__(params=[period])
 
         self.period = period
-        self._high_inputs = deque(maxlen=self.period)
-        self._low_inputs = deque(maxlen=self.period)
+        self._high_inputs = RollingExtremum(period, is_max=True)
+        self._low_inputs = RollingExtremum(period, is_max=False)
 
         self.direction = 0
         self.changed = False
@@ -94,8 +93,8 @@ cdef class Swings(Indicator):
         self._low_inputs.append(low)
 
         # Update max high and min low
-        cdef double max_high = max(self._high_inputs)
-        cdef double min_low = min(self._low_inputs)
+        cdef double max_high = self._high_inputs.value()
+        cdef double min_low = self._low_inputs.value()
 
         # Calculate if swings
         cdef bint is_swing_high = high >= max_high and low >= min_low
@@ -47,6 +47,32 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarType
 
 
+# Functions TA-Lib does not flag as having an unstable period, but whose output still
+# depends on the length of their input window: EMA based, cumulative (AD, OBV, ADOSC),
+# recursive (SAR, SAREXT) and those returning positions within the window (MAXINDEX...)
+_FULL_WINDOW_FUNCTIONS = frozenset(
+    {
+        "AD",
+        "ADOSC",
+        "APO",
+        "DEMA",
+        "MACD",
+        "MACDEXT",
+        "MACDFIX",
+        "MAXINDEX",
+        "MININDEX",
+        "MINMAXINDEX",
+        "OBV",
+        "PPO",
+        "SAR",
+        "SAREXT",
+        "T3",
+        "TEMA",
+        "TRIX",
+    },
+)
+
+
 class TAFunctionWrapper:
     """
     A wrapper class for TA-Lib functions, facilitating the handling of technical
@@ -225,6 +251,14 @@ class TALibIndicatorManager(Indicator):
         If uniform price bars should be skipped.
     skip_zero_close_bar : bool, default True
         If zero sized bars should be skipped.
+    incremental : bool, default False
+        If inputs should be held in preallocated rolling arrays, with each indicator
+        recomputed over only its own lookback window (indicators with the same window
+        share the same input views). Indicators with an unstable period (such as EMA,
+        RSI, ATR or MACD), cumulative or recursive indicators (such as AD, OBV or SAR),
+        and those with a non-SMA moving average type depend on the length of their
+        input window, so these are always recomputed over the full input window (as
+        when not incremental).
 
     Raises
     ------
@@ -242,6 +276,7 @@ class TALibIndicatorManager(Indicator):
         buffer_size: int | None = None,
         skip_uniform_price_bar: bool = True,
         skip_zero_close_bar: bool = True,
+        incremental: bool = False,
     ) -> None:
         super().__init__([])
 
@@ -255,6 +290,7 @@ class TALibIndicatorManager(Indicator):
         self._period = period
         self._skip_uniform_price_bar = skip_uniform_price_bar
         self._skip_zero_close_bar = skip_zero_close_bar
+        self._incremental = incremental
         self._output_array: np.recarray | None = None
         self._last_ts_event: int = 0
         self._data_error_counter: int = 0
@@ -268,6 +304,12 @@ class TALibIndicatorManager(Indicator):
         self._indicators: set | None = None
         self.output_names: tuple | None = None
 
+        # Initialize on `set_indicators` (incremental mode only)
+        self._input_arrays: dict[str, np.ndarray] | None = None
+        self._input_window: int = 0
+        self._input_size: int = 0
+        self._indicator_groups: dict[int, list[TAFunctionWrapper]] | None = None
+
         # Initialize the logger
         clock = LiveClock()
         logger = Logger(clock)
@@ -328,6 +370,16 @@ class TALibIndicatorManager(Indicator):
         self._input_deque = deque(maxlen=lookback + 1)
         self.output_names = tuple(output_names)
 
+        if self._incremental:
+            self._init_input_arrays(window=lookback + 1)
+            self._indicator_groups = {}
+            for indicator in self._indicators:
+                if self._has_unstable_period(indicator):
+                    window = lookback + 1
+                else:
+                    window = indicator.fn.lookback + 1
+                self._indicator_groups.setdefault(window, []).append(indicator)
+
         # Initialize the output dtypes
         self._output_dtypes = [
             (col, np.dtype("uint64") if col in ["ts_event", "ts_init"] else np.dtype("float64"))
@@ -339,6 +391,45 @@ class TALibIndicatorManager(Indicator):
     def __repr__(self) -> str:
         return f"{self.name}[{self._bar_type}]"
 
+    @staticmethod
+    def _has_unstable_period(indicator: TAFunctionWrapper) -> bool:
+        # If the output depends on inputs beyond the lookback window, because the
+        # function is recursive or cumulative (seeded from the start of its input)
+        flags = indicator.fn.info.get("function_flags") or []
+        if "Function has an unstable period" in flags:
+            return True
+        if indicator.name in _FULL_WINDOW_FUNCTIONS:
+            return True
+        # Any moving average type parameter (`matype`, `slowk_matype`, `fastmatype`...)
+        # selecting other than an SMA
+        return any(
+            name.endswith("matype") and value != talib.MA_Type.SMA
+            for name, value in indicator.fn.parameters.items()
+        )
+
+    def _init_input_arrays(self, window: int) -> None:
+        # Twice the window so rows are only shifted back once every `window` appends
+        self._input_window = window
+        self._input_size = 0
+        self._input_arrays = {
+            name: np.zeros(window * 2, dtype=dtype) for name, dtype in self.input_dtypes()
+        }
+
+    def _append_input(self, values: tuple) -> None:
+        if self._input_size == self._input_window * 2:
+            keep = self._input_window - 1
+            for array in self._input_arrays.values():
+                array[:keep] = array[self._input_size - keep : self._input_size]
+            self._input_size = keep
+
+        self._input_size += 1
+        self._replace_input(values)
+
+    def _replace_input(self, values: tuple) -> None:
+        index = self._input_size - 1
+        for array, value in zip(self._input_arrays.values(), values):
+            array[index] = value
+
     @staticmethod
     def input_names() -> list:
         return list(talib_indicator_manager_input_names)
@@ -392,6 +483,22 @@ class TALibIndicatorManager(Indicator):
         """
         self._log.debug("Calculating outputs.")
 
+        if self._incremental:
+            combined_output = self._calculate_outputs_incremental()
+        else:
+            combined_output = self._calculate_outputs()
+
+        if append:
+            self._log.debug("Appending output.")
+            self._output_deque.append(combined_output)
+        else:
+            self._log.debug("Prepending output.")
+            self._output_deque[-1] = combined_output
+
+        # Reset output array to force rebuild on next access
+        self._output_array = None
+
+    def _calculate_outputs(self) -> np.ndarray:
         combined_output = np.zeros(1, dtype=self._output_dtypes)
         combined_output["ts_event"] = self._input_deque[-1]["ts_event"].item()
         combined_output["ts_init"] = self._input_deque[-1]["ts_init"].item()
@@ -416,15 +523,31 @@ class TALibIndicatorManager(Indicator):
                 for i, output_name in enumerate(indicator.output_names):
                     combined_output[output_name] = results[i][-1]
 
-        if append:
-            self._log.debug("Appending output.")
-            self._output_deque.append(combined_output)
-        else:
-            self._log.debug("Prepending output.")
-            self._output_deque[-1] = combined_output
+        return combined_output
 
-        # Reset output array to force rebuild on next access
-        self._output_array = None
+    def _calculate_outputs_incremental(self) -> np.ndarray:
+        combined_output = np.zeros(1, dtype=self._output_dtypes)
+        end = self._input_size
+        for name, array in self._input_arrays.items():
+            combined_output[name] = array[end - 1]
+
+        for window, indicators in self._indicator_groups.items():
+            # Views over the rolling arrays (no copies), shared by all indicators
+            # with the same lookback
+            start = max(end - window, 0)
+            inputs_dict = {name: array[start:end] for name, array in self._input_arrays.items()}
+            for indicator in indicators:
+                self._log.debug(f"Calculating {indicator.name} outputs.")
+                indicator.fn.set_input_arrays(inputs_dict)
+                results = indicator.fn.run()
+
+                if len(indicator.output_names) == 1:
+                    combined_output[indicator.output_names[0]] = results[-1]
+                else:
+                    for i, output_name in enumerate(indicator.output_names):
+                        combined_output[output_name] = results[i][-1]
+
+        return combined_output
 
     def _increment_count(self) -> None:
         self.count += 1
@@ -705,21 +828,22 @@ class TALibIndicatorManager(Indicator):
             self._log.warning(f"Skipping zero close bar: {bar!r}")
             return
 
-        bar_data = np.array(
-            [
-                (
-                    bar.ts_event,
-                    bar.ts_init,
-                    bar.open.as_double(),
-                    bar.high.as_double(),
-                    bar.low.as_double(),
-                    bar.close.as_double(),
-                    bar.volume.as_double(),
-                ),
-            ],
-            dtype=self.input_dtypes(),
+        values = (
+            bar.ts_event,
+            bar.ts_init,
+            bar.open.as_double(),
+            bar.high.as_double(),
+            bar.low.as_double(),
+            bar.close.as_double(),
+            bar.volume.as_double(),
         )
 
+        if self._incremental:
+            self._handle_bar_incremental(bar, values)
+            return
+
+        bar_data = np.array([values], dtype=self.input_dtypes())
+
         if bar.ts_event == self._last_ts_event:
             self._input_deque[-1] = bar_data
             self._update_ta_outputs(append=False)
@@ -733,3 +857,18 @@ class TALibIndicatorManager(Indicator):
             return
 
         self._last_ts_event = bar.ts_event
+
+    def _handle_bar_incremental(self, bar: Bar, values: tuple) -> None:
+        if bar.ts_event == self._last_ts_event:
+            self._replace_input(values)
+            self._update_ta_outputs(append=False)
+        elif bar.ts_event > self._last_ts_event:
+            self._append_input(values)
+            self._increment_count()
+            self._update_ta_outputs()
+        else:
+            self._data_error_counter += 1
+            self._log.error(f"Received out of sync bar: {bar!r}")
+            return
+
+        self._last_ts_event = bar.ts_event
@@ -13,13 +13,17 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+cimport numpy as np
+
 from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 
 
 cdef class VerticalHorizontalFilter(Indicator):
     cdef MovingAverage _ma
-    cdef object _prices
+    cdef RollingExtremum _max_prices
+    cdef RollingExtremum _min_prices
 
     cdef readonly int period
     """The window period.\n\n:returns: `int`"""
@@ -29,4 +33,7 @@ cdef class VerticalHorizontalFilter(Indicator):
     """The current value.\n\n:returns: `double`"""
 
     cpdef void update_raw(self, double close)
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=*)
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i)
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i)
     cdef void _check_initialized(self)
@@ -13,8 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
-from collections import deque
-
+cimport numpy as np
 from libc.math cimport fabs
 
 from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
@@ -22,6 +21,8 @@ from nautilus_trader.indicators.average.ma_factory import MovingAverageType
 
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.indicators.base.indicator cimport Indicator
+from nautilus_trader.indicators.base.indicator cimport bars_to_closes
+from nautilus_trader.indicators.base.window cimport RollingExtremum
 from nautilus_trader.model.data cimport Bar
 
 
@@ -51,7 +52,8 @@ cdef class VerticalHorizontalFilter(Indicator):
         super().__init__(params=params)
 
         self.period = period
-        self._prices = deque(maxlen=self.period)
+        self._max_prices = RollingExtremum(period, is_max=True)
+        self._min_prices = RollingExtremum(period, is_max=False)
         self._ma = MovingAverageFactory.create(period, ma_type)
         self._previous_close = 0
         self.value = 0
@@ -72,6 +74,21 @@ cdef class VerticalHorizontalFilter(Indicator):
             bar.close.as_double(),
         )
 
+    cpdef void handle_bars(self, list bars):
+        """
+        Update the indicator with the given bars in a single pass.
+
+        Parameters
+        ----------
+        bars : list[Bar]
+            The bars to handle (in ascending time order).
+
+        """
+        Condition.not_none(bars, "bars")
+
+        cdef np.ndarray closes = bars_to_closes(bars)
+        self.update_raw_batch(closes)
+
     cpdef void update_raw(self, double close):
         """
         Update the indicator with the given raw value.
@@ -86,10 +103,11 @@ cdef class VerticalHorizontalFilter(Indicator):
         if not self.has_inputs:
             self._previous_close = close
 
-        self._prices.append(close)
+        self._max_prices.append(close)
+        self._min_prices.append(close)
 
-        cdef double max_price = max(self._prices)
-        cdef double min_price = min(self._prices)
+        cdef double max_price = self._max_prices.value()
+        cdef double min_price = self._min_prices.value()
 
         self._ma.update_raw(fabs(close - self._previous_close))
         if self.initialized:
@@ -98,14 +116,49 @@ cdef class VerticalHorizontalFilter(Indicator):
 
         self._check_initialized()
 
+    cpdef np.ndarray update_raw_batch(self, np.ndarray closes, bint return_values=False):
+        """
+        Update the indicator with the given raw values in a single pass.
+
+        Parameters
+        ----------
+        closes : np.ndarray
+            The close prices (one dimensional, in ascending time order).
+        return_values : bool, default False
+            If the indicator value after each update should be returned.
+
+        Returns
+        -------
+        np.ndarray[float64] or ``None``
+
+        Raises
+        ------
+        ValueError
+            If `closes` is not one dimensional.
+
+        """
+        return self._update_raw_batch(
+            [closes],
+            ["closes"],
+            1,
+            return_values,
+        )
+
+    cdef void _update_raw_at(self, double[:, ::1] inputs, Py_ssize_t i):
+        self.update_raw(inputs[0, i])
+
+    cdef void _set_outputs_at(self, double[:, ::1] outputs, Py_ssize_t i):
+        outputs[i, 0] = self.value
+
     cdef void _check_initialized(self):
         if not self.initialized:
             self._set_has_inputs(True)
-            if self._ma.initialized and len(self._prices) >= self.period:
+            if self._ma.initialized and self._max_prices.is_full():
                 self._set_initialized(True)
 
     cpdef void _reset(self):
-        self._prices.clear()
+        self._max_prices.clear()
+        self._min_prices.clear()
         self._ma.reset()
         self._previous_close = 0
         self.value = 0
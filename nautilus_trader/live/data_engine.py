@@ -15,6 +15,7 @@
 
 import asyncio
 from asyncio import Queue
+from collections import deque
 from typing import Final
 
 from nautilus_trader.cache.cache import Cache
@@ -83,6 +84,13 @@ class LiveDataEngine(DataEngine):
         self._req_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._res_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._data_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._data_backlog: deque[Data] = deque()  # Pending while the queue is full
+        self._batch_size: int = config.batch_size
+
+        # Queue metrics
+        self._data_qsize_max: int = 0
+        self._data_batch_size: int = 0
+        self._data_batch_size_max: int = 0
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -195,6 +203,39 @@ class LiveDataEngine(DataEngine):
         """
         return self._data_queue.qsize()
 
+    def data_qsize_max(self) -> int:
+        """
+        Return the maximum number of `Data` objects observed buffered on the internal queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._data_qsize_max
+
+    def data_batch_size(self) -> int:
+        """
+        Return the number of `Data` objects drained from the internal queue in the last batch.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._data_batch_size
+
+    def data_batch_size_max(self) -> int:
+        """
+        Return the maximum number of `Data` objects drained from the internal queue in a batch.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._data_batch_size_max
+
     def kill(self) -> None:
         """
         Kill the engine by abruptly canceling the queue tasks and calling stop.
@@ -333,17 +374,79 @@ class LiveDataEngine(DataEngine):
         PyCondition.not_none(data, "data")
         # Do not allow None through (None is a sentinel value which stops the queue)
 
+        self._loop.call_soon_threadsafe(self._enqueue_data, data)
+
+    def process_batch(self, data: list[Data]) -> None:
+        """
+        Process the given batch of data (in order).
+
+        The whole batch is placed on the internal queue with a single event loop
+        callback, rather than one callback per item. If the internal queue
+        becomes full then will log a warning and block until queue size reduces.
+
+        Parameters
+        ----------
+        data : list[Data]
+            The data to process.
+
+        Warnings
+        --------
+        This method is not thread-safe and should only be called from the same thread the event
+        loop is running on. Calling it from a different thread may lead to unexpected behavior.
+
+        """
+        PyCondition.not_none(data, "data")
+        # Do not allow None through (None is a sentinel value which stops the queue)
+        PyCondition.false(any(x is None for x in data), "data contained a `None` item")
+
+        if not data:
+            return
+
+        self._loop.call_soon_threadsafe(self._enqueue_data_batch, data)
+
+    # -- INTERNAL -------------------------------------------------------------------------------------
+
+    def _enqueue_data(self, data: Data) -> None:
+        if self._data_backlog:
+            # Keep the order behind the data already waiting for space in the queue
+            self._data_backlog.append(data)
+            return
+
         try:
-            self._loop.call_soon_threadsafe(self._data_queue.put_nowait, data)
+            self._data_queue.put_nowait(data)
         except asyncio.QueueFull:
             self._log.warning(
                 f"Blocking on `_data_queue.put` as queue full at "
                 f"{self._data_queue.qsize():_} items.",
             )
             # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._data_queue.put(data))
-
-    # -- INTERNAL -------------------------------------------------------------------------------------
+            self._data_backlog.append(data)
+            self._loop.create_task(self._put_data_backlog())
+
+    def _enqueue_data_batch(self, data: list[Data]) -> None:
+        if self._data_backlog:
+            # Keep the order behind the data already waiting for space in the queue
+            self._data_backlog.extend(data)
+            return
+
+        for i, item in enumerate(data):
+            try:
+                self._data_queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self._log.warning(
+                    f"Blocking on `_data_queue.put` as queue full at "
+                    f"{self._data_queue.qsize():_} items.",
+                )
+                # Schedule the remaining `put` operations to be executed once there is space
+                self._data_backlog.extend(data[i:])
+                self._loop.create_task(self._put_data_backlog())
+                return
+
+    async def _put_data_backlog(self) -> None:
+        # Later data is appended to the backlog until it has all been placed on the queue
+        while self._data_backlog:
+            await self._data_queue.put(self._data_backlog[0])
+            self._data_backlog.popleft()
 
     def _enqueue_sentinels(self) -> None:
         self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, self._sentinel)
@@ -436,6 +539,31 @@ class LiveDataEngine(DataEngine):
             else:
                 self._log.debug(stopped_msg + ".")
 
+    def _drain_data_queue(self, data: Data) -> bool:
+        # Drain everything available (up to the batch size) on this wakeup,
+        # returns whether the sentinel message was seen.
+        queue = self._data_queue
+        qsize = queue.qsize() + 1
+        if qsize > self._data_qsize_max:
+            self._data_qsize_max = qsize
+
+        self._handle_data(data)
+        count = 1
+        stopping = False
+        while count < self._batch_size and not queue.empty():
+            data = queue.get_nowait()
+            if data is self._sentinel:
+                stopping = True
+                break
+            self._handle_data(data)
+            count += 1
+
+        self._data_batch_size = count
+        if count > self._data_batch_size_max:
+            self._data_batch_size_max = count
+
+        return stopping
+
     async def _run_data_queue(self) -> None:
         self._log.debug(f"Data queue processing starting (qsize={self.data_qsize()})...")
         try:
@@ -443,7 +571,10 @@ class LiveDataEngine(DataEngine):
                 data: Data | None = await self._data_queue.get()
                 if data is self._sentinel:
                     break
-                self._handle_data(data)
+                if self._drain_data_queue(data):
+                    break  # Sentinel seen during drain
+                if self._data_batch_size == self._batch_size:
+                    await asyncio.sleep(0)  # Yield so other tasks are not starved
         except asyncio.CancelledError:
             self._log.warning("Data message queue canceled.")
         except RuntimeError as e:
@@ -16,6 +16,7 @@
 import asyncio
 import math
 from asyncio import Queue
+from collections import deque
 from decimal import Decimal
 from typing import Any, Final
 
@@ -118,6 +119,13 @@ class LiveExecutionEngine(ExecutionEngine):
         self._loop: asyncio.AbstractEventLoop = loop
         self._cmd_queue: asyncio.Queue = Queue(maxsize=config.qsize)
         self._evt_queue: asyncio.Queue = Queue(maxsize=config.qsize)
+        self._evt_backlog: deque[OrderEvent] = deque()  # Pending while the queue is full
+        self._batch_size: int = config.batch_size
+
+        # Queue metrics
+        self._evt_qsize_max: int = 0
+        self._evt_batch_size: int = 0
+        self._evt_batch_size_max: int = 0
 
         # Async tasks
         self._cmd_queue_task: asyncio.Task | None = None
@@ -231,6 +239,39 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         return self._evt_queue.qsize()
 
+    def evt_qsize_max(self) -> int:
+        """
+        Return the maximum number of `Event` messages observed buffered on the internal queue.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._evt_qsize_max
+
+    def evt_batch_size(self) -> int:
+        """
+        Return the number of `Event` messages drained from the internal queue in the last batch.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._evt_batch_size
+
+    def evt_batch_size_max(self) -> int:
+        """
+        Return the maximum number of `Event` messages drained from the internal queue in a batch.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._evt_batch_size_max
+
     # -- COMMANDS -------------------------------------------------------------------------------------
 
     def kill(self) -> None:
@@ -300,17 +341,79 @@ class LiveExecutionEngine(ExecutionEngine):
         """
         PyCondition.not_none(event, "event")
 
+        self._loop.call_soon_threadsafe(self._enqueue_evt, event)
+
+    def process_batch(self, events: list[OrderEvent]) -> None:
+        """
+        Process the given batch of events (in order).
+
+        The whole batch is placed on the internal queue with a single event loop
+        callback, rather than one callback per event. If the internal queue
+        becomes full then will log a warning and block until queue size reduces.
+
+        Parameters
+        ----------
+        events : list[OrderEvent]
+            The events to process.
+
+        Warnings
+        --------
+        This method is not thread-safe and should only be called from the same thread the event
+        loop is running on. Calling it from a different thread may lead to unexpected behavior.
+
+        """
+        PyCondition.not_none(events, "events")
+        # Do not allow None through (None is a sentinel value which stops the queue)
+        PyCondition.false(any(x is None for x in events), "events contained a `None` item")
+
+        if not events:
+            return
+
+        self._loop.call_soon_threadsafe(self._enqueue_evt_batch, events)
+
+    # -- INTERNAL -------------------------------------------------------------------------------------
+
+    def _enqueue_evt(self, event: OrderEvent) -> None:
+        if self._evt_backlog:
+            # Keep the order behind the events already waiting for space in the queue
+            self._evt_backlog.append(event)
+            return
+
         try:
-            self._loop.call_soon_threadsafe(self._evt_queue.put_nowait, event)
+            self._evt_queue.put_nowait(event)
         except asyncio.QueueFull:
             self._log.warning(
                 f"Blocking on `_evt_queue.put` as queue full "
                 f"at {self._evt_queue.qsize():_} items.",
             )
             # Schedule the `put` operation to be executed once there is space in the queue
-            self._loop.create_task(self._evt_queue.put(event))
+            self._evt_backlog.append(event)
+            self._loop.create_task(self._put_evt_backlog())
 
-    # -- INTERNAL -------------------------------------------------------------------------------------
+    def _enqueue_evt_batch(self, events: list[OrderEvent]) -> None:
+        if self._evt_backlog:
+            # Keep the order behind the events already waiting for space in the queue
+            self._evt_backlog.extend(events)
+            return
+
+        for i, event in enumerate(events):
+            try:
+                self._evt_queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._log.warning(
+                    f"Blocking on `_evt_queue.put` as queue full "
+                    f"at {self._evt_queue.qsize():_} items.",
+                )
+                # Schedule the remaining `put` operations to be executed once there is space
+                self._evt_backlog.extend(events[i:])
+                self._loop.create_task(self._put_evt_backlog())
+                return
+
+    async def _put_evt_backlog(self) -> None:
+        # Later events are appended to the backlog until it has all been placed on the queue
+        while self._evt_backlog:
+            await self._evt_queue.put(self._evt_backlog[0])
+            self._evt_backlog.popleft()
 
     def _enqueue_sentinel(self) -> None:
         self._loop.call_soon_threadsafe(self._cmd_queue.put_nowait, self._sentinel)
@@ -372,6 +475,31 @@ class LiveExecutionEngine(ExecutionEngine):
             else:
                 self._log.debug(stopped_msg + ".")
 
+    def _drain_evt_queue(self, event: OrderEvent) -> bool:
+        # Drain everything available (up to the batch size) on this wakeup,
+        # returns whether the sentinel message was seen.
+        queue = self._evt_queue
+        qsize = queue.qsize() + 1
+        if qsize > self._evt_qsize_max:
+            self._evt_qsize_max = qsize
+
+        self._handle_event(event)
+        count = 1
+        stopping = False
+        while count < self._batch_size and not queue.empty():
+            event = queue.get_nowait()
+            if event is self._sentinel:
+                stopping = True
+                break
+            self._handle_event(event)
+            count += 1
+
+        self._evt_batch_size = count
+        if count > self._evt_batch_size_max:
+            self._evt_batch_size_max = count
+
+        return stopping
+
     async def _run_evt_queue(self) -> None:
         self._log.debug(
             f"Event message queue processing starting (qsize={self.evt_qsize()})...",
@@ -381,7 +509,10 @@ class LiveExecutionEngine(ExecutionEngine):
                 event: OrderEvent | None = await self._evt_queue.get()
                 if event is self._sentinel:
                     break
-                self._handle_event(event)
+                if self._drain_evt_queue(event):
+                    break  # Sentinel seen during drain
+                if self._evt_batch_size == self._batch_size:
+                    await asyncio.sleep(0)  # Yield so other tasks are not starved
         except asyncio.CancelledError:
             self._log.warning("Event message queue canceled.")
         except RuntimeError as e:
@@ -25,6 +25,7 @@ from nautilus_trader.model.data cimport OrderBookDelta
 from nautilus_trader.model.data cimport OrderBookDeltas
 from nautilus_trader.model.data cimport QuoteTick
 from nautilus_trader.model.data cimport TradeTick
+from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
@@ -47,6 +48,10 @@ cdef class OrderBook(Data):
 
     cpdef list bids(self)
     cpdef list asks(self)
+    cpdef tuple bids_depth(self, int depth=*, bint cumulative=*)
+    cpdef tuple asks_depth(self, int depth=*, bint cumulative=*)
+    cpdef int fill_bids_depth(self, double[::1] prices, double[::1] sizes, uint64_t[::1] counts, bint cumulative=*)
+    cpdef int fill_asks_depth(self, double[::1] prices, double[::1] sizes, uint64_t[::1] counts, bint cumulative=*)
     cpdef best_bid_price(self)
     cpdef best_ask_price(self)
     cpdef best_bid_size(self)
@@ -70,3 +75,50 @@ cdef class Level:
 
     @staticmethod
     cdef Level from_mem_c(Level_API mem)
+
+
+cdef class OrderBookDiff(Data):
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the book.\n\n:returns: `InstrumentId`"""
+    cdef readonly uint64_t sequence
+    """The sequence number of the diff (monotonic per subscription).\n\n:returns: `uint64_t`"""
+    cdef readonly bint is_checkpoint
+    """If the diff is a full checkpoint of the book.\n\n:returns: `bool`"""
+    cdef readonly list bids
+    """The changed bid levels as (price, size) pairs.\n\n:returns: `list[tuple[float, float]]`"""
+    cdef readonly list asks
+    """The changed ask levels as (price, size) pairs.\n\n:returns: `list[tuple[float, float]]`"""
+    cdef readonly uint64_t ts_event
+    """The UNIX timestamp (nanoseconds) when the data event occurred.\n\n:returns: `uint64_t`"""
+    cdef readonly uint64_t ts_init
+    """The UNIX timestamp (nanoseconds) when the object was initialized.\n\n:returns: `uint64_t`"""
+
+    @staticmethod
+    cdef OrderBookDiff from_dict_c(dict values)
+
+    @staticmethod
+    cdef dict to_dict_c(OrderBookDiff obj)
+
+
+cdef class OrderBookDiffer:
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the differ.\n\n:returns: `InstrumentId`"""
+    cdef readonly int depth
+    """The maximum number of levels per side to diff (0 for the full book).\n\n:returns: `int`"""
+    cdef readonly int checkpoint_interval
+    """The number of diffs between full checkpoints.\n\n:returns: `int`"""
+    cdef readonly uint64_t sequence
+    """The sequence number of the last diff.\n\n:returns: `uint64_t`"""
+
+    cdef dict _last_bids
+    cdef dict _last_asks
+    cdef int _since_checkpoint
+    cdef int _capacity
+    cdef double[::1] _prices
+    cdef double[::1] _sizes
+    cdef uint64_t[::1] _counts
+
+    cdef dict _levels(self, OrderBook book, bint bids)
+    cpdef OrderBookDiff diff(self, OrderBook book, uint64_t ts_init, bint checkpoint=*)
+    cpdef void force_checkpoint(self)
+    cpdef void reset(self)
@@ -16,6 +16,7 @@
 import pickle
 from operator import itemgetter
 
+import numpy as np
 import pandas as pd
 
 from libc.stdint cimport INT64_MAX
@@ -46,11 +47,13 @@ from nautilus_trader.core.rust.model cimport level_size
 from nautilus_trader.core.rust.model cimport orderbook_add
 from nautilus_trader.core.rust.model cimport orderbook_apply_delta
 from nautilus_trader.core.rust.model cimport orderbook_asks
+from nautilus_trader.core.rust.model cimport orderbook_asks_fill_depth
 from nautilus_trader.core.rust.model cimport orderbook_best_ask_price
 from nautilus_trader.core.rust.model cimport orderbook_best_ask_size
 from nautilus_trader.core.rust.model cimport orderbook_best_bid_price
 from nautilus_trader.core.rust.model cimport orderbook_best_bid_size
 from nautilus_trader.core.rust.model cimport orderbook_bids
+from nautilus_trader.core.rust.model cimport orderbook_bids_fill_depth
 from nautilus_trader.core.rust.model cimport orderbook_book_type
 from nautilus_trader.core.rust.model cimport orderbook_check_integrity
 from nautilus_trader.core.rust.model cimport orderbook_clear
@@ -405,6 +408,162 @@ cdef class OrderBook(Data):
 
         return levels
 
+    cpdef tuple bids_depth(self, int depth=10, bint cumulative=False):
+        """
+        Return the top bid levels for the order book as arrays.
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The maximum number of levels to return.
+        cumulative : bool, default False
+            If the sizes should be cumulative from the top of the book.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The prices, sizes and order counts, sorted in descending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        Condition.positive_int(depth, "depth")
+
+        cdef double[::1] prices = np.empty(depth, dtype=np.float64)
+        cdef double[::1] sizes = np.empty(depth, dtype=np.float64)
+        cdef uint64_t[::1] counts = np.empty(depth, dtype=np.uint64)
+        cdef int filled = self.fill_bids_depth(prices, sizes, counts, cumulative)
+
+        return (
+            np.asarray(prices[:filled]),
+            np.asarray(sizes[:filled]),
+            np.asarray(counts[:filled]),
+        )
+
+    cpdef tuple asks_depth(self, int depth=10, bint cumulative=False):
+        """
+        Return the top ask levels for the order book as arrays.
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The maximum number of levels to return.
+        cumulative : bool, default False
+            If the sizes should be cumulative from the top of the book.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            The prices, sizes and order counts, sorted in ascending order of price.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not positive (> 0).
+
+        """
+        Condition.positive_int(depth, "depth")
+
+        cdef double[::1] prices = np.empty(depth, dtype=np.float64)
+        cdef double[::1] sizes = np.empty(depth, dtype=np.float64)
+        cdef uint64_t[::1] counts = np.empty(depth, dtype=np.uint64)
+        cdef int filled = self.fill_asks_depth(prices, sizes, counts, cumulative)
+
+        return (
+            np.asarray(prices[:filled]),
+            np.asarray(sizes[:filled]),
+            np.asarray(counts[:filled]),
+        )
+
+    cpdef int fill_bids_depth(
+        self,
+        double[::1] prices,
+        double[::1] sizes,
+        uint64_t[::1] counts,
+        bint cumulative=False,
+    ):
+        """
+        Fill the given preallocated buffers with the top bid levels.
+
+        The depth is the length of the shortest buffer, the levels are written
+        directly from the book without creating any intermediate objects.
+
+        Parameters
+        ----------
+        prices : np.ndarray[np.float64]
+            The buffer for the level prices.
+        sizes : np.ndarray[np.float64]
+            The buffer for the level sizes.
+        counts : np.ndarray[np.uint64]
+            The buffer for the level order counts.
+        cumulative : bool, default False
+            If the sizes should be cumulative from the top of the book.
+
+        Returns
+        -------
+        int
+            The number of levels filled, sorted in descending order of price.
+
+        """
+        cdef Py_ssize_t depth = min(prices.shape[0], sizes.shape[0], counts.shape[0])
+        if depth == 0:
+            return 0
+
+        return orderbook_bids_fill_depth(
+            &self._mem,
+            depth,
+            &prices[0],
+            &sizes[0],
+            &counts[0],
+            cumulative,
+        )
+
+    cpdef int fill_asks_depth(
+        self,
+        double[::1] prices,
+        double[::1] sizes,
+        uint64_t[::1] counts,
+        bint cumulative=False,
+    ):
+        """
+        Fill the given preallocated buffers with the top ask levels.
+
+        The depth is the length of the shortest buffer, the levels are written
+        directly from the book without creating any intermediate objects.
+
+        Parameters
+        ----------
+        prices : np.ndarray[np.float64]
+            The buffer for the level prices.
+        sizes : np.ndarray[np.float64]
+            The buffer for the level sizes.
+        counts : np.ndarray[np.uint64]
+            The buffer for the level order counts.
+        cumulative : bool, default False
+            If the sizes should be cumulative from the top of the book.
+
+        Returns
+        -------
+        int
+            The number of levels filled, sorted in ascending order of price.
+
+        """
+        cdef Py_ssize_t depth = min(prices.shape[0], sizes.shape[0], counts.shape[0])
+        if depth == 0:
+            return 0
+
+        return orderbook_asks_fill_depth(
+            &self._mem,
+            depth,
+            &prices[0],
+            &sizes[0],
+            &counts[0],
+            cumulative,
+        )
+
     cpdef best_bid_price(self):
         """
         Return the best bid price in the book (if no bids then returns ``None``).
@@ -739,3 +898,299 @@ cdef class Level:
 
         """
         return level_exposure(&self._mem)
+
+
+cdef class OrderBookDiff(Data):
+    """
+    Represents the changed price levels of an order book since the last diff.
+
+    A size of zero for a level indicates that the level was removed. When
+    `is_checkpoint` is ``True`` the bids and asks contain every level of the
+    book (up to the subscribed depth), and any previously reconstructed state
+    should be replaced.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the book.
+    sequence : uint64_t
+        The sequence number of the diff (monotonic per subscription).
+    is_checkpoint : bool
+        If the diff is a full checkpoint of the book.
+    bids : list[tuple[float, float]]
+        The changed bid levels as (price, size) pairs.
+    asks : list[tuple[float, float]]
+        The changed ask levels as (price, size) pairs.
+    ts_event : uint64_t
+        The UNIX timestamp (nanoseconds) when the last book update occurred.
+    ts_init : uint64_t
+        The UNIX timestamp (nanoseconds) when the object was initialized.
+
+    """
+
+    def __init__(
+        self,
+        InstrumentId instrument_id not None,
+        uint64_t sequence,
+        bint is_checkpoint,
+        list bids not None,
+        list asks not None,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    ):
+        self.instrument_id = instrument_id
+        self.sequence = sequence
+        self.is_checkpoint = is_checkpoint
+        self.bids = bids
+        self.asks = asks
+        self.ts_event = ts_event
+        self.ts_init = ts_init
+
+    def __eq__(self, OrderBookDiff other) -> bool:
+        return OrderBookDiff.to_dict_c(self) == OrderBookDiff.to_dict_c(other)
+
+    def __hash__(self) -> int:
+        return hash((self.instrument_id, self.sequence, self.ts_init))
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"sequence={self.sequence}, "
+            f"is_checkpoint={self.is_checkpoint}, "
+            f"bids={self.bids}, "
+            f"asks={self.asks}, "
+            f"ts_event={self.ts_event}, "
+            f"ts_init={self.ts_init})"
+        )
+
+    @staticmethod
+    cdef OrderBookDiff from_dict_c(dict values):
+        Condition.not_none(values, "values")
+        return OrderBookDiff(
+            instrument_id=InstrumentId.from_str_c(values["instrument_id"]),
+            sequence=values["sequence"],
+            is_checkpoint=values["is_checkpoint"],
+            bids=[tuple(level) for level in values["bids"]],
+            asks=[tuple(level) for level in values["asks"]],
+            ts_event=values["ts_event"],
+            ts_init=values["ts_init"],
+        )
+
+    @staticmethod
+    cdef dict to_dict_c(OrderBookDiff obj):
+        Condition.not_none(obj, "obj")
+        return {
+            "type": "OrderBookDiff",
+            "instrument_id": obj.instrument_id.to_str(),
+            "sequence": obj.sequence,
+            "is_checkpoint": obj.is_checkpoint,
+            "bids": obj.bids,
+            "asks": obj.asks,
+            "ts_event": obj.ts_event,
+            "ts_init": obj.ts_init,
+        }
+
+    @staticmethod
+    def from_dict(dict values) -> OrderBookDiff:
+        """
+        Return an order book diff from the given dict values.
+
+        Parameters
+        ----------
+        values : dict[str, object]
+            The values for initialization.
+
+        Returns
+        -------
+        OrderBookDiff
+
+        """
+        return OrderBookDiff.from_dict_c(values)
+
+    @staticmethod
+    def to_dict(OrderBookDiff obj):
+        """
+        Return a dictionary representation of this object.
+
+        Returns
+        -------
+        dict[str, object]
+
+        """
+        return OrderBookDiff.to_dict_c(obj)
+
+
+cdef class OrderBookDiffer:
+    """
+    Provides a stateful differ producing `OrderBookDiff` updates from an order book.
+
+    Each call to `diff` compares the current levels of the book with the levels
+    at the previous call, and returns only the levels which changed. A full
+    checkpoint is returned on the first call, and then once every
+    `checkpoint_interval` calls, so that late subscribers can resynchronize.
+
+    Parameters
+    ----------
+    instrument_id : InstrumentId
+        The instrument ID for the differ.
+    depth : int, default 0
+        The maximum number of levels per side to diff (0 for the full book).
+        Levels which fall outside of the depth are reported as removed.
+    checkpoint_interval : int, default 100
+        The number of calls to `diff` between full checkpoints.
+
+    Raises
+    ------
+    ValueError
+        If `depth` is negative (< 0).
+    ValueError
+        If `checkpoint_interval` is not positive (> 0).
+
+    """
+
+    def __init__(
+        self,
+        InstrumentId instrument_id not None,
+        int depth=0,
+        int checkpoint_interval=100,
+    ):
+        Condition.not_negative_int(depth, "depth")
+        Condition.positive_int(checkpoint_interval, "checkpoint_interval")
+
+        self.instrument_id = instrument_id
+        self.depth = depth
+        self.checkpoint_interval = checkpoint_interval
+        self.sequence = 0
+
+        self._last_bids = {}
+        self._last_asks = {}
+        self._since_checkpoint = 0
+        self._capacity = depth if depth > 0 else 64
+        self._prices = np.empty(self._capacity, dtype=np.float64)
+        self._sizes = np.empty(self._capacity, dtype=np.float64)
+        self._counts = np.empty(self._capacity, dtype=np.uint64)
+
+    cdef dict _levels(self, OrderBook book, bint bids):
+        cdef int filled = 0
+        while True:
+            if bids:
+                filled = book.fill_bids_depth(self._prices, self._sizes, self._counts)
+            else:
+                filled = book.fill_asks_depth(self._prices, self._sizes, self._counts)
+
+            if self.depth > 0 or filled < self._capacity:
+                break
+
+            # Full book requested and the buffers were exhausted
+            self._capacity *= 2
+            self._prices = np.empty(self._capacity, dtype=np.float64)
+            self._sizes = np.empty(self._capacity, dtype=np.float64)
+            self._counts = np.empty(self._capacity, dtype=np.uint64)
+
+        cdef dict levels = {}
+        cdef int i
+        for i in range(filled):
+            levels[self._prices[i]] = self._sizes[i]
+
+        return levels
+
+    cpdef OrderBookDiff diff(self, OrderBook book, uint64_t ts_init, bint checkpoint=False):
+        """
+        Return the changed levels of the given book since the last call.
+
+        Parameters
+        ----------
+        book : OrderBook
+            The order book to diff.
+        ts_init : uint64_t
+            The UNIX timestamp (nanoseconds) for the diff initialization.
+        checkpoint : bool, default False
+            If a full checkpoint should be forced.
+
+        Returns
+        -------
+        OrderBookDiff or ``None``
+            ``None`` if no levels changed and no checkpoint was due.
+
+        Raises
+        ------
+        ValueError
+            If `book.instrument_id` is not equal to the differs instrument ID.
+
+        """
+        Condition.not_none(book, "book")
+        Condition.equal(book.instrument_id, self.instrument_id, "book.instrument_id", "instrument_id")
+
+        cdef dict bids = self._levels(book, True)
+        cdef dict asks = self._levels(book, False)
+
+        self._since_checkpoint += 1
+        cdef bint is_checkpoint = (
+            checkpoint
+            or self.sequence == 0
+            or self._since_checkpoint >= self.checkpoint_interval
+        )
+
+        cdef list changed_bids
+        cdef list changed_asks
+        if is_checkpoint:
+            changed_bids = list(bids.items())
+            changed_asks = list(asks.items())
+            self._since_checkpoint = 0
+        else:
+            changed_bids = _changed_levels(self._last_bids, bids)
+            changed_asks = _changed_levels(self._last_asks, asks)
+            if not changed_bids and not changed_asks:
+                return None  # Nothing to publish
+
+        self._last_bids = bids
+        self._last_asks = asks
+        self.sequence += 1
+
+        return OrderBookDiff(
+            instrument_id=self.instrument_id,
+            sequence=self.sequence,
+            is_checkpoint=is_checkpoint,
+            bids=changed_bids,
+            asks=changed_asks,
+            ts_event=book.ts_last,
+            ts_init=ts_init,
+        )
+
+    cpdef void force_checkpoint(self):
+        """
+        Force the next diff to be a full checkpoint.
+
+        Unlike `reset`, the sequence continues from the last diff, so that
+        existing subscribers do not observe a sequence gap or restart.
+
+        """
+        self._since_checkpoint = self.checkpoint_interval
+
+    cpdef void reset(self):
+        """
+        Reset the differ.
+
+        All stateful fields are reset to their initial value, the next diff
+        will be a full checkpoint.
+
+        """
+        self._last_bids.clear()
+        self._last_asks.clear()
+        self._since_checkpoint = 0
+        self.sequence = 0
+
+
+cdef list _changed_levels(dict last, dict current):
+    cdef list changed = []
+    cdef double price
+    for price, size in current.items():
+        if last.get(price) != size:
+            changed.append((price, size))
+
+    for price in last:
+        if price not in current:
+            changed.append((price, 0.0))  # Level removed
+
+    return changed
@@ -154,6 +154,20 @@ cdef class Bar(Data):
     @staticmethod
     cdef dict to_dict_c(Bar obj)
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        BarType bar_type,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] opens,
+        const int64_t[:] highs,
+        const int64_t[:] lows,
+        const int64_t[:] closes,
+        const uint64_t[:] volumes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    )
+
     cpdef bint is_single_price(self)
 
 
@@ -339,6 +353,19 @@ cdef class QuoteTick(Data):
     @staticmethod
     cdef dict to_dict_c(QuoteTick obj)
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] bid_prices_raw,
+        const int64_t[:] ask_prices_raw,
+        const uint64_t[:] bid_sizes_raw,
+        const uint64_t[:] ask_sizes_raw,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    )
+
     cpdef Price extract_price(self, PriceType price_type)
     cpdef Quantity extract_volume(self, PriceType price_type)
 
@@ -376,6 +403,19 @@ cdef class TradeTick(Data):
     @staticmethod
     cdef dict to_dict_c(TradeTick obj)
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] prices_raw,
+        const uint64_t[:] sizes_raw,
+        const uint8_t[:] aggressor_sides,
+        list trade_ids,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    )
+
     @staticmethod
     cdef TradeTick from_mem_c(TradeTick_t mem)
 
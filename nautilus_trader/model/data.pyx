@@ -1031,6 +1031,110 @@ cdef class Bar(Data):
 
         return output
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        BarType bar_type,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] opens,
+        const int64_t[:] highs,
+        const int64_t[:] lows,
+        const int64_t[:] closes,
+        const uint64_t[:] volumes,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    ):
+        cdef Py_ssize_t count = ts_events.shape[0]
+        cdef list output = [None] * count
+
+        cdef Py_ssize_t i
+        for i in range(count):
+            output[i] = Bar.from_mem_c(
+                bar_new_from_raw(
+                    bar_type._mem,
+                    opens[i],
+                    highs[i],
+                    lows[i],
+                    closes[i],
+                    price_prec,
+                    volumes[i],
+                    size_prec,
+                    ts_events[i],
+                    ts_inits[i],
+                )
+            )
+
+        return output
+
+    @staticmethod
+    def from_raw_arrays_to_list(
+        BarType bar_type not None,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        opens,
+        highs,
+        lows,
+        closes,
+        volumes,
+        ts_events,
+        ts_inits,
+    ) -> list[Bar]:
+        """
+        Return bars built from the given arrays of raw values in a single pass.
+
+        Parameters
+        ----------
+        bar_type : BarType
+            The bar type for the bars.
+        price_prec : uint8_t
+            The price precision for the bars.
+        size_prec : uint8_t
+            The volume precision for the bars.
+        opens : np.ndarray[int64]
+            The raw open prices (as scaled fixed precision integers).
+        highs : np.ndarray[int64]
+            The raw high prices (as scaled fixed precision integers).
+        lows : np.ndarray[int64]
+            The raw low prices (as scaled fixed precision integers).
+        closes : np.ndarray[int64]
+            The raw close prices (as scaled fixed precision integers).
+        volumes : np.ndarray[uint64]
+            The raw volumes (as scaled fixed precision integers).
+        ts_events : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the data events occurred.
+        ts_inits : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+        Returns
+        -------
+        list[Bar]
+
+        Raises
+        ------
+        ValueError
+            If the lengths of the arrays are not all equal.
+
+        """
+        cdef Py_ssize_t count = len(ts_events)
+        Condition.true(
+            len(opens) == len(highs) == len(lows) == len(closes)
+            == len(volumes) == len(ts_inits) == count,
+            "array lengths were not all equal",
+        )
+
+        return Bar.from_raw_arrays_to_list_c(
+            bar_type,
+            price_prec,
+            size_prec,
+            opens,
+            highs,
+            lows,
+            closes,
+            volumes,
+            ts_events,
+            ts_inits,
+        )
+
     cpdef bint is_single_price(self):
         """
         If the OHLC are all equal to a single price.
@@ -2788,6 +2892,104 @@ cdef class QuoteTick(Data):
 
         return output
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] bid_prices_raw,
+        const int64_t[:] ask_prices_raw,
+        const uint64_t[:] bid_sizes_raw,
+        const uint64_t[:] ask_sizes_raw,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    ):
+        cdef Py_ssize_t count = ts_events.shape[0]
+        cdef list output = [None] * count
+
+        cdef Py_ssize_t i
+        for i in range(count):
+            output[i] = QuoteTick.from_raw_c(
+                instrument_id,
+                bid_prices_raw[i],
+                ask_prices_raw[i],
+                price_prec,
+                price_prec,
+                bid_sizes_raw[i],
+                ask_sizes_raw[i],
+                size_prec,
+                size_prec,
+                ts_events[i],
+                ts_inits[i],
+            )
+
+        return output
+
+    @staticmethod
+    def from_raw_arrays_to_list(
+        InstrumentId instrument_id not None,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        bid_prices_raw,
+        ask_prices_raw,
+        bid_sizes_raw,
+        ask_sizes_raw,
+        ts_events,
+        ts_inits,
+    ) -> list[QuoteTick]:
+        """
+        Return quote ticks built from the given arrays of raw values in a single pass.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The quotes instrument ID.
+        price_prec : uint8_t
+            The bid and ask price precision.
+        size_prec : uint8_t
+            The bid and ask size precision.
+        bid_prices_raw : np.ndarray[int64]
+            The raw top of book bid prices (as scaled fixed precision integers).
+        ask_prices_raw : np.ndarray[int64]
+            The raw top of book ask prices (as scaled fixed precision integers).
+        bid_sizes_raw : np.ndarray[uint64]
+            The raw top of book bid sizes (as scaled fixed precision integers).
+        ask_sizes_raw : np.ndarray[uint64]
+            The raw top of book ask sizes (as scaled fixed precision integers).
+        ts_events : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the tick events occurred.
+        ts_inits : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+        Returns
+        -------
+        list[QuoteTick]
+
+        Raises
+        ------
+        ValueError
+            If the lengths of the arrays are not all equal.
+
+        """
+        cdef Py_ssize_t count = len(ts_events)
+        Condition.true(
+            len(bid_prices_raw) == len(ask_prices_raw) == len(bid_sizes_raw)
+            == len(ask_sizes_raw) == len(ts_inits) == count,
+            "array lengths were not all equal",
+        )
+
+        return QuoteTick.from_raw_arrays_to_list_c(
+            instrument_id,
+            price_prec,
+            size_prec,
+            bid_prices_raw,
+            ask_prices_raw,
+            bid_sizes_raw,
+            ask_sizes_raw,
+            ts_events,
+            ts_inits,
+        )
+
     cpdef Price extract_price(self, PriceType price_type):
         """
         Extract the price for the given price type.
@@ -3241,6 +3443,102 @@ cdef class TradeTick(Data):
 
         return output
 
+    @staticmethod
+    cdef list from_raw_arrays_to_list_c(
+        InstrumentId instrument_id,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        const int64_t[:] prices_raw,
+        const uint64_t[:] sizes_raw,
+        const uint8_t[:] aggressor_sides,
+        list trade_ids,
+        const uint64_t[:] ts_events,
+        const uint64_t[:] ts_inits,
+    ):
+        cdef Py_ssize_t count = ts_events.shape[0]
+        cdef list output = [None] * count
+
+        cdef Py_ssize_t i
+        for i in range(count):
+            output[i] = TradeTick.from_raw_c(
+                instrument_id,
+                prices_raw[i],
+                price_prec,
+                sizes_raw[i],
+                size_prec,
+                <AggressorSide>aggressor_sides[i],
+                TradeId(trade_ids[i]),
+                ts_events[i],
+                ts_inits[i],
+            )
+
+        return output
+
+    @staticmethod
+    def from_raw_arrays_to_list(
+        InstrumentId instrument_id not None,
+        uint8_t price_prec,
+        uint8_t size_prec,
+        prices_raw,
+        sizes_raw,
+        aggressor_sides,
+        list trade_ids not None,
+        ts_events,
+        ts_inits,
+    ) -> list[TradeTick]:
+        """
+        Return trade ticks built from the given arrays of raw values in a single pass.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The trade instrument ID.
+        price_prec : uint8_t
+            The traded price precision.
+        size_prec : uint8_t
+            The traded size precision.
+        prices_raw : np.ndarray[int64]
+            The raw traded prices (as scaled fixed precision integers).
+        sizes_raw : np.ndarray[uint64]
+            The raw traded sizes (as scaled fixed precision integers).
+        aggressor_sides : np.ndarray[uint8]
+            The `AggressorSide` values for the trades.
+        trade_ids : list[str]
+            The trade match IDs (assigned by the venue).
+        ts_events : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the tick events occurred.
+        ts_inits : np.ndarray[uint64]
+            The UNIX timestamps (nanoseconds) when the data objects were initialized.
+
+        Returns
+        -------
+        list[TradeTick]
+
+        Raises
+        ------
+        ValueError
+            If the lengths of the arrays are not all equal.
+
+        """
+        cdef Py_ssize_t count = len(ts_events)
+        Condition.true(
+            len(prices_raw) == len(sizes_raw) == len(aggressor_sides)
+            == len(trade_ids) == len(ts_inits) == count,
+            "array lengths were not all equal",
+        )
+
+        return TradeTick.from_raw_arrays_to_list_c(
+            instrument_id,
+            price_prec,
+            size_prec,
+            prices_raw,
+            sizes_raw,
+            aggressor_sides,
+            trade_ids,
+            ts_events,
+            ts_inits,
+        )
+
 
 cdef class Ticker(Data):
     """
@@ -14,10 +14,14 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.shared import SharedDataStore
 
 
 __all__ = (
     "BaseDataCatalog",
+    "CatalogManifest",
     "ParquetDataCatalog",
+    "SharedDataStore",
 )
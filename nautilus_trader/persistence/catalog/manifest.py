@@ -0,0 +1,389 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import fsspec
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+# The version of the Arrow schemas used for catalog data files, recorded for each file in
+# the manifest so that files written with an older schema can be identified.
+DATA_SCHEMA_VERSION = 1
+
+MANIFEST_FILENAME = "manifest.parquet"
+
+_MANIFEST_SCHEMA = pa.schema(
+    [
+        pa.field("path", pa.string(), nullable=False),
+        pa.field("data_type", pa.string(), nullable=False),
+        pa.field("identifier", pa.string()),
+        pa.field("ts_min", pa.uint64()),
+        pa.field("ts_max", pa.uint64()),
+        pa.field("num_rows", pa.uint64(), nullable=False),
+        pa.field("schema_version", pa.uint32(), nullable=False),
+    ],
+)
+
+
+class ManifestEntry(NamedTuple):
+    """
+    Represents a single data file in a catalog manifest.
+    """
+
+    path: str
+    """The path of the file relative to the catalog root."""
+    data_type: str
+    """The data type (class filename) of the file."""
+    identifier: str | None
+    """The URI safe instrument ID or bar type of the file (if any)."""
+    ts_min: int | None
+    """The minimum `ts_init` in the file (``None`` if unknown)."""
+    ts_max: int | None
+    """The maximum `ts_init` in the file (``None`` if unknown)."""
+    num_rows: int
+    """The number of rows in the file."""
+    schema_version: int
+    """The data schema version of the file."""
+
+    def overlaps(self, start: int | None, end: int | None) -> bool:
+        """
+        Return a value indicating whether the file may contain rows within the given
+        inclusive `ts_init` range.
+
+        Parameters
+        ----------
+        start : int, optional
+            The start of the range (UNIX nanoseconds). If ``None`` then unbounded.
+        end : int, optional
+            The end of the range (UNIX nanoseconds). If ``None`` then unbounded.
+
+        Returns
+        -------
+        bool
+
+        """
+        if start is not None and self.ts_max is not None and self.ts_max < start:
+            return False
+        if end is not None and self.ts_min is not None and self.ts_min > end:
+            return False
+        return True
+
+
+def manifest_entry_from_table(
+    path: str,
+    data_type: str,
+    identifier: str | None,
+    table: pa.Table,
+) -> ManifestEntry:
+    """
+    Return a manifest entry for a data file written from the given `table`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file relative to the catalog root.
+    data_type : str
+        The data type (class filename) of the file.
+    identifier : str, optional
+        The URI safe instrument ID or bar type of the file.
+    table : pa.Table
+        The table written to the file.
+
+    Returns
+    -------
+    ManifestEntry
+
+    """
+    ts_min: int | None = None
+    ts_max: int | None = None
+    if "ts_init" in table.column_names and table.num_rows > 0:
+        min_max = pc.min_max(table.column("ts_init"))
+        ts_min = min_max["min"].as_py()
+        ts_max = min_max["max"].as_py()
+
+    return ManifestEntry(
+        path=path,
+        data_type=data_type,
+        identifier=identifier,
+        ts_min=ts_min,
+        ts_max=ts_max,
+        num_rows=table.num_rows,
+        schema_version=DATA_SCHEMA_VERSION,
+    )
+
+
+def manifest_entry_from_metadata(
+    path: str,
+    data_type: str,
+    identifier: str | None,
+    metadata: pq.FileMetaData,
+) -> ManifestEntry:
+    """
+    Return a manifest entry for a data file from its Parquet footer metadata.
+
+    The `ts_init` range is taken from the row group statistics, and is left unknown
+    if any row group was written without statistics.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file relative to the catalog root.
+    data_type : str
+        The data type (class filename) of the file.
+    identifier : str, optional
+        The URI safe instrument ID or bar type of the file.
+    metadata : pq.FileMetaData
+        The Parquet footer metadata of the file.
+
+    Returns
+    -------
+    ManifestEntry
+
+    """
+    ts_min: int | None = None
+    ts_max: int | None = None
+    names = metadata.schema.names
+    if "ts_init" in names and metadata.num_row_groups > 0:
+        column = names.index("ts_init")
+        for i in range(metadata.num_row_groups):
+            stats = metadata.row_group(i).column(column).statistics
+            if stats is None or not stats.has_min_max:
+                ts_min = None
+                ts_max = None
+                break
+            ts_min = stats.min if ts_min is None else min(ts_min, stats.min)
+            ts_max = stats.max if ts_max is None else max(ts_max, stats.max)
+
+    return ManifestEntry(
+        path=path,
+        data_type=data_type,
+        identifier=identifier,
+        ts_min=ts_min,
+        ts_max=ts_max,
+        num_rows=metadata.num_rows,
+        schema_version=DATA_SCHEMA_VERSION,
+    )
+
+
+class CatalogManifest:
+    """
+    Provides a persistent index of the data files in a catalog.
+
+    For each file the manifest records the data type, instrument ID or bar type,
+    `ts_init` range, row count and schema version. This allows queries to open only
+    the files which overlap the requested range, without listing the catalog
+    directories or reading any file footers.
+
+    The manifest is stored as a single Parquet file at the catalog root, and is
+    reloaded whenever the file changes on the filesystem.
+
+    Parameters
+    ----------
+    fs : fsspec.AbstractFileSystem
+        The filesystem of the catalog.
+    path : str
+        The root path of the catalog.
+
+    Warnings
+    --------
+    The manifest is not threadsafe, and concurrent writers to the same catalog may
+    lose each others entries.
+
+    """
+
+    def __init__(self, fs: fsspec.AbstractFileSystem, path: str) -> None:
+        self.fs = fs
+        self.path = f"{path}/{MANIFEST_FILENAME}"
+        self._entries: dict[str, dict[str, ManifestEntry]] = {}
+        self._file_info: tuple | None = None
+        self._loaded = False
+
+    def _current_file_info(self) -> tuple | None:
+        if not self.fs.exists(self.path):
+            return None
+        info = self.fs.info(self.path)
+        return info.get("size"), info.get("mtime", info.get("created"))
+
+    def _maybe_reload(self) -> None:
+        file_info = self._current_file_info()
+        if self._loaded and file_info == self._file_info:
+            return
+
+        self._entries = {}
+        if file_info is not None:
+            with self.fs.open(self.path, "rb") as f:
+                table = pq.read_table(f)
+            for row in table.to_pylist():
+                entry = ManifestEntry(**row)
+                self._entries.setdefault(entry.data_type, {})[entry.path] = entry
+
+        self._file_info = file_info
+        self._loaded = True
+
+    def has_data_type(self, data_type: str) -> bool:
+        """
+        Return a value indicating whether the manifest holds any files for the given
+        `data_type`.
+
+        Parameters
+        ----------
+        data_type : str
+            The data type (class filename).
+
+        Returns
+        -------
+        bool
+
+        """
+        self._maybe_reload()
+        return bool(self._entries.get(data_type))
+
+    def entries(self, data_type: str | None = None) -> list[ManifestEntry]:
+        """
+        Return the entries in the manifest, sorted by path.
+
+        Parameters
+        ----------
+        data_type : str, optional
+            The data type (class filename) filter for the entries.
+
+        Returns
+        -------
+        list[ManifestEntry]
+
+        """
+        self._maybe_reload()
+        if data_type is not None:
+            entries = list(self._entries.get(data_type, {}).values())
+        else:
+            entries = [e for by_path in self._entries.values() for e in by_path.values()]
+        return sorted(entries, key=lambda e: e.path)
+
+    def query(
+        self,
+        data_type: str,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> list[ManifestEntry]:
+        """
+        Return the entries for the given `data_type` which overlap the inclusive
+        `ts_init` range, sorted by path.
+
+        Parameters
+        ----------
+        data_type : str
+            The data type (class filename).
+        start : int, optional
+            The start of the range (UNIX nanoseconds).
+        end : int, optional
+            The end of the range (UNIX nanoseconds).
+
+        Returns
+        -------
+        list[ManifestEntry]
+
+        """
+        return [e for e in self.entries(data_type) if e.overlaps(start, end)]
+
+    def add(self, entries: list[ManifestEntry]) -> None:
+        """
+        Add the given `entries` to the manifest and persist it.
+
+        Any existing entries for the same paths are replaced.
+
+        Parameters
+        ----------
+        entries : list[ManifestEntry]
+            The entries to add.
+
+        """
+        self.update(added=entries)
+
+    def remove(self, paths: list[str]) -> None:
+        """
+        Remove the entries for the given `paths` from the manifest and persist it.
+
+        Parameters
+        ----------
+        paths : list[str]
+            The paths (relative to the catalog root) to remove.
+
+        """
+        self.update(removed=paths)
+
+    def update(
+        self,
+        added: list[ManifestEntry] | None = None,
+        removed: list[str] | None = None,
+    ) -> None:
+        """
+        Remove then add the given entries, persisting the manifest with a single write.
+
+        Readers will observe either all or none of the changes.
+
+        Parameters
+        ----------
+        added : list[ManifestEntry], optional
+            The entries to add (replacing any existing entries for the same paths).
+        removed : list[str], optional
+            The paths (relative to the catalog root) to remove.
+
+        """
+        self._maybe_reload()
+        if removed:
+            to_remove = set(removed)
+            for by_path in self._entries.values():
+                for path in to_remove.intersection(by_path):
+                    del by_path[path]
+        for entry in added or []:
+            self._entries.setdefault(entry.data_type, {})[entry.path] = entry
+        self._flush()
+
+    def replace(self, entries: list[ManifestEntry]) -> None:
+        """
+        Replace all entries in the manifest with the given `entries` and persist it.
+
+        Parameters
+        ----------
+        entries : list[ManifestEntry]
+            The new entries for the manifest.
+
+        """
+        self._entries = {}
+        for entry in entries:
+            self._entries.setdefault(entry.data_type, {})[entry.path] = entry
+        self._loaded = True
+        self._flush()
+
+    def _flush(self) -> None:
+        entries = sorted(
+            (e for by_path in self._entries.values() for e in by_path.values()),
+            key=lambda e: e.path,
+        )
+        table = pa.Table.from_pylist([e._asdict() for e in entries], schema=_MANIFEST_SCHEMA)
+
+        # Write to a temporary file first, so that readers never observe a
+        # partially written manifest.
+        tmp_path = f"{self.path}.tmp"
+        with self.fs.open(tmp_path, "wb") as f:
+            pq.write_table(table, f)
+        self.fs.mv(tmp_path, self.path)
+
+        self._file_info = self._current_file_info()
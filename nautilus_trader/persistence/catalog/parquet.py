@@ -43,6 +43,7 @@ from nautilus_trader.core.inspect import is_nautilus_class
 from nautilus_trader.core.message import Event
 from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
 from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import GenericData
@@ -53,6 +54,10 @@ from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.data import capsule_to_list
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.persistence.catalog.base import BaseDataCatalog
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.persistence.catalog.manifest import ManifestEntry
+from nautilus_trader.persistence.catalog.manifest import manifest_entry_from_metadata
+from nautilus_trader.persistence.catalog.manifest import manifest_entry_from_table
 from nautilus_trader.persistence.funcs import class_to_filename
 from nautilus_trader.persistence.funcs import combine_filters
 from nautilus_trader.persistence.funcs import urisafe_instrument_id
@@ -100,12 +105,20 @@ class ParquetDataCatalog(BaseDataCatalog):
         groups.
     show_query_paths : bool, default False
         If globed query paths should be printed to stdout.
+    use_manifest : bool, default True
+        If a manifest of the written data files (with their `ts_init` ranges) should be
+        maintained, and used to open only the files overlapping the query range. Data
+        types with no files in the manifest fall back to listing the catalog directories.
 
     Warnings
     --------
     The data catalog is not threadsafe. Using it in a multithreaded environment can lead to
     unexpected behavior.
 
+    The existing files for a data type are indexed when it is first written with the
+    manifest. Data files written to the catalog by other means after that are not
+    visible to queries for the data type, until `rebuild_manifest` is called.
+
     Notes
     -----
     For more details about `fsspec` and its filesystem protocols, see
@@ -122,6 +135,7 @@ class ParquetDataCatalog(BaseDataCatalog):
         min_rows_per_group: int = 0,
         max_rows_per_group: int = 5000,
         show_query_paths: bool = False,
+        use_manifest: bool = True,
     ) -> None:
         self.fs_protocol: str = fs_protocol or _DEFAULT_FS_PROTOCOL
         self.fs_storage_options = fs_storage_options or {}
@@ -145,6 +159,9 @@ class ParquetDataCatalog(BaseDataCatalog):
             final_path = "/" + final_path
 
         self.path = str(final_path)
+        self.manifest: CatalogManifest | None = (
+            CatalogManifest(fs=self.fs, path=self.path) if use_manifest else None
+        )
 
     @classmethod
     def from_env(cls) -> ParquetDataCatalog:
@@ -223,26 +240,84 @@ class ParquetDataCatalog(BaseDataCatalog):
         else:
             return f"{self.path}/data/{class_to_filename(data_cls)}"
 
+    def _relative_path(self, path: str) -> str:
+        root = self.path.lstrip("/") + "/"
+        path = path.lstrip("/")
+        assert path.startswith(root), f"{path} is not within the catalog"
+        return path[len(root) :]
+
     def write_chunk(
         self,
         data: list[Data],
         data_cls: type[Data],
         instrument_id: str | None = None,
         basename_template: str = "part-{i}",
+        append: bool = False,
         **kwargs: Any,
     ) -> None:
+        entries = self._unindexed_entries({class_to_filename(data_cls)})
+        entries += self._write_chunk(
+            data=data,
+            data_cls=data_cls,
+            instrument_id=instrument_id,
+            basename_template=basename_template,
+            append=append,
+            **kwargs,
+        )
+        if self.manifest is not None:
+            self.manifest.add(entries)
+
+    def _write_chunk(
+        self,
+        data: list[Data],
+        data_cls: type[Data],
+        instrument_id: str | None = None,
+        basename_template: str = "part-{i}",
+        append: bool = False,
+        **kwargs: Any,
+    ) -> list[ManifestEntry]:
+        kw = dict(**self.dataset_kwargs, **kwargs)
+        PyCondition.false(
+            append and "partitioning" in kw,
+            "`partitioning` is not supported when appending",
+        )
+
         table = self._objects_to_table(data, data_cls=data_cls)
         path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
-        kw = dict(**self.dataset_kwargs, **kwargs)
+
+        data_type = class_to_filename(data_cls)
+        identifier = urisafe_instrument_id(instrument_id) if instrument_id is not None else None
 
         if "partitioning" not in kw:
-            self._fast_write(
+            entry = manifest_entry_from_table(
+                path="",
+                data_type=data_type,
+                identifier=identifier,
+                table=table,
+            )
+            if append:
+                if entry.ts_min is not None and entry.ts_max is not None:
+                    self._check_append_range(path, ts_min=entry.ts_min, ts_max=entry.ts_max)
+                basename_template = self._append_basename(entry)
+
+            file_path = self._fast_write(
                 table=table,
                 path=path,
                 fs=self.fs,
                 basename_template=basename_template,
             )
+            if self.manifest is None:
+                return []
+            return [entry._replace(path=self._relative_path(file_path))]
         else:
+            written_files: list[pds.WrittenFile] = []
+            user_file_visitor = kw.pop("file_visitor", None)
+
+            def file_visitor(written_file: pds.WrittenFile) -> None:
+                written_files.append(written_file)
+                if user_file_visitor is not None:
+                    user_file_visitor(written_file)
+
             # Write parquet file
             pds.write_dataset(
                 data=table,
@@ -252,9 +327,39 @@ class ParquetDataCatalog(BaseDataCatalog):
                 filesystem=self.fs,
                 min_rows_per_group=self.min_rows_per_group,
                 max_rows_per_group=self.max_rows_per_group,
-                **self.dataset_kwargs,
-                **kwargs,
+                file_visitor=file_visitor,
+                **kw,
             )
+            if self.manifest is None:
+                return []
+            return [
+                manifest_entry_from_metadata(
+                    path=self._relative_path(written_file.path),
+                    data_type=data_type,
+                    identifier=identifier,
+                    metadata=written_file.metadata,
+                )
+                for written_file in written_files
+            ]
+
+    @staticmethod
+    def _append_basename(entry: ManifestEntry) -> str:
+        # Name the file from its `ts_init` range, zero padded so that the files sort in
+        # time order (or uniquely if the range is unknown, as without a `ts_init` column)
+        if entry.ts_min is None or entry.ts_max is None:
+            return UUID4().value
+        return f"{entry.ts_min:020d}-{entry.ts_max:020d}"
+
+    def _check_append_range(self, path: str, ts_min: int, ts_max: int) -> None:
+        for entry in self._dataset_entries(path):
+            if entry.ts_min is None or entry.ts_max is None:
+                continue  # Range unknown, so the file was named uniquely
+            if entry.overlaps(ts_min, ts_max):
+                raise ValueError(
+                    f"Cannot append data with `ts_init` range [{ts_min}, {ts_max}], "
+                    f"overlaps existing file '{entry.path}' with range "
+                    f"[{entry.ts_min}, {entry.ts_max}]",
+                )
 
     def _fast_write(
         self,
@@ -262,20 +367,23 @@ class ParquetDataCatalog(BaseDataCatalog):
         path: str,
         fs: fsspec.AbstractFileSystem,
         basename_template: str,
-    ) -> None:
+    ) -> str:
         name = basename_template.format(i=0)
+        file_path = f"{path}/{name}.parquet"
         fs.mkdirs(path, exist_ok=True)
         pq.write_table(
             table,
-            where=f"{path}/{name}.parquet",
+            where=file_path,
             filesystem=fs,
             row_group_size=self.max_rows_per_group,
         )
+        return file_path
 
     def write_data(
         self,
         data: list[Data | Event],
         basename_template: str = "part-{i}",
+        append: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -294,6 +402,12 @@ class ParquetDataCatalog(BaseDataCatalog):
             The token '{i}' will be replaced with an automatically incremented
             integer as files are partitioned.
             If not specified, it defaults to 'part-{i}' + the default extension '.parquet'.
+        append : bool, default False
+            If the data should be appended as new time partitioned files, named from the
+            `ts_init` range of each chunk ('{ts_min}-{ts_max}.parquet', zero padded to 20
+            digits), rather than written using the `basename_template`. Data without a
+            `ts_init` column is appended to uniquely named files. Existing files are
+            never rewritten.
         kwargs : Any
             Additional keyword arguments to be passed to the `write_chunk` method.
 
@@ -316,6 +430,9 @@ class ParquetDataCatalog(BaseDataCatalog):
         ------
         ValueError
             If data of the same type is not monotonically increasing (or non-decreasing) based on `ts_init`.
+        ValueError
+            If `append` and the `ts_init` range of any chunk overlaps an existing file
+            for the same data type and instrument ID.
 
         """
 
@@ -330,15 +447,212 @@ class ParquetDataCatalog(BaseDataCatalog):
             return name, None
 
         name_to_cls = {cls.__name__: cls for cls in {type(d) for d in data}}
+        entries = self._unindexed_entries({class_to_filename(cls) for cls in name_to_cls.values()})
         for (cls_name, instrument_id), single_type in groupby(sorted(data, key=key), key=key):
-            self.write_chunk(
+            entries += self._write_chunk(
                 data=list(single_type),
                 data_cls=name_to_cls[cls_name],
                 instrument_id=instrument_id,
                 basename_template=basename_template,
+                append=append,
                 **kwargs,
             )
 
+        # Persist the manifest once for all chunks
+        if self.manifest is not None:
+            self.manifest.add(entries)
+
+    def rebuild_manifest(self) -> None:
+        """
+        Rebuild the manifest from the Parquet footers of all data files in the catalog.
+
+        This should be called to index data files which were written to the catalog
+        by other means, or before the manifest existed.
+
+        Raises
+        ------
+        ValueError
+            If the catalog was created with `use_manifest` False.
+
+        """
+        PyCondition.not_none(self.manifest, "manifest")
+
+        self.manifest.replace(self._scan_entries(f"{self.path}/data"))
+
+    def _unindexed_entries(self, data_types: set[str]) -> list[ManifestEntry]:
+        # Return the entries for the existing files of the data types not yet held in the
+        # manifest (written before the manifest existed, or with it disabled), so that
+        # they are indexed along with the first files written for each data type.
+        if self.manifest is None:
+            return []
+
+        entries: list[ManifestEntry] = []
+        for data_type in sorted(data_types):
+            if not self.manifest.has_data_type(data_type):
+                entries += self._scan_entries(f"{self.path}/data/{data_type}")
+
+        return entries
+
+    def _scan_entries(self, dataset_path: str) -> list[ManifestEntry]:
+        # Build the entries for all files under the dataset path from their footers
+        entries: list[ManifestEntry] = []
+        if not self.fs.exists(dataset_path):
+            return entries
+
+        for file_path in self.fs.find(dataset_path):
+            path = self._relative_path(file_path)
+            parts = path.split("/")
+            with self.fs.open(file_path, "rb") as f:
+                metadata = pq.read_metadata(f)
+            # The identifier directory is absent for data not written per instrument,
+            # which may instead be nested in hive partition ('key=value') directories
+            has_identifier = len(parts) > 3 and "=" not in parts[2]
+            entries.append(
+                manifest_entry_from_metadata(
+                    path=path,
+                    data_type=parts[1],
+                    identifier=parts[2] if has_identifier else None,
+                    metadata=metadata,
+                ),
+            )
+
+        return entries
+
+    def _dataset_entries(self, dataset_path: str) -> list[ManifestEntry]:
+        # Return the entries for all files under the dataset path, from the manifest
+        # if it holds the data type (otherwise from the file footers).
+        rel_path = self._relative_path(dataset_path).rstrip("/")
+        data_type = rel_path.split("/")[1]
+        if self.manifest is not None and self.manifest.has_data_type(data_type):
+            return [
+                entry
+                for entry in self.manifest.entries(data_type)
+                if entry.path.startswith(rel_path + "/")
+            ]
+
+        return self._scan_entries(dataset_path)
+
+    def compact(
+        self,
+        data_cls: type,
+        instrument_id: str | None = None,
+        max_rows_per_file: int = 1_000_000,
+    ) -> list[str]:
+        """
+        Compact the small data files for the given data type (and instrument ID) into
+        sorted files of up to `max_rows_per_file` rows.
+
+        Consecutive files (in `ts_init` order) within the same directory are merged while
+        their combined row count fits within `max_rows_per_file`. Each merged file is
+        sorted by `ts_init`, written with row groups of `max_rows_per_group` rows and
+        named from its `ts_init` range, then the manifest is updated before the merged
+        files are removed.
+
+        Parameters
+        ----------
+        data_cls : type
+            The data type to compact.
+        instrument_id : str, optional
+            The instrument ID (or bar type) to compact. If ``None`` then compacts the
+            files for all instruments of the data type.
+        max_rows_per_file : int, default 1_000_000
+            The maximum number of rows for a compacted file.
+
+        Returns
+        -------
+        list[str]
+            The paths of the written files.
+
+        Raises
+        ------
+        ValueError
+            If `max_rows_per_file` is not positive (> 0).
+
+        Warnings
+        --------
+        Compaction can run in the background while the catalog is queried, though a query
+        which began before the manifest was updated may fail if it opens a merged file
+        after it has been removed.
+
+        """
+        PyCondition.positive_int(max_rows_per_file, "max_rows_per_file")
+
+        dataset_path = self._make_path(data_cls=data_cls, instrument_id=instrument_id)
+        entries_by_dir: dict[str, list[ManifestEntry]] = defaultdict(list)
+        for entry in self._dataset_entries(dataset_path):
+            entries_by_dir[entry.path.rsplit("/", 1)[0]].append(entry)
+
+        written: list[str] = []
+        for directory, entries in sorted(entries_by_dir.items()):
+            for group in self._compaction_groups(entries, max_rows_per_file):
+                written.append(self._compact_files(directory, group))
+
+        return written
+
+    @staticmethod
+    def _compaction_groups(
+        entries: list[ManifestEntry],
+        max_rows_per_file: int,
+    ) -> list[list[ManifestEntry]]:
+        groups: list[list[ManifestEntry]] = []
+        group: list[ManifestEntry] = []
+        group_rows = 0
+        for entry in sorted(entries, key=lambda e: (e.ts_min or 0, e.path)):
+            if group_rows + entry.num_rows > max_rows_per_file:
+                if len(group) > 1:
+                    groups.append(group)
+                group = []
+                group_rows = 0
+                if entry.num_rows >= max_rows_per_file:
+                    continue  # Already full sized
+            group.append(entry)
+            group_rows += entry.num_rows
+
+        if len(group) > 1:
+            groups.append(group)
+
+        return groups
+
+    def _compact_files(self, directory: str, group: list[ManifestEntry]) -> str:
+        tables: list[pa.Table] = []
+        for entry in group:
+            with self.fs.open(f"{self.path}/{entry.path}", "rb") as f:
+                tables.append(pq.read_table(f))
+        table = pa.concat_tables(tables)
+        if "ts_init" in table.column_names:
+            table = table.sort_by("ts_init")
+
+        entry = manifest_entry_from_table(
+            path="",
+            data_type=group[0].data_type,
+            identifier=group[0].identifier,
+            table=table,
+        )
+        entry = entry._replace(path=f"{directory}/{self._append_basename(entry)}.parquet")
+        file_path = f"{self.path}/{entry.path}"
+
+        # Write to a temporary file outside the data directory first (so it is never
+        # picked up by a query), as the merged file may replace one of the group
+        tmp_dir = f"{self.path}/.tmp"
+        tmp_path = f"{tmp_dir}/{UUID4().value}.parquet"
+        self.fs.mkdirs(tmp_dir, exist_ok=True)
+        pq.write_table(
+            table,
+            where=tmp_path,
+            filesystem=self.fs,
+            row_group_size=self.max_rows_per_group,
+        )
+        self.fs.mv(tmp_path, file_path)
+
+        if self.manifest is not None:
+            self.manifest.update(added=[entry], removed=[e.path for e in group])
+
+        for old_entry in group:
+            if old_entry.path != entry.path:
+                self.fs.rm(f"{self.path}/{old_entry.path}")
+
+        return file_path
+
     # -- QUERIES ----------------------------------------------------------------------------------
 
     def query(
@@ -399,17 +713,24 @@ class ParquetDataCatalog(BaseDataCatalog):
             raise ValueError("`session` was `None` when a value was expected")
 
         file_prefix = class_to_filename(data_cls)
-        glob_path = f"{self.path}/data/{file_prefix}/**/*"
-        dirs = self.fs.glob(glob_path)
+        entries = self._manifest_entries(f"{self.path}/data/{file_prefix}", start=start, end=end)
+        if entries is not None:
+            entries = self._filter_identifiers(entries, instrument_ids, bar_types)
+            dirs = [f"{self.path}/{entry.path}" for entry in entries]
+        else:
+            glob_path = f"{self.path}/data/{file_prefix}/**/*"
+            dirs = self.fs.glob(glob_path)
+            if instrument_ids:
+                dirs = [
+                    p for p in dirs if any(urisafe_instrument_id(x) in p for x in instrument_ids)
+                ]
+            if bar_types:
+                dirs = [p for p in dirs if any(urisafe_instrument_id(x) in p for x in bar_types)]
         if self.show_query_paths:
             print(dirs)
 
         for idx, path in enumerate(dirs):
             assert self.fs.exists(path)
-            if instrument_ids and not any(urisafe_instrument_id(x) in path for x in instrument_ids):
-                continue
-            if bar_types and not any(urisafe_instrument_id(x) in path for x in bar_types):
-                continue
             table = f"{file_prefix}_{idx}"
             query = self._build_query(
                 table,
@@ -491,19 +812,31 @@ class ParquetDataCatalog(BaseDataCatalog):
         end: TimestampLike | None = None,
         ts_column: str = "ts_init",
     ) -> pds.Dataset | None:
-        # Original dataset
-        dataset = pds.dataset(path, filesystem=self.fs)
-
-        # Instrument id filters (not stored in table, need to filter based on files)
-        if instrument_ids is not None:
-            if not isinstance(instrument_ids, list):
-                instrument_ids = [instrument_ids]
-            valid_files = [
-                fn
-                for fn in dataset.files
-                if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
-            ]
-            dataset = pds.dataset(valid_files, filesystem=self.fs)
+        if instrument_ids is not None and not isinstance(instrument_ids, list):
+            instrument_ids = [instrument_ids]
+
+        # Original dataset (only the files overlapping the time range, if in the manifest)
+        entries = self._manifest_entries(path, start=start, end=end)
+        if entries is not None:
+            if instrument_ids is not None:
+                entries = self._filter_identifiers(entries, instrument_ids=instrument_ids)
+            files = [f"{self.path}/{entry.path}" for entry in entries]
+            if not files:
+                # Read the schema from a single file so that the empty result has it
+                files = self._manifest_files(path)[:1]
+                return pds.dataset(files, filesystem=self.fs).schema.empty_table()
+            dataset = pds.dataset(files, filesystem=self.fs)
+        else:
+            dataset = pds.dataset(path, filesystem=self.fs)
+
+            # Instrument id filters (not stored in table, need to filter based on files)
+            if instrument_ids is not None:
+                valid_files = [
+                    fn
+                    for fn in dataset.files
+                    if any(urisafe_instrument_id(x) in fn for x in instrument_ids)
+                ]
+                dataset = pds.dataset(valid_files, filesystem=self.fs)
 
         filters: list[pds.Expression] = [filter_expr] if filter_expr is not None else []
         if start is not None:
@@ -516,6 +849,66 @@ class ParquetDataCatalog(BaseDataCatalog):
             filter_ = None
         return dataset.to_table(filter=filter_)
 
+    def _manifest_files(
+        self,
+        dataset_path: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[str] | None:
+        # Return the files in the manifest under the dataset path which overlap the
+        # time range, or `None` if the data type is not held in the manifest.
+        entries = self._manifest_entries(dataset_path, start=start, end=end)
+        if entries is None:
+            return None
+
+        return [f"{self.path}/{entry.path}" for entry in entries]
+
+    def _manifest_entries(
+        self,
+        dataset_path: str,
+        start: TimestampLike | None = None,
+        end: TimestampLike | None = None,
+    ) -> list[ManifestEntry] | None:
+        # Return the entries in the manifest under the dataset path which overlap the
+        # time range, or `None` if the data type is not held in the manifest.
+        if self.manifest is None or not dataset_path.startswith(f"{self.path}/data/"):
+            return None
+
+        rel_path = self._relative_path(dataset_path).rstrip("/")
+        data_type = rel_path.split("/")[1]
+        if not self.manifest.has_data_type(data_type):
+            return None
+
+        entries = self.manifest.query(
+            data_type=data_type,
+            start=dt_to_unix_nanos(start) if start is not None else None,
+            end=dt_to_unix_nanos(end) if end is not None else None,
+        )
+        return [entry for entry in entries if entry.path.startswith(rel_path + "/")]
+
+    @staticmethod
+    def _filter_identifiers(
+        entries: list[ManifestEntry],
+        instrument_ids: list[str] | None = None,
+        bar_types: list[str] | None = None,
+    ) -> list[ManifestEntry]:
+        # Return the entries for the given instrument IDs (including the bar types of
+        # each instrument) and bar types, where no filter is applied if empty
+        if instrument_ids:
+            prefixes = tuple(urisafe_instrument_id(x) + "-" for x in instrument_ids)
+            safe_ids = {urisafe_instrument_id(x) for x in instrument_ids}
+            entries = [
+                entry
+                for entry in entries
+                if entry.identifier is not None
+                and (entry.identifier in safe_ids or entry.identifier.startswith(prefixes))
+            ]
+        if bar_types:
+            safe_bar_types = {urisafe_instrument_id(x) for x in bar_types}
+            entries = [entry for entry in entries if entry.identifier in safe_bar_types]
+
+        return entries
+
     def _build_query(
         self,
         table: str,
@@ -0,0 +1,132 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+from os import PathLike
+from pathlib import Path
+
+import pyarrow as pa
+
+from nautilus_trader.core.correctness import PyCondition
+
+
+class SharedDataStore:
+    """
+    Provides a host local store of decoded catalog query results.
+
+    Each table is written once in the uncompressed Arrow IPC file format, and
+    can then be memory-mapped by any number of processes on the same host. Tables
+    read from the store reference the mapped pages directly (zero-copy), so
+    the resident memory for a dataset is shared between all readers rather
+    than scaling with the number of processes.
+
+    Parameters
+    ----------
+    path : PathLike[str] | str
+        The directory for the store (will be created if it does not exist).
+
+    Warnings
+    --------
+    The store does not manage the lifetime of its directory, the owner of the
+    store is responsible for removing it once all readers have finished.
+
+    """
+
+    def __init__(self, path: PathLike[str] | str) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _table_path(self, key: str) -> Path:
+        return self.path / f"{key}.arrow"
+
+    def contains(self, key: str) -> bool:
+        """
+        Return a value indicating whether a table exists for the given `key`.
+
+        Parameters
+        ----------
+        key : str
+            The key for the table.
+
+        Returns
+        -------
+        bool
+
+        """
+        return self._table_path(key).exists()
+
+    def put(self, key: str, table: pa.Table) -> Path:
+        """
+        Write the given `table` to the store under the given `key`.
+
+        If a table already exists for the key then it will not be rewritten.
+
+        Parameters
+        ----------
+        key : str
+            The key for the table.
+        table : pa.Table
+            The table to write.
+
+        Returns
+        -------
+        Path
+            The path to the written file.
+
+        Raises
+        ------
+        ValueError
+            If `key` is not a valid string.
+
+        """
+        PyCondition.valid_string(key, "key")
+
+        path = self._table_path(key)
+        if path.exists():
+            return path
+
+        # Write to a temporary file first, so that readers never observe a
+        # partially written table.
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+
+        return path
+
+    def get(self, key: str) -> pa.Table | None:
+        """
+        Return the memory-mapped table for the given `key` (if found).
+
+        Parameters
+        ----------
+        key : str
+            The key for the table.
+
+        Returns
+        -------
+        pa.Table or ``None``
+
+        """
+        path = self._table_path(key)
+        if not path.exists():
+            return None
+
+        # The buffers of the returned table keep the memory map alive
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all()
@@ -17,6 +17,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import pyarrow as pa
+
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.instruments import Instrument
@@ -32,3 +34,4 @@ class CatalogDataResult:
     data: list[Data]
     instrument: Instrument | None = None
     client_id: ClientId | None = None
+    table: pa.Table | None = None  # Undecoded data (for columnar loading)
@@ -32,7 +32,6 @@ from nautilus_trader.core.data cimport Data
 from nautilus_trader.core.datetime cimport as_utc_index
 from nautilus_trader.core.datetime cimport dt_to_unix_nanos
 from nautilus_trader.core.rust.core cimport CVec
-from nautilus_trader.core.rust.core cimport secs_to_nanos
 from nautilus_trader.core.rust.model cimport AggressorSide
 from nautilus_trader.core.rust.model cimport BookAction
 from nautilus_trader.core.rust.model cimport OrderSide
@@ -47,6 +46,24 @@ from nautilus_trader.model.objects cimport Price
 from nautilus_trader.model.objects cimport Quantity
 
 
+cdef inline object _index_to_unix_nanos(index):
+    # Vectorized `dt_to_unix_nanos` for every timestamp of the index (the index is
+    # normalized to nanoseconds first, as `asi8` is in the unit of the index)
+    return np.ascontiguousarray(pd.DatetimeIndex(index).as_unit("ns").asi8, dtype=np.uint64)
+
+
+cdef inline object _scale_to_raw(values, dtype):
+    # Vectorized `int(value * 1e9)` for every value (truncates toward zero)
+    return np.ascontiguousarray(np.asarray(values, dtype=np.float64) * 1e9).astype(dtype)
+
+
+cdef inline object _round_to_raw(values, uint8_t precision, dtype):
+    # Vectorized `Price(value, precision).raw` for every value (rounds half away from zero)
+    scaled = np.asarray(values, dtype=np.float64) * 10.0 ** precision
+    rounded = np.copysign(np.floor(np.abs(scaled) + 0.5), scaled).astype(np.int64)
+    return np.ascontiguousarray(rounded * 10 ** (9 - precision)).astype(dtype)
+
+
 cdef class OrderBookDeltaDataWrangler:
     """
     Provides a means of building lists of Nautilus `OrderBookDelta` objects.
@@ -231,18 +248,20 @@ cdef class QuoteTickDataWrangler:
         if "ask_size" not in data.columns:
             data["ask_size"] = float(default_volume)
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([dt_to_unix_nanos(dt) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events = _index_to_unix_nanos(data.index)
+        ts_inits = ts_events + np.uint64(ts_init_delta)
 
-        return list(map(
-            self._build_tick,
-            data["bid_price"],
-            data["ask_price"],
-            data["bid_size"],
-            data["ask_size"],
+        return QuoteTick.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            _scale_to_raw(data["bid_price"], np.int64),
+            _scale_to_raw(data["ask_price"], np.int64),
+            _scale_to_raw(data["bid_size"], np.uint64),
+            _scale_to_raw(data["ask_size"], np.uint64),
             ts_events,
             ts_inits,
-        ))
+        )
 
     def process_bar_data(
         self,
@@ -365,29 +384,31 @@ cdef class QuoteTickDataWrangler:
                     df_ticks_final.iloc[i + 1] = low
                     df_ticks_final.iloc[i + 2] = high
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in df_ticks_final.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events = _index_to_unix_nanos(df_ticks_final.index)
+        ts_inits = ts_events + np.uint64(ts_init_delta)
 
         if is_raw:
-            return list(map(
-                self._build_tick_from_raw,
-                df_ticks_final["bid_price"],
-                df_ticks_final["ask_price"],
-                df_ticks_final["bid_size"],
-                df_ticks_final["ask_size"],
-                ts_events,
-                ts_inits,
-            ))
+            bid_prices_raw = np.ascontiguousarray(df_ticks_final["bid_price"], dtype=np.int64)
+            ask_prices_raw = np.ascontiguousarray(df_ticks_final["ask_price"], dtype=np.int64)
+            bid_sizes_raw = np.ascontiguousarray(df_ticks_final["bid_size"], dtype=np.uint64)
+            ask_sizes_raw = np.ascontiguousarray(df_ticks_final["ask_size"], dtype=np.uint64)
         else:
-            return list(map(
-                self._build_tick,
-                df_ticks_final["bid_price"],
-                df_ticks_final["ask_price"],
-                df_ticks_final["bid_size"],
-                df_ticks_final["ask_size"],
-                ts_events,
-                ts_inits,
-            ))
+            bid_prices_raw = _scale_to_raw(df_ticks_final["bid_price"], np.int64)
+            ask_prices_raw = _scale_to_raw(df_ticks_final["ask_price"], np.int64)
+            bid_sizes_raw = _scale_to_raw(df_ticks_final["bid_size"], np.uint64)
+            ask_sizes_raw = _scale_to_raw(df_ticks_final["ask_size"], np.uint64)
+
+        return QuoteTick.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            bid_prices_raw,
+            ask_prices_raw,
+            bid_sizes_raw,
+            ask_sizes_raw,
+            ts_events,
+            ts_inits,
+        )
 
     # cpdef method for Python wrap() (called with map)
     cpdef QuoteTick _build_tick_from_raw(
@@ -478,35 +499,38 @@ cdef class TradeTickDataWrangler:
         Condition.false(data.empty, "data.empty")
 
         data = as_utc_index(data)
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([dt_to_unix_nanos(dt) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
+        ts_events = _index_to_unix_nanos(data.index)
+        ts_inits = ts_events + np.uint64(ts_init_delta)
 
         if is_raw:
-            return list(map(
-                self._build_tick_from_raw,
-                data["price"],
-                data["quantity"],
-                self._create_side_if_not_exist(data),
-                data["trade_id"].astype(str),
-                ts_events,
-                ts_inits,
-            ))
+            prices_raw = np.ascontiguousarray(data["price"], dtype=np.int64)
+            sizes_raw = np.ascontiguousarray(data["quantity"], dtype=np.uint64)
         else:
-            return list(map(
-                self._build_tick,
-                data["price"],
-                data["quantity"],
-                self._create_side_if_not_exist(data),
-                data["trade_id"].astype(str),
-                ts_events,
-                ts_inits,
-            ))
+            prices_raw = _scale_to_raw(data["price"], np.int64)
+            sizes_raw = _scale_to_raw(data["quantity"], np.uint64)
+
+        return TradeTick.from_raw_arrays_to_list_c(
+            self.instrument.id,
+            self.instrument.price_precision,
+            self.instrument.size_precision,
+            prices_raw,
+            sizes_raw,
+            self._create_side_if_not_exist(data),
+            data["trade_id"].astype(str).tolist(),
+            ts_events,
+            ts_inits,
+        )
 
     def _create_side_if_not_exist(self, data):
         if "side" in data.columns:
-            return data["side"].apply(lambda x: AggressorSide.BUYER if str(x).upper() == "BUY" else AggressorSide.SELLER)
+            is_buyer = data["side"].astype(str).str.upper().to_numpy() == "BUY"
         else:
-            return data["buyer_maker"].apply(lambda x: AggressorSide.SELLER if x is True else AggressorSide.BUYER)
+            buyer_maker = data["buyer_maker"]
+            if buyer_maker.dtype == bool:
+                is_buyer = ~buyer_maker.to_numpy()
+            else:
+                is_buyer = np.array([x is not True for x in buyer_maker], dtype=bool)
+        return np.where(is_buyer, AggressorSide.BUYER, AggressorSide.SELLER).astype(np.uint8)
 
     # cpdef method for Python wrap() (called with map)
     cpdef TradeTick _build_tick_from_raw(
@@ -620,15 +644,26 @@ cdef class BarDataWrangler:
         if "volume" not in data:
             data["volume"] = float(default_volume)
 
-        cdef uint64_t[:] ts_events = np.ascontiguousarray([secs_to_nanos(dt.timestamp()) for dt in data.index], dtype=np.uint64)  # noqa
-        cdef uint64_t[:] ts_inits = np.ascontiguousarray([ts_event + ts_init_delta for ts_event in ts_events], dtype=np.uint64)  # noqa
-
-        return list(map(
-            self._build_bar,
-            data.values,
+        ts_events = _index_to_unix_nanos(data.index)
+        ts_inits = ts_events + np.uint64(ts_init_delta)
+
+        # Columns are expected in the order [open, high, low, close, volume]
+        values = np.asarray(data.values, dtype=np.float64)
+        cdef uint8_t price_prec = self.instrument.price_precision
+        cdef uint8_t size_prec = self.instrument.size_precision
+
+        return Bar.from_raw_arrays_to_list_c(
+            self.bar_type,
+            price_prec,
+            size_prec,
+            _round_to_raw(values[:, 0], price_prec, np.int64),
+            _round_to_raw(values[:, 1], price_prec, np.int64),
+            _round_to_raw(values[:, 2], price_prec, np.int64),
+            _round_to_raw(values[:, 3], price_prec, np.int64),
+            _round_to_raw(values[:, 4], size_prec, np.uint64),
             ts_events,
-            ts_inits
-        ))
+            ts_inits,
+        )
 
     # cpdef method for Python wrap() (called with map)
     cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init):
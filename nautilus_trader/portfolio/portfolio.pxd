@@ -33,6 +33,15 @@ from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
 
 
+cdef class CurrencyTotals:
+    cdef dict _totals
+    cdef dict _counts
+
+    cdef void add(self, Money value)
+    cdef void sub(self, Money value)
+    cdef dict to_dict(self)
+
+
 cdef class Portfolio(PortfolioFacade):
     cdef LoggerAdapter _log
     cdef Clock _clock
@@ -44,6 +53,12 @@ cdef class Portfolio(PortfolioFacade):
     cdef dict _unrealized_pnls
     cdef dict _net_positions
     cdef set _pending_calcs
+    cdef dict _pnl_contribs
+    cdef dict _pnl_totals
+    cdef dict _pnl_dirty
+    cdef dict _exposure_contribs
+    cdef dict _exposure_totals
+    cdef dict _exposure_dirty
 
 # -- COMMANDS -------------------------------------------------------------------------------------
 
@@ -61,5 +76,9 @@ cdef class Portfolio(PortfolioFacade):
     cdef object _net_position(self, InstrumentId instrument_id)
     cdef void _update_net_position(self, InstrumentId instrument_id, list positions_open)
     cdef Money _calculate_unrealized_pnl(self, InstrumentId instrument_id)
+    cdef Money _calculate_net_exposure(self, Account account, Instrument instrument, list positions_open)
+    cdef bint _is_cacheable(self, Account account, InstrumentId instrument_id)
+    cdef void _invalidate_aggregates(self, InstrumentId instrument_id)
+    cdef void _clear_aggregates(self)
     cdef Price _get_last_price(self, Position position)
     cdef double _calculate_xrate_to_base(self, Account account, Instrument instrument, OrderSide side)
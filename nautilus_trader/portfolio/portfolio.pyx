@@ -73,6 +73,49 @@ cdef tuple _UPDATE_ORDER_EVENTS = (
 )
 
 
+cdef class CurrencyTotals:
+    """
+    Provides running totals of money amounts per currency.
+
+    A currency is included in the totals while at least one amount added for
+    that currency has not been subtracted.
+    """
+
+    def __init__(self):
+        self._totals: dict[Currency, Money] = {}
+        self._counts: dict[Currency, int] = {}
+
+    cdef void add(self, Money value):
+        cdef Currency currency = value.currency
+        cdef Money total = self._totals.get(currency)
+        if total is None:
+            self._totals[currency] = Money.from_raw_c(value._mem.raw, currency)
+            self._counts[currency] = 1
+        else:
+            total.add_assign(value)
+            self._counts[currency] += 1
+
+    cdef void sub(self, Money value):
+        cdef Currency currency = value.currency
+        cdef int count = self._counts[currency] - 1
+        if count == 0:
+            del self._totals[currency]
+            del self._counts[currency]
+        else:
+            (<Money>self._totals[currency]).sub_assign(value)
+            self._counts[currency] = count
+
+    cdef dict to_dict(self):
+        cdef dict totals = {}
+        cdef:
+            Currency currency
+            Money total
+        for currency, total in self._totals.items():
+            totals[currency] = Money.from_raw_c(total._mem.raw, currency)
+
+        return totals
+
+
 cdef class Portfolio(PortfolioFacade):
     """
     Provides a trading portfolio.
@@ -114,6 +157,14 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions: dict[InstrumentId, Decimal] = {}
         self._pending_calcs: set[InstrumentId] = set()
 
+        # Running aggregates per venue, updated for dirty instruments on query
+        self._pnl_contribs: dict[InstrumentId, Money] = {}
+        self._pnl_totals: dict[Venue, CurrencyTotals] = {}
+        self._pnl_dirty: dict[Venue, set[InstrumentId]] = {}
+        self._exposure_contribs: dict[InstrumentId, Money] = {}
+        self._exposure_totals: dict[Venue, CurrencyTotals] = {}
+        self._exposure_dirty: dict[Venue, set[InstrumentId]] = {}
+
         self.analyzer = PortfolioAnalyzer()
 
         # Register default statistics
@@ -230,6 +281,7 @@ cdef class Portfolio(PortfolioFacade):
         """
         # Clean slate
         self._unrealized_pnls.clear()
+        self._clear_aggregates()
 
         cdef list all_positions_open = self._cache.positions_open()
 
@@ -257,6 +309,7 @@ cdef class Portfolio(PortfolioFacade):
                 positions_open=positions_open,
             )
 
+            self._invalidate_aggregates(instrument_id)
             self._unrealized_pnls[instrument_id] = self._calculate_unrealized_pnl(instrument_id)
 
             account = self._cache.account_for_venue(self._venue or instrument_id.venue)
@@ -304,9 +357,10 @@ cdef class Portfolio(PortfolioFacade):
         """
         Update the portfolio with the given tick.
 
-        Clears the unrealized PnL for the quote ticks instrument, and
-        performs any initialization calculations which may have been pending
-        a market quote update.
+        Clears the unrealized PnL for the quote ticks instrument, marks the
+        instrument as dirty for the venue aggregates, and performs any
+        initialization calculations which may have been pending a market
+        quote update.
 
         Parameters
         ----------
@@ -317,6 +371,7 @@ cdef class Portfolio(PortfolioFacade):
         Condition.not_none(tick, "tick")
 
         self._unrealized_pnls.pop(tick.instrument_id, None)
+        self._invalidate_aggregates(tick.instrument_id)
 
         if self.initialized:
             return
@@ -505,6 +560,7 @@ cdef class Portfolio(PortfolioFacade):
             positions_open=positions_open
         )
 
+        self._invalidate_aggregates(event.instrument_id)
         self._unrealized_pnls[event.instrument_id] = self._calculate_unrealized_pnl(
             instrument_id=event.instrument_id,
         )
@@ -557,6 +613,7 @@ cdef class Portfolio(PortfolioFacade):
         self._net_positions.clear()
         self._unrealized_pnls.clear()
         self._pending_calcs.clear()
+        self._clear_aggregates()
         self.analyzer.reset()
 
         self.initialized = False
@@ -679,6 +736,9 @@ cdef class Portfolio(PortfolioFacade):
         """
         Return the unrealized pnls for the given venue (if found).
 
+        The totals are maintained incrementally, only instruments which have
+        been updated since the last query are recalculated.
+
         Parameters
         ----------
         venue : Venue
@@ -691,35 +751,48 @@ cdef class Portfolio(PortfolioFacade):
         """
         Condition.not_none(venue, "venue")
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
-
-        cdef set instrument_ids = {p.instrument_id for p in positions_open}
+        cdef CurrencyTotals totals = self._pnl_totals.get(venue)
+        if totals is None:
+            totals = CurrencyTotals()
+            self._pnl_totals[venue] = totals
 
-        cdef dict unrealized_pnls = {}  # type: dict[Currency, 0.0]
+        cdef CurrencyTotals volatile = CurrencyTotals()
+        cdef set dirty = self._pnl_dirty.get(venue)
+        cdef Account account = self._cache.account_for_venue(self._venue or venue)
 
         cdef:
             InstrumentId instrument_id
             Money pnl
-        for instrument_id in instrument_ids:
-            pnl = self._unrealized_pnls.get(instrument_id)
-            if pnl is not None:
-                # PnL already calculated
-                unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
+        for instrument_id in list(dirty or ()):
+            if self._cache.positions_open_count(None, instrument_id) == 0:
+                dirty.discard(instrument_id)
+                continue  # Nothing to calculate
+
+            if not self._is_cacheable(account, instrument_id):
+                # Recalculate on every query
+                pnl = self._calculate_unrealized_pnl(instrument_id)
+                if pnl is not None:
+                    volatile.add(pnl)
                 continue  # To next instrument_id
-            # Calculate PnL
+
             pnl = self._calculate_unrealized_pnl(instrument_id)
             if pnl is None:
                 continue  # Error logged in `_calculate_unrealized_pnl`
-            unrealized_pnls[pnl.currency] = unrealized_pnls.get(pnl.currency, 0.0) + pnl.as_f64_c()
 
-        return {k: Money(v, k) for k, v in unrealized_pnls.items()}
+            self._unrealized_pnls[instrument_id] = pnl
+            self._pnl_contribs[instrument_id] = pnl
+            totals.add(pnl)
+            dirty.discard(instrument_id)
+
+        return _merge_totals(totals, volatile)
 
     cpdef dict net_exposures(self, Venue venue):
         """
         Return the net exposures for the given venue (if found).
 
+        The totals are maintained incrementally, only instruments which have
+        been updated since the last query are recalculated.
+
         Parameters
         ----------
         venue : Venue
@@ -740,65 +813,57 @@ cdef class Portfolio(PortfolioFacade):
             )
             return None  # Cannot calculate
 
-        cdef list positions_open = self._cache.positions_open(venue)
-        if not positions_open:
-            return {}  # Nothing to calculate
+        cdef CurrencyTotals totals = self._exposure_totals.get(venue)
+        if totals is None:
+            totals = CurrencyTotals()
+            self._exposure_totals[venue] = totals
 
-        cdef dict net_exposures = {}  # type: dict[Currency, float]
+        cdef CurrencyTotals volatile = CurrencyTotals()
+        cdef set dirty = self._exposure_dirty.get(venue)
 
         cdef:
-            Position position
+            InstrumentId instrument_id
             Instrument instrument
-            Price last
-            Currency settlement_currency
-            double xrate
-        for position in positions_open:
-            instrument = self._cache.instrument(position.instrument_id)
+            list positions_open
+            Money net_exposure
+        for instrument_id in list(dirty or ()):
+            positions_open = self._cache.positions_open(
+                venue=None,  # Faster query filtering
+                instrument_id=instrument_id,
+            )
+            if not positions_open:
+                dirty.discard(instrument_id)
+                continue  # Nothing to calculate
+
+            instrument = self._cache.instrument(instrument_id)
             if instrument is None:
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"no instrument for {position.instrument_id}."
+                    f"no instrument for {instrument_id}."
                 )
                 return None  # Cannot calculate
 
-            last = self._get_last_price(position)
-            if last is None:
+            if not self._cache.has_quote_ticks(instrument_id) and not self._cache.has_trade_ticks(instrument_id):
                 self._log.error(
                     f"Cannot calculate net exposures: "
-                    f"no prices for {position.instrument_id}."
+                    f"no prices for {instrument_id}."
                 )
                 continue  # Cannot calculate
 
-            xrate = self._calculate_xrate_to_base(
-                instrument=instrument,
-                account=account,
-                side=position.entry,
-            )
-
-            if xrate == 0.0:
-                self._log.error(
-                    f"Cannot calculate net exposures: "
-                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}."
-                )
-                return None  # Cannot calculate
-
-            if account.base_currency is not None:
-                settlement_currency = account.base_currency
-            else:
-                settlement_currency = instrument.get_settlement_currency()
+            net_exposure = self._calculate_net_exposure(account, instrument, positions_open)
+            if net_exposure is None:
+                return None  # Cannot calculate (error logged)
 
-            net_exposure = instrument.notional_value(
-                position.quantity,
-                last,
-            ).as_f64_c()
-            net_exposure = round(net_exposure * xrate, settlement_currency._mem.precision)
-
-            total_net_exposure = net_exposures.get(settlement_currency, 0.0)
-            total_net_exposure += net_exposure
+            if not self._is_cacheable(account, instrument_id):
+                # Recalculate on every query
+                volatile.add(net_exposure)
+                continue  # To next instrument_id
 
-            net_exposures[settlement_currency] = total_net_exposure
+            self._exposure_contribs[instrument_id] = net_exposure
+            totals.add(net_exposure)
+            dirty.discard(instrument_id)
 
-        return {k: Money(v, k) for k, v in net_exposures.items()}
+        return _merge_totals(totals, volatile)
 
     cpdef Money unrealized_pnl(self, InstrumentId instrument_id):
         """
@@ -1088,6 +1153,95 @@ cdef class Portfolio(PortfolioFacade):
 
         return Money(total_pnl, currency)
 
+    cdef Money _calculate_net_exposure(
+        self,
+        Account account,
+        Instrument instrument,
+        list positions_open,
+    ):
+        cdef Currency settlement_currency
+        if account.base_currency is not None:
+            settlement_currency = account.base_currency
+        else:
+            settlement_currency = instrument.get_settlement_currency()
+
+        cdef double total_net_exposure = 0.0
+
+        cdef:
+            Position position
+            Price last
+            double xrate
+            double net_exposure
+        for position in positions_open:
+            last = self._get_last_price(position)
+            if last is None:
+                continue  # Cannot calculate (checked by caller)
+
+            xrate = self._calculate_xrate_to_base(
+                instrument=instrument,
+                account=account,
+                side=position.entry,
+            )
+
+            if xrate == 0.0:
+                self._log.error(
+                    f"Cannot calculate net exposures: "
+                    f"insufficient data for {instrument.get_settlement_currency()}/{account.base_currency}."
+                )
+                return None  # Cannot calculate
+
+            net_exposure = instrument.notional_value(
+                position.quantity,
+                last,
+            ).as_f64_c()
+            total_net_exposure += round(net_exposure * xrate, settlement_currency._mem.precision)
+
+        return Money(total_net_exposure, settlement_currency)
+
+    cdef bint _is_cacheable(self, Account account, InstrumentId instrument_id):
+        # An instrument contribution can only be cached when it is fully
+        # determined by the instruments own quotes (which mark it dirty),
+        # otherwise it depends on trades or exchange rates from other instruments.
+        if not self._cache.has_quote_ticks(instrument_id):
+            return False
+
+        if account is None or account.base_currency is None:
+            return True
+
+        cdef Instrument instrument = self._cache.instrument(instrument_id)
+        return instrument is not None and instrument.get_settlement_currency() == account.base_currency
+
+    cdef void _invalidate_aggregates(self, InstrumentId instrument_id):
+        cdef Venue venue = instrument_id.venue
+
+        cdef Money pnl = self._pnl_contribs.pop(instrument_id, None)
+        if pnl is not None:
+            (<CurrencyTotals>self._pnl_totals[venue]).sub(pnl)
+
+        cdef Money net_exposure = self._exposure_contribs.pop(instrument_id, None)
+        if net_exposure is not None:
+            (<CurrencyTotals>self._exposure_totals[venue]).sub(net_exposure)
+
+        cdef set dirty = self._pnl_dirty.get(venue)
+        if dirty is None:
+            dirty = set()
+            self._pnl_dirty[venue] = dirty
+        dirty.add(instrument_id)
+
+        dirty = self._exposure_dirty.get(venue)
+        if dirty is None:
+            dirty = set()
+            self._exposure_dirty[venue] = dirty
+        dirty.add(instrument_id)
+
+    cdef void _clear_aggregates(self):
+        self._pnl_contribs.clear()
+        self._pnl_totals.clear()
+        self._pnl_dirty.clear()
+        self._exposure_contribs.clear()
+        self._exposure_totals.clear()
+        self._exposure_dirty.clear()
+
     cdef Price _get_last_price(self, Position position):
         cdef QuoteTick quote_tick = self._cache.quote_tick(position.instrument_id)
         if quote_tick is not None:
@@ -1113,3 +1267,20 @@ cdef class Portfolio(PortfolioFacade):
             )
 
         return Decimal(1)  # No conversion needed
+
+
+cdef dict _merge_totals(CurrencyTotals totals, CurrencyTotals volatile):
+    cdef dict merged = totals.to_dict()
+
+    cdef:
+        Currency currency
+        Money value
+        Money total
+    for currency, value in volatile.to_dict().items():
+        total = merged.get(currency)
+        if total is None:
+            merged[currency] = value
+        else:
+            total.add_assign(value)
+
+    return merged
@@ -27,24 +27,31 @@ from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
 from nautilus_trader.execution.messages cimport TradingCommand
+from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.identifiers cimport InstrumentId
 from nautilus_trader.model.instruments.base cimport Instrument
-from nautilus_trader.model.objects cimport Price
-from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.portfolio.base cimport PortfolioFacade
+from nautilus_trader.risk.profile cimport InstrumentRiskProfile
 
 
 cdef class RiskEngine(Component):
     cdef readonly PortfolioFacade _portfolio
     cdef readonly Cache _cache
     cdef readonly dict _max_notional_per_order
+    cdef readonly dict _max_net_exposure_per_instrument
+    cdef dict _risk_profiles
+    cdef dict _position_qtys
+    cdef dict _net_qtys
+    cdef double _max_leverage_f64
     cdef readonly Throttler _order_submit_throttler
     cdef readonly Throttler _order_modify_throttler
 
     cdef readonly TradingState trading_state
     """The current trading state for the engine.\n\n:returns: `TradingState`"""
+    cdef readonly object max_leverage
+    """The maximum effective leverage for margin accounts.\n\n:returns: `float` or ``None``"""
     cdef readonly bint is_bypassed
     """If the risk engine is completely bypassed.\n\n:returns: `bool`"""
     cdef readonly bint debug
@@ -60,6 +67,7 @@ cdef class RiskEngine(Component):
     cpdef void process(self, Event event)
     cpdef void set_trading_state(self, TradingState state)
     cpdef void set_max_notional_per_order(self, InstrumentId instrument_id, new_value: Decimal)
+    cpdef void set_max_net_exposure_per_instrument(self, InstrumentId instrument_id, new_value: Decimal)
     cpdef void _log_state(self)
 
 # -- RISK SETTINGS --------------------------------------------------------------------------------
@@ -68,6 +76,8 @@ cdef class RiskEngine(Component):
     cpdef tuple max_order_modify_rate(self)
     cpdef dict max_notionals_per_order(self)
     cpdef object max_notional_per_order(self, InstrumentId instrument_id)
+    cpdef dict max_net_exposures_per_instrument(self)
+    cpdef object max_net_exposure_per_instrument(self, InstrumentId instrument_id)
 
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
@@ -83,12 +93,12 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS -----------------------------------------------------------------------------
 
-    cpdef bint _check_order(self, Instrument instrument, Order order)
-    cpdef bint _check_order_price(self, Instrument instrument, Order order)
-    cpdef bint _check_order_quantity(self, Instrument instrument, Order order)
-    cpdef bint _check_orders_risk(self, Instrument instrument, list orders)
-    cpdef str _check_price(self, Instrument instrument, Price price)
-    cpdef str _check_quantity(self, Instrument instrument, Quantity quantity)
+    cdef InstrumentRiskProfile _risk_profile(self, Instrument instrument)
+    cpdef bint _check_order(self, InstrumentRiskProfile profile, Order order)
+    cpdef bint _check_order_price(self, InstrumentRiskProfile profile, Order order)
+    cpdef bint _check_order_quantity(self, InstrumentRiskProfile profile, Order order)
+    cpdef bint _check_orders_risk(self, InstrumentRiskProfile profile, list orders)
+    cdef double _net_qty(self, InstrumentId instrument_id)
 
 # -- DENIALS --------------------------------------------------------------------------------------
 
@@ -107,3 +117,4 @@ cdef class RiskEngine(Component):
 # -- EVENT HANDLERS -------------------------------------------------------------------------------
 
     cpdef void _handle_event(self, Event event)
+    cdef void _update_net_qty(self, PositionEvent event)
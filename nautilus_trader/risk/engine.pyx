@@ -20,9 +20,12 @@ import pandas as pd
 
 from nautilus_trader.config import RiskEngineConfig
 
+from libc.math cimport fabs
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.accounting.accounts.base cimport Account
+from nautilus_trader.accounting.accounts.margin cimport MarginAccount
 from nautilus_trader.cache.cache cimport Cache
 from nautilus_trader.common.clock cimport Clock
 from nautilus_trader.common.component cimport Component
@@ -37,7 +40,6 @@ from nautilus_trader.common.messages cimport TradingStateChanged
 from nautilus_trader.core.correctness cimport Condition
 from nautilus_trader.core.message cimport Command
 from nautilus_trader.core.message cimport Event
-from nautilus_trader.core.rust.model cimport AssetType
 from nautilus_trader.core.rust.model cimport OrderSide
 from nautilus_trader.core.rust.model cimport OrderStatus
 from nautilus_trader.core.rust.model cimport OrderType
@@ -55,20 +57,21 @@ from nautilus_trader.model.data cimport TradeTick
 from nautilus_trader.model.events.order cimport OrderCancelRejected
 from nautilus_trader.model.events.order cimport OrderDenied
 from nautilus_trader.model.events.order cimport OrderModifyRejected
+from nautilus_trader.model.events.position cimport PositionEvent
 from nautilus_trader.model.functions cimport order_type_to_str
 from nautilus_trader.model.functions cimport trading_state_to_str
 from nautilus_trader.model.identifiers cimport ComponentId
 from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.identifiers cimport PositionId
 from nautilus_trader.model.instruments.base cimport Instrument
-from nautilus_trader.model.instruments.currency_pair cimport CurrencyPair
 from nautilus_trader.model.objects cimport Currency
 from nautilus_trader.model.objects cimport Money
 from nautilus_trader.model.objects cimport Price
-from nautilus_trader.model.objects cimport Quantity
 from nautilus_trader.model.orders.base cimport Order
 from nautilus_trader.model.orders.list cimport OrderList
 from nautilus_trader.model.position cimport Position
 from nautilus_trader.portfolio.base cimport PortfolioFacade
+from nautilus_trader.risk.profile cimport InstrumentRiskProfile
 
 
 cdef class RiskEngine(Component):
@@ -179,6 +182,14 @@ cdef class RiskEngine(Component):
 
         # Risk settings
         self._max_notional_per_order: dict[InstrumentId, Decimal] = {}
+        self._max_net_exposure_per_instrument: dict[InstrumentId, Decimal] = {}
+        self._risk_profiles: dict[InstrumentId, InstrumentRiskProfile] = {}
+        self.max_leverage = config.max_leverage
+        self._max_leverage_f64 = config.max_leverage or 0.0
+
+        # Net position quantities (tracked incrementally from position events)
+        self._position_qtys: dict[PositionId, float] = {}
+        self._net_qtys: dict[InstrumentId, float] = {}
 
         # Configure
         self._initialize_risk_checks(config)
@@ -196,6 +207,14 @@ cdef class RiskEngine(Component):
         for instrument_id, value in max_notional_config.items():
             self.set_max_notional_per_order(InstrumentId.from_str_c(instrument_id), Decimal(value))
 
+        cdef dict max_net_exposure_config = config.max_net_exposure_per_instrument
+        for instrument_id, value in max_net_exposure_config.items():
+            self.set_max_net_exposure_per_instrument(InstrumentId.from_str_c(instrument_id), Decimal(value))
+
+        if self.max_leverage is not None:
+            Condition.positive(self.max_leverage, "max_leverage")
+            self._log.info(f"Set MAX_LEVERAGE: {self.max_leverage}.", color=LogColor.BLUE)
+
 # -- COMMANDS -------------------------------------------------------------------------------------
 
     cpdef void execute(self, Command command):
@@ -304,6 +323,7 @@ cdef class RiskEngine(Component):
 
         old_value: Decimal = self._max_notional_per_order.get(instrument_id)
         self._max_notional_per_order[instrument_id] = new_value
+        self._risk_profiles.pop(instrument_id, None)  # Rebuilt on next check
 
         cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
         self._log.info(
@@ -311,6 +331,43 @@ cdef class RiskEngine(Component):
             color=LogColor.BLUE,
         )
 
+    cpdef void set_max_net_exposure_per_instrument(self, InstrumentId instrument_id, new_value):
+        """
+        Set the maximum net exposure for the given instrument ID.
+
+        The check applies to orders for margin accounts which would increase
+        the net position for the instrument. Passing a new_value of ``None``
+        will disable the pre-trade risk max net exposure check.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument ID for the max net exposure.
+        new_value : integer, float, string or Decimal
+            The max net exposure value to set (in the instruments quote currency).
+
+        Raises
+        ------
+        decimal.InvalidOperation
+            If `new_value` not a valid input for `decimal.Decimal`.
+        ValueError
+            If `new_value` is not ``None`` and not positive.
+
+        """
+        if new_value is not None:
+            new_value = Decimal(new_value)
+            Condition.type(new_value, Decimal, "new_value")
+            Condition.positive(new_value, "new_value")
+
+        self._max_net_exposure_per_instrument[instrument_id] = new_value
+        self._risk_profiles.pop(instrument_id, None)  # Rebuilt on next check
+
+        cdef str new_value_str = f"{new_value:,}" if new_value is not None else str(None)
+        self._log.info(
+            f"Set MAX_NET_EXPOSURE_PER_INSTRUMENT: {instrument_id} {new_value_str}.",
+            color=LogColor.BLUE,
+        )
+
 # -- RISK SETTINGS --------------------------------------------------------------------------------
 
     cpdef tuple max_order_submit_rate(self):
@@ -365,6 +422,28 @@ cdef class RiskEngine(Component):
         """
         return self._max_notional_per_order.get(instrument_id)
 
+    cpdef dict max_net_exposures_per_instrument(self):
+        """
+        Return the current maximum net exposures per instrument settings.
+
+        Returns
+        -------
+        dict[InstrumentId, Decimal]
+
+        """
+        return self._max_net_exposure_per_instrument.copy()
+
+    cpdef object max_net_exposure_per_instrument(self, InstrumentId instrument_id):
+        """
+        Return the current maximum net exposure for the given instrument ID.
+
+        Returns
+        -------
+        Decimal or ``None``
+
+        """
+        return self._max_net_exposure_per_instrument.get(instrument_id)
+
 # -- ABSTRACT METHODS -----------------------------------------------------------------------------
 
     cpdef void _on_start(self):
@@ -388,6 +467,9 @@ cdef class RiskEngine(Component):
         self.event_count = 0
         self._order_submit_throttler.reset()
         self._order_modify_throttler.reset()
+        self._risk_profiles.clear()
+        self._position_qtys.clear()
+        self._net_qtys.clear()
 
     cpdef void _dispose(self):
         pass
@@ -438,13 +520,15 @@ cdef class RiskEngine(Component):
             )
             return  # Denied
 
+        cdef InstrumentRiskProfile profile = self._risk_profile(instrument)
+
         ########################################################################
         # PRE-TRADE ORDER(S) CHECKS
         ########################################################################
-        if not self._check_order(instrument, order):
+        if not self._check_order(profile, order):
             return  # Denied
 
-        if not self._check_orders_risk(instrument, [order]):
+        if not self._check_orders_risk(profile, [order]):
             return # Denied
 
         self._execution_gateway(instrument, command)
@@ -464,14 +548,16 @@ cdef class RiskEngine(Component):
             )
             return  # Denied
 
+        cdef InstrumentRiskProfile profile = self._risk_profile(instrument)
+
         ########################################################################
         # PRE-TRADE ORDER(S) CHECKS
         ########################################################################
         for order in command.order_list.orders:
-            if not self._check_order(instrument, order):
+            if not self._check_order(profile, order):
                 return  # Denied
 
-        if not self._check_orders_risk(instrument, command.order_list.orders):
+        if not self._check_orders_risk(profile, command.order_list.orders):
             # Deny all orders in list
             self._deny_order_list(command.order_list, "OrderList DENIED")
             return # Denied
@@ -510,22 +596,23 @@ cdef class RiskEngine(Component):
             )
             return  # Denied
 
+        cdef InstrumentRiskProfile profile = self._risk_profile(instrument)
         cdef str risk_msg = None
 
         # Check price
-        risk_msg = self._check_price(instrument, command.price)
+        risk_msg = profile.check_price(command.price)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
 
         # Check trigger
-        risk_msg = self._check_price(instrument, command.trigger_price)
+        risk_msg = profile.check_price(command.trigger_price)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
 
         # Check quantity
-        risk_msg = self._check_quantity(instrument, command.quantity)
+        risk_msg = profile.check_quantity(command.quantity)
         if risk_msg:
             self._reject_modify_order(order=order, reason=risk_msg)
             return  # Denied
@@ -556,24 +643,37 @@ cdef class RiskEngine(Component):
 
 # -- PRE-TRADE CHECKS -----------------------------------------------------------------------------
 
-    cpdef bint _check_order(self, Instrument instrument, Order order):
+    cdef InstrumentRiskProfile _risk_profile(self, Instrument instrument):
+        cdef InstrumentRiskProfile profile = self._risk_profiles.get(instrument.id)
+        if profile is None or profile.instrument is not instrument:
+            # Build profile for a new or updated instrument
+            profile = InstrumentRiskProfile(
+                instrument=instrument,
+                max_notional_per_order=self._max_notional_per_order.get(instrument.id),
+                max_net_exposure=self._max_net_exposure_per_instrument.get(instrument.id),
+            )
+            self._risk_profiles[instrument.id] = profile
+
+        return profile
+
+    cpdef bint _check_order(self, InstrumentRiskProfile profile, Order order):
         ########################################################################
         # VALIDATION CHECKS
         ########################################################################
-        if not self._check_order_price(instrument, order):
+        if not self._check_order_price(profile, order):
             return False  # Denied
-        if not self._check_order_quantity(instrument, order):
+        if not self._check_order_quantity(profile, order):
             return False  # Denied
 
         return True  # Check passed
 
-    cpdef bint _check_order_price(self, Instrument instrument, Order order):
+    cpdef bint _check_order_price(self, InstrumentRiskProfile profile, Order order):
         ########################################################################
         # CHECK PRICE
         ########################################################################
         cdef str risk_msg = None
         if order.has_price_c():
-            risk_msg = self._check_price(instrument, order.price)
+            risk_msg = profile.check_price(order.price)
             if risk_msg:
                 self._deny_order(order=order, reason=risk_msg)
                 return False  # Denied
@@ -582,46 +682,37 @@ cdef class RiskEngine(Component):
         # CHECK TRIGGER
         ########################################################################
         if order.has_trigger_price_c():
-            risk_msg = self._check_price(instrument, order.trigger_price)
+            risk_msg = profile.check_price(order.trigger_price)
             if risk_msg:
                 self._deny_order(order=order, reason=f"trigger {risk_msg}")
                 return False  # Denied
 
         return True  # Passed
 
-    cpdef bint _check_order_quantity(self, Instrument instrument, Order order):
-        cdef str risk_msg = self._check_quantity(instrument, order.quantity)
+    cpdef bint _check_order_quantity(self, InstrumentRiskProfile profile, Order order):
+        cdef str risk_msg = profile.check_quantity(order.quantity)
         if risk_msg:
             self._deny_order(order=order, reason=risk_msg)
             return False  # Denied
 
         return True  # Passed
 
-    cpdef bint _check_orders_risk(self, Instrument instrument, list orders):
+    cpdef bint _check_orders_risk(self, InstrumentRiskProfile profile, list orders):
         ########################################################################
         # RISK CHECKS
         ########################################################################
+        cdef Instrument instrument = profile.instrument
         cdef QuoteTick last_quote = None
         cdef TradeTick last_trade = None
         cdef Price last_px = None
         cdef Money free
 
-        # Determine max notional
-        cdef Money max_notional = None
-        max_notional_setting: Optional[Decimal] = self._max_notional_per_order.get(instrument.id)
-        if max_notional_setting:
-            # TODO(cs): Improve efficiency of this
-            max_notional = Money(float(max_notional_setting), instrument.quote_currency)
-
         # Get account for risk checks
         cdef Account account = self._cache.account_for_venue(instrument.id.venue)
         if account is None:
             self._log.debug(f"Cannot find account for venue {instrument.id.venue}.")
             return True  # TODO: Temporary early return until handling routing/multiple venues
 
-        if account.is_margin_account:
-            return True  # TODO: Determine risk controls for margin
-
         free = account.balance_free(instrument.quote_currency)
 
         cdef:
@@ -631,7 +722,22 @@ cdef class RiskEngine(Component):
             Money cum_notional_sell = None
             Money order_balance_impact = None
             Currency base_currency = None
+            Currency max_notional_currency
+            int64_t max_notional_raw
             double xrate
+            Money margin_init
+            Money margin_free = None
+            Money balance_total
+            int64_t cum_margin_buy = 0
+            int64_t cum_margin_sell = 0
+            int64_t cum_margin
+            double net_qty = 0.0
+            double projected_qty
+            double exposure
+        if account.is_margin_account:
+            # Projected net quantity, accumulated across the orders in the list
+            net_qty = self._net_qty(instrument.id)
+
         for order in orders:
             if order.order_type == OrderType.MARKET or order.order_type == OrderType.MARKET_TO_LIMIT:
                 if last_px is None:
@@ -668,20 +774,22 @@ cdef class RiskEngine(Component):
                 last_px = order.price
 
             ####################################################################
-            # CASH account balance risk check
+            # Notional risk checks
             ####################################################################
-            if isinstance(instrument, CurrencyPair) and order.side == OrderSide.SELL:
+            max_notional_raw = profile._max_notional_per_order_raw
+            max_notional_currency = profile.quote_currency
+            if profile.is_currency_pair and order.side == OrderSide.SELL:
                 xrate = 1.0 / last_px.as_f64_c()
                 notional = Money(order.quantity.as_f64_c() * xrate, instrument.base_currency)
-                if max_notional:
-                    max_notional = Money(max_notional * Decimal(xrate), instrument.base_currency)
+                max_notional_raw = <int64_t>(max_notional_raw * xrate)
+                max_notional_currency = instrument.base_currency
             else:
                 notional = instrument.notional_value(order.quantity, last_px, use_quote_for_inverse=True)
 
-            if max_notional and notional._mem.raw > max_notional._mem.raw:
+            if max_notional_raw > 0 and notional._mem.raw > max_notional_raw:
                 self._deny_order(
                     order=order,
-                    reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={max_notional.to_str()}, notional={notional.to_str()}",
+                    reason=f"NOTIONAL_EXCEEDS_MAX_PER_ORDER: max_notional={Money.from_raw_c(max_notional_raw, max_notional_currency).to_str()}, notional={notional.to_str()}",
                 )
                 return False  # Denied
 
@@ -709,6 +817,74 @@ cdef class RiskEngine(Component):
                 )
                 return False  # Denied
 
+            ####################################################################
+            # MARGIN account risk checks
+            ####################################################################
+            if account.is_margin_account:
+                if order.is_reduce_only:
+                    continue  # Order can only reduce the net position (releases margin)
+
+                if order.side == OrderSide.BUY:
+                    projected_qty = net_qty + order.quantity.as_f64_c()
+                else:
+                    projected_qty = net_qty - order.quantity.as_f64_c()
+
+                if fabs(projected_qty) <= fabs(net_qty):
+                    net_qty = projected_qty
+                    continue  # Order reduces the net position (releases margin)
+
+                net_qty = projected_qty
+
+                exposure = profile.exposure_f64(fabs(projected_qty), last_px.as_f64_c())
+
+                # Check MAX net exposure for instrument
+                if profile.max_net_exposure is not None and exposure > profile._max_net_exposure_f64:
+                    self._deny_order(
+                        order=order,
+                        reason=f"NET_EXPOSURE_EXCEEDS_MAX_PER_INSTRUMENT: max_net_exposure={profile.max_net_exposure.to_str()}, net_exposure={Money(exposure, profile.quote_currency).to_str()}",
+                    )
+                    return False  # Denied
+
+                # Check MAX leverage
+                if self._max_leverage_f64 > 0.0:
+                    balance_total = account.balance_total(profile.quote_currency)
+                    if (
+                        balance_total is not None
+                        and balance_total._mem.raw > 0
+                        and exposure / balance_total.as_f64_c() > self._max_leverage_f64
+                    ):
+                        self._deny_order(
+                            order=order,
+                            reason=f"LEVERAGE_EXCEEDS_MAX: max_leverage={self.max_leverage}, leverage={exposure / balance_total.as_f64_c():.2f}",
+                        )
+                        return False  # Denied
+
+                # Check initial margin against free balance
+                margin_init = (<MarginAccount>account).calculate_margin_init(
+                    instrument,
+                    order.quantity,
+                    last_px,
+                )
+                if margin_free is None:
+                    margin_free = account.balance_free(margin_init.currency)
+                if order.is_buy_c():
+                    cum_margin_buy += margin_init._mem.raw
+                    cum_margin = cum_margin_buy
+                else:
+                    cum_margin_sell += margin_init._mem.raw
+                    cum_margin = cum_margin_sell
+                if margin_free is not None and cum_margin > margin_free._mem.raw:
+                    self._deny_order(
+                        order=order,
+                        reason=f"MARGIN_INIT_EXCEEDS_FREE_BALANCE: free={margin_free.to_str()}, margin_init={Money.from_raw_c(cum_margin, margin_init.currency).to_str()}",
+                    )
+                    return False  # Denied
+
+                continue  # Margin checks passed
+
+            ####################################################################
+            # CASH account balance risk checks
+            ####################################################################
             order_balance_impact = account.balance_impact(instrument, order.quantity, last_px, order.side)
 
             if free is not None and (free._mem.raw + order_balance_impact._mem.raw) < 0:
@@ -760,31 +936,21 @@ cdef class RiskEngine(Component):
         # Finally
         return True  # Passed
 
-    cpdef str _check_price(self, Instrument instrument, Price price):
-        if price is None:
-            # Nothing to check
-            return None
-        if price.precision > instrument.price_precision:
-            # Check failed
-            return f"price {price} invalid (precision {price.precision} > {instrument.price_precision})"
-        if instrument.asset_type != AssetType.OPTION:
-            if price.raw_int64_c() <= 0:
-                # Check failed
-                return f"price {price} invalid (not positive)"
-
-    cpdef str _check_quantity(self, Instrument instrument, Quantity quantity):
-        if quantity is None:
-            # Nothing to check
-            return None
-        if quantity._mem.precision > instrument.size_precision:
-            # Check failed
-            return f"quantity {quantity.to_str()} invalid (precision {quantity._mem.precision} > {instrument.size_precision})"
-        if instrument.max_quantity and quantity > instrument.max_quantity:
-            # Check failed
-            return f"quantity {quantity.to_str()} invalid (> maximum trade size of {instrument.max_quantity})"
-        if instrument.min_quantity and quantity < instrument.min_quantity:
-            # Check failed
-            return f"quantity {quantity.to_str()} invalid (< minimum trade size of {instrument.min_quantity})"
+    cdef double _net_qty(self, InstrumentId instrument_id):
+        cdef object net_qty = self._net_qtys.get(instrument_id)
+        if net_qty is not None:
+            return net_qty
+
+        # Initialize from the open positions in the cache, then maintained
+        # incrementally from position events.
+        cdef double total = 0.0
+        cdef Position position
+        for position in self._cache.positions_open(None, instrument_id):
+            self._position_qtys[position.id] = position.signed_qty
+            total += position.signed_qty
+
+        self._net_qtys[instrument_id] = total
+        return total
 
 # -- DENIALS --------------------------------------------------------------------------------------
 
@@ -933,3 +1099,17 @@ cdef class RiskEngine(Component):
         if self.debug:
             self._log.debug(f"{RECV}{EVT} {event}.", LogColor.MAGENTA)
         self.event_count += 1
+
+        if isinstance(event, PositionEvent):
+            self._update_net_qty(event)
+
+    cdef void _update_net_qty(self, PositionEvent event):
+        cdef object net_qty = self._net_qtys.get(event.instrument_id)
+        if net_qty is None:
+            return  # Not yet initialized (will be from the cache on next check)
+
+        cdef double prev_qty = self._position_qtys.pop(event.position_id, 0.0)
+        if event.signed_qty != 0.0:
+            self._position_qtys[event.position_id] = event.signed_qty
+
+        self._net_qtys[event.instrument_id] = net_qty + (event.signed_qty - prev_qty)
@@ -0,0 +1,56 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from libc.stdint cimport int64_t
+from libc.stdint cimport uint8_t
+from libc.stdint cimport uint64_t
+
+from nautilus_trader.model.identifiers cimport InstrumentId
+from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.objects cimport Currency
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef class InstrumentRiskProfile:
+    cdef readonly Instrument instrument
+    """The instrument for the profile.\n\n:returns: `Instrument`"""
+    cdef readonly InstrumentId instrument_id
+    """The instrument ID for the profile.\n\n:returns: `InstrumentId`"""
+    cdef readonly Currency quote_currency
+    """The quote currency for the instrument.\n\n:returns: `Currency`"""
+    cdef readonly Money max_notional_per_order
+    """The maximum notional per order (in quote currency).\n\n:returns: `Money` or ``None``"""
+    cdef readonly Money max_net_exposure
+    """The maximum net exposure for the instrument (in quote currency).\n\n:returns: `Money` or ``None``"""
+    cdef readonly bint is_currency_pair
+    """If the instrument is a currency pair.\n\n:returns: `bool`"""
+
+    cdef uint8_t _price_precision
+    cdef uint8_t _size_precision
+    cdef bint _is_option
+    cdef bint _has_max_quantity
+    cdef bint _has_min_quantity
+    cdef uint64_t _max_quantity_raw
+    cdef uint64_t _min_quantity_raw
+    cdef int64_t _max_notional_per_order_raw
+    cdef double _max_net_exposure_f64
+    cdef bint _is_inverse
+    cdef double _multiplier_f64
+
+    cdef str check_price(self, Price price)
+    cdef str check_quantity(self, Quantity quantity)
+    cdef double exposure_f64(self, double quantity, double price)
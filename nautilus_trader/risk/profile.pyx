@@ -0,0 +1,137 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport AssetType
+from nautilus_trader.model.instruments.base cimport Instrument
+from nautilus_trader.model.instruments.currency_pair cimport CurrencyPair
+from nautilus_trader.model.objects cimport Money
+from nautilus_trader.model.objects cimport Price
+from nautilus_trader.model.objects cimport Quantity
+
+
+cdef class InstrumentRiskProfile:
+    """
+    Provides a precompiled pre-trade risk profile for an instrument.
+
+    The instrument limits and risk settings are resolved once on creation into
+    raw fixed-point values, so that the per order checks only compare integers.
+    The profile should be recreated whenever the instrument or the risk settings
+    change.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument for the profile.
+    max_notional_per_order : Decimal, optional
+        The maximum notional value per order (in the instruments quote currency).
+    max_net_exposure : Decimal, optional
+        The maximum net exposure for the instrument (in the instruments quote currency).
+
+    Raises
+    ------
+    ValueError
+        If `max_notional_per_order` is not ``None`` and not positive.
+    ValueError
+        If `max_net_exposure` is not ``None`` and not positive.
+
+    """
+
+    def __init__(
+        self,
+        Instrument instrument not None,
+        max_notional_per_order = None,
+        max_net_exposure = None,
+    ):
+        if max_notional_per_order is not None:
+            Condition.positive(max_notional_per_order, "max_notional_per_order")
+        if max_net_exposure is not None:
+            Condition.positive(max_net_exposure, "max_net_exposure")
+
+        self.instrument = instrument
+        self.instrument_id = instrument.id
+        self.quote_currency = instrument.quote_currency
+        self.is_currency_pair = isinstance(instrument, CurrencyPair)
+
+        self._price_precision = instrument.price_precision
+        self._size_precision = instrument.size_precision
+        self._is_option = instrument.asset_type == AssetType.OPTION
+        self._has_max_quantity = instrument.max_quantity is not None
+        self._has_min_quantity = instrument.min_quantity is not None
+        self._max_quantity_raw = instrument.max_quantity._mem.raw if self._has_max_quantity else 0
+        self._min_quantity_raw = instrument.min_quantity._mem.raw if self._has_min_quantity else 0
+        self._is_inverse = instrument.is_inverse
+        self._multiplier_f64 = instrument.multiplier.as_f64_c()
+
+        if max_notional_per_order is not None:
+            self.max_notional_per_order = Money(
+                float(max_notional_per_order),
+                instrument.quote_currency,
+            )
+            self._max_notional_per_order_raw = self.max_notional_per_order._mem.raw
+        else:
+            self.max_notional_per_order = None
+            self._max_notional_per_order_raw = 0
+
+        if max_net_exposure is not None:
+            self.max_net_exposure = Money(float(max_net_exposure), instrument.quote_currency)
+            self._max_net_exposure_f64 = self.max_net_exposure.as_f64_c()
+        else:
+            self.max_net_exposure = None
+            self._max_net_exposure_f64 = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"max_notional_per_order={self.max_notional_per_order}, "
+            f"max_net_exposure={self.max_net_exposure})"
+        )
+
+    cdef str check_price(self, Price price):
+        if price is None:
+            # Nothing to check
+            return None
+        if price._mem.precision > self._price_precision:
+            # Check failed
+            return f"price {price} invalid (precision {price._mem.precision} > {self._price_precision})"
+        if not self._is_option and price._mem.raw <= 0:
+            # Check failed
+            return f"price {price} invalid (not positive)"
+
+        return None  # Check passed
+
+    cdef str check_quantity(self, Quantity quantity):
+        if quantity is None:
+            # Nothing to check
+            return None
+        if quantity._mem.precision > self._size_precision:
+            # Check failed
+            return f"quantity {quantity.to_str()} invalid (precision {quantity._mem.precision} > {self._size_precision})"
+        if self._has_max_quantity and quantity._mem.raw > self._max_quantity_raw:
+            # Check failed
+            return f"quantity {quantity.to_str()} invalid (> maximum trade size of {self.instrument.max_quantity})"
+        if self._has_min_quantity and quantity._mem.raw < self._min_quantity_raw:
+            # Check failed
+            return f"quantity {quantity.to_str()} invalid (< minimum trade size of {self.instrument.min_quantity})"
+
+        return None  # Check passed
+
+    cdef double exposure_f64(self, double quantity, double price):
+        # Equivalent to `Instrument.notional_value` in quote currency, without
+        # allocating the `Money` object.
+        if self._is_inverse:
+            return quantity  # Quantity is notional in quote currency
+        return quantity * self._multiplier_f64 * price
@@ -26,6 +26,7 @@ from nautilus_trader.execution.messages cimport CancelOrder
 from nautilus_trader.execution.messages cimport ModifyOrder
 from nautilus_trader.execution.messages cimport SubmitOrder
 from nautilus_trader.execution.messages cimport SubmitOrderList
+from nautilus_trader.model.book cimport OrderBookDiff
 from nautilus_trader.model.data cimport Bar
 from nautilus_trader.model.data cimport InstrumentClose
 from nautilus_trader.model.data cimport InstrumentStatus
@@ -105,6 +106,7 @@ _OBJECT_TO_DICT_MAP: dict[str, Callable[[None], dict]] = {
     CryptoFuture.__name__: CryptoFuture.to_dict_c,
     OrderBookDelta.__name__: OrderBookDelta.to_dict_c,
     OrderBookDeltas.__name__: OrderBookDeltas.to_dict_c,
+    OrderBookDiff.__name__: OrderBookDiff.to_dict_c,
     TradeTick.__name__: TradeTick.to_dict_c,
     Ticker.__name__: Ticker.to_dict_c,
     QuoteTick.__name__: QuoteTick.to_dict_c,
@@ -156,6 +158,7 @@ _OBJECT_FROM_DICT_MAP: dict[str, Callable[[dict], Any]] = {
     CryptoFuture.__name__: CryptoFuture.from_dict_c,
     OrderBookDelta.__name__: OrderBookDelta.from_dict_c,
     OrderBookDeltas.__name__: OrderBookDeltas.from_dict_c,
+    OrderBookDiff.__name__: OrderBookDiff.from_dict_c,
     TradeTick.__name__: TradeTick.from_dict_c,
     Ticker.__name__: Ticker.from_dict_c,
     QuoteTick.__name__: QuoteTick.from_dict_c,
@@ -210,6 +213,7 @@ EXTERNAL_PUBLISHING_TYPES = (
     CryptoFuture,
     OrderBookDelta,
     OrderBookDeltas,
+    OrderBookDiff,
     TradeTick,
     Ticker,
     QuoteTick,
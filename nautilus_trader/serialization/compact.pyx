@@ -0,0 +1,488 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import sys
+
+import msgspec
+
+from nautilus_trader.core.correctness cimport Condition
+from nautilus_trader.core.rust.model cimport ContingencyType
+from nautilus_trader.core.rust.model cimport LiquiditySide
+from nautilus_trader.core.rust.model cimport OrderSide
+from nautilus_trader.core.rust.model cimport OrderType
+from nautilus_trader.core.rust.model cimport PositionSide
+from nautilus_trader.core.rust.model cimport TimeInForce
+from nautilus_trader.core.rust.model cimport TriggerType
+from nautilus_trader.model.functions cimport contingency_type_from_str
+from nautilus_trader.model.functions cimport contingency_type_to_str
+from nautilus_trader.model.functions cimport liquidity_side_from_str
+from nautilus_trader.model.functions cimport liquidity_side_to_str
+from nautilus_trader.model.functions cimport order_side_from_str
+from nautilus_trader.model.functions cimport order_side_to_str
+from nautilus_trader.model.functions cimport order_type_from_str
+from nautilus_trader.model.functions cimport order_type_to_str
+from nautilus_trader.model.functions cimport position_side_from_str
+from nautilus_trader.model.functions cimport position_side_to_str
+from nautilus_trader.model.functions cimport time_in_force_from_str
+from nautilus_trader.model.functions cimport time_in_force_to_str
+from nautilus_trader.model.functions cimport trigger_type_from_str
+from nautilus_trader.model.functions cimport trigger_type_to_str
+from nautilus_trader.serialization.base cimport _OBJECT_FROM_DICT_MAP
+from nautilus_trader.serialization.base cimport _OBJECT_TO_DICT_MAP
+from nautilus_trader.serialization.base cimport Serializer
+
+
+cdef tuple[str, int, float, bool] _PRIMITIVES = (str, int, float, bool)
+
+
+cdef enum FieldCodec:
+    CODEC_RAW = 0
+    CODEC_IDENTIFIER = 1
+    CODEC_DECIMAL = 2
+    CODEC_MONEY = 3
+    CODEC_ORDER_SIDE = 4
+    CODEC_ORDER_TYPE = 5
+    CODEC_TIME_IN_FORCE = 6
+    CODEC_TRIGGER_TYPE = 7
+    CODEC_CONTINGENCY_TYPE = 8
+    CODEC_LIQUIDITY_SIDE = 9
+    CODEC_POSITION_SIDE = 10
+
+
+cdef tuple _EVENT_HEADER = (
+    ("trader_id", CODEC_IDENTIFIER),
+    ("strategy_id", CODEC_IDENTIFIER),
+    ("instrument_id", CODEC_IDENTIFIER),
+    ("client_order_id", CODEC_RAW),
+)
+
+cdef tuple _VENUE_EVENT_FIELDS = _EVENT_HEADER + (
+    ("venue_order_id", CODEC_RAW),
+    ("account_id", CODEC_IDENTIFIER),
+    ("event_id", CODEC_RAW),
+    ("ts_event", CODEC_RAW),
+    ("ts_init", CODEC_RAW),
+    ("reconciliation", CODEC_RAW),
+)
+
+cdef tuple _VENUE_REASON_EVENT_FIELDS = _EVENT_HEADER + (
+    ("venue_order_id", CODEC_RAW),
+    ("account_id", CODEC_IDENTIFIER),
+    ("reason", CODEC_RAW),
+    ("event_id", CODEC_RAW),
+    ("ts_event", CODEC_RAW),
+    ("ts_init", CODEC_RAW),
+    ("reconciliation", CODEC_RAW),
+)
+
+cdef tuple _POSITION_HEADER = (
+    ("trader_id", CODEC_IDENTIFIER),
+    ("strategy_id", CODEC_IDENTIFIER),
+    ("instrument_id", CODEC_IDENTIFIER),
+    ("position_id", CODEC_RAW),
+    ("account_id", CODEC_IDENTIFIER),
+    ("opening_order_id", CODEC_RAW),
+)
+
+cdef tuple _POSITION_STATE_FIELDS = (
+    ("entry", CODEC_ORDER_SIDE),
+    ("side", CODEC_POSITION_SIDE),
+    ("signed_qty", CODEC_RAW),
+    ("quantity", CODEC_DECIMAL),
+    ("peak_qty", CODEC_DECIMAL),
+    ("last_qty", CODEC_DECIMAL),
+    ("last_px", CODEC_DECIMAL),
+    ("currency", CODEC_IDENTIFIER),
+    ("avg_px_open", CODEC_RAW),
+)
+
+# The schema ID is the position in this tuple (starting from 1), so new schemas
+# must only ever be appended to maintain compatibility with persisted values.
+cdef tuple _SCHEMAS = (
+    (
+        "OrderInitialized",
+        _EVENT_HEADER + (
+            ("order_side", CODEC_ORDER_SIDE),
+            ("order_type", CODEC_ORDER_TYPE),
+            ("quantity", CODEC_DECIMAL),
+            ("time_in_force", CODEC_TIME_IN_FORCE),
+            ("post_only", CODEC_RAW),
+            ("reduce_only", CODEC_RAW),
+            ("quote_quantity", CODEC_RAW),
+            ("options", CODEC_RAW),
+            ("emulation_trigger", CODEC_TRIGGER_TYPE),
+            ("trigger_instrument_id", CODEC_RAW),
+            ("contingency_type", CODEC_CONTINGENCY_TYPE),
+            ("order_list_id", CODEC_RAW),
+            ("linked_order_ids", CODEC_RAW),
+            ("parent_order_id", CODEC_RAW),
+            ("exec_algorithm_id", CODEC_RAW),
+            ("exec_algorithm_params", CODEC_RAW),
+            ("exec_spawn_id", CODEC_RAW),
+            ("tags", CODEC_RAW),
+            ("event_id", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+            ("reconciliation", CODEC_RAW),
+        ),
+    ),
+    (
+        "OrderDenied",
+        _EVENT_HEADER + (
+            ("reason", CODEC_RAW),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    (
+        "OrderEmulated",
+        _EVENT_HEADER + (
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    (
+        "OrderReleased",
+        _EVENT_HEADER + (
+            ("released_price", CODEC_DECIMAL),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    (
+        "OrderSubmitted",
+        _EVENT_HEADER + (
+            ("account_id", CODEC_IDENTIFIER),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    ("OrderAccepted", _VENUE_EVENT_FIELDS),
+    (
+        "OrderRejected",
+        _EVENT_HEADER + (
+            ("account_id", CODEC_IDENTIFIER),
+            ("reason", CODEC_RAW),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+            ("reconciliation", CODEC_RAW),
+        ),
+    ),
+    ("OrderCanceled", _VENUE_EVENT_FIELDS),
+    ("OrderExpired", _VENUE_EVENT_FIELDS),
+    ("OrderTriggered", _VENUE_EVENT_FIELDS),
+    ("OrderPendingUpdate", _VENUE_EVENT_FIELDS),
+    ("OrderPendingCancel", _VENUE_EVENT_FIELDS),
+    ("OrderModifyRejected", _VENUE_REASON_EVENT_FIELDS),
+    ("OrderCancelRejected", _VENUE_REASON_EVENT_FIELDS),
+    (
+        "OrderUpdated",
+        _EVENT_HEADER + (
+            ("venue_order_id", CODEC_RAW),
+            ("account_id", CODEC_IDENTIFIER),
+            ("quantity", CODEC_DECIMAL),
+            ("price", CODEC_DECIMAL),
+            ("trigger_price", CODEC_DECIMAL),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+            ("reconciliation", CODEC_RAW),
+        ),
+    ),
+    (
+        "OrderFilled",
+        _EVENT_HEADER + (
+            ("venue_order_id", CODEC_RAW),
+            ("account_id", CODEC_IDENTIFIER),
+            ("trade_id", CODEC_RAW),
+            ("position_id", CODEC_RAW),
+            ("order_side", CODEC_ORDER_SIDE),
+            ("order_type", CODEC_ORDER_TYPE),
+            ("last_qty", CODEC_DECIMAL),
+            ("last_px", CODEC_DECIMAL),
+            ("currency", CODEC_IDENTIFIER),
+            ("commission", CODEC_MONEY),
+            ("liquidity_side", CODEC_LIQUIDITY_SIDE),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+            ("info", CODEC_RAW),
+            ("reconciliation", CODEC_RAW),
+        ),
+    ),
+    (
+        "PositionOpened",
+        _POSITION_HEADER + _POSITION_STATE_FIELDS + (
+            ("realized_pnl", CODEC_MONEY),
+            ("duration_ns", CODEC_RAW),
+            ("event_id", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    (
+        "PositionChanged",
+        _POSITION_HEADER + _POSITION_STATE_FIELDS + (
+            ("avg_px_close", CODEC_RAW),
+            ("realized_return", CODEC_RAW),
+            ("realized_pnl", CODEC_MONEY),
+            ("unrealized_pnl", CODEC_MONEY),
+            ("event_id", CODEC_RAW),
+            ("ts_opened", CODEC_RAW),
+            ("ts_event", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+    (
+        "PositionClosed",
+        _POSITION_HEADER + (("closing_order_id", CODEC_RAW),) + _POSITION_STATE_FIELDS + (
+            ("avg_px_close", CODEC_RAW),
+            ("realized_return", CODEC_RAW),
+            ("realized_pnl", CODEC_MONEY),
+            ("event_id", CODEC_RAW),
+            ("ts_opened", CODEC_RAW),
+            ("ts_closed", CODEC_RAW),
+            ("duration_ns", CODEC_RAW),
+            ("ts_init", CODEC_RAW),
+        ),
+    ),
+)
+
+cdef dict _SCHEMA_IDS = {schema[0]: i + 1 for i, schema in enumerate(_SCHEMAS)}
+
+# The MessagePack integer range (int64 to uint64)
+cdef object _PACKED_MIN = -(2 ** 63)
+cdef object _PACKED_MAX = 2 ** 64 - 1
+
+
+cdef object _pack_decimal(str value):
+    # Packs the decimal string as a fixed-point integer with the precision in
+    # the low 4 bits, e.g. '1.00010' -> (100010 << 4) | 5. The string itself
+    # is kept if the packed integer is outside the MessagePack integer range.
+    cdef Py_ssize_t point = value.find(".")
+    if point == -1:
+        packed = int(value) << 4
+    else:
+        packed = (int(value[:point] + value[point + 1:]) << 4) | (len(value) - point - 1)
+    if packed < _PACKED_MIN or packed > _PACKED_MAX:
+        return value
+    return packed
+
+
+cdef str _unpack_decimal(object packed, bint grouped):
+    if isinstance(packed, str):
+        return packed  # Not packed (out of range)
+
+    cdef int precision = packed & 0xF
+    mantissa = packed >> 4
+    cdef str sign = "-" if mantissa < 0 else ""
+    if precision == 0:
+        integer, fraction = abs(mantissa), 0
+    else:
+        integer, fraction = divmod(abs(mantissa), 10 ** precision)
+
+    # Grouped format matches `Money.to_str`
+    cdef str integer_str = f"{integer:_}" if grouped else str(integer)
+    if precision == 0:
+        return f"{sign}{integer_str}"
+    return f"{sign}{integer_str}.{fraction:0{precision}d}"
+
+
+cdef object _encode_value(object value, int codec):
+    if value is None or codec == CODEC_RAW or codec == CODEC_IDENTIFIER:
+        return value
+    elif codec == CODEC_DECIMAL:
+        return _pack_decimal(value)
+    elif codec == CODEC_MONEY:
+        amount, currency = value.split(" ")
+        return [_pack_decimal(amount), currency]
+    elif codec == CODEC_ORDER_SIDE:
+        return <int>order_side_from_str(value)
+    elif codec == CODEC_ORDER_TYPE:
+        return <int>order_type_from_str(value)
+    elif codec == CODEC_TIME_IN_FORCE:
+        return <int>time_in_force_from_str(value)
+    elif codec == CODEC_TRIGGER_TYPE:
+        return <int>trigger_type_from_str(value)
+    elif codec == CODEC_CONTINGENCY_TYPE:
+        return <int>contingency_type_from_str(value)
+    elif codec == CODEC_LIQUIDITY_SIDE:
+        return <int>liquidity_side_from_str(value)
+    elif codec == CODEC_POSITION_SIDE:
+        return <int>position_side_from_str(value)
+    else:  # pragma: no cover (design-time error)
+        raise RuntimeError(f"invalid field codec, was {codec}")
+
+
+cdef object _decode_value(object value, int codec):
+    if value is None or codec == CODEC_RAW:
+        return value
+    elif codec == CODEC_IDENTIFIER:
+        return sys.intern(value)  # Repeated for every event, so share a single string
+    elif codec == CODEC_DECIMAL:
+        return _unpack_decimal(value, False)
+    elif codec == CODEC_MONEY:
+        return f"{_unpack_decimal(value[0], True)} {sys.intern(value[1])}"
+    elif codec == CODEC_ORDER_SIDE:
+        return order_side_to_str(<OrderSide>value)
+    elif codec == CODEC_ORDER_TYPE:
+        return order_type_to_str(<OrderType>value)
+    elif codec == CODEC_TIME_IN_FORCE:
+        return time_in_force_to_str(<TimeInForce>value)
+    elif codec == CODEC_TRIGGER_TYPE:
+        return trigger_type_to_str(<TriggerType>value)
+    elif codec == CODEC_CONTINGENCY_TYPE:
+        return contingency_type_to_str(<ContingencyType>value)
+    elif codec == CODEC_LIQUIDITY_SIDE:
+        return liquidity_side_to_str(<LiquiditySide>value)
+    elif codec == CODEC_POSITION_SIDE:
+        return position_side_to_str(<PositionSide>value)
+    else:  # pragma: no cover (design-time error)
+        raise RuntimeError(f"invalid field codec, was {codec}")
+
+
+cdef class CompactSerializer(Serializer):
+    """
+    Provides a compact binary serializer for order and position events.
+
+    Events with a registered schema are encoded as a 'MessagePack' array of the
+    schema ID followed by the field values in schema order (no field names).
+    Prices and quantities are packed as fixed-point integers, enums as their
+    integer values, and timestamps remain `uint64_t` integers.
+
+    All other objects fall back to the 'MessagePack' map encoding used by
+    `MsgSpecSerializer`, so the serializer can be used anywhere a
+    `MsgSpecSerializer` is used.
+
+    Warnings
+    --------
+    Values written with this serializer are not readable by a `MsgSpecSerializer`
+    (and vice versa for the schema encoded events), so the encoding of an existing
+    database or external stream should not be changed.
+
+    """
+
+    def __init__(self):
+        self._encode = msgspec.msgpack.encode
+        self._decode = msgspec.msgpack.decode
+
+    cpdef bytes serialize(self, object obj):
+        """
+        Serialize the given object to compact bytes.
+
+        Parameters
+        ----------
+        obj : object
+            The object to serialize.
+
+        Returns
+        -------
+        bytes
+
+        Raises
+        ------
+        RuntimeError
+            If `obj` cannot be serialized.
+
+        """
+        Condition.not_none(obj, "obj")
+
+        cdef str type_name = type(obj).__name__
+        cdef object schema_id = _SCHEMA_IDS.get(type_name)
+        if schema_id is None:
+            return self._serialize_dict(obj)
+
+        cdef dict obj_dict = _OBJECT_TO_DICT_MAP[type_name](obj)
+        cdef tuple fields = _SCHEMAS[<int>schema_id - 1][1]
+        cdef list values = [schema_id]
+
+        cdef str field
+        cdef int codec
+        for field, codec in fields:
+            values.append(_encode_value(obj_dict[field], codec))
+
+        return self._encode(values)
+
+    cdef bytes _serialize_dict(self, object obj):
+        if isinstance(obj, dict):
+            return self._encode(obj)
+
+        delegate = _OBJECT_TO_DICT_MAP.get(type(obj).__name__)
+        if delegate is None:
+            if isinstance(obj, _PRIMITIVES):
+                return self._encode(obj)
+            else:
+                raise RuntimeError(f"cannot serialize object: unrecognized type {type(obj)}")
+
+        return self._encode(delegate(obj))
+
+    cpdef object deserialize(self, bytes obj_bytes):
+        """
+        Deserialize the given compact bytes to an object.
+
+        Parameters
+        ----------
+        obj_bytes : bytes
+            The object bytes to deserialize.
+
+        Returns
+        -------
+        object
+
+        Raises
+        ------
+        RuntimeError
+            If `obj_bytes` cannot be deserialized.
+
+        """
+        Condition.not_none(obj_bytes, "obj_bytes")
+
+        cdef object decoded = self._decode(obj_bytes)
+        if isinstance(decoded, list):
+            return self._deserialize_schema(decoded)
+        if not isinstance(decoded, dict):
+            return decoded  # Primitive
+
+        cdef str obj_type = decoded.get("type")
+        if obj_type is None:
+            return decoded
+
+        delegate = _OBJECT_FROM_DICT_MAP.get(obj_type)
+        if delegate is None:
+            return decoded
+
+        return delegate(decoded)
+
+    cdef object _deserialize_schema(self, list values):
+        cdef int schema_id = values[0]
+        if schema_id < 1 or schema_id > len(_SCHEMAS):
+            raise RuntimeError(f"cannot deserialize object: unrecognized schema ID {schema_id}")
+
+        cdef tuple schema = _SCHEMAS[schema_id - 1]
+        cdef str type_name = schema[0]
+        cdef tuple fields = schema[1]
+        cdef dict obj_dict = {"type": type_name}
+
+        cdef int i
+        cdef str field
+        cdef int codec
+        for i, (field, codec) in enumerate(fields, start=1):
+            obj_dict[field] = _decode_value(values[i], codec)
+
+        return _OBJECT_FROM_DICT_MAP[type_name](obj_dict)
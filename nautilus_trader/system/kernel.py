@@ -73,6 +73,8 @@ from nautilus_trader.persistence.writer import StreamingFeatherWriter
 from nautilus_trader.portfolio.base import PortfolioFacade
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
+from nautilus_trader.serialization.base import Serializer
+from nautilus_trader.serialization.compact import CompactSerializer
 from nautilus_trader.serialization.serializer import MsgSpecSerializer
 from nautilus_trader.trading.controller import Controller
 from nautilus_trader.trading.strategy import Strategy
@@ -216,13 +218,11 @@ class NautilusKernel:
         if not config.cache or not config.cache.database:
             cache_db = None
         elif config.cache.database.type == "redis":
-            encoding = config.cache.encoding.lower()
             cache_db = CacheDatabaseAdapter(
                 trader_id=self._trader_id,
                 logger=self._logger,
-                serializer=MsgSpecSerializer(
-                    encoding=msgspec.msgpack if encoding == "msgpack" else msgspec.json,
-                    timestamps_as_str=True,  # Hardcoded for now
+                serializer=_create_serializer(
+                    encoding=config.cache.encoding,
                     timestamps_as_iso8601=config.cache.timestamps_as_iso8601,
                 ),
                 config=config.cache,
@@ -250,10 +250,8 @@ class NautilusKernel:
 
         msgbus_serializer = None
         if config.message_bus:
-            encoding = config.message_bus.encoding.lower()
-            msgbus_serializer = MsgSpecSerializer(
-                encoding=msgspec.msgpack if encoding == "msgpack" else msgspec.json,
-                timestamps_as_str=True,  # Hardcoded for now
+            msgbus_serializer = _create_serializer(
+                encoding=config.message_bus.encoding,
                 timestamps_as_iso8601=config.message_bus.timestamps_as_iso8601,
             )
         self._msgbus = MessageBus(
@@ -1143,3 +1141,15 @@ class NautilusKernel:
     def _flush_writer(self) -> None:
         if self._writer is not None:
             self._writer.flush()
+
+
+def _create_serializer(encoding: str, timestamps_as_iso8601: bool) -> Serializer:
+    encoding = encoding.lower()
+    if encoding == "compact":
+        return CompactSerializer()
+
+    return MsgSpecSerializer(
+        encoding=msgspec.msgpack if encoding == "msgpack" else msgspec.json,
+        timestamps_as_str=True,  # Hardcoded for now
+        timestamps_as_iso8601=timestamps_as_iso8601,
+    )
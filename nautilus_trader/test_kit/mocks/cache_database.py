@@ -86,6 +86,18 @@ class MockCacheDatabase(CacheDatabaseFacade):
     def load_positions(self) -> dict:
         return self.positions.copy()
 
+    def load_open_orders(self) -> dict:
+        return {k: v for k, v in self.orders.items() if not v.is_closed}
+
+    def load_open_positions(self) -> dict:
+        return {k: v for k, v in self.positions.items() if v.is_open}
+
+    def load_index_orders_closed(self) -> set[ClientOrderId]:
+        return {k for k, v in self.orders.items() if v.is_closed}
+
+    def load_index_positions_closed(self) -> set[PositionId]:
+        return {k for k, v in self.positions.items() if v.is_closed}
+
     def load_currency(self, code: str) -> Currency:
         return self.currencies.get(code)
 
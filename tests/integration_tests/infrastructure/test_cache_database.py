@@ -31,6 +31,9 @@ from nautilus_trader.common.logging import Logger
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.config.common import CacheConfig
 from nautilus_trader.config.common import DatabaseConfig
+from nautilus_trader.core.nautilus_pyo3 import UUID4 as RustUUID4
+from nautilus_trader.core.nautilus_pyo3 import RedisCacheDatabase as RustRedisCacheDatabase
+from nautilus_trader.core.nautilus_pyo3 import TraderId as RustTraderId
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
@@ -238,6 +241,50 @@ class TestCacheDatabaseAdapter:
         # Assert
         assert self.database.load_order(order.client_order_id) == order
 
+    @pytest.mark.asyncio
+    async def test_read_bulk_returns_same_records_as_per_key_reads(self):
+        # Arrange
+        self.database.add_currency(Currency.from_str("AUD"))
+        self.database.add_instrument(AUDUSD_SIM)
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        order2 = self.strategy.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        self.database.add_order(order1)
+        self.database.add_order(order2)
+
+        # Allow MPSC thread to insert
+        await eventually(lambda: self.database.load_order(order2.client_order_id))
+
+        backing = RustRedisCacheDatabase(
+            trader_id=RustTraderId(self.trader_id.value),
+            instance_id=RustUUID4(),
+            config_json=msgspec.json.encode(CacheConfig(database=DatabaseConfig())),
+        )
+        keys = [
+            "currencies:AUD",
+            "currencies:JPY",  # Missing
+            f"instruments:{AUDUSD_SIM.id}",
+            f"instruments:{AUDUSD_SIM.id}X",  # Missing
+            f"orders:{order1.client_order_id}",
+            "orders:O-MISSING",  # Missing
+            f"orders:{order2.client_order_id}",
+        ]
+
+        # Act
+        result = backing.read_bulk(keys)
+
+        # Assert
+        assert result == [backing.read(key) for key in keys]
+        assert [len(r) > 0 for r in result] == [True, False, True, False, True, False, True]
+
     @pytest.mark.asyncio
     async def test_add_position(self):
         # Arrange
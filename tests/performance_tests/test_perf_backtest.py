@@ -28,11 +28,13 @@ from nautilus_trader.config import LoggingConfig
 from nautilus_trader.examples.strategies.ema_cross import EMACross
 from nautilus_trader.examples.strategies.ema_cross import EMACrossConfig
 from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.test_kit.performance import PerformanceHarness
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -128,6 +130,52 @@ class TestBacktestEnginePerformance(PerformanceHarness):
 
         benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
 
+    @staticmethod
+    def test_run_for_tick_processing_with_arrow_data(benchmark):
+        def setup():
+            config = BacktestEngineConfig(logging=LoggingConfig(bypass_logging=True))
+            engine = BacktestEngine(config=config)
+
+            engine.add_venue(
+                venue=Venue("SIM"),
+                oms_type=OmsType.HEDGING,
+                account_type=AccountType.MARGIN,
+                base_currency=USD,
+                starting_balances=[Money(1_000_000, USD)],
+            )
+
+            engine.add_instrument(USDJPY_SIM)
+
+            # Setup data (held as columnar Arrow data by the engine)
+            wrangler = QuoteTickDataWrangler(USDJPY_SIM)
+            provider = TestDataProvider()
+            ticks = wrangler.process_bar_data(
+                bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+                ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+            )
+            table = ArrowSerializer.serialize_batch(ticks, data_cls=QuoteTick)
+            engine.add_arrow_data(table, data_cls=QuoteTick)
+
+            config = EMACrossConfig(
+                instrument_id=USDJPY_SIM.id,
+                bar_type=TestDataStubs.bartype_usdjpy_1min_bid(),
+                trade_size=Decimal(1_000_000),
+                fast_ema_period=10,
+                slow_ema_period=20,
+            )
+            strategy = EMACross(config=config)
+
+            start = datetime(2013, 2, 1, 0, 0, 0, 0, tzinfo=pytz.utc)
+            end = datetime(2013, 2, 10, 0, 0, 0, 0, tzinfo=pytz.utc)
+
+            return (engine, start, end, strategy), {}
+
+        def run(engine, start, end, strategy):
+            engine.add_strategy(strategy)
+            engine.run(start=start, end=end)
+
+        benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+
     @staticmethod
     def test_run_with_ema_cross_strategy(benchmark):
         def setup():
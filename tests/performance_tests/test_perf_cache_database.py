@@ -0,0 +1,118 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import socket
+import sys
+import time
+
+import msgspec
+import pytest
+
+from nautilus_trader.cache.database import CacheDatabaseAdapter
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.config.common import CacheConfig
+from nautilus_trader.config.common import DatabaseConfig
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
+from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+ORDER_COUNT = 10_000
+
+
+def _redis_available() -> bool:
+    try:
+        with socket.create_connection(("localhost", 6379), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+# Requirements:
+# - A Redis instance listening on the default port 6379
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32" or not _redis_available(),
+    reason="requires a local Redis instance",
+)
+
+
+class TestCacheDatabaseAdapterPerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(clock=self.clock, bypass=True)
+
+        self.database = CacheDatabaseAdapter(
+            trader_id=TestIdStubs.trader_id(),
+            logger=self.logger,
+            serializer=MsgSpecSerializer(encoding=msgspec.msgpack, timestamps_as_str=True),
+            config=CacheConfig(database=DatabaseConfig()),
+        )
+        self.database.flush()
+
+        order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=TestIdStubs.strategy_id(),
+            clock=self.clock,
+        )
+        self.orders = [
+            order_factory.market(
+                AUDUSD_SIM.id,
+                OrderSide.BUY,
+                Quantity.from_int(100_000),
+            )
+            for _ in range(ORDER_COUNT)
+        ]
+        for order in self.orders:
+            self.database.add_order(order)
+
+        # Allow MPSC thread to insert
+        while len(self.database.keys("*:orders:*")) < ORDER_COUNT:
+            time.sleep(0.1)
+
+    def teardown(self):
+        self.database.flush()
+
+    def test_load_orders(self):
+        # Orders are read with pipelined bulk reads
+        result = self.benchmark.pedantic(
+            target=self.database.load_orders,
+            iterations=1,
+            rounds=5,
+        )
+
+        assert len(result) == ORDER_COUNT
+
+    def test_load_order_per_key(self):
+        # Baseline of one database round trip per order
+        client_order_ids = [order.client_order_id for order in self.orders]
+
+        def load_orders():
+            return [self.database.load_order(c) for c in client_order_ids]
+
+        result = self.benchmark.pedantic(
+            target=load_orders,
+            iterations=1,
+            rounds=5,
+        )
+
+        assert len(result) == ORDER_COUNT
@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 from datetime import timedelta
 
 from nautilus_trader.common.clock import LiveClock
@@ -79,3 +80,28 @@ class TestClockPerformanceTests(PerformanceHarness):
         )
         # ~320.1ms                       minimum of 1 runs @ 1 iteration each run. (100000 advances)
         # ~3.7ms / ~3655.1μs / 3655108ns minimum of 1 runs @ 1 iteration each run.
+
+
+class TestLiveClockTimersPerformanceTests(PerformanceHarness):
+    def test_set_and_cancel_timers_with_many_timers(self):
+        # Arrange
+        loop = asyncio.new_event_loop()
+        clock = LiveClock(loop=loop)
+        interval = timedelta(seconds=60)
+        for i in range(10_000):
+            clock.set_timer(f"TIMER-{i}", interval, callback=lambda e: None)
+
+        def set_and_cancel_timer():
+            clock.set_timer("TIMER", interval, callback=lambda e: None)
+            clock.cancel_timer("TIMER")
+
+        # Act
+        self.benchmark.pedantic(
+            target=set_and_cancel_timer,
+            iterations=10_000,
+            rounds=1,
+        )
+
+        # Tear Down
+        clock.cancel_timers()
+        loop.close()
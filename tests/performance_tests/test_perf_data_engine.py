@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+import pytest
+
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.data.engine import DataEngine
+from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestDataEnginePerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(clock=self.clock, bypass=True)
+
+        self.msgbus = MessageBus(
+            trader_id=TestIdStubs.trader_id(),
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = Cache(logger=self.logger)
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        self.data_engine = DataEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.handler = []
+        self.msgbus.subscribe(topic="data.quotes.SIM.AUD/USD", handler=self.handler.append)
+        self.msgbus.subscribe(
+            topic=f"data.bars.{TestDataStubs.bartype_audusd_1min_bid()}",
+            handler=self.handler.append,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_process_quote_tick(self):
+        self.benchmark.pedantic(
+            target=self.data_engine.process,
+            args=(TestDataStubs.quote_tick(AUDUSD_SIM),),
+            iterations=100_000,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_process_bar(self):
+        self.benchmark.pedantic(
+            target=self.data_engine.process,
+            args=(TestDataStubs.bar_5decimal(),),
+            iterations=100_000,
+            rounds=1,
+        )
@@ -0,0 +1,270 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+import pytest
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.indicators.amat import ArcherMovingAveragesTrends
+from nautilus_trader.indicators.aroon import AroonOscillator
+from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.ama import AdaptiveMovingAverage
+from nautilus_trader.indicators.average.dema import DoubleExponentialMovingAverage
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.indicators.average.hma import HullMovingAverage
+from nautilus_trader.indicators.average.rma import WilderMovingAverage
+from nautilus_trader.indicators.average.sma import SimpleMovingAverage
+from nautilus_trader.indicators.average.vidya import VariableIndexDynamicAverage
+from nautilus_trader.indicators.average.wma import WeightedMovingAverage
+from nautilus_trader.indicators.bias import Bias
+from nautilus_trader.indicators.bollinger_bands import BollingerBands
+from nautilus_trader.indicators.cci import CommodityChannelIndex
+from nautilus_trader.indicators.cmo import ChandeMomentumOscillator
+from nautilus_trader.indicators.dm import DirectionalMovement
+from nautilus_trader.indicators.donchian_channel import DonchianChannel
+from nautilus_trader.indicators.efficiency_ratio import EfficiencyRatio
+from nautilus_trader.indicators.fuzzy_candlesticks import FuzzyCandlesticks
+from nautilus_trader.indicators.keltner_channel import KeltnerChannel
+from nautilus_trader.indicators.keltner_position import KeltnerPosition
+from nautilus_trader.indicators.kvo import KlingerVolumeOscillator
+from nautilus_trader.indicators.linear_regression import LinearRegression
+from nautilus_trader.indicators.macd import MovingAverageConvergenceDivergence
+from nautilus_trader.indicators.obv import OnBalanceVolume
+from nautilus_trader.indicators.pressure import Pressure
+from nautilus_trader.indicators.psl import PsychologicalLine
+from nautilus_trader.indicators.roc import RateOfChange
+from nautilus_trader.indicators.rsi import RelativeStrengthIndex
+from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
+from nautilus_trader.indicators.spread_analyzer import SpreadAnalyzer
+from nautilus_trader.indicators.stochastics import Stochastics
+from nautilus_trader.indicators.swings import Swings
+from nautilus_trader.indicators.vhf import VerticalHorizontalFilter
+from nautilus_trader.indicators.volatility_ratio import VolatilityRatio
+from nautilus_trader.indicators.vwap import VolumeWeightedAveragePrice
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+# A long period so any per update O(period) work dominates
+PERIOD = 200
+
+INDICATORS = {
+    "ArcherMovingAveragesTrends": lambda: ArcherMovingAveragesTrends(PERIOD // 4, PERIOD, 5),
+    "AroonOscillator": lambda: AroonOscillator(PERIOD),
+    "AverageTrueRange": lambda: AverageTrueRange(PERIOD),
+    "AdaptiveMovingAverage": lambda: AdaptiveMovingAverage(PERIOD, 2, 30),
+    "DoubleExponentialMovingAverage": lambda: DoubleExponentialMovingAverage(PERIOD),
+    "ExponentialMovingAverage": lambda: ExponentialMovingAverage(PERIOD),
+    "HullMovingAverage": lambda: HullMovingAverage(PERIOD),
+    "WilderMovingAverage": lambda: WilderMovingAverage(PERIOD),
+    "SimpleMovingAverage": lambda: SimpleMovingAverage(PERIOD),
+    "VariableIndexDynamicAverage": lambda: VariableIndexDynamicAverage(PERIOD),
+    "WeightedMovingAverage": lambda: WeightedMovingAverage(PERIOD),
+    "Bias": lambda: Bias(PERIOD),
+    "BollingerBands": lambda: BollingerBands(PERIOD, 2.0),
+    "CommodityChannelIndex": lambda: CommodityChannelIndex(PERIOD),
+    "ChandeMomentumOscillator": lambda: ChandeMomentumOscillator(PERIOD),
+    "DirectionalMovement": lambda: DirectionalMovement(PERIOD),
+    "DonchianChannel": lambda: DonchianChannel(PERIOD),
+    "EfficiencyRatio": lambda: EfficiencyRatio(PERIOD),
+    "FuzzyCandlesticks": lambda: FuzzyCandlesticks(PERIOD),
+    "KeltnerChannel": lambda: KeltnerChannel(PERIOD, 2.5),
+    "KeltnerPosition": lambda: KeltnerPosition(PERIOD, 2.5),
+    "KlingerVolumeOscillator": lambda: KlingerVolumeOscillator(PERIOD // 4, PERIOD, 5),
+    "LinearRegression": lambda: LinearRegression(PERIOD),
+    "MovingAverageConvergenceDivergence": lambda: MovingAverageConvergenceDivergence(
+        PERIOD // 4,
+        PERIOD,
+    ),
+    "OnBalanceVolume": lambda: OnBalanceVolume(PERIOD),
+    "Pressure": lambda: Pressure(PERIOD),
+    "PsychologicalLine": lambda: PsychologicalLine(PERIOD),
+    "RateOfChange": lambda: RateOfChange(PERIOD),
+    "RelativeStrengthIndex": lambda: RelativeStrengthIndex(PERIOD),
+    "RelativeVolatilityIndex": lambda: RelativeVolatilityIndex(PERIOD),
+    "Stochastics": lambda: Stochastics(PERIOD, 3),
+    "Swings": lambda: Swings(PERIOD),
+    "VerticalHorizontalFilter": lambda: VerticalHorizontalFilter(PERIOD),
+    "VolatilityRatio": lambda: VolatilityRatio(PERIOD // 4, PERIOD),
+    "VolumeWeightedAveragePrice": lambda: VolumeWeightedAveragePrice(),
+}
+
+
+def _random_walk_bars(count: int) -> list[Bar]:
+    rng = np.random.default_rng(42)
+    closes = 1.0 + np.cumsum(rng.normal(0.0, 0.0001, count))
+    bar_type = TestDataStubs.bartype_audusd_1min_bid()
+    bars = []
+    prev_close = closes[0]
+    for i, close in enumerate(closes):
+        high = max(prev_close, close) + 0.00005
+        low = min(prev_close, close) - 0.00005
+        bars.append(
+            Bar(
+                bar_type=bar_type,
+                open=Price(prev_close, 5),
+                high=Price(high, 5),
+                low=Price(low, 5),
+                close=Price(close, 5),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i,
+                ts_init=i,
+            ),
+        )
+        prev_close = close
+    return bars
+
+
+BARS = _random_walk_bars(1_000)
+
+
+def handle_bars(indicator, bars: list[Bar]) -> None:
+    for bar in bars:
+        indicator.handle_bar(bar)
+
+
+class PerBarActor(Actor):
+    def on_historical_data(self, data) -> None:
+        pass  # Observing intermediate state requires the per bar indicator updates
+
+
+def handle_quote_ticks(indicator, ticks: list) -> None:
+    for tick in ticks:
+        indicator.handle_quote_tick(tick)
+
+
+class TestIndicatorPerformance(PerformanceHarness):
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize("name", list(INDICATORS))
+    def test_handle_bars(self, name):
+        # Warm up past the initial period so only steady state updates are measured
+        indicator = INDICATORS[name]()
+        handle_bars(indicator, BARS)
+
+        self.benchmark.pedantic(
+            target=handle_bars,
+            args=(indicator, BARS),
+            iterations=10,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize("name", list(INDICATORS))
+    def test_handle_bars_batch(self, name):
+        indicator = INDICATORS[name]()
+        indicator.handle_bars(BARS)
+
+        self.benchmark.pedantic(
+            target=indicator.handle_bars,
+            args=(BARS,),
+            iterations=10,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "DoubleExponentialMovingAverage",
+            "ExponentialMovingAverage",
+            "HullMovingAverage",
+            "LinearRegression",
+            "MovingAverageConvergenceDivergence",
+            "RelativeStrengthIndex",
+            "RelativeVolatilityIndex",
+            "SimpleMovingAverage",
+            "VerticalHorizontalFilter",
+            "WilderMovingAverage",
+        ],
+    )
+    def test_update_raw_batch(self, name):
+        indicator = INDICATORS[name]()
+        closes = np.asarray([bar.close.as_double() for bar in BARS], dtype=np.float64)
+        indicator.update_raw_batch(closes)
+
+        self.benchmark.pedantic(
+            target=indicator.update_raw_batch,
+            args=(closes,),
+            iterations=10,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "AverageTrueRange",
+            "BollingerBands",
+            "CommodityChannelIndex",
+            "KeltnerChannel",
+            "Stochastics",
+        ],
+    )
+    def test_update_raw_batch_hlc(self, name):
+        indicator = INDICATORS[name]()
+        highs = np.asarray([bar.high.as_double() for bar in BARS], dtype=np.float64)
+        lows = np.asarray([bar.low.as_double() for bar in BARS], dtype=np.float64)
+        closes = np.asarray([bar.close.as_double() for bar in BARS], dtype=np.float64)
+        indicator.update_raw_batch(highs, lows, closes)
+
+        self.benchmark.pedantic(
+            target=indicator.update_raw_batch,
+            args=(highs, lows, closes),
+            iterations=10,
+            rounds=1,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize("actor_cls", [PerBarActor, Actor])
+    def test_actor_handle_bars_warm_up(self, actor_cls):
+        # Compares the per bar warm up path with the batch warm up path
+        def setup():
+            actor = actor_cls()
+            for name in [
+                "AverageTrueRange",
+                "BollingerBands",
+                "MovingAverageConvergenceDivergence",
+                "RelativeStrengthIndex",
+                "Stochastics",
+            ]:
+                actor.register_indicator_for_bars(BARS[0].bar_type, INDICATORS[name]())
+            return (actor,), {}
+
+        self.benchmark.pedantic(
+            target=lambda actor: actor.handle_bars(BARS),
+            setup=setup,
+            iterations=1,
+            rounds=10,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_spread_analyzer_handle_quote_ticks(self):
+        indicator = SpreadAnalyzer(TestIdStubs.audusd_id(), PERIOD)
+        ticks = [
+            TestDataStubs.quote_tick(bid_price=bar.low.as_double(), ask_price=bar.high.as_double())
+            for bar in BARS
+        ]
+        handle_quote_ticks(indicator, ticks)
+
+        self.benchmark.pedantic(
+            target=handle_quote_ticks,
+            args=(indicator, ticks),
+            iterations=10,
+            rounds=1,
+        )
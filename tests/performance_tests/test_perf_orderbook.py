@@ -13,6 +13,7 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pytest
 
 from nautilus_trader.model.book import OrderBook
@@ -46,3 +47,41 @@ def test_orderbook_updates(benchmark):
     # benchmark something
     # book = benchmark(run_l3_test, book=book, feed=feed)
     benchmark.pedantic(run_l3_test, args=(book, feed), rounds=10, iterations=10, warmup_rounds=5)
+
+
+def test_orderbook_bids_levels(benchmark):
+    book = TestDataStubs.order_book(
+        bid_price=1_000.0,
+        ask_price=1_001.0,
+        bid_levels=500,
+        ask_levels=500,
+    )
+    benchmark.pedantic(book.bids, rounds=1_000, iterations=10)
+
+
+def test_orderbook_bids_depth(benchmark):
+    book = TestDataStubs.order_book(
+        bid_price=1_000.0,
+        ask_price=1_001.0,
+        bid_levels=500,
+        ask_levels=500,
+    )
+    benchmark.pedantic(book.bids_depth, args=(10,), rounds=1_000, iterations=10)
+
+
+def test_orderbook_fill_bids_depth(benchmark):
+    book = TestDataStubs.order_book(
+        bid_price=1_000.0,
+        ask_price=1_001.0,
+        bid_levels=500,
+        ask_levels=500,
+    )
+    prices = np.empty(10, dtype=np.float64)
+    sizes = np.empty(10, dtype=np.float64)
+    counts = np.empty(10, dtype=np.uint64)
+    benchmark.pedantic(
+        book.fill_bids_depth,
+        args=(prices, sizes, counts, True),
+        rounds=1_000,
+        iterations=10,
+    )
@@ -0,0 +1,144 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.common.logging import Logger
+from nautilus_trader.config import RiskEngineConfig
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.execution.messages import SubmitOrder
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.risk.engine import RiskEngine
+from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestRiskEnginePerformance(PerformanceHarness):
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(clock=self.clock, bypass=True)
+        self.trader_id = TestIdStubs.trader_id()
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestComponentStubs.cache()
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+        self.portfolio.update_account(self.account_state())
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=RiskEngineConfig(
+                max_order_submit_rate="1000000/00:00:01",
+                max_notional_per_order={"AUD/USD.SIM": 10_000_000},
+            ),
+        )
+
+        # Commands which pass the risk checks are sent to the execution engine
+        self.sent = 0
+        self.msgbus.register(endpoint="ExecEngine.execute", handler=self._count_sent)
+
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=StrategyId("S-001"),
+            clock=self.clock,
+        )
+
+    def account_state(self):
+        return TestEventStubs.cash_account_state()
+
+    def _count_sent(self, command):
+        self.sent += 1
+
+    def _submit_order(self, order):
+        return SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=order.strategy_id,
+            order=order,
+            command_id=UUID4(),
+            ts_init=0,
+        )
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_execute_submit_limit_order(self):
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+        )
+        command = self._submit_order(order)
+
+        self.benchmark.pedantic(
+            target=self.risk_engine.execute,
+            args=(command,),
+            iterations=100_000,
+            rounds=1,
+        )
+        assert self.sent > 0
+
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    def test_execute_submit_market_order(self):
+        # Entry price is determined from the latest quote in the cache
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(100_000),
+        )
+        command = self._submit_order(order)
+
+        self.benchmark.pedantic(
+            target=self.risk_engine.execute,
+            args=(command,),
+            iterations=100_000,
+            rounds=1,
+        )
+        assert self.sent > 0
+
+
+class TestRiskEngineMarginAccountPerformance(TestRiskEnginePerformance):
+    # Runs the same benchmarks with the margin account risk checks
+    def account_state(self):
+        return TestEventStubs.margin_account_state()
@@ -25,12 +25,16 @@ from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.serialization.compact import CompactSerializer
 from nautilus_trader.serialization.serializer import MsgSpecSerializer
 from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
 AUDUSD = TestIdStubs.audusd_id()
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
 
 
 class TestSerializationPerformance(PerformanceHarness):
@@ -61,7 +65,15 @@ class TestSerializationPerformance(PerformanceHarness):
             ts_init=0,
         )
 
+        self.fill = TestEventStubs.order_filled(
+            self.order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+        )
+
         self.serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+        self.json_serializer = MsgSpecSerializer(encoding=msgspec.json)
+        self.compact_serializer = CompactSerializer()
 
     @pytest.fixture(autouse=True)
     @pytest.mark.benchmark(disable_gc=True, warmup=True)
@@ -77,3 +89,34 @@ class TestSerializationPerformance(PerformanceHarness):
             rounds=1,
         )
         # ~0.0ms / ~4.1μs / 4105ns minimum of 10,000 runs @ 1 iteration each run.
+
+    @pytest.mark.parametrize("encoding", ["msgpack", "json", "compact"])
+    def test_serialize_order_filled(self, encoding):
+        serializer = self._serializer(encoding)
+        self.benchmark.extra_info["size_bytes"] = len(serializer.serialize(self.fill))
+
+        self.benchmark.pedantic(
+            target=serializer.serialize,
+            args=(self.fill,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    @pytest.mark.parametrize("encoding", ["msgpack", "json", "compact"])
+    def test_deserialize_order_filled(self, encoding):
+        serializer = self._serializer(encoding)
+        fill_bytes = serializer.serialize(self.fill)
+
+        self.benchmark.pedantic(
+            target=serializer.deserialize,
+            args=(fill_bytes,),
+            iterations=10_000,
+            rounds=1,
+        )
+
+    def _serializer(self, encoding: str):
+        if encoding == "compact":
+            return self.compact_serializer
+        elif encoding == "json":
+            return self.json_serializer
+        return self.serializer
@@ -0,0 +1,105 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import importlib.util
+
+import numpy as np
+import pytest
+
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.performance import PerformanceHarness
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+if importlib.util.find_spec("talib") is None:
+    pytestmark = pytest.mark.skip(reason="talib is not installed")
+else:
+    from nautilus_trader.indicators.ta_lib.manager import TAFunctionWrapper
+    from nautilus_trader.indicators.ta_lib.manager import TALibIndicatorManager
+
+
+BAR_TYPE = TestDataStubs.bartype_audusd_1min_bid()
+
+INDICATOR_SETS = {
+    "single": ["SMA_10"],
+    "moving_averages": ["SMA_10", "SMA_50", "EMA_20", "EMA_50"],
+    "typical": [
+        "SMA_10",
+        "EMA_20",
+        "RSI_14",
+        "MACD_12_26_9",
+        "BBANDS_20_2.0_2.0_0_UPPER",
+        "ATR_14",
+    ],
+    "long_lookback": ["SMA_10", "RSI_14", "ATR_14", "SMA_200"],
+}
+
+
+def _random_walk_bars(count: int) -> list[Bar]:
+    rng = np.random.default_rng(42)
+    closes = 1.0 + np.cumsum(rng.normal(0.0, 0.0001, count))
+    bars = []
+    prev_close = closes[0]
+    for i, close in enumerate(closes):
+        bars.append(
+            Bar(
+                bar_type=BAR_TYPE,
+                open=Price(prev_close, 5),
+                high=Price(max(prev_close, close) + 0.00005, 5),
+                low=Price(min(prev_close, close) - 0.00005, 5),
+                close=Price(close, 5),
+                volume=Quantity.from_int(1_000_000),
+                ts_event=i + 1,
+                ts_init=i + 1,
+            ),
+        )
+        prev_close = close
+    return bars
+
+
+BARS = _random_walk_bars(1_000)
+
+
+def handle_bars(manager, bars: list[Bar]) -> None:
+    for bar in bars:
+        manager.handle_bar(bar)
+
+
+class TestTALibIndicatorManagerPerformance(PerformanceHarness):
+    @pytest.mark.benchmark(disable_gc=True, warmup=True)
+    @pytest.mark.parametrize("incremental", [False, True], ids=["full_window", "incremental"])
+    @pytest.mark.parametrize("indicator_set", list(INDICATOR_SETS))
+    def test_handle_bars(self, indicator_set, incremental):
+        indicators = TAFunctionWrapper.from_list_of_str(INDICATOR_SETS[indicator_set])
+
+        def setup():
+            # Bars must have increasing timestamps, so a new manager is needed for each round
+            manager = TALibIndicatorManager(
+                bar_type=BAR_TYPE,
+                period=1,
+                buffer_size=100,
+                incremental=incremental,
+            )
+            manager.set_indicators(indicators)
+            return (manager, BARS), {}
+
+        self.benchmark.pedantic(
+            target=handle_bars,
+            setup=setup,
+            iterations=1,
+            rounds=10,
+        )
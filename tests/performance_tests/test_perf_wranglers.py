@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
 from nautilus_trader.test_kit.performance import PerformanceBench
@@ -57,3 +60,29 @@ class TestDataWranglersPerformance(PerformanceHarness):
             iterations=1,
         )
         # ~500.2ms / ~500210.6μs / 500210608ns minimum of 10 runs @ 1 iteration each run.
+
+    def test_quote_tick_from_raw_arrays_to_list(self):
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        count = 100_000
+        prices = np.full(count, 100_000_000_000, dtype=np.int64)
+        sizes = np.full(count, 1_000_000_000_000_000, dtype=np.uint64)
+        timestamps = np.arange(count, dtype=np.uint64)
+
+        def from_raw_arrays():
+            QuoteTick.from_raw_arrays_to_list(
+                usdjpy.id,
+                usdjpy.price_precision,
+                usdjpy.size_precision,
+                prices,
+                prices,
+                sizes,
+                sizes,
+                timestamps,
+                timestamps,
+            )
+
+        PerformanceBench.profile_function(
+            target=from_raw_arrays,
+            runs=10,
+            iterations=1,
+        )
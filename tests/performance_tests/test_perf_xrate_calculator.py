@@ -14,12 +14,28 @@
 # -------------------------------------------------------------------------------------------------
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
+from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import ETH
+from nautilus_trader.model.currencies import JPY
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.performance import PerformanceBench
 
 
+# 32 currencies quoted against USD, plus a handful of crosses
+_CODES = [
+    "AUD", "BRL", "CAD", "CHF", "CLP", "CNH", "CZK", "DKK",
+    "EUR", "GBP", "HKD", "HUF", "IDR", "ILS", "INR", "JPY",
+    "KRW", "MXN", "NOK", "NZD", "PHP", "PLN", "RUB", "SAR",
+    "SEK", "SGD", "THB", "TRY", "TWD", "ZAR", "CNY", "MYR",
+]  # fmt: skip
+
+_BID_QUOTES = {f"{code}/USD": 1.0 / (i + 1.5) for i, code in enumerate(_CODES)}
+_BID_QUOTES.update({"EUR/GBP": 0.86, "EUR/JPY": 157.2, "GBP/JPY": 182.8, "AUD/NZD": 1.08})
+_ASK_QUOTES = {symbol: bid * 1.0001 for symbol, bid in _BID_QUOTES.items()}
+
+
 class TestExchangeRateCalculatorPerformanceTests:
     @staticmethod
     def get_xrate():
@@ -50,3 +66,51 @@ class TestExchangeRateCalculatorPerformanceTests:
         )
         # ~0.0ms / ~8.2μs / 8198ns minimum of 100,000 runs @ 1 iteration each run.
         # ~0.0ms / ~4.7μs / 4732ns minimum of 100,000 runs @ 1 iteration each run.
+
+    @staticmethod
+    def get_xrate_many_currencies():
+        ExchangeRateCalculator().get_rate(
+            from_currency=AUD,
+            to_currency=JPY,
+            price_type=PriceType.MID,
+            bid_quotes=_BID_QUOTES,
+            ask_quotes=_ASK_QUOTES,
+        )
+
+    def test_get_xrate_many_currencies(self):
+        PerformanceBench.profile_function(
+            target=self.get_xrate_many_currencies,
+            runs=1_000,
+            iterations=1,
+        )
+
+
+class TestExchangeRateGraphPerformanceTests:
+    def setup(self):
+        # Fixture Setup
+        self.graph = ExchangeRateGraph()
+        for symbol, bid in _BID_QUOTES.items():
+            self.graph.update(symbol, bid, _ASK_QUOTES[symbol])
+
+    def get_xrate(self):
+        self.graph.get_rate("AUD", "JPY", PriceType.MID)
+
+    def update_and_get_xrate(self):
+        # Changes a leg on the path, so the cached rate is recalculated
+        self.graph.update("AUD/USD", 0.66000, 0.66010)
+        self.graph.update("AUD/USD", 0.66001, 0.66011)
+        self.graph.get_rate("AUD", "JPY", PriceType.MID)
+
+    def test_get_xrate_many_currencies(self):
+        PerformanceBench.profile_function(
+            target=self.get_xrate,
+            runs=100_000,
+            iterations=1,
+        )
+
+    def test_update_and_get_xrate_many_currencies(self):
+        PerformanceBench.profile_function(
+            target=self.update_and_get_xrate,
+            runs=100_000,
+            iterations=1,
+        )
@@ -20,6 +20,7 @@ import pandas as pd
 import pytest
 
 from nautilus_trader.accounting.calculators import ExchangeRateCalculator
+from nautilus_trader.accounting.calculators import ExchangeRateGraph
 from nautilus_trader.accounting.calculators import RolloverInterestCalculator
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import BTC
@@ -215,6 +216,115 @@ class TestExchangeRateCalculator:
         assert result == 110.115
 
 
+class TestExchangeRateGraph:
+    def test_get_rate_when_from_code_equals_to_code_returns_one(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+
+        # Act
+        result = graph.get_rate("USD", "USD", PriceType.BID)
+
+        # Assert
+        assert result == 1.0
+
+    def test_get_rate_when_no_path_returns_zero(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+        graph.update("EUR/CHF", 0.95000, 0.95010)
+
+        # Act
+        result1 = graph.get_rate("AUD", "CHF", PriceType.BID)
+        result2 = graph.get_rate("JPY", "USD", PriceType.BID)
+
+        # Assert
+        assert result1 == 0.0
+        assert result2 == 0.0
+
+    def test_get_rate_with_last_price_type_raises_value_error(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            graph.get_rate("AUD", "USD", PriceType.LAST)
+
+    @pytest.mark.parametrize(
+        ("from_code", "to_code", "price_type", "expected"),
+        [
+            ["USD", "JPY", PriceType.MID, 110.115],
+            ["JPY", "USD", PriceType.MID, 0.009081414884438995],
+            ["JPY", "AUD", PriceType.BID, 0.011353315168029064],
+            ["AUD", "JPY", PriceType.ASK, 88.11501299999999],
+        ],
+    )
+    def test_get_rate_matches_calculator(self, from_code, to_code, price_type, expected):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", 110.100, 110.130)
+        graph.update("AUD/USD", 0.80000, 0.80010)
+
+        # Act
+        result = graph.get_rate(from_code, to_code, price_type)
+
+        # Assert
+        assert result == expected
+
+    def test_get_rate_with_multiple_hops(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80000)
+        graph.update("USD/JPY", 100.000, 100.000)
+        graph.update("EUR/JPY", 160.000, 160.000)
+
+        # Act
+        result = graph.get_rate("AUD", "EUR", PriceType.MID)
+
+        # Assert
+        assert result == pytest.approx(0.5)
+
+    def test_update_leg_invalidates_dependent_rates(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("USD/JPY", 110.100, 110.130)
+        graph.update("AUD/USD", 0.80000, 0.80010)
+        graph.update("EUR/USD", 1.10000, 1.10010)
+        graph.get_rate("AUD", "JPY", PriceType.BID)
+        eur_jpy = graph.get_rate("EUR", "JPY", PriceType.BID)
+
+        # Act
+        graph.update("AUD/USD", 0.70000, 0.70010)
+
+        # Assert
+        assert graph.get_rate("AUD", "JPY", PriceType.BID) == 0.7 / (1.0 / 110.100)
+        assert graph.get_rate("EUR", "JPY", PriceType.BID) == eur_jpy
+
+    def test_update_with_new_leg_finds_new_paths(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+        assert graph.get_rate("AUD", "JPY", PriceType.BID) == 0.0
+
+        # Act
+        graph.update("USD/JPY", 110.100, 110.130)
+
+        # Assert
+        assert graph.get_rate("AUD", "JPY", PriceType.BID) == 0.8 / (1.0 / 110.100)
+
+    def test_clear_removes_all_rates(self):
+        # Arrange
+        graph = ExchangeRateGraph()
+        graph.update("AUD/USD", 0.80000, 0.80010)
+        graph.get_rate("AUD", "USD", PriceType.BID)
+
+        # Act
+        graph.clear()
+
+        # Assert
+        assert graph.get_rate("AUD", "USD", PriceType.BID) == 0.0
+
+
 class TestRolloverInterestCalculator:
     def setup(self):
         # Fixture Setup
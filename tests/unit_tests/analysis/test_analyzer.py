@@ -15,8 +15,13 @@
 
 from datetime import datetime
 
+import numpy as np
+import pyarrow as pa
+import pytest
+
 from nautilus_trader.analysis.analyzer import PortfolioAnalyzer
 from nautilus_trader.analysis.statistics.sharpe_ratio import SharpeRatio
+from nautilus_trader.analysis.statistics.win_rate import WinRate
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.model.currencies import AUD
@@ -198,3 +203,41 @@ class TestPortfolioAnalyzer:
         assert len(result) == 2
         assert result["P-1"] == 6.0
         assert result["P-2"] == 16.0
+
+    def test_calculate_statistics_batch_with_arrays(self):
+        # Arrange
+        self.analyzer.register_statistic(SharpeRatio())
+        self.analyzer.register_statistic(WinRate())
+        returns = np.array([[0.01, -0.01, 0.02], [0.01, -0.02, np.nan]])
+        realized_pnls = np.array([[10.0, -5.0], [10.0, np.nan]])
+
+        # Act
+        result = self.analyzer.calculate_statistics_batch(returns, realized_pnls)
+
+        # Assert
+        assert list(result.index) == [0, 1]
+        assert list(result.columns) == ["Win Rate", "Sharpe Ratio (252 days)"]
+        assert list(result["Win Rate"]) == [0.5, 1.0]
+        assert result["Sharpe Ratio (252 days)"][0] > 0.0
+        assert result["Sharpe Ratio (252 days)"][1] < 0.0
+
+    def test_calculate_statistics_batch_with_arrow_table(self):
+        # Arrange
+        self.analyzer.register_statistic(WinRate())
+        realized_pnls = pa.table({"run-1": [10.0, -5.0], "run-2": [10.0, None]})
+
+        # Act
+        result = self.analyzer.calculate_statistics_batch(realized_pnls=realized_pnls)
+
+        # Assert
+        assert list(result.index) == ["run-1", "run-2"]
+        assert list(result["Win Rate"]) == [0.5, 1.0]
+
+    def test_calculate_statistics_batch_with_mismatched_runs_raises(self):
+        # Arrange
+        returns = np.zeros((2, 3))
+        realized_pnls = np.zeros((3, 3))
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.analyzer.calculate_statistics_batch(returns, realized_pnls)
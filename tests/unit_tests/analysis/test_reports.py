@@ -345,5 +345,5 @@ class TestReportProvider:
         assert report.iloc[0]["avg_px_open"] == "1.0001"
         assert report.iloc[0]["avg_px_close"] == "1.0001"
         assert report.iloc[0]["ts_opened"] == UNIX_EPOCH
-        assert pd.isna(report.iloc[0]["ts_closed"])
+        assert report.iloc[0]["ts_closed"] is pd.NA
         assert report.iloc[0]["realized_return"] == "0.0"
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.analysis.statistic import PortfolioStatistic
 
 
@@ -33,3 +35,16 @@ class TestPortfolioStatistic:
 
         # Assert
         assert result == "Portfolio Statistic"
+
+    def test_calculate_batch_when_not_implemented_returns_none(self):
+        # Arrange
+        stat = PortfolioStatistic()
+        values = np.array([[0.01, -0.02, np.nan], [0.03, 0.01, 0.02]])
+
+        # Act
+        result_returns = stat.calculate_from_returns_batch(values)
+        result_realized_pnls = stat.calculate_from_realized_pnls_batch(values)
+
+        # Assert
+        assert result_returns is None
+        assert result_realized_pnls is None
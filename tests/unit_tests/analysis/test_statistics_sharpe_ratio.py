@@ -15,6 +15,7 @@
 
 import math
 
+import numpy as np
 import pandas as pd
 from numpy import float64
 from numpy import linspace
@@ -87,3 +88,25 @@ class TestSharpeRatioPortfolioStatistic:
         # Assert
         assert result
         assert math.isclose(result, 27.6097808756245, rel_tol=1e-9)
+
+    def test_calculate_batch_matches_calculate_per_run(self):
+        # Arrange
+        index = pd.date_range("1/1/2000", periods=10, freq="1D")
+        data = pd.Series(linspace(0.1, 1, 10), index=index, dtype=float64)
+        returns = np.array(
+            [
+                linspace(0.1, 1, 10),
+                [1.0, -1.0] + [nan] * 8,
+                [nan] * 10,
+            ],
+        )
+
+        stat = SharpeRatio()
+
+        # Act
+        result = stat.calculate_from_returns_batch(returns)
+
+        # Assert
+        assert math.isclose(result[0], stat.calculate_from_returns(data), rel_tol=1e-9)
+        assert result[1] == 0.0
+        assert pd.isna(result[2])
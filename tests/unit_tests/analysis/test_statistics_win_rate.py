@@ -13,8 +13,10 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
 import pandas as pd
 from numpy import float64
+from numpy import nan
 
 from nautilus_trader.analysis.statistics.win_rate import WinRate
 
@@ -62,3 +64,20 @@ class TestWinRatePortfolioStatistic:
 
         # Assert
         assert result == 0.6
+
+    def test_calculate_batch_with_padded_runs_returns_expected(self):
+        # Arrange
+        stat = WinRate()
+        data = np.array(
+            [
+                [2.0, 2.0, 1.0, -1.0, -2.0],
+                [1.0, -1.0, nan, nan, nan],
+                [nan, nan, nan, nan, nan],
+            ],
+        )
+
+        # Act
+        result = stat.calculate_from_realized_pnls_batch(data)
+
+        # Assert
+        assert list(result) == [0.6, 0.5, 0.0]
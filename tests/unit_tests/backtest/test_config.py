@@ -31,6 +31,7 @@ from nautilus_trader.config import ImportableActorConfig
 from nautilus_trader.config.common import NautilusConfig
 from nautilus_trader.config.common import msgspec_encoding_hook
 from nautilus_trader.config.common import tokenize_config
+from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import QuoteTick
@@ -44,6 +45,7 @@ from nautilus_trader.test_kit.mocks.data import data_catalog_setup
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.config import TestConfigStubs
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.test_kit.stubs.persistence import TestPersistenceStubs
 
 
@@ -135,6 +137,26 @@ class TestBacktestConfig:
         # Assert
         assert len(result.data) == 2745
 
+    def test_backtest_data_config_bars(self):
+        # Arrange
+        bar = TestDataStubs.bar_5decimal()
+        self.catalog.write_data([bar])
+
+        config = BacktestDataConfig(
+            catalog_path=self.catalog.path,
+            catalog_fs_protocol=str(self.catalog.fs.protocol),
+            data_cls=Bar,
+            instrument_id=self.instrument.id,
+            bar_spec="1-MINUTE-BID",
+        )
+
+        # Act
+        result = BacktestNode.load_data_config(config)
+
+        # Assert
+        assert result.data == [bar]
+        assert result.instrument == self.instrument
+
     def test_backtest_data_config_status_updates(self):
         # Arrange
         from tests.integration_tests.adapters.betfair.test_kit import load_betfair_data
@@ -0,0 +1,222 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import os
+
+import pytest
+
+from nautilus_trader import PACKAGE_ROOT
+from nautilus_trader.backtest.data_stream import ArrowDataSource
+from nautilus_trader.backtest.data_stream import ArrowDataStream
+from nautilus_trader.backtest.data_stream import CapsuleDataStream
+from nautilus_trader.core.nautilus_pyo3 import DataBackendSession
+from nautilus_trader.core.nautilus_pyo3 import NautilusDataType
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.data import capsule_to_list
+from nautilus_trader.persistence.wranglers import BarDataWrangler
+from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+ETHUSDT_BINANCE = TestInstrumentProvider.ethusdt_binance()
+USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+class TestArrowDataSource:
+    def setup(self):
+        provider = TestDataProvider()
+        self.quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )[:10_000]
+        self.trades = TradeTickDataWrangler(ETHUSDT_BINANCE).process(
+            provider.read_csv_ticks("binance/ethusdt-trades.csv"),
+        )[:10_000]
+
+    def test_quote_tick_source_yields_equal_objects(self):
+        # Arrange
+        table = ArrowSerializer.serialize_batch(self.quotes, data_cls=QuoteTick)
+
+        # Act
+        source = ArrowDataSource(QuoteTick, table)
+
+        # Assert
+        assert source.instrument_id == AUDUSD_SIM.id
+        assert source.size == len(self.quotes)
+        assert source.ts_first == self.quotes[0].ts_init
+        assert source.ts_last == self.quotes[-1].ts_init
+        assert list(source) == self.quotes
+
+    def test_trade_tick_source_across_batches_yields_equal_objects(self):
+        # Arrange
+        table = ArrowSerializer.serialize_batch(self.trades, data_cls=TradeTick)
+
+        # Act
+        source = ArrowDataSource(TradeTick, table.to_batches(max_chunksize=1_000))
+
+        # Assert
+        assert list(source) == self.trades
+
+    def test_bar_source_yields_equal_objects(self):
+        # Arrange
+        bar_type = BarType.from_str("USD/JPY.SIM-1-MINUTE-BID-EXTERNAL")
+        bars = BarDataWrangler(bar_type, USDJPY_SIM).process(
+            TestDataProvider().read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv")[:1_000],
+        )
+        table = ArrowSerializer.serialize_batch(bars, data_cls=Bar)
+
+        # Act
+        source = ArrowDataSource(Bar, table)
+
+        # Assert
+        assert source.bar_type == bar_type
+        assert source.instrument_id == USDJPY_SIM.id
+        assert list(source) == bars
+
+    def test_reset_returns_to_first_element(self):
+        # Arrange
+        table = ArrowSerializer.serialize_batch(self.quotes, data_cls=QuoteTick)
+        source = ArrowDataSource(QuoteTick, table)
+        list(source)
+
+        # Act
+        source.reset()
+
+        # Assert
+        assert next(source) == self.quotes[0]
+
+    def test_unsorted_data_raises_value_error(self):
+        # Arrange
+        table = ArrowSerializer.serialize_batch(self.quotes, data_cls=QuoteTick)
+        batches = table.to_batches(max_chunksize=1_000)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            ArrowDataSource(QuoteTick, list(reversed(batches)))
+
+
+class TestArrowDataStream:
+    def test_stream_merges_sources_by_ts_init(self):
+        # Arrange
+        provider = TestDataProvider()
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )[:10_000]
+        trades = TradeTickDataWrangler(ETHUSDT_BINANCE).process(
+            provider.read_csv_ticks("binance/ethusdt-trades.csv"),
+        )[:10_000]
+
+        # Act
+        stream = ArrowDataStream(
+            [
+                ArrowDataSource(
+                    QuoteTick,
+                    ArrowSerializer.serialize_batch(quotes, data_cls=QuoteTick),
+                ),
+                ArrowDataSource(
+                    TradeTick,
+                    ArrowSerializer.serialize_batch(trades, data_cls=TradeTick),
+                ),
+            ],
+        )
+
+        # Assert
+        assert stream.size == 20_000
+        assert list(stream) == sorted(quotes + trades, key=lambda x: x.ts_init)
+
+    def test_clear_removes_all_sources(self):
+        # Arrange
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            TestDataProvider().read_csv_ticks("truefx/audusd-ticks.csv"),
+        )[:100]
+        stream = ArrowDataStream(
+            [ArrowDataSource(QuoteTick, ArrowSerializer.serialize_batch(quotes, QuoteTick))],
+        )
+
+        # Act
+        stream.clear()
+
+        # Assert
+        assert stream.size == 0
+        assert stream.ts_first is None
+        assert list(stream) == []
+
+
+class TestCapsuleDataStream:
+    def setup(self):
+        self.path = os.path.join(PACKAGE_ROOT, "tests/test_data/quote_tick_data.parquet")
+        self.sessions = []  # Sessions must outlive their query results
+
+    def _query_result(self):
+        session = DataBackendSession(chunk_size=1_000)
+        session.add_file(NautilusDataType.QuoteTick, "quote_ticks", self.path)
+        self.sessions.append(session)
+        return session.to_query_result()
+
+    def test_stream_yields_equal_objects_across_chunks(self):
+        # Arrange
+        expected = []
+        for chunk in self._query_result():
+            expected.extend(capsule_to_list(chunk))
+
+        # Act
+        stream = CapsuleDataStream(self._query_result())
+        result = list(stream)
+
+        # Assert
+        assert len(result) == 9500
+        assert result == expected
+        assert stream.count == 9500
+        assert stream.ts_first is None
+
+    def test_ts_first_returns_next_element_timestamp(self):
+        # Arrange
+        query_result = self._query_result()
+        chunk = next(query_result)
+        first = capsule_to_list(chunk)[0]
+
+        # Act
+        stream = CapsuleDataStream(self._query_result())
+
+        # Assert
+        assert stream.ts_first == first.ts_init
+        assert stream.count == 0
+
+    def test_chunks_remain_valid_after_next_chunk_and_query_result_dropped(self):
+        # Arrange
+        query_result = self._query_result()
+        first_chunk = next(query_result)
+        expected = capsule_to_list(first_chunk)
+
+        # Act
+        next(query_result)
+        del query_result
+
+        # Assert
+        assert capsule_to_list(first_chunk) == expected
+
+    def test_empty_iterator_yields_no_elements(self):
+        # Arrange, Act
+        stream = CapsuleDataStream([])
+
+        # Assert
+        assert stream.ts_first is None
+        assert list(stream) == []
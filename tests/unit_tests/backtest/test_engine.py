@@ -44,6 +44,7 @@ from nautilus_trader.model.data import GenericData
 from nautilus_trader.model.data import InstrumentStatus
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType
 from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import BarAggregation
@@ -62,6 +63,7 @@ from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.persistence.wranglers import TradeTickDataWrangler
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.component import TestComponentStubs
@@ -362,17 +364,23 @@ class TestBacktestEngineData:
             fill_model=FillModel(),
         )
 
-    def test_add_pyo3_data_raises_type_error(self) -> None:
+    def test_add_pyo3_data_converts_and_adds_to_engine(self) -> None:
         # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+
         path = TEST_DATA_DIR / "truefx" / "audusd-ticks.csv"
         df = pd.read_csv(path)
 
         wrangler = wranglers_v2.QuoteTickDataWrangler.from_instrument(AUDUSD_SIM)
         ticks = wrangler.from_pandas(df)
 
-        # Act, Assert
-        with pytest.raises(TypeError):
-            self.engine.add_data(ticks)
+        # Act
+        self.engine.add_data(ticks)
+
+        # Assert
+        assert len(self.engine.data) == len(ticks)
+        assert isinstance(self.engine.data[0], QuoteTick)
+        assert self.engine.data[0].instrument_id == AUDUSD_SIM.id
 
     def test_add_generic_data_adds_to_engine(self):
         # Arrange
@@ -568,6 +576,80 @@ class TestBacktestEngineData:
         # Assert
         assert len(self.engine.data) == 69806
 
+    def test_add_data_multiple_batches_merges_sorted_stream(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        self.engine.add_instrument(ETHUSDT_BINANCE)
+        provider = TestDataProvider()
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )
+        trades = TradeTickDataWrangler(ETHUSDT_BINANCE).process(
+            provider.read_csv_ticks("binance/ethusdt-trades.csv"),
+        )
+
+        # Act
+        self.engine.add_data(trades)
+        self.engine.add_data(quotes[50_000:])
+        self.engine.add_data(quotes[:50_000])
+
+        # Assert
+        data = self.engine.data
+        assert len(data) == 169806
+        assert data == sorted(trades + quotes, key=lambda x: x.ts_init)
+
+    def test_add_data_without_sort_appends_to_sorted_stream(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        provider = TestDataProvider()
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )
+
+        # Act
+        self.engine.add_data(quotes[50_000:])
+        self.engine.add_data(quotes[:50_000])
+        self.engine.add_data(quotes[:10], sort=False)
+
+        # Assert
+        data = self.engine.data
+        assert data[:100_000] == quotes
+        assert data[100_000:] == quotes[:10]
+
+    def test_add_arrow_data_runs_columnar_source_with_data(self):
+        # Arrange
+        self.engine.add_instrument(AUDUSD_SIM)
+        self.engine.add_instrument(ETHUSDT_BINANCE)
+        provider = TestDataProvider()
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            provider.read_csv_ticks("truefx/audusd-ticks.csv"),
+        )
+        trades = TradeTickDataWrangler(ETHUSDT_BINANCE).process(
+            provider.read_csv_ticks("binance/ethusdt-trades.csv"),
+        )
+        table = ArrowSerializer.serialize_batch(quotes, data_cls=QuoteTick)
+
+        # Act
+        self.engine.add_arrow_data(table, data_cls=QuoteTick)
+        self.engine.add_data(trades)
+        self.engine.run()
+
+        # Assert
+        assert len(self.engine.data) == 69806  # Columnar data not materialized
+        assert self.engine.iteration == 169806
+        assert self.engine.cache.quote_tick(AUDUSD_SIM.id) == quotes[-1]
+
+    def test_add_arrow_data_when_instrument_not_in_cache_raises_value_error(self):
+        # Arrange
+        quotes = QuoteTickDataWrangler(AUDUSD_SIM).process(
+            TestDataProvider().read_csv_ticks("truefx/audusd-ticks.csv"),
+        )[:100]
+        table = ArrowSerializer.serialize_batch(quotes, data_cls=QuoteTick)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.add_arrow_data(table, data_cls=QuoteTick)
+
     def test_add_bars_adds_to_engine(self):
         # Arrange
         bar_spec = BarSpecification(
@@ -28,6 +28,7 @@ from nautilus_trader.config import LoggingConfig
 from nautilus_trader.model.data import BarType
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.persistence.catalog.shared import SharedDataStore
 from nautilus_trader.persistence.funcs import parse_bytes
 from nautilus_trader.test_kit.mocks.data import aud_usd_data_loader
 from nautilus_trader.test_kit.mocks.data import data_catalog_setup
@@ -92,6 +93,64 @@ class TestBacktestNode:
         # Assert
         assert len(results) == 1
 
+    def test_run_with_max_workers(self):
+        # Arrange
+        configs = [
+            *self.backtest_configs,
+            BacktestRunConfig(
+                engine=BacktestEngineConfig(
+                    strategies=self.strategies,
+                    logging=LoggingConfig(bypass_logging=True),
+                ),
+                venues=[self.venue_config],
+                data=[self.data_config],
+            ),
+        ]
+        node = BacktestNode(configs=configs)
+
+        # Act
+        results = node.run(max_workers=2)
+
+        # Assert
+        assert len(results) == 2
+        assert [r.run_config_id for r in results] == [c.id for c in configs]
+        assert node.get_engines() == []  # Engines live in the worker processes
+
+    def test_run_with_max_workers_and_shared_data(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs * 2)
+        expected = BacktestNode(configs=self.backtest_configs).run()
+
+        # Act
+        results = node.run(max_workers=2, shared_data=True)
+
+        # Assert
+        assert len(results) == 2
+        assert results[0].iterations == expected[0].iterations
+        assert results[0].total_orders == expected[0].total_orders
+
+    def test_load_shared_data_config_returns_undecoded_table(self, tmp_path):
+        # Arrange
+        store = SharedDataStore(tmp_path)
+        store.put(self.data_config.id, BacktestNode.load_data_table(self.data_config))
+
+        # Act
+        result = BacktestNode.load_shared_data_config(self.data_config, store)
+
+        # Assert
+        assert result.data == []
+        assert result.table is not None
+        assert result.table.num_rows > 0
+        assert result.instrument is not None
+
+    def test_run_with_invalid_max_workers_raises_value_error(self):
+        # Arrange
+        node = BacktestNode(configs=self.backtest_configs)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            node.run(max_workers=0)
+
     @pytest.mark.skip(reason="Aborting on macOS?")
     def test_backtest_run_batch_sync(self):
         # Arrange
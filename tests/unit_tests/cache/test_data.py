@@ -556,6 +556,40 @@ class TestCache:
         # Assert
         assert result == 0.80005
 
+    def test_get_xrate_updates_with_latest_quote(self):
+        # Arrange
+        self.cache.add_instrument(AUDUSD_SIM)
+
+        tick1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80000"),
+            ask_price=Price.from_str("0.80010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        tick2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.70000"),
+            ask_price=Price.from_str("0.70010"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        self.cache.add_quote_tick(tick1)
+        self.cache.get_xrate(SIM, AUD, USD)
+
+        # Act
+        self.cache.add_quote_tick(tick2)
+        result = self.cache.get_xrate(SIM, AUD, USD)
+
+        # Assert
+        assert result == 0.70005
+
     def test_get_xrate_fallbacks_to_bars_if_no_quotes_returns_correct_rate(self):
         # Arrange
         self.cache.reset()
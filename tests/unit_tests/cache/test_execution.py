@@ -22,7 +22,9 @@ from nautilus_trader.backtest.engine import BacktestEngineConfig
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.clock import TestClock
 from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.factories import OrderFactory
 from nautilus_trader.common.logging import Logger
+from nautilus_trader.config import CacheConfig
 from nautilus_trader.config import LoggingConfig
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.examples.strategies.ema_cross import EMACross
@@ -52,6 +54,7 @@ from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.portfolio.portfolio import Portfolio
 from nautilus_trader.risk.engine import RiskEngine
 from nautilus_trader.test_kit.mocks.actors import MockActor
+from nautilus_trader.test_kit.mocks.cache_database import MockCacheDatabase
 from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
@@ -1317,6 +1320,259 @@ class TestCache:
         assert True  # No exception raised
 
 
+class TestCacheWarmStart:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(self.clock, bypass=True)
+
+        self.database = MockCacheDatabase(logger=self.logger)
+        self.cache = Cache(
+            database=self.database,
+            logger=self.logger,
+            config=CacheConfig(warm_start=True),
+        )
+
+        self.open_order = TestExecStubs.make_accepted_order(
+            instrument_id=AUDUSD_SIM.id,
+            client_order_id=ClientOrderId("O-1"),
+        )
+        self.closed_order = TestExecStubs.make_filled_order(
+            instrument=AUDUSD_SIM,
+            client_order_id=ClientOrderId("O-2"),
+        )
+        self.database.add_order(self.open_order)
+        self.database.add_order(self.closed_order)
+
+    def add_positions(self) -> tuple[Position, Position]:
+        open_fill = TestEventStubs.order_filled(
+            TestExecStubs.make_accepted_order(
+                instrument_id=AUDUSD_SIM.id,
+                client_order_id=ClientOrderId("O-3"),
+            ),
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-1"),
+        )
+        open_position = Position(instrument=AUDUSD_SIM, fill=open_fill)
+
+        closed_fill = TestEventStubs.order_filled(
+            self.closed_order,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-2"),
+        )
+        closed_position = Position(instrument=AUDUSD_SIM, fill=closed_fill)
+        close_order = TestExecStubs.make_accepted_order(
+            instrument_id=AUDUSD_SIM.id,
+            order_side=OrderSide.SELL,
+            client_order_id=ClientOrderId("O-4"),
+        )
+        closed_position.apply(
+            TestEventStubs.order_filled(
+                close_order,
+                instrument=AUDUSD_SIM,
+                position_id=PositionId("P-2"),
+                trade_id=TradeId("2"),
+            ),
+        )
+
+        self.database.add_order(close_order)
+        self.database.add_position(open_position)
+        self.database.add_position(closed_position)
+
+        return open_position, closed_position
+
+    def test_cache_orders_loads_only_open_orders(self):
+        # Arrange, Act
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Assert
+        assert self.cache.warm_start
+        assert self.cache.orders_open() == [self.open_order]
+        assert self.cache.orders_open_count() == 1
+        assert self.cache.order_exists(self.closed_order.client_order_id)
+        assert self.cache.is_order_closed(self.closed_order.client_order_id)
+
+    def test_orders_includes_unloaded_orders(self):
+        # Arrange
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Act
+        orders = self.cache.orders()
+
+        # Assert
+        assert orders == [self.open_order, self.closed_order]
+        assert self.cache.check_integrity()
+
+    def test_orders_closed_includes_unloaded_orders(self):
+        # Arrange
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Act
+        orders = self.cache.orders_closed(instrument_id=AUDUSD_SIM.id)
+
+        # Assert
+        assert orders == [self.closed_order]
+
+    def test_order_counts_include_unloaded_orders(self):
+        # Arrange
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Act, Assert
+        assert self.cache.orders_closed_count() == 1
+        assert self.cache.orders_total_count() == 2
+        assert self.cache.client_order_ids() == {
+            self.open_order.client_order_id,
+            self.closed_order.client_order_id,
+        }
+
+    def test_order_when_unloaded_loads_from_database(self):
+        # Arrange
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Act
+        order = self.cache.order(self.closed_order.client_order_id)
+
+        # Assert
+        assert order == self.closed_order
+        assert self.cache.orders_closed() == [self.closed_order]
+        assert self.cache.check_integrity()
+
+    def test_check_integrity_with_indexed_unloaded_orders_passes(self):
+        # Arrange
+        self.database.index_order_position(
+            self.closed_order.client_order_id,
+            PositionId("P-1"),
+        )
+
+        # Act
+        self.cache.cache_orders()
+        self.cache.build_index()
+
+        # Assert
+        assert self.cache.orders() == [self.open_order]
+        assert self.cache.position_id(self.closed_order.client_order_id) == PositionId("P-1")
+        assert self.cache.check_integrity()
+
+    def test_cache_order_lists_loads_unloaded_members(self):
+        # Arrange
+        order_factory = OrderFactory(
+            trader_id=TestIdStubs.trader_id(),
+            strategy_id=StrategyId("S-001"),
+            clock=self.clock,
+        )
+        bracket = order_factory.bracket(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            sl_trigger_price=Price.from_str("0.99990"),
+            tp_price=Price.from_str("1.00010"),
+        )
+        entry, stop_loss, take_profit = bracket.orders
+        TestExecStubs.make_accepted_order(order=entry)
+        entry.apply(TestEventStubs.order_filled(entry, instrument=AUDUSD_SIM))
+        TestExecStubs.make_accepted_order(order=stop_loss)
+        TestExecStubs.make_accepted_order(order=take_profit)
+        for order in bracket.orders:
+            self.database.add_order(order)
+
+        # Act
+        self.cache.cache_orders()
+        self.cache.cache_order_lists()
+        self.cache.build_index()
+
+        # Assert
+        order_list = self.cache.order_list(bracket.id)
+        assert order_list is not None
+        assert {o.client_order_id for o in order_list.orders} == {
+            o.client_order_id for o in bracket.orders
+        }
+        assert self.cache.order(entry.client_order_id) == entry
+        assert self.cache.check_integrity()
+
+    def test_cache_positions_loads_only_open_positions(self):
+        # Arrange
+        open_position, closed_position = self.add_positions()
+
+        # Act
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Assert
+        assert self.cache.positions_open() == [open_position]
+        assert self.cache.position_exists(closed_position.id)
+        assert self.cache.is_position_closed(closed_position.id)
+        assert self.cache.position(closed_position.id) == closed_position
+        assert self.cache.positions_closed() == [closed_position]
+
+    def test_positions_includes_unloaded_positions(self):
+        # Arrange
+        open_position, closed_position = self.add_positions()
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Act
+        positions = self.cache.positions()
+
+        # Assert
+        assert positions == [open_position, closed_position]
+
+    def test_positions_closed_includes_unloaded_positions(self):
+        # Arrange
+        _, closed_position = self.add_positions()
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Act
+        positions = self.cache.positions_closed(instrument_id=AUDUSD_SIM.id)
+
+        # Assert
+        assert positions == [closed_position]
+        assert positions[0].realized_pnl == closed_position.realized_pnl
+
+    def test_position_counts_include_unloaded_positions(self):
+        # Arrange
+        self.add_positions()
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Act, Assert
+        assert self.cache.positions_closed_count() == 1
+        assert self.cache.positions_total_count() == 2
+        assert self.cache.position_ids() == {PositionId("P-1"), PositionId("P-2")}
+
+    def test_orders_for_position_when_position_unloaded_loads_orders(self):
+        # Arrange
+        _, closed_position = self.add_positions()
+        self.cache.cache_orders()
+        self.cache.cache_positions()
+        self.cache.build_index()
+
+        # Act
+        orders = self.cache.orders_for_position(closed_position.id)
+
+        # Assert
+        assert [o.client_order_id for o in orders] == [
+            self.closed_order.client_order_id,
+            ClientOrderId("O-4"),
+        ]
+
+    def test_reset_clears_unloaded_objects(self):
+        # Arrange
+        self.cache.cache_orders()
+
+        # Act
+        self.cache.reset()
+
+        # Assert
+        assert not self.cache.order_exists(self.closed_order.client_order_id)
+        assert self.cache.order(self.closed_order.client_order_id) is None
+
+
 class TestExecutionCacheIntegrityCheck:
     def setup(self):
         # Fixture Setup
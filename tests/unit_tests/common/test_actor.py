@@ -33,6 +33,7 @@ from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.data.engine import DataEngine
 from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.execution.engine import ExecutionEngine
+from nautilus_trader.indicators.rsi import RelativeStrengthIndex
 from nautilus_trader.model.currencies import EUR
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar
@@ -1351,6 +1352,32 @@ class TestActor:
         # Assert
         assert result == bars
 
+    def test_handle_bars_updates_registered_indicators_in_batch(self) -> None:
+        # Arrange
+        actor = Actor(config=ActorConfig(component_id=self.component_id))
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        bars = [TestDataStubs.bar_5decimal()] * 20
+        indicator = RelativeStrengthIndex(10)
+        sequential = RelativeStrengthIndex(10)
+        for bar in bars:
+            sequential.handle_bar(bar)
+
+        actor.register_indicator_for_bars(bars[0].bar_type, indicator)
+
+        # Act
+        actor.handle_bars(bars)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized
+
     def test_handle_data_when_not_running_does_not_send_to_on_data(self) -> None:
         # Arrange
         actor = MockActor()
@@ -1739,6 +1766,44 @@ class TestActor:
         # Assert
         assert self.data_engine.command_count == 2
 
+    def test_subscribe_order_book_diffs(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        # Act
+        actor.subscribe_order_book_diffs(AUDUSD_SIM.id, book_type=BookType.L2_MBP)
+
+        # Assert
+        assert self.data_engine.command_count == 1
+        assert self.msgbus.has_subscribers("data.book.diffs.SIM.AUD/USD.1000")
+
+    def test_unsubscribe_order_book_diffs(self) -> None:
+        # Arrange
+        actor = MockActor()
+        actor.register_base(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        actor.subscribe_order_book_diffs(AUDUSD_SIM.id, book_type=BookType.L2_MBP)
+
+        # Act
+        actor.unsubscribe_order_book_diffs(AUDUSD_SIM.id)
+
+        # Assert
+        assert self.data_engine.command_count == 2
+        assert not self.msgbus.has_subscribers("data.book.diffs.SIM.AUD/USD.1000")
+
     def test_subscribe_order_book_data(self) -> None:
         # Arrange
         actor = MockActor()
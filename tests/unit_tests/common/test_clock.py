@@ -1087,3 +1087,60 @@ class TestLiveClockWithLoopTimer:
 
         # Assert
         assert len(self.handler) >= 2
+
+    @pytest.mark.asyncio()
+    async def test_set_many_time_alerts_dispatches_in_time_order(self):
+        # Arrange
+        now = self.clock.utc_now()
+
+        # Act
+        for i in range(1_000):
+            alert_time = now + timedelta(milliseconds=100 + (999 - i) % 100)
+            self.clock.set_time_alert(f"TEST_ALERT{i}", alert_time)
+
+        await asyncio.sleep(0.5)
+
+        # Assert
+        assert self.clock.timer_count == 0
+        assert len(self.handler) == 1_000
+        ts_events = [event.ts_event for event in self.handler]
+        assert ts_events == sorted(ts_events)
+
+    @pytest.mark.asyncio()
+    async def test_cancel_many_timers_before_due(self):
+        # Arrange
+        interval = timedelta(milliseconds=200)
+        for i in range(1_000):
+            self.clock.set_timer(f"TEST_TIMER{i}", interval)
+
+        # Act
+        for i in range(0, 1_000, 2):
+            self.clock.cancel_timer(f"TEST_TIMER{i}")
+
+        await asyncio.sleep(0.3)
+
+        # Assert
+        assert self.clock.timer_count == 500
+        assert len(self.handler) == 500
+        assert {event.name for event in self.handler} == set(self.clock.timer_names)
+
+    @pytest.mark.asyncio()
+    async def test_cancel_timer_from_handler_of_another_due_timer(self):
+        # Arrange
+        alert_time = self.clock.utc_now() + timedelta(milliseconds=100)
+        events = []
+
+        def cancel_other(event):
+            events.append(event)
+            self.clock.cancel_timer("TEST_ALERT2")
+
+        self.clock.set_time_alert("TEST_ALERT1", alert_time, callback=cancel_other)
+        self.clock.set_time_alert("TEST_ALERT2", alert_time)
+
+        # Act
+        await asyncio.sleep(0.3)
+
+        # Assert
+        assert len(events) == 1
+        assert len(self.handler) == 0
+        assert self.clock.timer_count == 0
@@ -32,9 +32,11 @@ from nautilus_trader.data.messages import DataResponse
 from nautilus_trader.data.messages import Subscribe
 from nautilus_trader.data.messages import Unsubscribe
 from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.book import OrderBookDiff
 from nautilus_trader.model.data import Bar
 from nautilus_trader.model.data import BarSpecification
 from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import DataType
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
@@ -43,6 +45,7 @@ from nautilus_trader.model.data import Ticker
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import BarAggregation
 from nautilus_trader.model.enums import BookType
+from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
@@ -548,6 +551,26 @@ class TestDataEngine:
         # Assert
         assert self.data_engine.data_count == 4
 
+    def test_process_batch_processes_all_data(self):
+        # Arrange
+        tick = TestDataStubs.trade_tick()
+
+        # Act
+        self.data_engine.process_batch([tick, tick, tick])
+
+        # Assert
+        assert self.data_engine.data_count == 6
+
+    def test_process_batch_via_endpoint_processes_all_data(self):
+        # Arrange
+        tick = TestDataStubs.trade_tick()
+
+        # Act
+        self.msgbus.send(endpoint="DataEngine.process_batch", msg=[tick, tick])
+
+        # Assert
+        assert self.data_engine.data_count == 5
+
     def test_execute_subscribe_instruments_then_adds_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
@@ -1037,6 +1060,124 @@ class TestDataEngine:
         # Assert
         assert isinstance(handler[0], OrderBook)
 
+    def test_process_order_book_diffs_publishes_checkpoint_then_changed_levels(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        handler = []
+        self.msgbus.subscribe(
+            topic="data.book.diffs.BINANCE.ETHUSDT.1000",
+            handler=handler.append,
+        )
+
+        subscribe = Subscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=DataType(
+                OrderBookDiff,
+                {
+                    "instrument_id": ETHUSDT_BINANCE.id,
+                    "book_type": BookType.L2_MBP,
+                    "depth": 0,
+                    "interval_ms": 1000,
+                    "checkpoint_interval": 100,
+                },
+            ),
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+
+        snapshot = TestDataStubs.order_book_snapshot(ETHUSDT_BINANCE.id, ts_event=1)
+        update = TestDataStubs.order_book_delta(
+            ETHUSDT_BINANCE.id,
+            order=BookOrder(OrderSide.BUY, Price(10.0, 2), Quantity(5.0, 2), 0),
+            ts_event=2,
+        )
+
+        # Act
+        self.data_engine.process(snapshot)
+        for event in self.clock.advance_time(2_000_000_000):
+            event.handle()
+
+        self.data_engine.process(update)
+        for event in self.clock.advance_time(3_000_000_000):
+            event.handle()
+
+        # Assert
+        assert len(handler) == 2
+        assert handler[0].is_checkpoint
+        assert handler[0].sequence == 1
+        assert len(handler[0].bids) == 3
+        assert len(handler[0].asks) == 3
+        assert not handler[1].is_checkpoint
+        assert handler[1].sequence == 2
+        assert handler[1].bids == [(10.0, 5.0)]
+        assert handler[1].asks == []
+
+    def test_unsubscribe_order_book_diffs_cancels_timer(self):
+        # Arrange
+        self.data_engine.register_client(self.binance_client)
+        self.binance_client.start()
+
+        self.data_engine.process(ETHUSDT_BINANCE)  # <-- add necessary instrument for test
+
+        handler = []
+        self.msgbus.subscribe(
+            topic="data.book.diffs.BINANCE.ETHUSDT.1000",
+            handler=handler.append,
+        )
+
+        subscribe = Subscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=DataType(
+                OrderBookDiff,
+                {
+                    "instrument_id": ETHUSDT_BINANCE.id,
+                    "book_type": BookType.L2_MBP,
+                    "depth": 0,
+                    "interval_ms": 1000,
+                    "checkpoint_interval": 100,
+                },
+            ),
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        self.data_engine.execute(subscribe)
+        self.msgbus.unsubscribe(
+            topic="data.book.diffs.BINANCE.ETHUSDT.1000",
+            handler=handler.append,
+        )
+
+        unsubscribe = Unsubscribe(
+            client_id=ClientId(BINANCE.value),
+            venue=BINANCE,
+            data_type=DataType(
+                OrderBookDiff,
+                {
+                    "instrument_id": ETHUSDT_BINANCE.id,
+                    "interval_ms": 1000,
+                },
+            ),
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.data_engine.execute(unsubscribe)
+
+        # Assert
+        assert self.data_engine._order_book_differs == {}
+        assert "OrderBookDiff-ETHUSDT.BINANCE-1000" not in self.clock.timer_names
+        assert ETHUSDT_BINANCE.id not in self.binance_client.subscribed_order_book_deltas()
+        assert not self.msgbus.has_subscribers("data.book.deltas.BINANCE.ETHUSDT")
+
     def test_process_order_book_deltas_then_sends_to_registered_handler(self):
         # Arrange
         self.data_engine.register_client(self.binance_client)
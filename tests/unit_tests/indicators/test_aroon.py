@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.aroon import AroonOscillator
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -97,6 +99,28 @@ class TestAroonOscillator:
         assert self.aroon.aroon_down == 19.999999999999996
         assert self.aroon.value == -9.999999999999998
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        closes = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        highs = closes + 0.1
+        lows = closes - 0.1
+        indicator = AroonOscillator(10)
+        sequential = AroonOscillator(10)
+        for high, low in zip(highs, lows):
+            sequential.update_raw(high, low)
+
+        # Act
+        outputs = indicator.update_raw_batch(highs, lows, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized == sequential.initialized
+        assert list(outputs[-1]) == [
+            sequential.aroon_up,
+            sequential.aroon_down,
+            sequential.value,
+        ]
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -15,6 +15,7 @@
 
 import sys
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.atr import AverageTrueRange
@@ -160,6 +161,31 @@ class TestAverageTrueRange:
         # Act, Assert
         assert floored_atr.value == 5e-05
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        closes = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        highs = closes + 0.1
+        lows = closes - 0.1
+        indicator = AverageTrueRange(10)
+        sequential = AverageTrueRange(10)
+        for high, low, close in zip(highs, lows, closes):
+            sequential.update_raw(high, low, close)
+
+        # Act
+        outputs = indicator.update_raw_batch(highs, lows, closes, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert outputs[-1] == sequential.value
+
+    def test_update_raw_batch_with_unequal_lengths_raises_value_error(self):
+        # Arrange
+        values = np.ones(10)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.atr.update_raw_batch(values, values[:5], values)
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
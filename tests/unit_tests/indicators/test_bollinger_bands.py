@@ -126,6 +126,23 @@ class TestBollingerBands:
         assert indicator.middle == 1.0001900000000001
         assert indicator.lower == 1.0000644493609618
 
+    def test_handle_bars_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        indicator = BollingerBands(5, 2.0)
+        sequential = BollingerBands(5, 2.0)
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_3decimal()] * 5
+        for bar in bars:
+            sequential.handle_bar(bar)
+
+        # Act
+        indicator.handle_bars(bars)
+
+        # Assert
+        assert indicator.initialized
+        assert indicator.upper == sequential.upper
+        assert indicator.middle == sequential.middle
+        assert indicator.lower == sequential.lower
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         indicator = BollingerBands(5, 2.0)
@@ -118,6 +118,17 @@ class TestDonchianChannel:
         assert self.dc.middle == 1.00020
         assert self.dc.lower == 1.00000
 
+    def test_value_after_window_slides_drops_expired_extremes(self):
+        # Arrange
+        for i in range(25):
+            self.dc.update_raw(1.00000 + i * 0.00010, 1.00000 - i * 0.00010)
+        for i in range(10):
+            self.dc.update_raw(1.00020, 0.99980)
+
+        # Act, Assert
+        assert self.dc.upper == 1.00020
+        assert self.dc.lower == 0.99980
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         self.dc.update_raw(1.00020, 1.00000)
@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
@@ -127,6 +128,22 @@ class TestExponentialMovingAverage:
         # Act, Assert
         assert self.ema.value == pytest.approx(1.5123966942148757, rel=1e-9)
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, 25) ** 2
+        indicator = ExponentialMovingAverage(10)
+        sequential = ExponentialMovingAverage(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        outputs = indicator.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.count == sequential.count
+        assert outputs[-1] == sequential.value
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -15,6 +15,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.linear_regression import LinearRegression
@@ -85,6 +86,37 @@ class TestLinearRegression:
         assert self.linear_regression.cfo == 0
         assert self.linear_regression.R2 == 1
 
+    def test_values_after_window_slides_match_least_squares_fit(self):
+        # Arrange
+        rng = np.random.default_rng(1)
+        closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 100))
+
+        # Act
+        for close in closes:
+            self.linear_regression.update_raw(close)
+
+        # Assert
+        x = np.arange(1, self.period + 1, dtype=np.float64)
+        slope, intercept = np.polyfit(x, closes[-self.period :], 1)
+        assert self.linear_regression.slope == pytest.approx(slope, rel=1e-9)
+        assert self.linear_regression.intercept == pytest.approx(intercept, rel=1e-9)
+
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        indicator = LinearRegression(period=4)
+        sequential = LinearRegression(period=4)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        outputs = indicator.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized == sequential.initialized
+        assert outputs[-1] == sequential.value
+
     def test_reset(self):
         self.linear_regression.update_raw(1.00000)
 
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.rsi import RelativeStrengthIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -125,6 +127,22 @@ class TestRelativeStrengthIndex:
         # Act, Assert
         assert self.rsi.value == 0.7615344667662725
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        indicator = RelativeStrengthIndex(10)
+        sequential = RelativeStrengthIndex(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        outputs = indicator.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized == sequential.initialized
+        assert outputs[-1] == sequential.value
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         self.rsi.update_raw(1.00020)
@@ -13,6 +13,9 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+import pytest
+
 from nautilus_trader.indicators.rvi import RelativeVolatilityIndex
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -95,7 +98,23 @@ class TestRelativeVolatilityIndex:
         self.rvi.update_raw(110.04)
 
         # Assert
-        assert self.rvi.value == 67.2446018137445
+        assert self.rvi.value == pytest.approx(67.2446018137445, rel=1e-9)
+
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        indicator = RelativeVolatilityIndex(10)
+        sequential = RelativeVolatilityIndex(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        outputs = indicator.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized == sequential.initialized
+        assert outputs[-1] == sequential.value
 
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
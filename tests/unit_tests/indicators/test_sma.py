@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.average.sma import SimpleMovingAverage
 from nautilus_trader.model.enums import PriceType
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
@@ -126,6 +128,14 @@ class TestSimpleMovingAverage:
         # Act, Assert
         assert self.sma.value == 2.0
 
+    def test_value_after_window_slides_returns_mean_of_last_period_inputs(self):
+        # Arrange
+        for i in range(1, 26):
+            self.sma.update_raw(float(i))
+
+        # Act, Assert
+        assert self.sma.value == 20.5
+
     def test_handle_quote_tick_updates_with_expected_value(self):
         # Arrange
         sma_for_ticks1 = SimpleMovingAverage(10, PriceType.ASK)
@@ -163,6 +173,35 @@ class TestSimpleMovingAverage:
         assert sma_for_ticks.has_inputs
         assert sma_for_ticks.value == 1.0
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, 25) ** 2
+        sequential = SimpleMovingAverage(10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        result = self.sma.update_raw_batch(values)
+
+        # Assert
+        assert result is None
+        assert self.sma.value == sequential.value
+        assert self.sma.count == sequential.count
+        assert self.sma.initialized
+
+    def test_update_raw_batch_with_return_values_returns_value_after_each_update(self):
+        # Arrange
+        values = np.arange(1.0, 26.0)
+
+        # Act
+        result = self.sma.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert len(result) == 25
+        assert result[0] == 1.0
+        assert result[2] == 2.0
+        assert result[-1] == 20.5
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
@@ -107,6 +107,22 @@ class TestStochastics:
         assert self.stochastics.value_k == 20.0
         assert self.stochastics.value_d == 25.0
 
+    def test_handle_bars_produces_identical_state_to_handle_bar(self):
+        # Arrange
+        bars = [TestDataStubs.bar_5decimal(), TestDataStubs.bar_3decimal()] * 10
+        indicator = Stochastics(14, 3)
+        sequential = Stochastics(14, 3)
+        for bar in bars:
+            sequential.handle_bar(bar)
+
+        # Act
+        indicator.handle_bars(bars)
+
+        # Assert
+        assert indicator.value_k == sequential.value_k
+        assert indicator.value_d == sequential.value_d
+        assert indicator.initialized == sequential.initialized
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         self.stochastics.update_raw(1.00050, 1.00030, 1.00040)
@@ -45,6 +45,24 @@ else:
     from nautilus_trader.indicators.ta_lib.manager import TALibIndicatorManager
 
 
+def _supported_function_names() -> list[str]:
+    # All TA-Lib functions computed from the OHLCV inputs held by the manager
+    if importlib.util.find_spec("talib") is None:
+        return []
+
+    import talib
+    from talib import abstract
+
+    names = []
+    for name in talib.get_functions():
+        input_names = []
+        for value in abstract.Function(name).input_names.values():
+            input_names.extend(value if isinstance(value, list) else [value])
+        if set(input_names) <= {"open", "high", "low", "close", "volume"}:
+            names.append(name)
+    return names
+
+
 @pytest.fixture(scope="session")
 def bar_type() -> BarType:
     return BarType.from_str("GBP/USD.SIM-1-MINUTE-BID-EXTERNAL")
@@ -505,3 +523,93 @@ def test_ohlcv_when_no_indicators_are_set(indicator_manager, sample_data):
 
     # Assert
     assert indicator_manager.output_array.shape == (10,)
+
+
+def test_incremental_single_indicator_matches_full_window(bar_type, sample_data):
+    # Arrange
+    full_manager = TALibIndicatorManager(bar_type=bar_type, period=10)
+    full_manager.set_indicators(TAFunctionWrapper.from_list_of_str(["SMA_10"]))
+    incremental_manager = TALibIndicatorManager(bar_type=bar_type, period=10, incremental=True)
+    incremental_manager.set_indicators(TAFunctionWrapper.from_list_of_str(["SMA_10"]))
+
+    # Act
+    for bar in sample_data:
+        full_manager.handle_bar(bar)
+        incremental_manager.handle_bar(bar)
+
+    # Assert
+    assert incremental_manager.count == full_manager.count
+    assert incremental_manager.output_array["SMA_10"] == pytest.approx(
+        full_manager.output_array["SMA_10"],
+        rel=1e-12,
+        nan_ok=True,
+    )
+    assert np.array_equal(
+        incremental_manager.output_array["close"],
+        full_manager.output_array["close"],
+    )
+
+
+def test_incremental_multiple_indicators_with_shared_lookback(bar_type, sample_data):
+    # Arrange
+    indicators = TAFunctionWrapper.from_list_of_str(["SMA_10", "MAX_10", "EMA_20", "ATR_14"])
+    full_manager = TALibIndicatorManager(bar_type=bar_type, period=10)
+    full_manager.set_indicators(indicators)
+    indicator_manager = TALibIndicatorManager(bar_type=bar_type, period=10, incremental=True)
+    indicator_manager.set_indicators(indicators)
+
+    # Act
+    for bar in sample_data:
+        full_manager.handle_bar(bar)
+        indicator_manager.handle_bar(bar)
+
+    # Assert
+    assert len(indicator_manager._indicator_groups) == 2
+    assert indicator_manager._input_size <= 2 * indicator_manager._input_window
+    assert indicator_manager.value("SMA_10") == pytest.approx(full_manager.value("SMA_10"))
+    assert indicator_manager.value("MAX_10") == full_manager.value("MAX_10")
+    assert indicator_manager.value("EMA_20") == pytest.approx(full_manager.value("EMA_20"))
+    assert indicator_manager.value("ATR_14") == pytest.approx(full_manager.value("ATR_14"))
+
+
+@pytest.mark.parametrize("name", _supported_function_names())
+def test_incremental_matches_full_window_for_all_functions(bar_type, sample_data, name):
+    # Arrange
+    indicators = (TAFunctionWrapper(name=name), *TAFunctionWrapper.from_list_of_str(["SMA_30"]))
+    full_manager = TALibIndicatorManager(bar_type=bar_type, period=10)
+    full_manager.set_indicators(indicators)
+    incremental_manager = TALibIndicatorManager(bar_type=bar_type, period=10, incremental=True)
+    incremental_manager.set_indicators(indicators)
+
+    # Act
+    for bar in sample_data:
+        full_manager.handle_bar(bar)
+        incremental_manager.handle_bar(bar)
+
+    # Assert
+    for output_name in indicators[0].output_names:
+        assert incremental_manager.output_array[output_name] == pytest.approx(
+            full_manager.output_array[output_name],
+            rel=1e-9,
+            abs=1e-12,
+            nan_ok=True,
+        )
+
+
+def test_incremental_update_bar_with_same_ts_event(
+    bar_type,
+    sample_bar_1,
+    sample_bar_1_update,
+):
+    # Arrange
+    indicator_manager = TALibIndicatorManager(bar_type=bar_type, period=10, incremental=True)
+    indicator_manager.set_indicators(TAFunctionWrapper.from_list_of_str(["SMA_10"]))
+    indicator_manager.handle_bar(sample_bar_1)
+
+    # Act
+    indicator_manager.handle_bar(sample_bar_1_update)
+
+    # Assert
+    assert indicator_manager.count == 1
+    assert indicator_manager._input_size == 1
+    assert indicator_manager.value("close") == sample_bar_1_update.close.as_double()
@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import numpy as np
+
 from nautilus_trader.indicators.vhf import VerticalHorizontalFilter
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
@@ -72,6 +74,22 @@ class TestVerticalHorizontalFilter:
 
         assert self.vhf.value == 0.36842105263158487
 
+    def test_update_raw_batch_produces_identical_state_to_sequential_updates(self):
+        # Arrange
+        values = 1.0 + np.sin(np.linspace(0.0, 6.0, 50))
+        indicator = VerticalHorizontalFilter(period=10)
+        sequential = VerticalHorizontalFilter(period=10)
+        for value in values:
+            sequential.update_raw(value)
+
+        # Act
+        outputs = indicator.update_raw_batch(values, return_values=True)
+
+        # Assert
+        assert indicator.value == sequential.value
+        assert indicator.initialized == sequential.initialized
+        assert outputs[-1] == sequential.value
+
     def test_reset(self):
         self.vhf.update_raw(56.87)
 
@@ -101,6 +101,10 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -135,6 +139,10 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -179,6 +187,10 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -215,6 +227,10 @@ class TestLiveDataEngine:
         # Arrange
         self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
         self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
         self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
         self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
 
@@ -370,3 +386,111 @@ class TestLiveDataEngine:
 
         # Tear Down
         self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_batch_when_not_running_places_data_on_queue(self):
+        # Arrange
+        data = [TestDataStubs.trade_tick()] * 5
+
+        # Act
+        self.engine.process_batch(data)
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 5
+        assert self.engine.data_count == 0
+
+    @pytest.mark.asyncio
+    async def test_process_when_queue_full_keeps_order_behind_batch_backlog(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(qsize=2),
+        )
+
+        data = [Data(i, i) for i in range(6)]
+
+        # Act
+        self.engine.process_batch(data[:3])  # Last item waits for space in the queue
+        self.engine.process(data[3])
+        self.engine.process_batch(data[4:])
+        await asyncio.sleep(0.1)
+        result = [await self.engine._data_queue.get() for _ in range(len(data))]
+
+        # Assert
+        assert [x.ts_init for x in result] == [0, 1, 2, 3, 4, 5]
+
+    def test_process_batch_with_none_item_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.engine.process_batch([TestDataStubs.trade_tick(), None])
+
+    @pytest.mark.asyncio
+    async def test_process_batch_drains_data_in_single_batch(self):
+        # Arrange
+        self.engine.start()
+        data = [TestDataStubs.trade_tick()] * 5
+
+        # Act
+        self.engine.process_batch(data)
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_count == 5
+        assert self.engine.data_qsize_max() == 5
+        assert self.engine.data_batch_size() == 5
+        assert self.engine.data_batch_size_max() == 5
+
+        # Tear Down
+        self.engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_process_batch_drains_data_up_to_batch_size(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="DataEngine.execute", handler=self.engine.execute)
+        self.msgbus.deregister(endpoint="DataEngine.process", handler=self.engine.process)
+        self.msgbus.deregister(
+            endpoint="DataEngine.process_batch",
+            handler=self.engine.process_batch,
+        )
+        self.msgbus.deregister(endpoint="DataEngine.request", handler=self.engine.request)
+        self.msgbus.deregister(endpoint="DataEngine.response", handler=self.engine.response)
+
+        self.engine = LiveDataEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveDataEngineConfig(batch_size=2),
+        )
+        self.engine.start()
+        data = [TestDataStubs.trade_tick()] * 5
+
+        # Act
+        self.engine.process_batch(data)
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.engine.data_qsize() == 0
+        assert self.engine.data_count == 5
+        assert self.engine.data_qsize_max() == 5
+        assert self.engine.data_batch_size() == 1
+        assert self.engine.data_batch_size_max() == 2
+
+        # Tear Down
+        self.engine.stop()
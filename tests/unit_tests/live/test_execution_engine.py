@@ -419,6 +419,97 @@ class TestLiveExecutionEngine:
         # Tear Down
         self.exec_engine.stop()
 
+    @pytest.mark.asyncio()
+    async def test_process_batch_drains_events_in_single_batch(self):
+        # Arrange
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        events = [
+            TestEventStubs.order_submitted(order),
+            TestEventStubs.order_accepted(order),
+            TestEventStubs.order_canceled(order),
+        ]
+
+        # Act
+        self.exec_engine.process_batch(events)
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert self.exec_engine.evt_qsize() == 0
+        assert self.exec_engine.event_count == 3
+        assert self.exec_engine.evt_qsize_max() == 3
+        assert self.exec_engine.evt_batch_size() == 3
+        assert self.exec_engine.evt_batch_size_max() == 3
+
+        # Tear Down
+        self.exec_engine.stop()
+
+    @pytest.mark.asyncio()
+    async def test_process_when_queue_full_keeps_order_behind_batch_backlog(self):
+        # Arrange
+        self.msgbus.deregister(endpoint="ExecEngine.execute", handler=self.exec_engine.execute)
+        self.msgbus.deregister(endpoint="ExecEngine.process", handler=self.exec_engine.process)
+        self.msgbus.deregister(
+            endpoint="ExecEngine.reconcile_report",
+            handler=self.exec_engine.reconcile_report,
+        )
+        self.msgbus.deregister(
+            endpoint="ExecEngine.reconcile_mass_status",
+            handler=self.exec_engine.reconcile_mass_status,
+        )
+
+        self.exec_engine = LiveExecutionEngine(
+            loop=self.loop,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=LiveExecEngineConfig(qsize=2),
+        )
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        events = [
+            TestEventStubs.order_submitted(order),
+            TestEventStubs.order_accepted(order),
+            TestEventStubs.order_filled(order, instrument=AUDUSD_SIM),
+            TestEventStubs.order_canceled(order),
+        ]
+
+        # Act
+        self.exec_engine.process_batch(events[:3])  # Last event waits for space in the queue
+        self.exec_engine.process(events[3])
+        await asyncio.sleep(0.1)
+        result = [await self.exec_engine._evt_queue.get() for _ in range(len(events))]
+
+        # Assert
+        assert result == events
+
+    def test_process_batch_with_none_event_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.exec_engine.process_batch([None])
+
     @pytest.mark.asyncio
     async def test_handle_order_status_report(self):
         # Arrange
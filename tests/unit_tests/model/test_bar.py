@@ -16,6 +16,7 @@
 import pickle
 from datetime import timedelta
 
+import numpy as np
 import pytest
 
 from nautilus_trader.model.data import Bar
@@ -609,6 +610,36 @@ class TestBar:
         # Assert
         assert result == bar
 
+    def test_from_raw_arrays_to_list_returns_expected_bars(self):
+        # Arrange, Act
+        bars = Bar.from_raw_arrays_to_list(
+            AUDUSD_1_MIN_BID,
+            5,
+            0,
+            np.array([1000010000, 1000030000], dtype=np.int64),
+            np.array([1000040000, 1000050000], dtype=np.int64),
+            np.array([1000000000, 1000020000], dtype=np.int64),
+            np.array([1000030000, 1000040000], dtype=np.int64),
+            np.array([100000000000000, 200000000000000], dtype=np.uint64),
+            np.array([0, 60_000_000_000], dtype=np.uint64),
+            np.array([0, 60_000_000_000], dtype=np.uint64),
+        )
+
+        # Assert
+        assert bars[0] == Bar(
+            AUDUSD_1_MIN_BID,
+            Price.from_str("1.00001"),
+            Price.from_str("1.00004"),
+            Price.from_str("1.00000"),
+            Price.from_str("1.00003"),
+            Quantity.from_int(100_000),
+            0,
+            0,
+        )
+        assert bars[1].open == Price.from_str("1.00003")
+        assert bars[1].volume == Quantity.from_int(200_000)
+        assert bars[1].ts_init == 60_000_000_000
+
     def test_pickle_bar(self):
         # Arrange
         bar = Bar(
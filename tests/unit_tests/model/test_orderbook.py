@@ -17,10 +17,13 @@ import copy
 import pickle
 
 import msgspec
+import numpy as np
 import pandas as pd
 import pytest
 
 from nautilus_trader.model.book import OrderBook
+from nautilus_trader.model.book import OrderBookDiff
+from nautilus_trader.model.book import OrderBookDiffer
 from nautilus_trader.model.data import BookOrder
 from nautilus_trader.model.data import OrderBookDelta
 from nautilus_trader.model.data import OrderBookDeltas
@@ -294,6 +297,56 @@ class TestOrderBook:
         assert bid_level.price == Price.from_str("10.0")
         assert ask_level.price == Price.from_str("11.0")
 
+    def test_bids_depth(self):
+        # Arrange, Act
+        prices, sizes, counts = self.sample_book.bids_depth()
+
+        # Assert
+        assert prices.dtype == np.float64
+        assert sizes.dtype == np.float64
+        assert counts.dtype == np.uint64
+        assert prices.tolist() == [0.83, 0.82]
+        assert sizes.tolist() == [4.0, 1.0]
+        assert counts.tolist() == [1, 1]
+
+    def test_asks_depth_with_depth_and_cumulative(self):
+        # Arrange, Act
+        prices, sizes, counts = self.sample_book.asks_depth(depth=2, cumulative=True)
+
+        # Assert
+        assert prices.tolist() == [0.886, 0.887]
+        assert sizes.tolist() == [5.0, 15.0]
+        assert counts.tolist() == [1, 1]
+
+    def test_depth_when_no_orders_returns_empty_arrays(self):
+        # Arrange, Act
+        prices, sizes, counts = self.empty_book.bids_depth()
+
+        # Assert
+        assert len(prices) == 0
+        assert len(sizes) == 0
+        assert len(counts) == 0
+
+    def test_depth_with_invalid_depth_raises_value_error(self):
+        # Arrange, Act, Assert
+        with pytest.raises(ValueError):
+            self.sample_book.asks_depth(depth=0)
+
+    def test_fill_asks_depth_into_preallocated_buffers(self):
+        # Arrange
+        prices = np.zeros(5, dtype=np.float64)
+        sizes = np.zeros(5, dtype=np.float64)
+        counts = np.zeros(5, dtype=np.uint64)
+
+        # Act
+        filled = self.sample_book.fill_asks_depth(prices, sizes, counts)
+
+        # Assert
+        assert filled == 3
+        assert prices[:filled].tolist() == [0.886, 0.887, 0.9]
+        assert sizes[:filled].tolist() == [5.0, 10.0, 20.0]
+        assert counts[:filled].tolist() == [1, 1, 1]
+
     def test_repr(self):
         book = OrderBook(
             instrument_id=self.instrument.id,
@@ -699,3 +752,166 @@ class TestOrderBook:
         # Assert
         assert book.ts_last == new.ts_last
         assert book.sequence == new.sequence
+
+
+class TestOrderBookDiffer:
+    def setup(self):
+        self.instrument = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+        self.book = OrderBook(
+            instrument_id=self.instrument.id,
+            book_type=BookType.L2_MBP,
+        )
+        self.update(OrderSide.BUY, 1.00, 10.0)
+        self.update(OrderSide.BUY, 0.99, 20.0)
+        self.update(OrderSide.SELL, 1.01, 15.0)
+        self.update(OrderSide.SELL, 1.02, 25.0)
+
+    def update(self, side: OrderSide, price: float, size: float, ts: int = 1) -> None:
+        order = BookOrder(side=side, price=Price(price, 3), size=Quantity(size, 0), order_id=0)
+        if size == 0:
+            self.book.delete(order, ts)
+        else:
+            self.book.update(order, ts)
+
+    def test_first_diff_is_full_checkpoint(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=2)
+
+        # Assert
+        assert isinstance(diff, OrderBookDiff)
+        assert diff.instrument_id == self.instrument.id
+        assert diff.sequence == 1
+        assert diff.is_checkpoint
+        assert diff.bids == [(1.00, 10.0), (0.99, 20.0)]
+        assert diff.asks == [(1.01, 15.0), (1.02, 25.0)]
+        assert diff.ts_event == 1
+        assert diff.ts_init == 2
+
+    def test_diff_when_book_unchanged_returns_none(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        differ.diff(self.book, ts_init=2)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=3)
+
+        # Assert
+        assert diff is None
+        assert differ.sequence == 1
+
+    def test_diff_returns_only_changed_and_removed_levels(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        differ.diff(self.book, ts_init=2)
+
+        self.update(OrderSide.BUY, 1.00, 12.0, ts=3)
+        self.update(OrderSide.SELL, 1.02, 0.0, ts=3)
+        self.update(OrderSide.SELL, 1.03, 5.0, ts=3)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=4)
+
+        # Assert
+        assert diff.sequence == 2
+        assert not diff.is_checkpoint
+        assert diff.bids == [(1.00, 12.0)]
+        assert diff.asks == [(1.03, 5.0), (1.02, 0.0)]
+        assert diff.ts_event == 3
+
+    def test_diff_emits_checkpoint_every_interval(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id, checkpoint_interval=2)
+        differ.diff(self.book, ts_init=2)
+
+        # Act
+        self.update(OrderSide.BUY, 1.00, 11.0)
+        diff1 = differ.diff(self.book, ts_init=3)
+        self.update(OrderSide.BUY, 1.00, 12.0)
+        diff2 = differ.diff(self.book, ts_init=4)
+
+        # Assert
+        assert not diff1.is_checkpoint
+        assert diff2.is_checkpoint
+        assert diff2.bids == [(1.00, 12.0), (0.99, 20.0)]
+
+    def test_diff_with_forced_checkpoint(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        differ.diff(self.book, ts_init=2)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=3, checkpoint=True)
+
+        # Assert
+        assert diff.sequence == 2
+        assert diff.is_checkpoint
+
+    def test_diff_with_depth_reports_levels_outside_depth_as_removed(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id, depth=2)
+        differ.diff(self.book, ts_init=2)
+
+        self.update(OrderSide.BUY, 1.005, 1.0)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=3)
+
+        # Assert
+        assert diff.bids == [(1.005, 1.0), (0.99, 0.0)]
+        assert diff.asks == []
+
+    def test_diff_full_book_beyond_initial_capacity(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        for i in range(100):
+            self.update(OrderSide.BUY, 0.98 - i * 0.001, 1.0)
+
+        # Act
+        diff = differ.diff(self.book, ts_init=2)
+
+        # Assert
+        assert len(diff.bids) == 102
+
+    def test_reset_then_next_diff_is_checkpoint(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        differ.diff(self.book, ts_init=2)
+
+        # Act
+        differ.reset()
+        diff = differ.diff(self.book, ts_init=3)
+
+        # Assert
+        assert diff.sequence == 1
+        assert diff.is_checkpoint
+
+    def test_force_checkpoint_then_next_diff_is_checkpoint_with_continued_sequence(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        differ.diff(self.book, ts_init=2)
+
+        # Act
+        differ.force_checkpoint()
+        diff = differ.diff(self.book, ts_init=3)
+
+        # Assert
+        assert diff.sequence == 2
+        assert diff.is_checkpoint
+        assert differ.diff(self.book, ts_init=4) is None
+
+    def test_to_dict_and_from_dict_round_trip(self):
+        # Arrange
+        differ = OrderBookDiffer(self.instrument.id)
+        diff = differ.diff(self.book, ts_init=2)
+
+        # Act
+        values = OrderBookDiff.to_dict(diff)
+        result = OrderBookDiff.from_dict(msgspec.json.decode(msgspec.json.encode(values)))
+
+        # Assert
+        assert values["type"] == "OrderBookDiff"
+        assert values["sequence"] == 1
+        assert result == diff
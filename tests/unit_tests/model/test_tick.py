@@ -15,6 +15,9 @@
 
 import pickle
 
+import numpy as np
+import pytest
+
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.data import TradeTick
 from nautilus_trader.model.enums import AggressorSide
@@ -175,6 +178,53 @@ class TestQuoteTick:
         assert tick.ts_event == 1
         assert tick.ts_init == 2
 
+    def test_from_raw_arrays_to_list_returns_expected_ticks(self):
+        # Arrange, Act
+        ticks = QuoteTick.from_raw_arrays_to_list(
+            AUDUSD_SIM.id,
+            5,
+            0,
+            np.array([1000000000, 1000010000], dtype=np.int64),
+            np.array([1000010000, 1000020000], dtype=np.int64),
+            np.array([1000000000, 3000000000], dtype=np.uint64),
+            np.array([2000000000, 4000000000], dtype=np.uint64),
+            np.array([1, 3], dtype=np.uint64),
+            np.array([2, 4], dtype=np.uint64),
+        )
+
+        # Assert
+        assert ticks == [
+            QuoteTick.from_raw(
+                AUDUSD_SIM.id, 1000000000, 1000010000, 5, 5, 1000000000, 2000000000, 0, 0, 1, 2
+            ),
+            QuoteTick.from_raw(
+                AUDUSD_SIM.id, 1000010000, 1000020000, 5, 5, 3000000000, 4000000000, 0, 0, 3, 4
+            ),
+        ]
+        assert ticks[1].bid_price == Price.from_str("1.00001")
+        assert ticks[1].ask_size == Quantity.from_int(4)
+        assert ticks[1].ts_init == 4
+
+    def test_from_raw_arrays_to_list_with_unequal_lengths_raises_value_error(self):
+        # Arrange
+        prices = np.array([1000000000, 1000010000], dtype=np.int64)
+        sizes = np.array([1000000000, 1000000000], dtype=np.uint64)
+        timestamps = np.array([1], dtype=np.uint64)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            QuoteTick.from_raw_arrays_to_list(
+                AUDUSD_SIM.id,
+                5,
+                0,
+                prices,
+                prices,
+                sizes,
+                sizes,
+                timestamps,
+                timestamps,
+            )
+
     def test_pickling_round_trip_results_in_expected_tick(self):
         # Arrange
         tick = QuoteTick(
@@ -306,3 +356,36 @@ class TestTradeTick:
         assert tick.aggressor_side == AggressorSide.BUYER
         assert tick.ts_event == 1
         assert tick.ts_init == 2
+
+    def test_from_raw_arrays_to_list_returns_expected_ticks(self):
+        # Arrange, Act
+        ticks = TradeTick.from_raw_arrays_to_list(
+            AUDUSD_SIM.id,
+            5,
+            0,
+            np.array([1000010000, 1000020000], dtype=np.int64),
+            np.array([10000000000000, 20000000000000], dtype=np.uint64),
+            np.array([AggressorSide.BUYER, AggressorSide.SELLER], dtype=np.uint8),
+            ["123458", "123459"],
+            np.array([1, 3], dtype=np.uint64),
+            np.array([2, 4], dtype=np.uint64),
+        )
+
+        # Assert
+        assert len(ticks) == 2
+        assert ticks[0] == TradeTick.from_raw(
+            AUDUSD_SIM.id,
+            1000010000,
+            5,
+            10000000000000,
+            0,
+            AggressorSide.BUYER,
+            TradeId("123458"),
+            1,
+            2,
+        )
+        assert ticks[1].price == Price.from_str("1.00002")
+        assert ticks[1].size == Quantity.from_int(20_000)
+        assert ticks[1].aggressor_side == AggressorSide.SELLER
+        assert ticks[1].trade_id == TradeId("123459")
+        assert ticks[1].ts_init == 4
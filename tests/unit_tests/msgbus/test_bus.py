@@ -430,6 +430,56 @@ class TestMessageBus:
         assert handler1 == ["message1"]
         assert handler2 == ["message1", "message2", "message3"]
 
+    def test_subscribe_after_publish_then_receives_message_on_topic(self):
+        # Arrange
+        handler1 = []
+        handler2 = []
+
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.subscribe(topic="data.signal.my_signal", handler=handler1.append)
+        self.msgbus.subscribe(topic="data.*.my_?ignal", handler=handler2.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+
+        # Assert
+        assert handler1 == ["message2"]
+        assert handler2 == ["message2"]
+
+    def test_unsubscribe_after_publish_then_handler_no_longer_receives_messages(self):
+        # Arrange
+        handler = []
+
+        self.msgbus.subscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.signal.my_signal", "message1")
+
+        # Act
+        self.msgbus.unsubscribe(topic="data.*", handler=handler.append)
+        self.msgbus.publish("data.signal.my_signal", "message2")
+        self.msgbus.publish("data.signal.another_signal", "message3")
+
+        # Assert
+        assert handler == ["message1"]
+        assert self.msgbus.subscriptions() == []
+
+    def test_publish_sends_to_handlers_in_priority_then_subscription_order(self):
+        # Arrange
+        received = []
+
+        self.msgbus.subscribe(topic="data.*", handler=lambda m: received.append("first"))
+        self.msgbus.subscribe(topic="data.quotes.*", handler=lambda m: received.append("second"))
+        self.msgbus.subscribe(
+            topic="data.quotes.SIM.AUD/USD",
+            handler=lambda m: received.append("priority"),
+            priority=10,
+        )
+
+        # Act
+        self.msgbus.publish("data.quotes.SIM.AUD/USD", "message")
+
+        # Assert
+        assert received == ["priority", "first", "second"]
+
     def test_msgbus_for_system_events_using_component_id(self):
         # Arrange
         subscriber = []
@@ -459,6 +509,12 @@ class TestMessageBus:
         ["data.quotes.BINANCE", "data.*.BINANCE", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.*", True],
         ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.ETH*", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.*.BINANCE.BTC*", False],
+        ["data.trades.BINANCE.ETHUSDT", "data.trades.BINANCE.ETHUSD?", True],
+        ["data.trades.BINANCE.ETHUSDT", "data.trades.BINANCE.ETHUSD", False],
+        ["data.trades.BINANCE.ETHUSDT", "data.trades.BINANCE.ETHUSDT**", True],
+        ["data.trades", "data.trades.*", False],
+        ["aaab", "*a?b", True],
     ],
 )
 def test_is_matching_given_various_topic_pattern_combos(topic, pattern, expected):
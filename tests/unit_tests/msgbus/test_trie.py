@@ -0,0 +1,114 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+
+import pytest
+
+from nautilus_trader.common.component import Subscription
+from nautilus_trader.common.component import SubscriptionTrie
+
+
+class TestSubscriptionTrie:
+    def setup(self):
+        # Fixture Setup
+        self.trie = SubscriptionTrie()
+        self.handler = []
+
+    def test_match_with_no_subscriptions_returns_empty_list(self):
+        # Arrange, Act
+        result = self.trie.match("data.quotes.SIM.AUD/USD")
+
+        # Assert
+        assert result == []
+        assert len(self.trie) == 0
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ["*", True],
+            ["data.*", True],
+            ["data.quotes.SIM.AUD/USD", True],
+            ["data.quotes.SIM.AUD/US?", True],
+            ["data.*.SIM.*", True],
+            ["data.*.SIM.AUD*", True],
+            ["data.quotes.SIM", False],
+            ["data.trades.*", False],
+            ["data.quotes.SIM.AUD/USD.*", False],
+        ],
+    )
+    def test_match_given_various_patterns(self, pattern, expected):
+        # Arrange
+        sub = Subscription(topic=pattern, handler=self.handler.append)
+        self.trie.add(sub)
+
+        # Act
+        result = self.trie.match("data.quotes.SIM.AUD/USD")
+
+        # Assert
+        assert (result == [sub]) == expected
+
+    def test_add_when_already_added_does_not_duplicate(self):
+        # Arrange
+        sub = Subscription(topic="data.*", handler=self.handler.append)
+
+        # Act
+        self.trie.add(sub)
+        self.trie.add(sub)
+
+        # Assert
+        assert self.trie.match("data.quotes") == [sub]
+        assert len(self.trie) == 1
+
+    def test_match_returns_subscriptions_in_priority_then_added_order(self):
+        # Arrange
+        sub1 = Subscription(topic="data.*", handler=self.handler.append)
+        sub2 = Subscription(topic="data.quotes.*", handler=self.handler.append)
+        sub3 = Subscription(topic="data.quotes.SIM", handler=self.handler.append, priority=5)
+        sub4 = Subscription(topic="*", handler=self.handler.append)
+
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+        self.trie.add(sub3)
+        self.trie.add(sub4)
+
+        # Act
+        result = self.trie.match("data.quotes.SIM")
+
+        # Assert
+        assert result == [sub3, sub1, sub2, sub4]
+
+    def test_remove_then_no_longer_matches(self):
+        # Arrange
+        sub1 = Subscription(topic="data.quotes.*", handler=self.handler.append)
+        sub2 = Subscription(topic="data.quotes.SIM", handler=self.handler.append)
+        self.trie.add(sub1)
+        self.trie.add(sub2)
+
+        # Act
+        self.trie.remove(Subscription(topic="data.quotes.*", handler=self.handler.append))
+
+        # Assert
+        assert self.trie.match("data.quotes.SIM") == [sub2]
+        assert len(self.trie) == 1
+
+    def test_remove_when_not_added_does_nothing(self):
+        # Arrange
+        sub = Subscription(topic="data.*", handler=self.handler.append)
+
+        # Act
+        self.trie.remove(sub)
+
+        # Assert
+        assert len(self.trie) == 0
@@ -36,6 +36,8 @@ from nautilus_trader.model.instruments import BettingInstrument
 from nautilus_trader.model.instruments import Equity
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
+from nautilus_trader.persistence.catalog.manifest import DATA_SCHEMA_VERSION
+from nautilus_trader.persistence.catalog.manifest import ManifestEntry
 from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
 from nautilus_trader.test_kit.mocks.data import NewsEventData
 from nautilus_trader.test_kit.mocks.data import data_catalog_setup
@@ -275,6 +277,150 @@ class TestPersistenceCatalog:
         assert len(bars1) == 10
         assert len(bars2) == 10
 
+    def test_catalog_write_data_updates_manifest(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(10)]
+
+        # Act
+        self.catalog.write_data(quotes[:5], basename_template="first-{i}")
+        self.catalog.write_data(quotes[5:], basename_template="second-{i}")
+
+        # Assert
+        entries = self.catalog.manifest.entries("quote_tick")
+        assert [(e.ts_min, e.ts_max, e.num_rows) for e in entries] == [(0, 4, 5), (5, 9, 5)]
+        assert entries[0].path == "data/quote_tick/AUDUSD.SIM/first-0.parquet"
+        assert entries[0].identifier == "AUDUSD.SIM"
+
+    def test_catalog_query_opens_only_overlapping_files(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(10)]
+        self.catalog.write_data(quotes[:5], basename_template="first-{i}")
+        self.catalog.write_data(quotes[5:], basename_template="second-{i}")
+        dataset_path = f"{self.catalog.path}/data/quote_tick"
+
+        # Act
+        files = self.catalog._manifest_files(dataset_path, start=5)
+        result = self.catalog.quote_ticks(start=5)
+
+        # Assert
+        assert files == [f"{dataset_path}/AUDUSD.SIM/second-0.parquet"]
+        assert [q.ts_init for q in result] == [5, 6, 7, 8, 9]
+        assert self.catalog._manifest_files(dataset_path, start=10) == []
+
+    def test_catalog_rebuild_manifest_indexes_existing_files(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(10)]
+        catalog = ParquetDataCatalog(
+            path=self.catalog.path,
+            fs_protocol=self.FS_PROTOCOL,
+            use_manifest=False,
+        )
+        catalog.write_data(quotes)
+        assert self.catalog.manifest.entries() == []
+
+        # Act
+        self.catalog.rebuild_manifest()
+
+        # Assert
+        entries = self.catalog.manifest.entries()
+        assert [(e.data_type, e.identifier, e.ts_min, e.ts_max) for e in entries] == [
+            ("quote_tick", "AUDUSD.SIM", 0, 9),
+        ]
+        assert len(self.catalog.quote_ticks(start=5)) == 5
+
+    def test_catalog_write_data_indexes_files_written_without_manifest(self) -> None:
+        # Arrange
+        usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(10)]
+        catalog = ParquetDataCatalog(
+            path=self.catalog.path,
+            fs_protocol=self.FS_PROTOCOL,
+            use_manifest=False,
+        )
+        catalog.write_data(quotes[:5], basename_template="first-{i}")
+        catalog.write_data([TestDataStubs.quote_tick(usdjpy, ts_event=2, ts_init=2)])
+
+        # Act
+        self.catalog.write_data(quotes[5:], basename_template="second-{i}")
+
+        # Assert
+        entries = self.catalog.manifest.entries("quote_tick")
+        assert [(e.identifier, e.ts_min, e.ts_max) for e in entries] == [
+            ("AUDUSD.SIM", 0, 4),
+            ("AUDUSD.SIM", 5, 9),
+            ("USDJPY.SIM", 2, 2),
+        ]
+        assert len(self.catalog.quote_ticks()) == 11
+        result = self.catalog.quote_ticks(instrument_ids=["AUD/USD.SIM"])
+        assert [q.ts_init for q in result] == list(range(10))
+
+    def test_catalog_write_data_append_writes_time_partitioned_files(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(15)]
+
+        # Act
+        self.catalog.write_data(quotes[:5], append=True)
+        self.catalog.write_data(quotes[10:], append=True)
+        self.catalog.write_data(quotes[5:10], append=True)
+
+        # Assert
+        assert [e.path.rsplit("/", 1)[1] for e in self.catalog.manifest.entries()] == [
+            "00000000000000000000-00000000000000000004.parquet",
+            "00000000000000000005-00000000000000000009.parquet",
+            "00000000000000000010-00000000000000000014.parquet",
+        ]
+        assert sorted(q.ts_init for q in self.catalog.quote_ticks()) == list(range(15))
+
+    def test_catalog_append_basename_when_range_unknown_is_unique(self) -> None:
+        # Arrange
+        entry = ManifestEntry(
+            path="",
+            data_type="news_event_data",
+            identifier=None,
+            ts_min=None,
+            ts_max=None,
+            num_rows=1,
+            schema_version=DATA_SCHEMA_VERSION,
+        )
+
+        # Act
+        basename1 = ParquetDataCatalog._append_basename(entry)
+        basename2 = ParquetDataCatalog._append_basename(entry)
+
+        # Assert
+        assert "None" not in basename1
+        assert basename1 != basename2
+
+    def test_catalog_write_data_append_when_overlapping_raises(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(10)]
+        self.catalog.write_data(quotes[:5], append=True)
+
+        # Act, Assert
+        with pytest.raises(ValueError):
+            self.catalog.write_data(quotes[4:], append=True)
+        assert len(self.catalog.manifest.entries()) == 1
+
+    def test_catalog_compact_merges_small_files(self) -> None:
+        # Arrange
+        quotes = [TestDataStubs.quote_tick(ts_event=i, ts_init=i) for i in range(15)]
+        for i in range(0, 15, 5):
+            self.catalog.write_data(quotes[i : i + 5], append=True)
+
+        # Act
+        written = self.catalog.compact(QuoteTick, max_rows_per_file=10)
+
+        # Assert
+        dataset_path = f"{self.catalog.path}/data/quote_tick/AUDUSD.SIM"
+        assert written == [f"{dataset_path}/00000000000000000000-00000000000000000009.parquet"]
+        assert sorted(self.fs.ls(dataset_path, detail=False)) == [
+            f"{dataset_path}/00000000000000000000-00000000000000000009.parquet",
+            f"{dataset_path}/00000000000000000010-00000000000000000014.parquet",
+        ]
+        entries = self.catalog.manifest.entries()
+        assert [(e.ts_min, e.ts_max, e.num_rows) for e in entries] == [(0, 9, 10), (10, 14, 5)]
+        assert [q.ts_init for q in self.catalog.quote_ticks()] == list(range(15))
+
     def test_catalog_bar_query_instrument_id(
         self,
         betfair_catalog: ParquetDataCatalog,
@@ -0,0 +1,138 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import fsspec
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.persistence.catalog.manifest import DATA_SCHEMA_VERSION
+from nautilus_trader.persistence.catalog.manifest import CatalogManifest
+from nautilus_trader.persistence.catalog.manifest import ManifestEntry
+from nautilus_trader.persistence.catalog.manifest import manifest_entry_from_metadata
+from nautilus_trader.persistence.catalog.manifest import manifest_entry_from_table
+
+
+def _entry(path: str, ts_min: int, ts_max: int, data_type: str = "quote_tick") -> ManifestEntry:
+    return ManifestEntry(
+        path=path,
+        data_type=data_type,
+        identifier="AUDUSD.SIM",
+        ts_min=ts_min,
+        ts_max=ts_max,
+        num_rows=10,
+        schema_version=DATA_SCHEMA_VERSION,
+    )
+
+
+class TestCatalogManifest:
+    def setup(self) -> None:
+        self.fs = fsspec.filesystem("memory")
+        self.path = "/manifest_catalog"
+        if self.fs.exists(self.path):
+            self.fs.rm(self.path, recursive=True)
+        self.fs.mkdirs(self.path, exist_ok=True)
+
+    def test_entries_when_no_manifest_file_returns_empty(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+
+        # Act, Assert
+        assert manifest.entries() == []
+        assert not manifest.has_data_type("quote_tick")
+
+    def test_add_persists_entries_for_other_instances(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+        entry = _entry("data/quote_tick/AUDUSD.SIM/part-0.parquet", 1, 5)
+
+        # Act
+        manifest.add([entry])
+
+        # Assert
+        assert CatalogManifest(fs=self.fs, path=self.path).entries() == [entry]
+
+    def test_add_replaces_entry_with_same_path(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+        manifest.add([_entry("data/quote_tick/AUDUSD.SIM/part-0.parquet", 1, 5)])
+        entry = _entry("data/quote_tick/AUDUSD.SIM/part-0.parquet", 10, 20)
+
+        # Act
+        manifest.add([entry])
+
+        # Assert
+        assert manifest.entries() == [entry]
+
+    def test_query_returns_only_overlapping_entries(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+        entry1 = _entry("data/quote_tick/AUDUSD.SIM/part-0.parquet", 1, 5)
+        entry2 = _entry("data/quote_tick/AUDUSD.SIM/part-1.parquet", 6, 10)
+        entry3 = _entry("data/trade_tick/AUDUSD.SIM/part-0.parquet", 1, 10, "trade_tick")
+        manifest.add([entry1, entry2, entry3])
+
+        # Act, Assert
+        assert manifest.query("quote_tick") == [entry1, entry2]
+        assert manifest.query("quote_tick", start=5) == [entry1, entry2]
+        assert manifest.query("quote_tick", start=6) == [entry2]
+        assert manifest.query("quote_tick", end=5) == [entry1]
+        assert manifest.query("quote_tick", start=11) == []
+
+    def test_remove_and_replace_entries(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+        entry1 = _entry("data/quote_tick/AUDUSD.SIM/part-0.parquet", 1, 5)
+        entry2 = _entry("data/quote_tick/AUDUSD.SIM/part-1.parquet", 6, 10)
+        manifest.add([entry1, entry2])
+
+        # Act
+        manifest.remove([entry1.path])
+        remaining = manifest.entries()
+        manifest.replace([entry1])
+
+        # Assert
+        assert remaining == [entry2]
+        assert CatalogManifest(fs=self.fs, path=self.path).entries() == [entry1]
+
+    def test_update_removes_then_adds_entries(self):
+        # Arrange
+        manifest = CatalogManifest(fs=self.fs, path=self.path)
+        entry1 = _entry("data/quote_tick/AUDUSD.SIM/0-4.parquet", 0, 4)
+        entry2 = _entry("data/quote_tick/AUDUSD.SIM/5-9.parquet", 5, 9)
+        manifest.add([entry1, entry2])
+        merged = _entry("data/quote_tick/AUDUSD.SIM/0-9.parquet", 0, 9)
+
+        # Act
+        manifest.update(added=[merged], removed=[entry1.path, entry2.path])
+
+        # Assert
+        assert CatalogManifest(fs=self.fs, path=self.path).entries() == [merged]
+
+    def test_entry_from_table_and_metadata_are_equal(self):
+        # Arrange
+        table = pa.table({"value": [1, 2, 3], "ts_init": pa.array([3, 1, 2], pa.uint64())})
+        pq.write_table(table, f"{self.path}/part-0.parquet", filesystem=self.fs, row_group_size=2)
+        with self.fs.open(f"{self.path}/part-0.parquet", "rb") as f:
+            metadata = pq.read_metadata(f)
+
+        # Act
+        entry1 = manifest_entry_from_table("part-0.parquet", "quote_tick", None, table)
+        entry2 = manifest_entry_from_metadata("part-0.parquet", "quote_tick", None, metadata)
+
+        # Assert
+        assert entry1 == entry2
+        assert entry1.ts_min == 1
+        assert entry1.ts_max == 3
+        assert entry1.num_rows == 3
@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import pyarrow as pa
+
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+from nautilus_trader.persistence.catalog.shared import SharedDataStore
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+class TestSharedDataStore:
+    def test_get_when_no_table_returns_none(self, tmp_path):
+        # Arrange
+        store = SharedDataStore(tmp_path)
+
+        # Act, Assert
+        assert not store.contains("abc")
+        assert store.get("abc") is None
+
+    def test_put_then_get_returns_equal_table(self, tmp_path):
+        # Arrange
+        store = SharedDataStore(tmp_path)
+        table = pa.table({"ts_init": [1, 2, 3], "value": [1.0, 2.0, 3.0]})
+
+        # Act
+        path = store.put("abc", table)
+        result = store.get("abc")
+
+        # Assert
+        assert path.exists()
+        assert store.contains("abc")
+        assert result.equals(table)
+
+    def test_put_when_key_exists_does_not_rewrite(self, tmp_path):
+        # Arrange
+        store = SharedDataStore(tmp_path)
+        table1 = pa.table({"ts_init": [1, 2, 3]})
+        table2 = pa.table({"ts_init": [4, 5]})
+        store.put("abc", table1)
+
+        # Act
+        store.put("abc", table2)
+
+        # Assert
+        assert store.get("abc").equals(table1)
+
+    def test_get_from_second_store_on_same_path(self, tmp_path):
+        # Arrange
+        quotes = [TestDataStubs.quote_tick()]
+        table = ArrowSerializer.serialize_batch(quotes, data_cls=QuoteTick)
+        SharedDataStore(tmp_path).put("quotes", table)
+
+        # Act
+        result = SharedDataStore(tmp_path).get("quotes")
+        data = ParquetDataCatalog._handle_table_nautilus(result, data_cls=QuoteTick)
+
+        # Assert
+        assert data == quotes
@@ -15,12 +15,15 @@
 
 import os
 
+import pandas as pd
 import pytest
 
 from nautilus_trader import PACKAGE_ROOT
+from nautilus_trader.model.data import BarType
 from nautilus_trader.model.enums import BookAction
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.persistence.loaders import BinanceOrderBookDeltaDataLoader
+from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.persistence.wranglers import OrderBookDeltaDataWrangler
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.providers import TestDataProvider
@@ -92,3 +95,39 @@ def test_bar_data_wrangler(
     assert ticks[1].ts_event == ts_event2
     assert ticks[2].ts_event == ts_event3
     assert ticks[3].ts_event == ts_event4
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_quote_tick_data_wrangler_with_non_nanosecond_index(unit: str) -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    wrangler = QuoteTickDataWrangler(instrument=usdjpy)
+    index = pd.DatetimeIndex(["2013-02-01 00:00:00", "2013-02-01 00:00:01"]).as_unit(unit)
+    data = pd.DataFrame({"bid_price": [90.0, 90.1], "ask_price": [90.2, 90.3]}, index=index)
+
+    # Act
+    ticks = wrangler.process(data, ts_init_delta=1)
+
+    # Assert
+    assert [t.ts_event for t in ticks] == [1359676800000000000, 1359676801000000000]
+    assert [t.ts_init for t in ticks] == [1359676800000000001, 1359676801000000001]
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_bar_data_wrangler_with_non_nanosecond_tz_aware_index(unit: str) -> None:
+    # Arrange
+    usdjpy = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+    bar_type = BarType.from_str("USD/JPY.SIM-1-MINUTE-BID-EXTERNAL")
+    wrangler = BarDataWrangler(bar_type=bar_type, instrument=usdjpy)
+    index = pd.DatetimeIndex(["2013-02-01 09:00:00"], tz="Asia/Tokyo").as_unit(unit)
+    data = pd.DataFrame(
+        {"open": [90.0], "high": [90.2], "low": [89.9], "close": [90.1], "volume": [1.0]},
+        index=index,
+    )
+
+    # Act
+    bars = wrangler.process(data)
+
+    # Assert
+    assert bars[0].ts_event == 1359676800000000000
+    assert bars[0].ts_init == 1359676800000000000
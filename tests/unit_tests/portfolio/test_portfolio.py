@@ -1111,6 +1111,89 @@ class TestPortfolio:
         assert not self.portfolio.is_flat(AUDUSD_SIM.id)
         assert not self.portfolio.is_completely_flat()
 
+    def test_venue_aggregates_update_with_new_quote(self):
+        # Arrange
+        AccountFactory.register_calculated_account("SIM")
+
+        account_id = AccountId("SIM-01234")
+        state = AccountState(
+            account_id=account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(1_000_000, USD),
+                    Money(0, USD),
+                    Money(1_000_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.portfolio.update_account(state)
+
+        last_audusd1 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.80501"),
+            ask_price=Price.from_str("0.80505"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=0,
+            ts_init=0,
+        )
+
+        self.cache.add_quote_tick(last_audusd1)
+        self.portfolio.update_quote_tick(last_audusd1)
+
+        order = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+
+        fill = TestEventStubs.order_filled(
+            order,
+            instrument=AUDUSD_SIM,
+            strategy_id=StrategyId("S-1"),
+            account_id=account_id,
+            position_id=PositionId("P-123456"),
+            last_px=Price.from_str("1.00000"),
+        )
+
+        position = Position(instrument=AUDUSD_SIM, fill=fill)
+        self.cache.add_position(position, OmsType.HEDGING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+        unrealized_pnls1 = self.portfolio.unrealized_pnls(SIM)
+        net_exposures1 = self.portfolio.net_exposures(SIM)
+
+        last_audusd2 = QuoteTick(
+            instrument_id=AUDUSD_SIM.id,
+            bid_price=Price.from_str("0.90000"),
+            ask_price=Price.from_str("0.90004"),
+            bid_size=Quantity.from_int(1),
+            ask_size=Quantity.from_int(1),
+            ts_event=1,
+            ts_init=1,
+        )
+
+        # Act
+        self.cache.add_quote_tick(last_audusd2)
+        self.portfolio.update_quote_tick(last_audusd2)
+
+        # Assert
+        assert unrealized_pnls1 == {USD: Money(-19499.00, USD)}
+        assert net_exposures1 == {USD: Money(80501.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10000.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90000.00, USD)}
+        assert self.portfolio.unrealized_pnls(SIM) == {USD: Money(-10000.00, USD)}
+        assert self.portfolio.net_exposures(SIM) == {USD: Money(90000.00, USD)}
+
     def test_modifying_position_updates_portfolio(self):
         # Arrange
         AccountFactory.register_calculated_account("SIM")
@@ -41,6 +41,7 @@ from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import TradingState
 from nautilus_trader.model.enums import TriggerType
+from nautilus_trader.model.events import AccountState
 from nautilus_trader.model.events import OrderDenied
 from nautilus_trader.model.events import OrderModifyRejected
 from nautilus_trader.model.identifiers import AccountId
@@ -51,6 +52,8 @@ from nautilus_trader.model.identifiers import PositionId
 from nautilus_trader.model.identifiers import StrategyId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import AccountBalance
+from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 from nautilus_trader.model.orders.list import OrderList
@@ -989,6 +992,64 @@ class TestRiskEngineWithCashAccount:
         assert order.status == OrderStatus.DENIED
         assert self.exec_engine.command_count == 0  # <-- Command never reaches engine
 
+    def test_submit_order_after_max_notional_updated_then_uses_new_setting(self):
+        # Arrange
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 1_000_000)
+
+        # Initialize market
+        quote = TestDataStubs.quote_tick(AUDUSD_SIM)
+        self.cache.add_quote_tick(quote)
+
+        self.exec_engine.start()
+
+        strategy = Strategy()
+        strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        order1 = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(500_000),
+        )
+        order2 = strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(500_000),
+        )
+
+        submit_order1 = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order1,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        submit_order2 = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=strategy.id,
+            position_id=None,
+            order=order2,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order1)
+        self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 100_000)
+        self.risk_engine.execute(submit_order2)
+
+        # Assert
+        assert order1.status == OrderStatus.INITIALIZED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 1
+
     def test_submit_order_when_sell_market_order_and_over_max_notional_then_denies(self):
         # Arrange
         self.risk_engine.set_max_notional_per_order(AUDUSD_SIM.id, 1_000_000)
@@ -2137,3 +2198,212 @@ class TestRiskEngineWithBettingAccount:
 
         # Assert
         assert order.status == expected_status
+
+
+class TestRiskEngineWithMarginAccount:
+    def setup(self):
+        # Fixture Setup
+        self.clock = TestClock()
+        self.logger = Logger(
+            clock=self.clock,
+            level_stdout=LogLevel.DEBUG,
+            bypass=True,
+        )
+
+        self.trader_id = TestIdStubs.trader_id()
+        self.account_id = TestIdStubs.account_id()
+        self.venue = Venue("SIM")
+
+        self.msgbus = MessageBus(
+            trader_id=self.trader_id,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.cache = TestComponentStubs.cache()
+
+        self.portfolio = Portfolio(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine = ExecutionEngine(
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=ExecEngineConfig(debug=True),
+        )
+
+        self.risk_engine = RiskEngine(
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+            config=RiskEngineConfig(max_leverage=50.0, debug=True),
+        )
+
+        self.exec_client = MockExecutionClient(
+            client_id=ClientId(self.venue.value),
+            venue=self.venue,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.register_client(self.exec_client)
+
+        # Set account balance
+        self.account_state = AccountState(
+            account_id=self.account_id,
+            account_type=AccountType.MARGIN,
+            base_currency=USD,
+            reported=True,
+            balances=[
+                AccountBalance(
+                    Money(100_000, USD),
+                    Money(0, USD),
+                    Money(100_000, USD),
+                ),
+            ],
+            margins=[],
+            info={},
+            event_id=UUID4(),
+            ts_event=0,
+            ts_init=0,
+        )
+        self.portfolio.update_account(self.account_state)
+
+        # Prepare data
+        self.cache.add_instrument(AUDUSD_SIM)
+        self.cache.add_quote_tick(TestDataStubs.quote_tick(AUDUSD_SIM))
+
+        # Strategy
+        self.strategy = Strategy()
+        self.strategy.register(
+            trader_id=self.trader_id,
+            portfolio=self.portfolio,
+            msgbus=self.msgbus,
+            cache=self.cache,
+            clock=self.clock,
+            logger=self.logger,
+        )
+
+        self.exec_engine.start()
+
+    def _submit_market_order(self, side: OrderSide, quantity: int):
+        order = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            side,
+            Quantity.from_int(quantity),
+        )
+        submit_order = SubmitOrder(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy.id,
+            position_id=None,
+            order=order,
+            command_id=UUID4(),
+            ts_init=self.clock.timestamp_ns(),
+        )
+        self.risk_engine.execute(submit_order)
+        return order
+
+    @pytest.mark.parametrize(
+        "side,quantity,expected_status",
+        [
+            (OrderSide.BUY, 1_000_000, OrderStatus.INITIALIZED),
+            (OrderSide.SELL, 1_000_000, OrderStatus.INITIALIZED),
+            (OrderSide.BUY, 4_000_000, OrderStatus.DENIED),  # <-- Margin exceeds free balance
+            (OrderSide.SELL, 4_000_000, OrderStatus.DENIED),  # <-- Margin exceeds free balance
+        ],
+    )
+    def test_submit_order_when_margin_init_over_free_balance_then_denies(
+        self,
+        side,
+        quantity,
+        expected_status,
+    ):
+        # Arrange, Act
+        order = self._submit_market_order(side, quantity)
+
+        # Assert
+        assert order.status == expected_status
+
+    def test_submit_order_when_over_max_leverage_then_denies(self):
+        # Arrange, Act
+        order = self._submit_market_order(OrderSide.BUY, 6_000_000)  # <-- 60x leverage
+
+        # Assert
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_order_when_over_max_net_exposure_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_net_exposure_per_instrument(AUDUSD_SIM.id, 500_000)
+
+        # Act
+        order = self._submit_market_order(OrderSide.BUY, 1_000_000)
+
+        # Assert
+        assert self.risk_engine.max_net_exposure_per_instrument(AUDUSD_SIM.id) == 500_000
+        assert order.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_order_list_when_accumulated_net_exposure_over_max_then_denies(self):
+        # Arrange
+        self.risk_engine.set_max_net_exposure_per_instrument(AUDUSD_SIM.id, 800_000)
+
+        order1 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(500_000),
+        )
+        order2 = self.strategy.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(500_000),  # <-- Within max alone, but not with order1
+        )
+        order_list = OrderList(
+            order_list_id=OrderListId("1"),
+            orders=[order1, order2],
+        )
+        submit_order = SubmitOrderList(
+            self.trader_id,
+            self.strategy.id,
+            order_list,
+            UUID4(),
+            self.clock.timestamp_ns(),
+        )
+
+        # Act
+        self.risk_engine.execute(submit_order)
+
+        # Assert
+        assert order1.status == OrderStatus.DENIED
+        assert order2.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 0
+
+    def test_submit_order_which_reduces_net_position_then_skips_margin_checks(self):
+        # Arrange
+        order1 = self._submit_market_order(OrderSide.BUY, 3_000_000)
+        self.exec_engine.process(TestEventStubs.order_submitted(order1))
+        self.exec_engine.process(TestEventStubs.order_accepted(order1))
+        self.exec_engine.process(TestEventStubs.order_filled(order1, AUDUSD_SIM))
+
+        self.risk_engine.set_max_net_exposure_per_instrument(AUDUSD_SIM.id, 500_000)
+
+        # Act
+        order2 = self._submit_market_order(OrderSide.SELL, 2_000_000)  # <-- Reduces position
+        order3 = self._submit_market_order(OrderSide.BUY, 1_000_000)  # <-- Increases position
+
+        # Assert
+        assert order1.status == OrderStatus.FILLED
+        assert order2.status == OrderStatus.INITIALIZED
+        assert order3.status == OrderStatus.DENIED
+        assert self.exec_engine.command_count == 2
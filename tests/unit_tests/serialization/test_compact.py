@@ -0,0 +1,236 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2023 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import msgspec
+import pytest
+
+from nautilus_trader.common.clock import TestClock
+from nautilus_trader.common.factories import OrderFactory
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.events import OrderInitialized
+from nautilus_trader.model.events import OrderUpdated
+from nautilus_trader.model.events import PositionChanged
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.identifiers import PositionId
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.position import Position
+from nautilus_trader.serialization.compact import CompactSerializer
+from nautilus_trader.serialization.serializer import MsgSpecSerializer
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from tests.unit_tests.serialization import test_msgpack
+
+
+AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
+
+
+class TestCompactSerializer(test_msgpack.TestMsgSpecSerializer):
+    # Runs the full `MsgSpecSerializer` round trip suite with the compact encoding
+
+    def setup(self):
+        super().setup()
+        self.serializer = CompactSerializer()
+
+
+class TestCompactSerializerEncoding:
+    def setup(self):
+        # Fixture Setup
+        self.trader_id = TestIdStubs.trader_id()
+        self.strategy_id = TestIdStubs.strategy_id()
+        self.account_id = TestIdStubs.account_id()
+        self.order_factory = OrderFactory(
+            trader_id=self.trader_id,
+            strategy_id=self.strategy_id,
+            clock=TestClock(),
+        )
+
+        self.serializer = CompactSerializer()
+
+    def order_filled(
+        self,
+        commission: Money,
+        last_qty: Quantity | None = None,
+        last_px: Price | None = None,
+    ) -> OrderFilled:
+        return OrderFilled(
+            self.trader_id,
+            self.strategy_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            self.account_id,
+            TradeId("E123456"),
+            PositionId("T123456"),
+            OrderSide.SELL,
+            OrderType.LIMIT,
+            last_qty or Quantity.from_str("1500000"),
+            last_px or Price.from_str("1.00011"),
+            AUDUSD_SIM.quote_currency,
+            commission,
+            LiquiditySide.MAKER,
+            UUID4(),
+            1_000_000_000,
+            2_000_000_000,
+        )
+
+    def test_serialize_and_deserialize_order_filled_preserves_all_fields(self):
+        # Arrange
+        event = self.order_filled(Money(-1_234_567.89, USD))
+
+        # Act
+        deserialized = self.serializer.deserialize(self.serializer.serialize(event))
+
+        # Assert
+        assert OrderFilled.to_dict(deserialized) == OrderFilled.to_dict(event)
+        assert deserialized.commission == Money(-1_234_567.89, USD)
+        assert deserialized.ts_event == 1_000_000_000
+
+    @pytest.mark.parametrize(
+        ("last_qty", "last_px"),
+        [
+            ["2000000000.000000000", "1.000000000"],
+            ["18446744073.000000000", "9223372036.000000000"],
+            ["0.000000001", "-9223372036.000000000"],
+            ["1152921504.606846975", "-576460752.303423488"],
+        ],
+    )
+    def test_serialize_and_deserialize_order_filled_at_precision_and_magnitude_limits(
+        self,
+        last_qty: str,
+        last_px: str,
+    ):
+        # Arrange
+        event = self.order_filled(
+            Money(-1_234_567.89, USD),
+            last_qty=Quantity.from_str(last_qty),
+            last_px=Price.from_str(last_px),
+        )
+
+        # Act
+        deserialized = self.serializer.deserialize(self.serializer.serialize(event))
+
+        # Assert
+        assert OrderFilled.to_dict(deserialized) == OrderFilled.to_dict(event)
+        assert deserialized.last_qty == Quantity.from_str(last_qty)
+        assert deserialized.last_px == Price.from_str(last_px)
+
+    def test_serialize_and_deserialize_order_initialized_preserves_all_fields(self):
+        # Arrange
+        order = self.order_factory.limit(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+            Price.from_str("1.00000"),
+            post_only=True,
+            tags="ENTRY",
+        )
+        event = order.init_event
+
+        # Act
+        deserialized = self.serializer.deserialize(self.serializer.serialize(event))
+
+        # Assert
+        assert OrderInitialized.to_dict(deserialized) == OrderInitialized.to_dict(event)
+
+    def test_serialize_and_deserialize_order_updated_with_no_prices(self):
+        # Arrange
+        event = OrderUpdated(
+            self.trader_id,
+            self.strategy_id,
+            AUDUSD_SIM.id,
+            ClientOrderId("O-123456"),
+            VenueOrderId("1"),
+            self.account_id,
+            Quantity.from_str("0.00000001"),
+            None,
+            None,
+            UUID4(),
+            0,
+            0,
+        )
+
+        # Act
+        deserialized = self.serializer.deserialize(self.serializer.serialize(event))
+
+        # Assert
+        assert OrderUpdated.to_dict(deserialized) == OrderUpdated.to_dict(event)
+        assert deserialized.price is None
+
+    def test_serialize_and_deserialize_position_changed_preserves_all_fields(self):
+        # Arrange
+        order1 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.BUY,
+            Quantity.from_int(100_000),
+        )
+        fill1 = TestEventStubs.order_filled(
+            order1,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00001"),
+        )
+        order2 = self.order_factory.market(
+            AUDUSD_SIM.id,
+            OrderSide.SELL,
+            Quantity.from_int(50_000),
+        )
+        fill2 = TestEventStubs.order_filled(
+            order2,
+            instrument=AUDUSD_SIM,
+            position_id=PositionId("P-123456"),
+            strategy_id=StrategyId("S-001"),
+            last_px=Price.from_str("1.00011"),
+        )
+        position = Position(instrument=AUDUSD_SIM, fill=fill1)
+        position.apply(fill2)
+        event = PositionChanged.create(position, fill2, UUID4(), 0)
+
+        # Act
+        deserialized = self.serializer.deserialize(self.serializer.serialize(event))
+
+        # Assert
+        assert PositionChanged.to_dict(deserialized) == PositionChanged.to_dict(event)
+
+    def test_serialize_order_filled_is_smaller_than_msgpack(self):
+        # Arrange
+        event = self.order_filled(Money(2.50, USD))
+        msgpack_serializer = MsgSpecSerializer(encoding=msgspec.msgpack)
+
+        # Act
+        compact = self.serializer.serialize(event)
+        msgpack = msgpack_serializer.serialize(event)
+
+        # Assert
+        assert len(compact) < len(msgpack) // 2
+
+    def test_deserialize_with_unknown_schema_id_raises_runtime_error(self):
+        # Arrange
+        obj_bytes = msgspec.msgpack.encode([999, "TRADER-001"])
+
+        # Act, Assert
+        with pytest.raises(RuntimeError):
+            self.serializer.deserialize(obj_bytes)